@@ -0,0 +1,277 @@
+"""
+배정 결과 검증 (필수 조건 감사)
+배정이 끝난 상태를 학생 단위 배열로 만들어 numpy 연산 한 번씩으로 필수 조건을 모두 검사한다.
+학생 10만 명에서도 수십 ms 안에 끝나므로 run의 배정 직후와 수동 조정 뒤(이동이 멈추면 한 번) 실행한다.
+
+검사 항목 (위반 종류):
+    미배정        반이 없거나 반 번호가 1~학급 수 밖
+    중복배정      classes의 여러 자리(같은 반 두 번 포함)에 들어 있음
+    반목록누락    반은 있지만 classes의 어느 반에도 없음
+    반목록불일치  classes[c]에 있지만 assigned_class가 c가 아님
+    명단외학생    classes에 있지만 학생 명단에 없음
+    분반          분반 규칙의 두 이름이 같은 반
+    합반          합반 그룹(겹치는 그룹은 하나로 합침)이 여러 반으로 나뉨
+    동명이인      같은 이름이 같은 반에 두 명 이상
+"""
+
+import time
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, List, Optional, Sequence, Set, Tuple, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    import numpy as np
+    from class_assigner import ClassAssigner, Student
+    from manual_edits import ManualEditor
+
+# 배정 상태 자체의 오류 (규칙 위반과 달리 수동 조정으로 생길 수 없는 내부 오류)
+STATE_KINDS = ('미배정', '중복배정', '반목록누락', '반목록불일치', '명단외학생')
+RULE_KINDS = ('분반', '합반', '동명이인')
+
+
+@dataclass(frozen=True)
+class AuditViolation:
+    """검증 위반 한 건 (수동 조정의 규칙 위반 표시도 같은 형식, manual_edits.ManualEditor.violations)"""
+    kind: str  # STATE_KINDS 또는 RULE_KINDS
+    names: Tuple[str, ...]
+    classes: Tuple[int, ...]
+
+    def message(self) -> str:
+        classes = ', '.join(f'{c}반' for c in self.classes)
+        if self.kind == '분반':
+            return f"분반 위반: {' - '.join(self.names)} ({classes})"
+        if self.kind == '합반':
+            return f"합반 위반: {', '.join(self.names)} → {classes}로 나뉨"
+        if self.kind == '동명이인':
+            return f"동명이인 같은 반: {self.names[0]} ({classes})"
+        if self.kind == '미배정':
+            return f"미배정: {self.names[0]}" + (f" (반 번호 {self.classes[0]})" if self.classes else "")
+        if self.kind == '반목록불일치':
+            return f"반 목록 불일치: {self.names[0]} (배정 {self.classes[0]}반, 반 목록 {self.classes[1]}반)"
+        if self.kind == '명단외학생':
+            return f"명단에 없는 학생: {self.names[0]} ({classes})"
+        if self.kind == '중복배정':
+            return f"중복 배정: {self.names[0]} ({classes})"
+        return f"반 목록 누락: {self.names[0]} ({classes})"
+
+
+@dataclass
+class AuditReport:
+    """검증 결과"""
+    students: int
+    violations: List[AuditViolation] = field(default_factory=list)
+    elapsed_sec: float = 0.0
+
+    @property
+    def ok(self) -> bool:
+        return not self.violations
+
+    def counts(self) -> Dict[str, int]:
+        """위반 종류 → 건수 (위반이 있는 종류만)"""
+        counts: Dict[str, int] = {}
+        for violation in self.violations:
+            counts[violation.kind] = counts.get(violation.kind, 0) + 1
+        return counts
+
+    @property
+    def state_violations(self) -> List[AuditViolation]:
+        """규칙 위반을 뺀 배정 상태 오류 (STATE_KINDS)"""
+        return [v for v in self.violations if v.kind in STATE_KINDS]
+
+    def to_dict(self) -> dict:
+        return {
+            'ok': self.ok,
+            'students': self.students,
+            'counts': self.counts(),
+            'violations': [v.message() for v in self.violations],
+            'elapsed_ms': round(self.elapsed_sec * 1000, 3),
+        }
+
+
+def audit_assigner(assigner: 'ClassAssigner') -> AuditReport:
+    """ClassAssigner의 배정 상태 검증 (students, classes, 분반/합반 규칙)"""
+    import numpy as np
+    import pandas as pd
+
+    start = time.perf_counter()
+    students = assigner.students
+    # 반 목록의 학생은 객체 id로 명단 위치를 찾음 (동명이인도 구분)
+    listed = [s for class_students in assigner.classes.values() for s in class_students]
+    member_index = pd.Index(np.fromiter(map(id, students), dtype=np.int64, count=len(students))) \
+        .get_indexer(np.fromiter(map(id, listed), dtype=np.int64, count=len(listed)))
+    member_class = np.repeat(np.fromiter(assigner.classes, dtype=np.int64, count=len(assigner.classes)),
+                             [len(class_students) for class_students in assigner.classes.values()])
+    outsiders = [(listed[i].이름, int(member_class[i])) for i in np.flatnonzero(member_index < 0)]
+    roster = encode_roster([s.이름 for s in students], assigner.separation_pairs, assigner.together_groups)
+    violations = audit_arrays(roster, assigned_classes(students), member_index, member_class,
+                              assigner.target_class_count, outsiders)
+    return AuditReport(len(students), violations, time.perf_counter() - start)
+
+
+def audit_editor(editor: 'ManualEditor', roster: Optional['RosterCodes'] = None) -> AuditReport:
+    """
+    ManualEditor의 배정 상태 검증 (members는 학생 index 집합)
+
+    Args:
+        roster: 미리 만든 이름/규칙 코드 (수동 조정 중에는 이름과 규칙이 바뀌지 않으므로 재사용)
+    """
+    import numpy as np
+
+    start = time.perf_counter()
+    students = editor.students
+    sizes = [len(editor.members[c]) for c in editor.members]
+    member_index = np.fromiter((i for c in editor.members for i in editor.members[c]),
+                               dtype=np.int64, count=sum(sizes))
+    member_class = np.repeat(np.fromiter(editor.members, dtype=np.int64, count=len(sizes)), sizes)
+    if roster is None:
+        roster = encode_roster([s.이름 for s in students], editor.separation_pairs, editor.together_groups)
+    violations = audit_arrays(roster, assigned_classes(students), member_index, member_class,
+                              editor.target_class_count)
+    return AuditReport(len(students), violations, time.perf_counter() - start)
+
+
+def assigned_classes(students: Sequence['Student']) -> 'np.ndarray':
+    """학생별 반 번호 배열 (반이 없으면 0)"""
+    import numpy as np
+
+    return np.fromiter((s.assigned_class or 0 for s in students), dtype=np.int64, count=len(students))
+
+
+@dataclass
+class RosterCodes:
+    """학생 이름과 규칙을 정수 코드로 바꾼 것 (encode_roster)"""
+    codes: 'np.ndarray'  # 학생별 이름 코드
+    names: List[str]  # 코드 → 이름
+    pair_a: 'np.ndarray'  # 분반 쌍 (명단에 있는 이름만, 중복 제거, pair_a < pair_b)
+    pair_b: 'np.ndarray'
+    components: List[Set[str]]  # 합반 그룹 (겹치는 그룹은 하나로 합침)
+    component_of: 'np.ndarray'  # 이름 코드 → 합반 그룹 번호 (없으면 -1)
+
+
+def encode_roster(names: Sequence[str], separation_pairs: Iterable[Tuple[str, str]],
+                  together_groups: Iterable[Set[str]]) -> RosterCodes:
+    """학생 이름과 분반/합반 규칙의 이름을 한 번에 정수 코드로 변환"""
+    import numpy as np
+    import pandas as pd
+
+    separation_pairs = list(separation_pairs)
+    components = _components(together_groups)
+    rule_names = ([p[0] for p in separation_pairs] + [p[1] for p in separation_pairs] +
+                  [name for component in components for name in component])
+    n, pair_count = len(names), len(separation_pairs)
+    codes, uniques = pd.factorize(pd.Series(list(names) + rule_names, dtype=object))
+    codes, rule_codes = codes[:n].astype(np.int64), codes[n:].astype(np.int64)
+    name_total = len(uniques)
+
+    in_roster = np.zeros(name_total, dtype=bool)
+    in_roster[codes] = True
+    a, b = rule_codes[:pair_count], rule_codes[pair_count:2 * pair_count]
+    valid = in_roster[a] & in_roster[b] & (a != b)  # 명단에 없는 이름의 규칙은 검사하지 않음
+    pair_keys = np.unique(np.minimum(a, b)[valid] * name_total + np.maximum(a, b)[valid])
+
+    component_of = np.full(name_total, -1, dtype=np.int64)
+    component_of[rule_codes[2 * pair_count:]] = np.repeat(np.arange(len(components), dtype=np.int64),
+                                                          [len(component) for component in components])
+    return RosterCodes(codes, list(uniques), pair_keys // name_total, pair_keys % name_total,
+                       components, component_of)
+
+
+def audit_arrays(roster: RosterCodes, assigned: 'np.ndarray', member_index: 'np.ndarray',
+                 member_class: 'np.ndarray',
+                 class_count: int, outsiders: Iterable[Tuple[str, int]] = ()) -> List[AuditViolation]:
+    """
+    학생 단위 배열로 필수 조건 검증
+
+    Args:
+        roster: 학생 이름/규칙 코드 (encode_roster)
+        assigned: 학생별 반 번호 (반이 없으면 0)
+        member_index / member_class: 반 목록의 자리마다 학생 index와 반 번호
+        outsiders: 반 목록에 있지만 명단에 없는 학생 (이름, 반)
+
+    Returns:
+        위반 목록 (종류 순서는 모듈 설명과 같음)
+    """
+    import numpy as np
+
+    names = roster.names
+    codes = roster.codes
+    n = len(codes)
+    assigned = np.asarray(assigned, dtype=np.int64)
+    member_index = np.asarray(member_index, dtype=np.int64)
+    member_class = np.asarray(member_class, dtype=np.int64)
+    violations: List[AuditViolation] = []
+
+    # 1. 배정 상태: 모든 학생이 정확히 한 반에 있고 classes와 assigned_class가 일치
+    placed = (assigned >= 1) & (assigned <= class_count)
+    for i in np.flatnonzero(~placed):
+        violations.append(AuditViolation('미배정', (names[codes[i]],), (int(assigned[i]),) if assigned[i] else ()))
+    known = member_index >= 0
+    member_index, member_class = member_index[known], member_class[known]
+    listed = np.bincount(member_index, minlength=n)
+    for i in np.flatnonzero(listed > 1):
+        classes = tuple(sorted(int(c) for c in member_class[member_index == i]))
+        violations.append(AuditViolation('중복배정', (names[codes[i]],), classes))
+    for i in np.flatnonzero((listed == 0) & placed):
+        violations.append(AuditViolation('반목록누락', (names[codes[i]],), (int(assigned[i]),)))
+    for row in np.flatnonzero(assigned[member_index] != member_class):
+        i = member_index[row]
+        violations.append(AuditViolation('반목록불일치', (names[codes[i]],),
+                                         (int(assigned[i]), int(member_class[row]))))
+    for name, class_num in outsiders:
+        violations.append(AuditViolation('명단외학생', (name,), (class_num,)))
+
+    # 2. 규칙: 배정된 학생의 (이름 코드, 반) 키로 검사
+    width = class_count + 1
+    keys, key_counts = np.unique(codes[placed] * width + assigned[placed], return_counts=True)
+    if not len(keys):
+        return violations
+    key_names, key_classes = keys // width, keys % width
+
+    # 분반: 이름 a의 반마다 (b, 그 반) 키가 있는지 검사
+    a, b = roster.pair_a, roster.pair_b
+    if len(a):
+        name_counts = np.bincount(key_names, minlength=len(names))
+        starts = np.concatenate(([0], np.cumsum(name_counts)[:-1]))
+        reps = name_counts[a]
+        offsets = np.arange(reps.sum()) - np.repeat(np.cumsum(reps) - reps, reps)
+        a_classes = key_classes[np.repeat(starts[a], reps) + offsets]
+        probes = np.repeat(b, reps) * width + a_classes
+        found = keys[np.minimum(np.searchsorted(keys, probes), len(keys) - 1)] == probes
+        shared: Dict[int, List[int]] = {}
+        for p, c in zip(np.repeat(np.arange(len(a)), reps)[found].tolist(), a_classes[found].tolist()):
+            shared.setdefault(p, []).append(c)
+        for p, classes in shared.items():
+            violations.append(AuditViolation('분반', tuple(sorted((names[a[p]], names[b[p]]))), tuple(sorted(classes))))
+
+    # 합반: 그룹마다 배정된 반이 하나인지 검사
+    if roster.components:
+        component_of = roster.component_of[key_names]
+        grouped = component_of >= 0
+        component_keys = np.unique(component_of[grouped] * width + key_classes[grouped])
+        class_counts = np.bincount(component_keys // width, minlength=len(roster.components))
+        for component_idx in np.flatnonzero(class_counts > 1):
+            classes = component_keys[component_keys // width == component_idx] % width
+            violations.append(AuditViolation('합반', tuple(sorted(roster.components[component_idx])),
+                                             tuple(int(c) for c in classes)))
+
+    # 동명이인: (이름, 반) 키가 두 번 이상
+    duplicated = key_counts > 1
+    by_name: Dict[int, List[int]] = {}
+    for code, class_num in zip(key_names[duplicated].tolist(), key_classes[duplicated].tolist()):
+        by_name.setdefault(code, []).append(class_num)
+    for code, classes in by_name.items():
+        violations.append(AuditViolation('동명이인', (names[code],), tuple(classes)))
+
+    return violations
+
+
+def _components(together_groups: Iterable[Set[str]]) -> List[Set[str]]:
+    """이름을 공유하는 합반 그룹을 하나로 합친 그룹 목록"""
+    components: List[Set[str]] = []
+    for group in together_groups:
+        group = set(group)
+        overlapping = [c for c in components if c & group]
+        for component in overlapping:
+            group |= component
+            components.remove(component)
+        components.append(group)
+    return components
@@ -0,0 +1,231 @@
+"""
+명령줄 학급 편성 (대화상자 없이 실행)
+배치 서버, 예약 작업, 병렬 실행에서 사용하는 진입점. tkinter/PyQt를 불러오지 않는다.
+
+사용법:
+    python -m class_assigner "01 가상 명단.xlsx" "02 분반 합반할 학생 규칙.xlsx" -o "03 배정 결과.xlsx"
+    python -m class_assigner 명단.xlsx 규칙.xlsx --classes 8 --seed 42 --time-budget 60
+    python -m class_assigner 명단.xlsx 규칙.xlsx --json      # 로그 없이 결과 요약(JSON)만 출력
+    python -m class_assigner 명단.xlsx 규칙.xlsx --log-level warning   # 배정 경고와 오류만 출력
+
+종료 코드:
+    0 성공, 1 예상하지 못한 오류, 2 잘못된 입력 (인자, 파일 없음, 형식 오류),
+    3 배정 불가 (규칙 충돌, 배정하지 못한 학생), 4 시간 제한 초과 또는 중단
+"""
+
+import argparse
+import contextlib
+import json
+import os
+import sys
+import threading
+import time
+from dataclasses import asdict
+from typing import List, Optional
+
+from assignment_engines import ENGINES
+from assignment_events import AssignmentCancelled, CancelToken
+from assignment_log import LOG_LEVELS, log_level
+from parsed_inputs import CACHE_DIR_ENV
+from run_profiler import PROFILE_MODES
+
+EXIT_OK = 0
+EXIT_ERROR = 1
+EXIT_INVALID = 2
+EXIT_INFEASIBLE = 3
+EXIT_TIMEOUT = 4
+
+DEFAULT_OUTPUT_NAME = '03 6학년 배정 결과.xlsx'
+
+
+def run_assignment(student_file: str, rules_file: str, output_file: Optional[str] = None,
+                   target_class_count: int = 7, seed: Optional[int] = None, engine: str = 'greedy',
+                   time_budget: Optional[float] = None, writers: Optional[list] = None,
+                   metrics_file: Optional[str] = None, engine_budget: Optional[float] = None,
+                   engine_iterations: Optional[int] = None, profile: Optional[str] = None,
+                   profile_top: int = 30, cache_dir: Optional[str] = None) -> dict:
+    """
+    대화상자 없이 학급 편성 실행
+
+    예외를 던지지 않고 결과 요약을 반환한다 (status: ok / invalid / infeasible / timeout / error).
+
+    Args:
+        output_file: 결과 파일 경로 (없으면 명단 파일과 같은 폴더의 DEFAULT_OUTPUT_NAME)
+        seed: 배정 순서 난수 seed (같은 입력과 seed면 같은 결과)
+        engine: 배정 엔진 (assignment_engines.ENGINES)
+        time_budget: 시간 제한(초, 입력 파일 읽기 포함). 넘기면 결과 파일을 쓰지 않고 timeout
+        writers: 추가 출력 형식 (ClassAssigner.generate_output 참고)
+        metrics_file: 단계별 시간/카운터를 저장할 JSON 파일 (결과 요약의 'metrics'와 같은 내용)
+        engine_budget: greedy가 아닌 엔진의 개선 시간(초, time_budget 안에 포함되므로 더 짧게)
+        engine_iterations: greedy가 아닌 엔진의 반복 횟수 (같은 seed면 같은 결과)
+        profile: 진단용 프로파일 모드 ('cpu', 'memory', 'all'). 결과 파일 옆에 저장한 파일은 'profile_files'
+        profile_top: 프로파일 보고서의 시간 상위 함수 수
+        cache_dir: 입력 파싱 결과 디스크 캐시 폴더 (parsed_inputs.DiskInputCache, 내용이 같은 파일은 다시 읽지 않음)
+
+    배정을 실행했으면 배정 경고(배정할 수 없는 학생 등)를 'warnings'에, 배정 검증 결과를 'audit'에 담는다.
+    """
+    from class_assigner import ClassAssigner, RuleConflictError
+    from assignment_engines import evaluate
+    from parsed_inputs import DiskInputCache, parse_inputs
+
+    start = time.perf_counter()
+    if output_file is None:
+        output_file = os.path.join(os.path.dirname(os.path.abspath(student_file)), DEFAULT_OUTPUT_NAME)
+    result = {
+        'status': 'ok',
+        'exit_code': EXIT_OK,
+        'student_file': student_file,
+        'rules_file': rules_file,
+        'output_files': [],
+        'classes': target_class_count,
+        'seed': seed,
+        'engine': engine,
+    }
+    assigner = None
+
+    def finish(status, exit_code, **fields):
+        result.update(status=status, exit_code=exit_code, **fields)
+        if assigner is not None and assigner.profile_files:
+            result['profile_files'] = assigner.profile_files
+        if assigner is not None and assigner.warnings:
+            result['warnings'] = [asdict(w) for w in assigner.warnings]
+        result['elapsed_sec'] = round(time.perf_counter() - start, 3)
+        return result
+
+    # 1. 인자와 입력 파일 검사
+    if target_class_count < 1:
+        return finish('invalid', EXIT_INVALID, error=f"학급 수는 1 이상이어야 합니다: {target_class_count}")
+    if engine not in ENGINES:
+        return finish('invalid', EXIT_INVALID, error=f"지원하지 않는 엔진: {engine} (지원: {', '.join(ENGINES)})")
+    for path in (student_file, rules_file):
+        if not os.path.isfile(path):
+            return finish('invalid', EXIT_INVALID, error=f"파일이 없습니다: {path}")
+    try:
+        from result_writers import output_paths
+        output_paths(output_file, writers)
+    except ValueError as e:
+        return finish('invalid', EXIT_INVALID, error=str(e))
+
+    # 시간 제한은 취소 토큰으로 적용
+    cancel_token = CancelToken()
+    timer = threading.Timer(time_budget, cancel_token.cancel) if time_budget else None
+    if timer is not None:
+        timer.daemon = True
+        timer.start()
+    try:
+        try:
+            parsed = parse_inputs(student_file, rules_file, checkpoint=lambda done=0, total=0: cancel_token.check(),
+                                  disk_cache=DiskInputCache(cache_dir) if cache_dir else None)
+        except AssignmentCancelled:
+            return finish('timeout', EXIT_TIMEOUT, error=f"시간 제한({time_budget:g}초)을 넘겼습니다")
+        except Exception as e:
+            return finish('invalid', EXIT_INVALID, error=f"입력 파일을 읽을 수 없습니다: {e}")
+        if not parsed.students:
+            return finish('invalid', EXIT_INVALID, error="학생 명단이 비어 있습니다")
+        result['students'] = len(parsed.students)
+        if parsed.conflicts:
+            return finish('infeasible', EXIT_INFEASIBLE, error="규칙 충돌이 발견되었습니다",
+                          conflicts=parsed.conflicts)
+
+        # 2. 배정
+        assigner = ClassAssigner(student_file, rules_file, target_class_count=target_class_count, seed=seed)
+        try:
+            cancel_token.check()
+            result['output_files'] = assigner.run(output_file, writers=writers, cancel_token=cancel_token,
+                                                  parsed_inputs=parsed, metrics_file=metrics_file,
+                                                  engine=engine, engine_budget=engine_budget,
+                                                  engine_iterations=engine_iterations, profile=profile,
+                                                  profile_top=profile_top)
+        except AssignmentCancelled:
+            return finish('timeout', EXIT_TIMEOUT, error=f"시간 제한({time_budget:g}초)을 넘겼습니다")
+        except KeyboardInterrupt:
+            return finish('timeout', EXIT_TIMEOUT, error="사용자가 중단했습니다")
+        except RuleConflictError as e:
+            return finish('infeasible', EXIT_INFEASIBLE, error=str(e), conflicts=e.conflicts)
+        except Exception as e:
+            return finish('error', EXIT_ERROR, error=f"{type(e).__name__}: {e}")
+    finally:
+        if timer is not None:
+            timer.cancel()
+
+    # 3. 결과 요약 (배정하지 못한 학생이 있으면 결과 파일은 저장되지만 배정 불가로 보고)
+    result['quality'] = assigner.quality_report.overall if assigner.quality_report else None
+    result['metrics'] = assigner.metrics.to_dict()
+    result['objective'] = evaluate(assigner)
+    result['audit'] = assigner.audit_report.to_dict()
+    unassigned = [s.이름 for s in assigner.students if s.assigned_class is None]
+    if unassigned:
+        return finish('infeasible', EXIT_INFEASIBLE, error=f"배정하지 못한 학생 {len(unassigned)}명",
+                      unassigned=unassigned)
+    if not assigner.audit_report.ok:
+        return finish('infeasible', EXIT_INFEASIBLE,
+                      error=f"배정 검증에서 필수 조건 위반 {len(assigner.audit_report.violations)}건")
+    return finish('ok', EXIT_OK)
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog='python -m class_assigner',
+        description="자동 학급 편성 (명령줄 실행)",
+        epilog="종료 코드: 0 성공, 1 오류, 2 잘못된 입력, 3 배정 불가, 4 시간 제한 초과",
+    )
+    parser.add_argument('student_file', help="학생 명단 파일 (.xlsx, .csv, .parquet)")
+    parser.add_argument('rules_file', help="분반/합반 규칙 파일 (.xlsx, 또는 규칙/이름/상대/그룹 컬럼의 .csv, .parquet)")
+    parser.add_argument('-o', '--output', help=f"결과 파일 (기본: 명단 파일 폴더의 '{DEFAULT_OUTPUT_NAME}')")
+    parser.add_argument('-c', '--classes', type=int, default=7, help="진급 학급 수 (기본 7)")
+    parser.add_argument('--seed', type=int, help="난수 seed (같은 입력과 seed면 같은 결과)")
+    parser.add_argument('--engine', choices=ENGINES, default='greedy',
+                        help="배정 엔진 (기본 greedy, restarts/local_search는 greedy 배정 후 개선)")
+    parser.add_argument('--engine-budget', type=float, metavar='SEC',
+                        help="개선 엔진 실행 시간(초, 기본 5초)")
+    parser.add_argument('--engine-iterations', type=int, metavar='N',
+                        help="개선 엔진 반복 횟수 (시간 대신 횟수로 멈춰 seed별 결과 고정)")
+    parser.add_argument('--time-budget', type=float, metavar='SEC', help="시간 제한(초)")
+    parser.add_argument('--format', nargs='+', dest='formats', metavar='FORMAT',
+                        help="출력 형식 (xlsx csv jsonl parquet, 확장자가 --output과 같은 형식은 그 파일에, "
+                             "나머지는 확장자만 바꾼 파일에 저장)")
+    parser.add_argument('--metrics', metavar='FILE', help="단계별 시간/카운터를 JSON 파일로 저장")
+    parser.add_argument('--profile', choices=PROFILE_MODES,
+                        help="진단용 프로파일 (cpu: cProfile, memory: tracemalloc, all: 둘 다) - "
+                             "결과 파일 옆에 .prof와 .profile.txt 저장")
+    parser.add_argument('--profile-top', type=int, default=30, metavar='N',
+                        help="프로파일 보고서의 시간 상위 함수 수 (기본 30)")
+    parser.add_argument('--log-level', choices=list(LOG_LEVELS), default='info',
+                        help="진행 로그 레벨 (기본 info, warning: 배정 경고와 오류만, debug: 그룹 단위 세부 진행)")
+    parser.add_argument('--cache-dir', metavar='DIR', default=os.environ.get(CACHE_DIR_ENV),
+                        help=f"입력 파싱 결과 캐시 폴더 (내용이 같은 명단/규칙 파일은 다시 읽지 않음, "
+                             f"기본: 환경 변수 {CACHE_DIR_ENV})")
+    output = parser.add_mutually_exclusive_group()
+    output.add_argument('-q', '--quiet', action='store_true', help="진행 로그 출력 안 함 (오류만 표준 오류로)")
+    output.add_argument('--json', action='store_true', help="진행 로그 없이 결과 요약을 JSON으로 출력")
+    return parser
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """명령줄 실행 (종료 코드 반환, 인자 오류는 argparse가 종료 코드 2로 종료)"""
+    args = build_parser().parse_args(argv)
+
+    silent = args.quiet or args.json
+    # 출력하지 않을 로그는 레벨을 올려 메시지 포맷도 생략
+    with open(os.devnull, 'w', encoding='utf-8') if silent else contextlib.nullcontext(sys.stdout) as log:
+        with contextlib.redirect_stdout(log), log_level('error' if silent else args.log_level):
+            result = run_assignment(args.student_file, args.rules_file, output_file=args.output,
+                                    target_class_count=args.classes, seed=args.seed, engine=args.engine,
+                                    time_budget=args.time_budget, writers=args.formats,
+                                    metrics_file=args.metrics, engine_budget=args.engine_budget,
+                                    engine_iterations=args.engine_iterations, profile=args.profile,
+                                    profile_top=args.profile_top, cache_dir=args.cache_dir)
+
+    if args.json:
+        print(json.dumps(result, ensure_ascii=False, indent=2))
+    elif result['status'] != 'ok':
+        print(f"❌ {result['error']}", file=sys.stderr)
+        for line in result.get('conflicts', []):
+            print(line, file=sys.stderr)
+    elif not args.quiet:
+        print(f"✅ 결과 파일: {', '.join(result['output_files'])} ({result['elapsed_sec']:.2f}초)")
+    return result['exit_code']
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,255 @@
+"""
+배정 개선 엔진
+greedy 배정(Phase 1~5)이 끝난 뒤 정해진 시간/반복 횟수 안에서 목적함수를 줄인다.
+목적함수는 반별 편차(유효인원, 유효남/여학생, 점수평균, 난이도합)의 가중합에
+규칙 위반과 배정하지 못한 학생을 큰 가중치로 더한 값이며 작을수록 좋다.
+개선될 때마다 (경과 시간, 목적함수 항목)을 기록해 시간 대비 품질 곡선(anytime curve)을 남긴다.
+
+엔진:
+    greedy        Phase 1~5 규칙 기반 배정만 (개선 없음)
+    restarts      Phase 1~4 결과(잠긴 학생)는 그대로 두고 Phase 5를 다른 난수로 다시 실행해
+                  가장 좋은 배정을 고름
+    local_search  greedy 배정에서 시작해 Phase 5 학생(잠기지 않은 학생)의 이동/맞교환 중
+                  목적함수를 늘리지 않는 것만 받아들임 (ManualEditor로 이동마다 증분 계산)
+"""
+
+import random
+import time
+from typing import TYPE_CHECKING, Callable, Dict, List, Optional
+
+from assignment_log import log_level
+
+if TYPE_CHECKING:
+    from class_assigner import ClassAssigner
+    from manual_edits import ManualEditor
+
+ENGINES = ('greedy', 'restarts', 'local_search')
+
+# 시간/반복 횟수를 주지 않았을 때 개선 엔진 실행 시간(초)
+DEFAULT_ENGINE_BUDGET = 5.0
+
+# 목적함수 항목별 가중치 (규칙 위반/미배정은 어떤 편차 개선보다 커야 함)
+OBJECTIVE_WEIGHTS = {
+    '유효인원편차': 10.0,
+    '유효남학생편차': 3.0,
+    '유효여학생편차': 3.0,
+    '점수평균편차': 1.0,
+    '난이도합편차': 2.0,
+    '규칙위반': 1000.0,
+    '미배정': 1000.0,
+}
+
+
+def objective_terms(editor: 'ManualEditor', unassigned: int = 0) -> Dict[str, float]:
+    """
+    목적함수 항목 (ManualEditor의 반별 누적 통계에서 바로 계산, 반 수에 비례)
+
+    Args:
+        unassigned: 배정하지 못한 학생 수 (ManualEditor는 배정된 학생만 추적)
+    """
+    stats = editor.stats.values()
+
+    def spread(values):
+        values = list(values)
+        return float(max(values) - min(values)) if values else 0.0
+
+    return {
+        '유효인원편차': spread(s.유효인원 for s in stats),
+        '유효남학생편차': spread(s.유효남학생 for s in stats),
+        '유효여학생편차': spread(s.유효여학생 for s in stats),
+        '점수평균편차': spread(s.점수합 / s.학생수 for s in stats if s.학생수),
+        '난이도합편차': round(spread(s.난이도합 for s in stats), 6),  # 더하고 빼며 쌓인 부동소수 오차 제거
+        '규칙위반': float(editor.violation_count),
+        '미배정': float(unassigned),
+    }
+
+
+def objective_value(terms: Dict[str, float], weights: Optional[Dict[str, float]] = None) -> float:
+    """목적함수 값 (항목 가중합)"""
+    weights = OBJECTIVE_WEIGHTS if weights is None else weights
+    return sum(weights.get(name, 0.0) * value for name, value in terms.items())
+
+
+def make_editor(assigner: 'ClassAssigner') -> 'ManualEditor':
+    from manual_edits import ManualEditor
+
+    return ManualEditor(assigner.students, assigner.separation_pairs, assigner.together_groups,
+                        assigner.target_class_count)
+
+
+def evaluate(assigner: 'ClassAssigner') -> Dict[str, float]:
+    """현재 배정의 목적함수 항목과 값('목적함수')"""
+    unassigned = sum(1 for s in assigner.students if s.assigned_class is None)
+    terms = objective_terms(make_editor(assigner), unassigned)
+    terms['목적함수'] = round(objective_value(terms), 6)
+    return terms
+
+
+class _Trace:
+    """개선 기록 (시작점 + 목적함수가 줄어든 시점마다 한 점)"""
+
+    def __init__(self, assigner: 'ClassAssigner', time_budget: Optional[float], max_iterations: Optional[int]):
+        self.assigner = assigner
+        self.time_budget = time_budget
+        self.max_iterations = max_iterations
+        self.start = time.perf_counter()
+        self.deadline = self.start + time_budget if time_budget is not None else None
+        self.iterations = 0
+        self.points: List[dict] = []
+        self.best = float('inf')
+
+    def elapsed(self) -> float:
+        return time.perf_counter() - self.start
+
+    def running(self) -> bool:
+        """다음 반복을 실행할지 (취소 확인과 진행률 보고 포함)"""
+        if self.max_iterations is not None:
+            if self.iterations >= self.max_iterations:
+                return False
+            self.assigner._checkpoint(self.iterations, self.max_iterations)
+        if self.deadline is not None:
+            now = time.perf_counter()
+            if now >= self.deadline:
+                return False
+            self.assigner._checkpoint(now - self.start, self.time_budget)
+        self.iterations += 1
+        self.assigner._count('engine_iterations')
+        return True
+
+    def record(self, terms: Dict[str, float], value: float) -> bool:
+        """value가 지금까지의 최솟값보다 작으면 기록하고 True"""
+        if value >= self.best - 1e-9:
+            return False
+        self.best = value
+        self.points.append({
+            'elapsed_sec': round(self.elapsed(), 4),
+            'iteration': self.iterations,
+            'objective': round(value, 6),
+            'terms': {name: round(v, 6) for name, v in terms.items()},
+        })
+        return True
+
+
+def _rebuild_classes(assigner: 'ClassAssigner'):
+    """학생의 assigned_class로 assigner.classes 다시 구성 (students 순서 유지)"""
+    assigner.classes = {c: [] for c in range(1, assigner.target_class_count + 1)}
+    for student in assigner.students:
+        if student.assigned_class in assigner.classes:
+            assigner.classes[student.assigned_class].append(student)
+
+
+def _restarts(assigner: 'ClassAssigner', trace: _Trace, rng: random.Random):
+    """
+    Phase 5만 다른 난수로 다시 실행하며 가장 좋은 배정 유지
+
+    배정 경고(assigner.warnings)는 시도마다 따로 모아, 처음 Phase 5의 경고를 이긴 시도의 경고로 바꾼다.
+    """
+    students = assigner.students
+    free = [s for s in students if not s.locked]
+    terms = evaluate(assigner)
+    trace.record(terms, terms.pop('목적함수'))
+    best = [s.assigned_class for s in free]
+    initial_warnings = assigner.warnings
+    best_warnings = None  # None이면 처음 배정이 가장 좋음
+
+    previous_rng = assigner.rng
+    try:
+        with log_level('error'):
+            while trace.running():
+                for student in free:
+                    student.assigned_class = None
+                _rebuild_classes(assigner)
+                assigner.rng = random.Random(rng.getrandbits(64))
+                if initial_warnings is not None:
+                    assigner.warnings = []
+                assigner.phase5_balance_remaining()
+                terms = evaluate(assigner)
+                if trace.record(terms, terms.pop('목적함수')):
+                    best = [s.assigned_class for s in free]
+                    best_warnings = assigner.warnings
+    finally:
+        assigner.rng = previous_rng
+        assigner.warnings = initial_warnings
+        if initial_warnings is not None and best_warnings is not None:
+            assigner.warnings = [w for w in initial_warnings
+                                 if w.stage != 'phase5_balance_remaining'] + best_warnings
+        for student, class_num in zip(free, best):
+            student.assigned_class = class_num
+        _rebuild_classes(assigner)
+
+
+def _local_search(assigner: 'ClassAssigner', trace: _Trace, rng: random.Random, swap_ratio: float = 0.5):
+    """잠기지 않은 학생 한 명 이동 또는 두 명 맞교환, 목적함수가 늘지 않으면 채택"""
+    editor = make_editor(assigner)
+    unassigned = sum(1 for s in assigner.students if s.assigned_class is None)
+    class_count = assigner.target_class_count
+    movable = [i for i, s in enumerate(assigner.students) if not s.locked and s.assigned_class is not None]
+
+    terms = objective_terms(editor, unassigned)
+    current = objective_value(terms)
+    trace.record(terms, current)
+    if not movable or class_count < 2:
+        return
+
+    try:
+        while trace.running():
+            i = rng.choice(movable)
+            old_class = editor.students[i].assigned_class
+            if rng.random() < swap_ratio:
+                j = rng.choice(movable)
+                other_class = editor.students[j].assigned_class
+                if other_class == old_class:
+                    continue
+                editor.move(i, other_class)
+                editor.move(j, old_class)
+            else:
+                new_class = rng.randint(1, class_count - 1)
+                editor.move(i, new_class if new_class < old_class else new_class + 1)
+
+            terms = objective_terms(editor, unassigned)
+            value = objective_value(terms)
+            if value <= current + 1e-9:
+                # 같은 값도 받아들여 편차가 같은 평지에서 계속 움직임
+                current = value
+                trace.record(terms, value)
+                editor.history.clear()
+            else:
+                while editor.history:
+                    editor.undo()
+    finally:
+        _rebuild_classes(assigner)
+
+
+_ENGINE_FUNCTIONS: Dict[str, Callable] = {
+    'restarts': _restarts,
+    'local_search': _local_search,
+}
+
+
+def optimize(assigner: 'ClassAssigner', engine: str, time_budget: Optional[float] = None,
+             max_iterations: Optional[int] = None) -> List[dict]:
+    """
+    greedy 배정이 끝난 assigner의 배정 개선 (assigner.students/classes를 직접 바꿈)
+
+    Args:
+        engine: ENGINES 중 하나 ('greedy'면 시작점만 기록)
+        time_budget: 실행 시간(초). time_budget과 max_iterations가 모두 없으면 DEFAULT_ENGINE_BUDGET
+        max_iterations: 후보 배정 평가 횟수 (시간과 관계없이 같은 seed면 같은 결과)
+
+    Returns:
+        개선 기록 [{'elapsed_sec', 'iteration', 'objective', 'terms'}] (첫 항목이 greedy 배정,
+        마지막 항목이 최종 배정)
+    """
+    if engine not in ENGINES:
+        raise ValueError(f"지원하지 않는 엔진: {engine} (지원: {', '.join(ENGINES)})")
+    if time_budget is None and max_iterations is None:
+        time_budget = DEFAULT_ENGINE_BUDGET
+    trace = _Trace(assigner, time_budget, max_iterations)
+
+    if engine == 'greedy':
+        terms = evaluate(assigner)
+        trace.record(terms, terms.pop('목적함수'))
+    else:
+        # assigner.rng를 그대로 쓰면 같은 seed의 greedy 배정과 난수열이 이어지므로 한 번만 뽑아 분리
+        _ENGINE_FUNCTIONS[engine](assigner, trace, random.Random(assigner.rng.getrandbits(64)))
+    return trace.points
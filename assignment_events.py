@@ -0,0 +1,97 @@
+"""
+배정 진행 이벤트
+ClassAssigner가 실행 중에 내보내는 로그/단계/진행률 이벤트, 표준 출력 전달 스트림, 취소 토큰.
+GUI가 이벤트를 받아 실행 중에 진행 상황을 표시하고 취소를 요청한다.
+"""
+
+import contextlib
+import io
+import threading
+from dataclasses import dataclass
+from typing import Callable, Optional
+
+
+@dataclass
+class AssignmentEvent:
+    """배정 진행 이벤트"""
+    kind: str  # 'log' (출력 한 줄), 'phase' (단계 시작), 'progress' (진행률)
+    message: str = ''
+    step: int = 0  # 단계 번호 (1부터)
+    total: int = 0  # 전체 단계 수
+    fraction: float = 0.0  # 전체 진행률 (0.0 ~ 1.0, 'phase'/'progress')
+
+
+EventSink = Callable[[AssignmentEvent], None]
+
+
+class AssignmentCancelled(Exception):
+    """취소 요청으로 배정이 중단됨"""
+    pass
+
+
+class CancelToken:
+    """
+    배정 취소 토큰
+
+    다른 스레드(또는 프로세스)에서 cancel()을 호출하면 배정 코드가 다음 check()에서
+    AssignmentCancelled를 발생시킨다. 프로세스 사이에서 쓰려면 multiprocessing Event를 넘긴다.
+    """
+
+    def __init__(self, event=None):
+        self._event = event if event is not None else threading.Event()
+
+    def cancel(self):
+        self._event.set()
+
+    @property
+    def cancelled(self) -> bool:
+        return self._event.is_set()
+
+    def check(self):
+        """취소 요청이 있으면 AssignmentCancelled 발생"""
+        if self._event.is_set():
+            raise AssignmentCancelled("배정이 취소되었습니다.")
+
+
+class EventLogStream(io.TextIOBase):
+    """
+    print 출력을 줄 단위 'log' 이벤트로 전달하는 스트림
+
+    contextlib.redirect_stdout과 함께 사용하면 실행이 끝나기를 기다리지 않고
+    줄이 완성될 때마다 이벤트를 내보낸다.
+    """
+
+    def __init__(self, sink: EventSink):
+        super().__init__()
+        self.sink = sink
+        self._pending = ''
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, text: str) -> int:
+        lines = (self._pending + text).split('\n')
+        self._pending = lines.pop()
+        for line in lines:
+            self.sink(AssignmentEvent('log', line))
+        return len(text)
+
+    def flush(self):
+        """완성되지 않은 마지막 줄도 전달"""
+        if self._pending:
+            line, self._pending = self._pending, ''
+            self.sink(AssignmentEvent('log', line))
+
+
+@contextlib.contextmanager
+def forward_output(sink: Optional[EventSink]):
+    """sink가 있으면 블록 안의 표준 출력을 'log' 이벤트로 전달"""
+    if sink is None:
+        yield None
+        return
+    stream = EventLogStream(sink)
+    try:
+        with contextlib.redirect_stdout(stream):
+            yield stream
+    finally:
+        stream.flush()
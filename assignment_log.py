@@ -0,0 +1,95 @@
+"""
+배정 로그
+ClassAssigner와 결과 출력 코드가 쓰는 'class_assigner' 로거와 배정 경고 기록.
+
+메시지는 print와 같은 모양(이모지, 들여쓰기)으로 출력 시점의 sys.stdout에 쓴다. 그래서
+GUI 실시간 로그(forward_output), 명령줄 -q(devnull), 테스트의 capsys처럼 표준 출력을 바꾸는
+기존 방식이 그대로 동작한다. 레벨을 WARNING 이상으로 올리면 INFO 메시지는 %-형식 인자를
+포맷하지 않으므로 반복문 안의 로그가 문자열을 만들지 않는다.
+
+레벨:
+    debug    반복문 안의 세부 진행 (그룹/학생 단위)
+    info     단계 시작/완료와 요약 (기본)
+    warning  배정 경고 (배정할 수 없는 학생, 명단에 없는 학생)
+    error    규칙 충돌, 실행 오류
+"""
+
+import contextlib
+import logging
+import sys
+from dataclasses import dataclass
+
+LOGGER_NAME = 'class_assigner'
+LOG_LEVELS = {
+    'debug': logging.DEBUG,
+    'info': logging.INFO,
+    'warning': logging.WARNING,
+    'error': logging.ERROR,
+}
+
+# 배정 경고 종류 → 로그 메시지 (%(name)s: 학생 이름, %(reason)s: 이유)
+WARNING_MESSAGES = {
+    'unplaceable': "   ⚠️  경고: %(name)s 학생을 배정할 수 없습니다 (%(reason)s)",
+    'missing_student': "   ⚠️  경고: '%(name)s' 학생을 명단에서 찾을 수 없습니다.",
+}
+
+
+@dataclass(frozen=True)
+class AssignmentWarning:
+    """배정 경고 한 건 (ClassAssigner.warnings)"""
+    kind: str  # 'unplaceable' (배정 불가) | 'missing_student' (규칙의 학생이 명단에 없음)
+    name: str  # 학생 이름
+    reason: str = ''  # 배정 불가 이유 (예: '분반 규칙 충돌')
+    stage: str = ''  # 경고가 난 단계 (run_metrics 단계 이름, run 밖이면 빈 문자열)
+
+    def message(self) -> str:
+        return (WARNING_MESSAGES[self.kind] % {'name': self.name, 'reason': self.reason}).strip()
+
+
+class StdoutHandler(logging.Handler):
+    """레코드를 출력 시점의 sys.stdout에 한 줄로 쓰는 핸들러 (redirect_stdout을 따름)"""
+
+    def emit(self, record: logging.LogRecord):
+        stream = sys.stdout
+        if stream is None:  # 콘솔 없는 실행 파일
+            return
+        try:
+            stream.write(self.format(record) + '\n')
+        except Exception:
+            self.handleError(record)
+
+
+def get_logger() -> logging.Logger:
+    """배정 로거 (처음 호출할 때 StdoutHandler 연결, 루트 로거로 전파하지 않음)"""
+    logger = logging.getLogger(LOGGER_NAME)
+    if not any(isinstance(handler, StdoutHandler) for handler in logger.handlers):
+        logger.addHandler(StdoutHandler())
+        logger.setLevel(logging.INFO)
+        logger.propagate = False
+    return logger
+
+
+def set_log_level(level) -> int:
+    """
+    로그 레벨 변경
+
+    Args:
+        level: LOG_LEVELS의 이름('debug', 'info', 'warning', 'error') 또는 logging 레벨 숫자
+
+    Returns:
+        이전 레벨
+    """
+    logger = get_logger()
+    previous = logger.level
+    logger.setLevel(LOG_LEVELS[level] if isinstance(level, str) else level)
+    return previous
+
+
+@contextlib.contextmanager
+def log_level(level):
+    """블록 안에서만 로그 레벨 변경 (명령줄 -q/--json, 일괄 실행 등)"""
+    previous = set_log_level(level)
+    try:
+        yield
+    finally:
+        set_log_level(previous)
@@ -0,0 +1,112 @@
+"""
+별도 프로세스에서 학급 편성 실행
+GUI 프로세스는 파이프로 진행 메시지만 받으므로 배정 계산 중에도 이벤트 루프가 멈추지 않는다.
+
+파이프 메시지 (자식 → 부모):
+    ('event', AssignmentEvent)        출력 한 줄 / 단계 시작 / 진행률
+    ('done', output_file, preview)    배정 완료 (preview: 결과 미리보기 ResultPreview)
+    ('cancelled',)                    취소 요청으로 중단 (결과 파일 없음)
+    ('error', message, detail)        배정 실패 (detail: traceback)
+"""
+
+import multiprocessing
+import traceback
+from typing import List, Optional
+
+from assignment_events import AssignmentCancelled, CancelToken, forward_output
+
+
+def solve_in_process(conn, student_file: str, rules_file: str, output_file: str,
+                     target_class_count: int, workers: Optional[int] = None, cancel_event=None,
+                     parsed_inputs=None, profile: Optional[str] = None):
+    """자식 프로세스 진입점: 배정을 실행하고 진행 상황을 파이프로 전송"""
+    from class_assigner import ClassAssigner
+    from result_preview import build_preview
+
+    def send(event):
+        conn.send(('event', event))
+
+    try:
+        with forward_output(send):
+            assigner = ClassAssigner(
+                student_file=student_file,
+                rules_file=rules_file,
+                target_class_count=target_class_count
+            )
+            assigner.run(output_file=output_file, workers=workers, event_sink=send,
+                         cancel_token=CancelToken(cancel_event) if cancel_event is not None else None,
+                         parsed_inputs=parsed_inputs, profile=profile)
+        conn.send(('done', output_file, build_preview(assigner)))
+    except AssignmentCancelled:
+        conn.send(('cancelled',))
+    except Exception as e:
+        conn.send(('error', str(e), traceback.format_exc()))
+    finally:
+        conn.close()
+
+
+class AssignmentProcess:
+    """
+    배정 작업 프로세스 핸들 (부모 프로세스 쪽)
+
+    start() 후 poll()을 주기적으로 호출해 메시지를 받는다. 'done', 'cancelled', 'error'를
+    받으면 finished가 True가 된다. 프로세스가 메시지 없이 종료되면 'error'로 보고한다.
+    cancel()은 협조적 취소를 요청하고, 응답이 없으면 terminate()로 강제 종료한다.
+    """
+
+    def __init__(self, student_file: str, rules_file: str, output_file: str,
+                 target_class_count: int, workers: Optional[int] = None, parsed_inputs=None,
+                 profile: Optional[str] = None):
+        """
+        parsed_inputs: 미리 읽어 둔 명단/규칙 (ParsedInputs). 주면 작업 프로세스가 파일을 다시 읽지 않음
+        profile: 진단용 프로파일 모드 (ClassAssigner.run 참고)
+        """
+        # GUI 프로세스에서 fork하면 Qt 상태가 복제되므로 항상 spawn 사용
+        context = multiprocessing.get_context('spawn')
+        self._conn, child_conn = context.Pipe(duplex=False)
+        self._cancel_event = context.Event()
+        # daemon 프로세스는 자식 프로세스를 만들 수 없으므로 병렬 xlsx 렌더링(workers)을 위해 daemon=False
+        self.process = context.Process(
+            target=solve_in_process,
+            args=(child_conn, student_file, rules_file, output_file, target_class_count, workers,
+                  self._cancel_event, parsed_inputs, profile),
+            daemon=False,
+        )
+        self._child_conn = child_conn
+        self.finished = False
+
+    def start(self):
+        self.process.start()
+        # 부모 쪽 송신 끝을 닫아야 자식 종료 시 EOFError로 감지 가능
+        self._child_conn.close()
+
+    def poll(self, limit: Optional[int] = None) -> List[tuple]:
+        """도착한 메시지를 최대 limit개까지 반환 (기다리지 않음)"""
+        messages = []
+        while not self.finished and (limit is None or len(messages) < limit):
+            try:
+                if not self._conn.poll():
+                    break
+                message = self._conn.recv()
+            except (EOFError, OSError):
+                self.process.join(timeout=1)
+                message = ('error', f"작업 프로세스가 비정상 종료되었습니다 (종료 코드: {self.process.exitcode})", '')
+            messages.append(message)
+            if message[0] in ('done', 'cancelled', 'error'):
+                self._finish()
+        return messages
+
+    def cancel(self):
+        """취소 요청 (작업 프로세스가 다음 확인 지점에서 'cancelled'를 보내고 종료)"""
+        self._cancel_event.set()
+
+    def terminate(self):
+        """작업 프로세스 강제 종료"""
+        if self.process.is_alive():
+            self.process.terminate()
+        self._finish()
+
+    def _finish(self):
+        self.finished = True
+        self.process.join(timeout=5)
+        self._conn.close()
@@ -0,0 +1,251 @@
+"""
+일괄 학급 편성
+여러 학교/학년의 배정을 한 번에 실행한다. 작업은 프로세스 풀에서 동시에 실행되며
+(작업 수 / CPU 수) × 작업 하나 시간에 가깝게 끝난다. 작업마다 시간 제한이 있고,
+한 작업의 실패가 다른 작업에 영향을 주지 않으며, 끝나면 전체 결과 보고서를 만든다.
+
+사용법:
+    python batch_runner.py 학교들/                      # 하위 폴더마다 명단/규칙 파일 한 쌍
+    python batch_runner.py manifest.csv -j 8 --timeout 120 --report report.json
+
+manifest.csv 컬럼 (name, output, classes, seed는 생략 가능, 경로는 manifest 파일 기준):
+    name,roster,rules,output,classes,seed
+    A초-6,A초/명단.xlsx,A초/규칙.xlsx,A초/결과.xlsx,7,
+"""
+
+import argparse
+import contextlib
+import csv
+import glob
+import json
+import multiprocessing
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass, field
+from typing import Callable, Dict, List, Optional
+
+from assignment_cli import DEFAULT_OUTPUT_NAME, EXIT_ERROR, EXIT_OK, run_assignment
+from input_readers import input_extensions
+from assignment_log import log_level
+
+# 보고서 CSV 컬럼
+REPORT_COLUMNS = ['name', 'status', 'exit_code', 'elapsed_sec', 'students', 'classes', 'output_files', 'error']
+
+
+@dataclass
+class BatchJob:
+    """배정 작업 하나 (학교/학년 하나)"""
+    name: str
+    student_file: str
+    rules_file: str
+    output_file: str
+    target_class_count: int = 7
+    seed: Optional[int] = None
+
+
+@dataclass
+class BatchReport:
+    """일괄 실행 결과 (작업별 run_assignment 결과 + 전체 소요 시간)"""
+    results: List[dict] = field(default_factory=list)
+    elapsed_sec: float = 0.0
+    workers: int = 1
+
+    def counts(self) -> Dict[str, int]:
+        counts: Dict[str, int] = {}
+        for result in self.results:
+            counts[result['status']] = counts.get(result['status'], 0) + 1
+        return counts
+
+    @property
+    def ok(self) -> bool:
+        return all(result['status'] == 'ok' for result in self.results)
+
+    def to_dict(self) -> dict:
+        return {
+            'jobs': len(self.results),
+            'counts': self.counts(),
+            'workers': self.workers,
+            'elapsed_sec': self.elapsed_sec,
+            'job_time_sum_sec': round(sum(r.get('elapsed_sec', 0.0) for r in self.results), 3),
+            'results': self.results,
+        }
+
+    def write(self, path: str):
+        """보고서 저장 (.csv면 작업당 한 행, 그 외는 JSON)"""
+        if path.lower().endswith('.csv'):
+            with open(path, 'w', newline='', encoding='utf-8-sig') as f:
+                writer = csv.DictWriter(f, fieldnames=REPORT_COLUMNS, extrasaction='ignore')
+                writer.writeheader()
+                for result in self.results:
+                    writer.writerow({**result, 'output_files': ';'.join(result.get('output_files', []))})
+        else:
+            with open(path, 'w', encoding='utf-8') as f:
+                json.dump(self.to_dict(), f, ensure_ascii=False, indent=2)
+
+
+def _find_file(directory: str, keyword: str) -> Optional[str]:
+    """폴더에서 이름에 keyword가 들어간 입력 파일 (xlsx/csv/parquet, 결과 파일, 임시 파일 제외)"""
+    candidates = sorted(
+        path for path in glob.glob(os.path.join(directory, '*'))
+        if os.path.splitext(path)[1].lower() in input_extensions()
+        and keyword in os.path.basename(path) and '결과' not in os.path.basename(path)
+        and not os.path.basename(path).startswith('~$')
+    )
+    return candidates[0] if candidates else None
+
+
+def load_manifest(path: str, target_class_count: int = 7) -> List[BatchJob]:
+    """
+    작업 목록 읽기
+
+    Args:
+        path: 폴더 (하위 폴더마다 이름에 '명단'/'규칙'이 들어간 xlsx/csv/parquet 파일 한 쌍) 또는 manifest CSV
+        target_class_count: classes 컬럼이 없을 때의 학급 수
+    """
+    jobs = []
+    if os.path.isdir(path):
+        for directory in sorted(d for d in glob.glob(os.path.join(path, '*')) if os.path.isdir(d)):
+            student_file, rules_file = _find_file(directory, '명단'), _find_file(directory, '규칙')
+            if student_file is None or rules_file is None:
+                continue
+            jobs.append(BatchJob(name=os.path.basename(directory), student_file=student_file,
+                                 rules_file=rules_file, output_file=os.path.join(directory, DEFAULT_OUTPUT_NAME),
+                                 target_class_count=target_class_count))
+    else:
+        base_dir = os.path.dirname(os.path.abspath(path))
+        with open(path, newline='', encoding='utf-8-sig') as f:
+            for line, row in enumerate(csv.DictReader(f), 2):
+                row = {k.strip(): (v or '').strip() for k, v in row.items() if k}
+                if not row.get('roster') or not row.get('rules'):
+                    raise ValueError(f"{path}:{line}: roster, rules 컬럼은 필수입니다")
+                student_file = os.path.join(base_dir, row['roster'])
+                name = row.get('name') or os.path.splitext(os.path.basename(student_file))[0]
+                output_file = (os.path.join(base_dir, row['output']) if row.get('output') else
+                               os.path.join(os.path.dirname(student_file), f'{name} 배정 결과.xlsx'))
+                jobs.append(BatchJob(name=name, student_file=student_file,
+                                     rules_file=os.path.join(base_dir, row['rules']), output_file=output_file,
+                                     target_class_count=int(row.get('classes') or target_class_count),
+                                     seed=int(row['seed']) if row.get('seed') else None))
+
+    outputs = [os.path.abspath(job.output_file) for job in jobs]
+    duplicates = sorted({p for p in outputs if outputs.count(p) > 1})
+    if duplicates:
+        raise ValueError(f"결과 파일이 겹치는 작업이 있습니다: {', '.join(duplicates)}")
+    return jobs
+
+
+def run_job(job: BatchJob, timeout: Optional[float] = None, log_dir: Optional[str] = None) -> dict:
+    """작업 하나 실행 (풀 작업 프로세스에서 호출, 진행 로그는 log_dir/<name>.log 또는 버림)"""
+    log_file = os.path.join(log_dir, f'{job.name}.log') if log_dir else os.devnull
+    with open(log_file, 'w', encoding='utf-8') as log, contextlib.redirect_stdout(log), \
+            log_level('info' if log_dir else 'error'):
+        result = run_assignment(job.student_file, job.rules_file, output_file=job.output_file,
+                                target_class_count=job.target_class_count, seed=job.seed, time_budget=timeout)
+    return {'name': job.name, **result}
+
+
+def _crashed(job: BatchJob, error: str) -> dict:
+    return {'name': job.name, 'status': 'error', 'exit_code': EXIT_ERROR, 'student_file': job.student_file,
+            'rules_file': job.rules_file, 'output_files': [], 'classes': job.target_class_count,
+            'elapsed_sec': 0.0, 'error': error}
+
+
+def run_batch(jobs: List[BatchJob], workers: Optional[int] = None, timeout: Optional[float] = None,
+              log_dir: Optional[str] = None, on_result: Optional[Callable[[dict], None]] = None) -> BatchReport:
+    """
+    작업들을 프로세스 풀에서 동시에 실행
+
+    Args:
+        workers: 동시 실행 프로세스 수 (None = CPU 수)
+        timeout: 작업당 시간 제한(초). 배정 취소와 같은 지점에서 확인하며 넘기면 해당 작업만 timeout
+        log_dir: 작업별 진행 로그 폴더
+        on_result: 작업이 끝날 때마다 결과(dict)로 호출 (진행 표시용)
+
+    Returns:
+        작업 순서대로 정렬된 결과 보고서
+    """
+    start = time.perf_counter()
+    workers = max(1, min(workers or os.cpu_count() or 1, len(jobs) or 1))
+    if log_dir:
+        os.makedirs(log_dir, exist_ok=True)
+    results: Dict[int, dict] = {}
+
+    def record(idx, result):
+        results[idx] = result
+        if on_result is not None:
+            on_result(result)
+
+    # 작업 프로세스가 비정상 종료되면(메모리 부족 등) 풀 전체가 깨지므로,
+    # 그때 끝나지 않은 작업은 하나씩 새 프로세스에서 다시 실행해 원인 작업만 실패로 기록
+    retry = []
+    context = multiprocessing.get_context('spawn')
+    with ProcessPoolExecutor(max_workers=workers, mp_context=context) as executor:
+        futures = {executor.submit(run_job, job, timeout, log_dir): idx for idx, job in enumerate(jobs)}
+        for future in as_completed(futures):
+            idx = futures[future]
+            try:
+                record(idx, future.result())
+            except BrokenProcessPool:
+                retry.append(idx)
+            except Exception as e:
+                record(idx, _crashed(jobs[idx], f"{type(e).__name__}: {e}"))
+
+    for idx in sorted(retry):
+        with ProcessPoolExecutor(max_workers=1, mp_context=context) as executor:
+            try:
+                record(idx, executor.submit(run_job, jobs[idx], timeout, log_dir).result())
+            except BrokenProcessPool:
+                record(idx, _crashed(jobs[idx], "작업 프로세스가 비정상 종료되었습니다"))
+            except Exception as e:
+                record(idx, _crashed(jobs[idx], f"{type(e).__name__}: {e}"))
+
+    return BatchReport(results=[results[idx] for idx in range(len(jobs))],
+                       elapsed_sec=round(time.perf_counter() - start, 3), workers=workers)
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="여러 학교/학년 학급 편성 일괄 실행")
+    parser.add_argument('manifest', help="작업 폴더 또는 manifest CSV")
+    parser.add_argument('-j', '--workers', type=int, help="동시 실행 프로세스 수 (기본: CPU 수)")
+    parser.add_argument('--timeout', type=float, metavar='SEC', help="작업당 시간 제한(초)")
+    parser.add_argument('-c', '--classes', type=int, default=7, help="manifest에 학급 수가 없을 때 기본값 (기본 7)")
+    parser.add_argument('--report', help="보고서 파일 (.json 또는 .csv)")
+    parser.add_argument('--log-dir', help="작업별 진행 로그 폴더")
+    args = parser.parse_args(argv)
+
+    try:
+        jobs = load_manifest(args.manifest, target_class_count=args.classes)
+    except (OSError, ValueError) as e:
+        print(f"❌ manifest를 읽을 수 없습니다: {e}", file=sys.stderr)
+        return 2
+    if not jobs:
+        print("❌ 실행할 작업이 없습니다", file=sys.stderr)
+        return 2
+
+    print(f"🎓 {len(jobs)}개 작업 일괄 실행")
+    done = []
+
+    def show(result):
+        done.append(result)
+        mark = '✅' if result['status'] == 'ok' else '❌'
+        detail = f" - {result['error']}" if result.get('error') else ''
+        print(f"   {mark} [{len(done)}/{len(jobs)}] {result['name']}: {result['status']} "
+              f"({result.get('elapsed_sec', 0):.2f}초){detail}", flush=True)
+
+    report = run_batch(jobs, workers=args.workers, timeout=args.timeout, log_dir=args.log_dir, on_result=show)
+    summary = report.to_dict()
+    counts = ', '.join(f'{status} {count}' for status, count in sorted(summary['counts'].items()))
+    print(f"\n📋 완료: {counts} · 전체 {report.elapsed_sec:.2f}초 "
+          f"(작업 시간 합 {summary['job_time_sum_sec']:.2f}초, 프로세스 {report.workers}개)")
+    if args.report:
+        report.write(args.report)
+        print(f"📁 보고서: {args.report}")
+    return EXIT_OK if report.ok else EXIT_ERROR
+
+
+if __name__ == '__main__':
+    multiprocessing.freeze_support()
+    sys.exit(main())
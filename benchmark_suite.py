@@ -0,0 +1,183 @@
+"""
+배정 성능 벤치마크
+학생 수 × 진급 학급 수 조합마다 가상 명단/규칙 파일(synthetic_inputs)을 만들고 전체 배정을 실행해
+단계별 시간(파일 읽기, 규칙 검증, Phase 1~5, 결과 생성)과 결과 출력 형식별 시간을 측정한다.
+결과는 JSON Lines 기록 파일에 추가하고, 저장해 둔 기준값보다 느려진 단계를 회귀로 표시한다.
+
+사용법:
+    python benchmark_suite.py                                   # 1천/1만/10만 명 × 7/40반 (10만 명은 수 분 걸림)
+    python benchmark_suite.py --sizes 1000 10000 -n 5 --history benchmark_history.jsonl
+    python benchmark_suite.py --baseline benchmark_baseline.json --save-baseline   # 기준값 저장
+    python benchmark_suite.py --baseline benchmark_baseline.json                   # 회귀 시 종료 코드 1
+"""
+
+import argparse
+import contextlib
+import json
+import os
+import platform
+import statistics
+import sys
+import tempfile
+import time
+from typing import Dict, List, Optional
+
+DEFAULT_SIZES = (1000, 10000, 100000)
+DEFAULT_CLASS_COUNTS = (7, 40)
+
+# 결과 출력 형식별 측정 (이름, get_writer 인자, workers)
+EXPORTERS = (
+    ('export_xlsx', 'xlsx', None),      # openpyxl
+    ('export_xlsx_xml', 'xlsx', 1),     # xlsx_writer (순차 렌더링)
+    ('export_csv', 'csv', None),
+    ('export_jsonl', 'jsonl', None),
+)
+
+
+def scenario_name(students: int, classes: int) -> str:
+    return f'{students}x{classes}'
+
+
+def run_scenario(students: int, classes: int, data_dir: str, repeats: int = 3, seed: int = 1) -> dict:
+    """
+    조합 하나 측정
+
+    Returns:
+        {'students', 'classes', 'separation_pairs', 'stages': {단계: {'min_ms', 'median_ms'}}, 'counters'}
+    """
+    from class_assigner import ClassAssigner
+    from result_writers import get_writer
+    from synthetic_inputs import SyntheticSpec, write_inputs
+
+    directory = os.path.join(data_dir, scenario_name(students, classes))
+    inputs = write_inputs(directory, SyntheticSpec(students=students, original_classes=classes,
+                                                   target_classes=classes, seed=seed))
+
+    samples: Dict[str, List[float]] = {}
+    counters = {}
+    for _ in range(repeats):
+        with open(os.devnull, 'w', encoding='utf-8') as devnull, contextlib.redirect_stdout(devnull):
+            start = time.perf_counter()
+            assigner = ClassAssigner(inputs.student_file, inputs.rules_file, target_class_count=classes, seed=seed)
+            assigner.run(os.path.join(directory, 'result.xlsx'))
+            samples.setdefault('pipeline', []).append(time.perf_counter() - start)
+            for stage, timing in assigner.metrics.stages.items():
+                samples.setdefault(stage, []).append(timing.wall_sec)
+            counters = dict(assigner.metrics.counters)
+
+            for stage, writer, workers in EXPORTERS:
+                writer = get_writer(writer, workers=workers)
+                start = time.perf_counter()
+                writer.write(assigner, os.path.join(directory, f'{stage}{writer.extension}'))
+                samples.setdefault(stage, []).append(time.perf_counter() - start)
+
+    return {
+        'students': students,
+        'classes': classes,
+        'separation_pairs': len(inputs.separation_pairs),
+        'stages': {stage: {'min_ms': round(min(values) * 1000, 2),
+                           'median_ms': round(statistics.median(values) * 1000, 2)}
+                   for stage, values in samples.items()},
+        'counters': counters,
+    }
+
+
+def run_suite(sizes=DEFAULT_SIZES, class_counts=DEFAULT_CLASS_COUNTS, repeats: int = 3,
+              data_dir: Optional[str] = None, on_scenario=None) -> dict:
+    """모든 조합 측정 (data_dir가 없으면 임시 폴더에 입력 파일 생성 후 삭제)"""
+    result = {
+        'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S'),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'cpu_count': os.cpu_count(),
+        'repeats': repeats,
+        'scenarios': {},
+    }
+    with (tempfile.TemporaryDirectory() if data_dir is None else contextlib.nullcontext(data_dir)) as directory:
+        for students in sizes:
+            for classes in class_counts:
+                scenario = run_scenario(students, classes, directory, repeats=repeats)
+                result['scenarios'][scenario_name(students, classes)] = scenario
+                if on_scenario is not None:
+                    on_scenario(scenario)
+    return result
+
+
+def find_regressions(result: dict, baseline: dict, tolerance: float = 0.2,
+                     min_delta_ms: float = 5.0) -> List[dict]:
+    """
+    기준값보다 느려진 단계 목록 (중앙값 비교, 기준값에 없는 조합/단계는 건너뜀)
+
+    Args:
+        tolerance: 허용 비율 (0.2 = 기준값의 120%까지 허용)
+        min_delta_ms: 이보다 작은 차이는 측정 잡음으로 보고 무시
+    """
+    regressions = []
+    for name, scenario in result['scenarios'].items():
+        base_stages = baseline.get('scenarios', {}).get(name, {}).get('stages', {})
+        for stage, timing in scenario['stages'].items():
+            if stage not in base_stages:
+                continue
+            before, after = base_stages[stage]['median_ms'], timing['median_ms']
+            if after > before * (1 + tolerance) and after - before >= min_delta_ms:
+                regressions.append({'scenario': name, 'stage': stage, 'baseline_ms': before, 'median_ms': after,
+                                    'change': round(after / before - 1, 3) if before else None})
+    return regressions
+
+
+def format_scenario(scenario: dict) -> str:
+    lines = [f"\n📊 학생 {scenario['students']:,}명 × {scenario['classes']}반 "
+             f"(분반 {scenario['separation_pairs']:,}쌍)",
+             f"   {'단계':<34}{'최소(ms)':>12}{'중앙값(ms)':>12}"]
+    for stage, timing in scenario['stages'].items():
+        lines.append(f"   {stage:<34}{timing['min_ms']:>12,.1f}{timing['median_ms']:>12,.1f}")
+    return '\n'.join(lines)
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="배정 단계별 성능 벤치마크")
+    parser.add_argument('--sizes', type=int, nargs='+', default=list(DEFAULT_SIZES), help="학생 수 목록")
+    parser.add_argument('--classes', type=int, nargs='+', default=list(DEFAULT_CLASS_COUNTS), help="진급 학급 수 목록")
+    parser.add_argument('-n', '--repeats', type=int, default=3, help="조합별 반복 횟수 (기본 3)")
+    parser.add_argument('--data-dir', help="가상 입력/결과 파일 폴더 (기본: 임시 폴더)")
+    parser.add_argument('--history', help="결과를 추가할 JSON Lines 파일")
+    parser.add_argument('--baseline', help="기준값 JSON 파일 (있으면 회귀 검사)")
+    parser.add_argument('--save-baseline', action='store_true', help="이번 결과를 --baseline 파일에 저장")
+    parser.add_argument('--tolerance', type=float, default=0.2, help="회귀 판정 허용 비율 (기본 0.2 = 20%%)")
+    parser.add_argument('--min-delta-ms', type=float, default=5.0, help="회귀로 보지 않는 최소 차이(ms)")
+    args = parser.parse_args(argv)
+    if args.save_baseline and not args.baseline:
+        parser.error("--save-baseline에는 --baseline 파일이 필요합니다")
+
+    print(f"🎓 배정 벤치마크: 학생 {args.sizes} × 학급 {args.classes}, {args.repeats}회 반복")
+    result = run_suite(args.sizes, args.classes, repeats=args.repeats, data_dir=args.data_dir,
+                       on_scenario=lambda scenario: print(format_scenario(scenario), flush=True))
+
+    if args.history:
+        with open(args.history, 'a', encoding='utf-8') as f:
+            f.write(json.dumps(result, ensure_ascii=False) + '\n')
+        print(f"\n📁 기록 추가: {args.history}")
+
+    if args.save_baseline:
+        with open(args.baseline, 'w', encoding='utf-8') as f:
+            json.dump(result, f, ensure_ascii=False, indent=2)
+        print(f"📁 기준값 저장: {args.baseline}")
+        return 0
+    if args.baseline:
+        if not os.path.exists(args.baseline):
+            print(f"⚠️  기준값 파일이 없습니다: {args.baseline} (--save-baseline으로 저장)")
+            return 0
+        with open(args.baseline, encoding='utf-8') as f:
+            regressions = find_regressions(result, json.load(f), args.tolerance, args.min_delta_ms)
+        if regressions:
+            print(f"\n❌ 성능 회귀 {len(regressions)}건")
+            for r in regressions:
+                print(f"   {r['scenario']} {r['stage']}: {r['baseline_ms']:,.1f}ms → {r['median_ms']:,.1f}ms "
+                      f"(+{r['change']:.0%})")
+            return 1
+        print("\n✅ 기준값 대비 성능 회귀 없음")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -3,20 +3,74 @@
 5학년 152명의 학생을 7개 반으로 균등하게 배정하는 시스템
 """
 
-import pandas as pd
-import numpy as np
 from dataclasses import dataclass, field
-from typing import List, Dict, Set, Tuple, Optional
+from typing import Callable, List, Dict, Set, Tuple, Optional, TYPE_CHECKING
 import random
 from collections import defaultdict, Counter
-import openpyxl
-from openpyxl.utils.dataframe import dataframe_to_rows
-from openpyxl.styles import PatternFill, Border, Side, Alignment, Font
-from openpyxl.comments import Comment
+import contextlib
+import logging
 import os
 import sys
-import tkinter as tk
-from tkinter import filedialog, messagebox
+
+from assignment_events import AssignmentCancelled, AssignmentEvent, CancelToken, EventSink, forward_output
+from assignment_log import WARNING_MESSAGES, AssignmentWarning, get_logger
+
+# pandas/numpy/openpyxl/tkinter는 처음 사용할 때 import (GUI/CLI 시작 시간 단축)
+if TYPE_CHECKING:
+    from assignment_audit import AuditReport
+    from parsed_inputs import ParsedInputs
+    from quality_report import QualityReport
+    from run_metrics import RunMetrics
+
+# 진행 메시지 로거 (assignment_log 참고, 기본 INFO 레벨로 sys.stdout에 출력)
+log = get_logger()
+
+# 배정 검증 위반 중 로그에 보여줄 최대 건수 (전체는 audit_report)
+AUDIT_LOG_LIMIT = 20
+
+# 출력 컬럼 (반별 시트)
+OUTPUT_COLUMNS = ['학년', '반', '번호', '이름', '성별', '점수', '특수반', '전출', '난이도', '비고',
+                  '원학년', '원반', '원번호']
+# 가운데 정렬이 필요한 컬럼 번호 (1부터 시작)
+# 학년(1), 반(2), 번호(3), 이름(4), 성별(5), 특수반(7), 전출(8), 원학년(11), 원반(12), 원번호(13)
+CENTER_COLUMNS = {1, 2, 3, 4, 5, 7, 8, 11, 12, 13}
+
+HEADER_COLOR = "E0E0E0"  # 헤더 색상 (연한 회색)
+TOGETHER_COLOR = "CCFFFF"  # 합반 규칙 색상 (연한 파란색)
+
+# 색상 팔레트 (30개 - 분반 쌍별 구분, 부족하면 재사용)
+COLOR_PALETTE = [
+    "FFFF99", "FFCC99", "CCFFCC", "FFCCFF", "E6CCFF",
+    "FFE6CC", "E6E6E6", "FFE6E6", "E6FFE6", "FFE6F0",
+    "F0E6FF", "E6F0FF", "FFF0E6", "F0FFE6", "FFE6FF",
+    "E6FFFF", "FFFFDD", "FFDDDD", "DDFFDD", "DDDDFF",
+    "FFDDFF", "DDFFFF", "FFFFEE", "FFEEFF", "EEFFEE",
+    "EEEEFF", "FFEEDD", "DDEEFF", "EEFFDD", "FFDDEE",
+]
+
+COMMENT_AUTHOR = "AutoAssigner"
+
+
+@dataclass
+class SheetSpec:
+    """출력 시트 하나의 렌더링 명세 (openpyxl / 병렬 xlsx 렌더러 공용)"""
+    title: str
+    header: List[str]
+    rows: List[list]
+    kind: str = 'class'  # 'class' (반별 시트) 또는 'summary' (요약 시트)
+    row_fills: List[Tuple[str, ...]] = field(default_factory=list)  # 행별 색상 (빈 튜플이면 색상 없음)
+    comments: Dict[Tuple[int, int], str] = field(default_factory=dict)  # (행, 열) → 메모 내용
+    column_widths: Dict[str, float] = field(default_factory=dict)
+
+
+def is_missing(value) -> bool:
+    """결측값 판정 (스칼라에 대한 pd.isna와 같음, pandas 없이 동작)"""
+    if value is None:
+        return True
+    try:
+        return bool(value != value)  # NaN, NaT
+    except TypeError:
+        return True  # pd.NA는 비교 결과를 bool로 바꿀 수 없음
 
 
 @dataclass
@@ -40,20 +94,20 @@ class Student:
 
     def __post_init__(self):
         # NaN 처리
-        if pd.isna(self.특수반):
+        if is_missing(self.특수반):
             self.특수반 = False
         else:
             self.특수반 = bool(self.특수반)
 
-        if pd.isna(self.전출):
+        if is_missing(self.전출):
             self.전출 = False
         else:
             self.전출 = bool(self.전출)
 
-        if pd.isna(self.난이도):
+        if is_missing(self.난이도):
             self.난이도 = 0.0
 
-        if pd.isna(self.비고):
+        if is_missing(self.비고):
             self.비고 = ""
 
     def effective_count(self) -> int:
@@ -63,13 +117,214 @@ class Student:
         return 3 if self.특수반 else 1
 
 
+# 명단 xlsx 리더: openpyxl (읽기 전용 스트리밍, 기본) / pandas (시트마다 DataFrame)
+STUDENT_READERS = ('openpyxl', 'pandas')
+
+
+def read_students(student_file: str, checkpoint: Optional[Callable[..., None]] = None,
+                  reader: str = 'openpyxl') -> List[Student]:
+    """
+    학생 명단 파일의 모든 시트 파싱 (필수 컬럼이 없는 시트는 건너뜀)
+
+    CSV / Parquet 명단은 확장자로 구분해 input_readers의 표 형식 입력기로 읽는다.
+
+    Args:
+        student_file: 학생 명단 파일 경로
+        checkpoint: 시트/행마다 호출할 함수 (취소 확인, 진행률 보고용)
+        reader: xlsx 명단 리더. 'openpyxl'이면 행을 바로 Student로 바꾸는 스트리밍 리더(input_readers),
+            'pandas'면 read_excel
+    """
+    if reader not in STUDENT_READERS:
+        raise ValueError(f"지원하지 않는 명단 리더: {reader} (지원: {', '.join(STUDENT_READERS)})")
+    from input_readers import reader_for
+    table_reader = reader_for(student_file)
+    if table_reader is not None:
+        return table_reader.read_students(student_file, checkpoint=checkpoint)
+    if reader == 'openpyxl':
+        from input_readers import stream_xlsx_students
+        return stream_xlsx_students(student_file, checkpoint=checkpoint)
+
+    if checkpoint is None:
+        checkpoint = lambda done=0, total=0: None
+
+    import pandas as pd
+    from input_readers import student_from_row
+
+    all_students = []
+    try:
+        xl = pd.ExcelFile(student_file)
+        sheet_names = xl.sheet_names
+        log.info("   ℹ️  감지된 시트: %s", sheet_names)
+    except Exception as e:
+        log.error("   ❌ 파일 읽기 오류: %s", e)
+        raise
+
+    for sheet_idx, sheet_name in enumerate(sheet_names):
+        checkpoint(sheet_idx, len(sheet_names))
+        try:
+            # 숫자나 '-'가 포함된 시트만 반 정보로 간주 (필요 시 로직 강화 가능)
+            # 현재는 모든 시트를 시도하되, 데이터 구조가 안 맞으면 스킵하는 방식이 안전할 수 있음
+            df = pd.read_excel(student_file, sheet_name=sheet_name)
+
+            # 필수 컬럼 확인
+            required_cols = ['학년', '반', '번호', '이름']
+            if not all(col in df.columns for col in required_cols):
+                log.warning("   ⚠️  Skipping sheet '%s': 필수 컬럼 누락", sheet_name)
+                continue
+
+
+        except Exception as e:
+            log.warning("   ⚠️  Error reading sheet '%s': %s", sheet_name, e)
+            continue
+
+        for _, row in df.iterrows():
+            checkpoint()
+            all_students.append(student_from_row(row))
+
+
+    return all_students
+
+
+def read_rules(rules_file: str) -> Tuple[List[Tuple[str, str]], List[Set[str]]]:
+    """
+    분반/합반 규칙 파일(Sheet1) 파싱 (CSV / Parquet은 input_readers의 표 형식 규칙)
+
+    Returns:
+        (분반 쌍 목록, 합반 그룹 목록)
+    """
+    from input_readers import reader_for
+    table_reader = reader_for(rules_file)
+    if table_reader is not None:
+        return table_reader.read_rules(rules_file)
+
+    import pandas as pd
+
+    df = pd.read_excel(rules_file, sheet_name='Sheet1')
+
+    # 분반 규칙 파싱 (첫 5개 열)
+    separation_pairs = []
+    for idx, row in df.iterrows():
+        if idx == 0:  # 헤더 행 스킵
+            continue
+
+        student1_name = row['Unnamed: 1']
+        student2_name = row['Unnamed: 4']
+
+        if pd.notna(student1_name) and pd.notna(student2_name):
+            separation_pairs.append((student1_name, student2_name))
+
+    # 합반 규칙 파싱 (마지막 5개 열)
+    together_groups = []
+    current_group = set()
+    for idx, row in df.iterrows():
+        if idx == 0:  # 헤더 행 스킵
+            continue
+
+        student1_name = row['Unnamed: 7']  # 왼쪽 이름
+        student2_name = row['Unnamed: 10']  # 오른쪽 이름
+
+        # 왼쪽 또는 오른쪽에 학생 이름이 있으면 그룹에 추가
+        if pd.notna(student1_name) or pd.notna(student2_name):
+            if pd.notna(student1_name):
+                current_group.add(student1_name)
+            if pd.notna(student2_name):
+                current_group.add(student2_name)
+        else:
+            # 둘 다 비어있으면 그룹 종료
+            if current_group:
+                together_groups.append(current_group)
+                current_group = set()
+
+    if current_group:
+        together_groups.append(current_group)
+
+    return separation_pairs, together_groups
+
+
+def find_rule_conflicts(students: List[Student], separation_rules: Dict[str, Set[str]],
+                        together_groups: List[Set[str]]) -> List[str]:
+    """
+    규칙 간 논리적 모순 목록 (없으면 빈 목록)
+
+    Args:
+        students: 학생 목록 (동명이인 확인용)
+        separation_rules: 이름 → 분반해야 하는 이름 집합 (양방향)
+        together_groups: 합반 그룹 목록
+    """
+    conflicts = []
+
+    # 학생 명단에서 이름별 인원수 계산 (동명이인 확인용)
+    name_counts = Counter(s.이름 for s in students)
+
+    # 1. 합반 그룹 내부에서 분반 규칙 검사
+    for group in together_groups:
+        for name1 in group:
+            for name2 in group:
+                if name1 != name2 and name2 in separation_rules.get(name1, set()):
+                    conflicts.append(f"❌ 충돌: {name1}와 {name2}는 합반해야 하지만 동시에 분반해야 함")
+
+    # 2. 합반 그룹 내부에서 동명이인 검사 (학생 명단 기준)
+    for group in together_groups:
+        for name in group:
+            if name_counts[name] > 1:
+                conflicts.append(f"❌ 충돌: '{name}' 학생은 동명이인({name_counts[name]}명)이므로 합반 규칙에 포함될 수 없음")
+
+    return conflicts
+
+
+class RuleConflictError(ValueError):
+    """분반/합반 규칙이 서로 모순되어 배정할 수 없음"""
+
+    def __init__(self, message: str, conflicts: List[str]):
+        super().__init__(message)
+        self.conflicts = conflicts
+
+
 class ClassAssigner:
     """학급 편성 시스템"""
 
-    def __init__(self, student_file: str, rules_file: str, target_class_count: int = 7):
+    # 배정 순서를 정하는 난수 생성기 (seed를 주지 않으면 전역 random 모듈)
+    rng = random
+
+    # 진행 이벤트를 받을 함수 / 취소 토큰 (run의 event_sink, cancel_token 참고)
+    event_sink: Optional[EventSink] = None
+    cancel_token: Optional[CancelToken] = None
+
+    # 마지막 run의 단계별 시간/카운터 (run 밖에서 단계 메서드를 직접 호출하면 기록 안 함)
+    metrics: Optional['RunMetrics'] = None
+
+    # 마지막 run의 개선 엔진 기록 (assignment_engines.optimize 참고, greedy면 None)
+    engine_trace: Optional[List[dict]] = None
+
+    # 마지막 run의 프로파일 파일 (run의 profile 참고, 프로파일하지 않았으면 빈 목록)
+    profile_files: List[str] = []
+
+    # 마지막 run의 배정 경고 (배정할 수 없는 학생 등, run 밖에서 단계 메서드를 직접 호출하면 None)
+    warnings: Optional[List[AssignmentWarning]] = None
+
+    # 마지막 배정 검증 결과 (audit 참고, run이 결과 생성 전에 실행)
+    audit_report: Optional['AuditReport'] = None
+
+    # 마지막 결과 출력 시 계산한 품질 보고서 (generate_output 참고)
+    quality_report: Optional['QualityReport'] = None
+
+    # 진행률 계산용 현재 단계 (run 밖에서 단계 메서드를 직접 호출하면 0)
+    _step: int = 0
+    _total_steps: int = 0
+    _progress_percent: int = -1
+    _stage_name: str = ''
+
+    # generate_output 중에는 출력 전에 계산한 품질 보고서를 build_sheet_specs가 그대로 사용
+    _reuse_quality_report: bool = False
+
+    def __init__(self, student_file: str, rules_file: str, target_class_count: int = 7,
+                 seed: Optional[int] = None):
         self.student_file = student_file
         self.rules_file = rules_file
         self.target_class_count = target_class_count
+        if seed is not None:
+            # 같은 입력과 seed면 항상 같은 결과 (Phase 1은 규칙 집합을 이름순으로 순회해 해시 seed와 무관)
+            self.rng = random.Random(seed)
         self.students: List[Student] = []
         self.classes: Dict[int, List[Student]] = {i: [] for i in range(1, self.target_class_count + 1)}
 
@@ -78,65 +333,34 @@ class ClassAssigner:
         self.separation_pairs: List[Tuple[str, str]] = []  # 분반 쌍 (색상 구분용)
         self.together_groups: List[Set[str]] = []  # 합반 규칙
 
-        print("=" * 70)
-        print("🎓 자동 학급 편성 프로그램 시작")
-        print("=" * 70)
+        log.info("=" * 70)
+        log.info("🎓 자동 학급 편성 프로그램 시작")
+        log.info("=" * 70)
 
-    def load_students(self):
-        """모든 시트에서 학생 데이터 로드"""
-        print("\n📚 Step 0: 학생 데이터 로드 중...")
+    def load_students(self, students: Optional[List[Student]] = None):
+        """
+        모든 시트에서 학생 데이터 로드
 
-        all_students = []
-        try:
-            xl = pd.ExcelFile(self.student_file)
-            sheet_names = xl.sheet_names
-            print(f"   ℹ️  감지된 시트: {sheet_names}")
-        except Exception as e:
-            print(f"   ❌ 파일 읽기 오류: {e}")
-            raise
+        Args:
+            students: 미리 읽어 둔 학생 목록 (ParsedInputs). 주면 파일을 다시 읽지 않음
+        """
+        log.info("\n📚 Step 0: 학생 데이터 로드 중...")
 
-        for sheet_name in sheet_names:
-            try:
-                # 숫자나 '-'가 포함된 시트만 반 정보로 간주 (필요 시 로직 강화 가능)
-                # 현재는 모든 시트를 시도하되, 데이터 구조가 안 맞으면 스킵하는 방식이 안전할 수 있음
-                df = pd.read_excel(self.student_file, sheet_name=sheet_name)
-                
-                # 필수 컬럼 확인
-                required_cols = ['학년', '반', '번호', '이름']
-                if not all(col in df.columns for col in required_cols):
-                    print(f"   ⚠️  Skipping sheet '{sheet_name}': 필수 컬럼 누락")
-                    continue
-
-
-            except Exception as e:
-                print(f"   ⚠️  Error reading sheet '{sheet_name}': {e}")
-                continue
-
-            for _, row in df.iterrows():
-                student = Student(
-                    학년=int(row['학년']),
-                    원반=int(row['반']),
-                    원번호=int(row['번호']),
-                    이름=str(row['이름']),
-                    성별=str(row['성별']),
-                    점수=float(row['점수']),
-                    특수반=row['특수반'],
-                    전출=row['전출'],
-                    난이도=row['난이도'],
-                    비고=row['비고']
-                )
-                all_students.append(student)
-
-        self.students = all_students
+        if students is None:
+            students = read_students(self.student_file, checkpoint=self._checkpoint)
+        else:
+            log.info("   ℹ️  미리 읽어 둔 명단 사용")
+        self.students = students
 
         # 성별별 등수 계산
         self._calculate_ranks()
 
-        print(f"   ✅ 총 {len(self.students)}명의 학생 데이터 로드 완료")
-        print(f"   - 남학생: {sum(1 for s in self.students if s.성별 == '남')}명")
-        print(f"   - 여학생: {sum(1 for s in self.students if s.성별 == '여')}명")
-        print(f"   - 특수반: {sum(1 for s in self.students if s.특수반)}명")
-        print(f"   - 전출생: {sum(1 for s in self.students if s.전출)}명")
+        log.info("   ✅ 총 %d명의 학생 데이터 로드 완료", len(self.students))
+        if log.isEnabledFor(logging.INFO):  # 집계는 출력할 때만
+            log.info("   - 남학생: %d명", sum(1 for s in self.students if s.성별 == '남'))
+            log.info("   - 여학생: %d명", sum(1 for s in self.students if s.성별 == '여'))
+            log.info("   - 특수반: %d명", sum(1 for s in self.students if s.특수반))
+            log.info("   - 전출생: %d명", sum(1 for s in self.students if s.전출))
 
     def _calculate_ranks(self):
         """성별별 등수 계산"""
@@ -152,94 +376,52 @@ class ClassAssigner:
         for rank, student in enumerate(females, 1):
             student.rank = rank
 
-    def load_rules(self):
-        """분반/합반 규칙 로드 및 검증"""
-        print("\n📋 Step 1: 분반/합반 규칙 로드 중...")
-
-        df = pd.read_excel(self.rules_file, sheet_name='Sheet1')
-
-        # 분반 규칙 파싱 (첫 5개 열)
-        separation_count = 0
-        for idx, row in df.iterrows():
-            if idx == 0:  # 헤더 행 스킵
-                continue
-
-            student1_class = row['분반해야하는 학생']
-            student1_name = row['Unnamed: 1']
-            student2_class = row['Unnamed: 3']
-            student2_name = row['Unnamed: 4']
-
-            if pd.notna(student1_name) and pd.notna(student2_name):
-                self.separation_rules[student1_name].add(student2_name)
-                self.separation_rules[student2_name].add(student1_name)
-                self.separation_pairs.append((student1_name, student2_name))  # 쌍 저장
-                separation_count += 1
-
-        # 합반 규칙 파싱 (마지막 5개 열)
-        together_count = 0
-        current_group = set()
-        for idx, row in df.iterrows():
-            if idx == 0:  # 헤더 행 스킵
-                continue
+    def load_rules(self, rules: Optional[Tuple[List[Tuple[str, str]], List[Set[str]]]] = None):
+        """
+        분반/합반 규칙 로드 및 검증
 
-            student1_name = row['Unnamed: 7']  # 왼쪽 이름
-            student2_name = row['Unnamed: 10']  # 오른쪽 이름
+        Args:
+            rules: 미리 읽어 둔 (분반 쌍 목록, 합반 그룹 목록). 주면 파일을 다시 읽지 않음
+        """
+        log.info("\n📋 Step 1: 분반/합반 규칙 로드 중...")
 
-            # 왼쪽 또는 오른쪽에 학생 이름이 있으면 그룹에 추가
-            if pd.notna(student1_name) or pd.notna(student2_name):
-                if pd.notna(student1_name):
-                    current_group.add(student1_name)
-                if pd.notna(student2_name):
-                    current_group.add(student2_name)
-            else:
-                # 둘 다 비어있으면 그룹 종료
-                if current_group:
-                    self.together_groups.append(current_group)
-                    together_count += len(current_group)
-                    current_group = set()
+        if rules is None:
+            separation_pairs, together_groups = read_rules(self.rules_file)
+        else:
+            separation_pairs, together_groups = rules
+            together_groups = [set(group) for group in together_groups]
 
-        if current_group:
-            self.together_groups.append(current_group)
-            together_count += len(current_group)
+        for student1_name, student2_name in separation_pairs:
+            self.separation_rules[student1_name].add(student2_name)
+            self.separation_rules[student2_name].add(student1_name)
+            self.separation_pairs.append((student1_name, student2_name))  # 쌍 저장
+        self.together_groups.extend(together_groups)
 
-        print(f"   ✅ 분반 규칙: {separation_count}쌍")
-        print(f"   ✅ 합반 규칙: {len(self.together_groups)}그룹 ({together_count}명)")
+        log.info("   ✅ 분반 규칙: %d쌍", len(separation_pairs))
+        log.info("   ✅ 합반 규칙: %d그룹 (%d명)", len(self.together_groups),
+                 sum(len(group) for group in together_groups))
 
         # 규칙 충돌 검증
-        self._validate_rules()
+        with self._stage('_validate_rules'):
+            self._validate_rules()
 
     def _validate_rules(self):
         """규칙 간 논리적 모순 검증"""
-        print("   🔍 규칙 충돌 검증 중...")
-
-        conflicts = []
+        log.info("   🔍 규칙 충돌 검증 중...")
 
-        # 학생 명단에서 이름별 인원수 계산 (동명이인 확인용)
-        name_counts = Counter(s.이름 for s in self.students)
-
-        # 1. 합반 그룹 내부에서 분반 규칙 검사
-        for group in self.together_groups:
-            for name1 in group:
-                for name2 in group:
-                    if name1 != name2 and name2 in self.separation_rules.get(name1, set()):
-                        conflicts.append(f"❌ 충돌: {name1}와 {name2}는 합반해야 하지만 동시에 분반해야 함")
-
-        # 2. 합반 그룹 내부에서 동명이인 검사 (학생 명단 기준)
-        for group in self.together_groups:
-            for name in group:
-                if name_counts[name] > 1:
-                    conflicts.append(f"❌ 충돌: '{name}' 학생은 동명이인({name_counts[name]}명)이므로 합반 규칙에 포함될 수 없음")
+        conflicts = find_rule_conflicts(self.students, self.separation_rules, self.together_groups)
 
         if conflicts:
-            print("\n" + "=" * 70)
-            print("⚠️  규칙 충돌 발견!")
-            print("=" * 70)
+            log.error("\n" + "=" * 70)
+            log.error("⚠️  규칙 충돌 발견!")
+            log.error("=" * 70)
             for conflict in conflicts:
-                print(conflict)
-            print("\n💡 해결 방법: '02 분반 합반할 학생 규칙.xlsx' 파일을 수정해주세요.")
-            raise ValueError("규칙 충돌이 발견되었습니다. 위의 충돌을 해결한 후 다시 실행해주세요.")
+                log.error(conflict)
+            log.error("\n💡 해결 방법: '02 분반 합반할 학생 규칙.xlsx' 파일을 수정해주세요.")
+            raise RuleConflictError("규칙 충돌이 발견되었습니다. 위의 충돌을 해결한 후 다시 실행해주세요.",
+                                    conflicts)
 
-        print("   ✅ 규칙 충돌 없음 - 모든 규칙이 논리적으로 일관됨")
+        log.info("   ✅ 규칙 충돌 없음 - 모든 규칙이 논리적으로 일관됨")
 
     def _find_student_by_name(self, name: str) -> Optional[Student]:
         """이름으로 학생 찾기"""
@@ -259,6 +441,8 @@ class ClassAssigner:
 
     def _can_assign(self, student: Student, class_num: int) -> bool:
         """학생을 특정 반에 배정할 수 있는지 검사 (분반 규칙 체크)"""
+        if self.metrics is not None:
+            self.metrics.counters['can_assign_calls'] += 1
         # 이미 해당 반에 있는 학생들의 이름 목록
         students_in_class = [s.이름 for s in self.classes[class_num]]
 
@@ -282,10 +466,11 @@ class ClassAssigner:
             for alternative_class in range(1, self.target_class_count + 1):
                 if alternative_class != class_num and self._can_assign(student, alternative_class):
                     class_num = alternative_class
+                    self._count('alternative_class_fallbacks')
                     break
             else:
                 # 어느 반에도 배정할 수 없음 - 오류
-                print(f"   ⚠️  경고: {student.이름} 학생을 배정할 수 없습니다 (분반 규칙 충돌)")
+                self._warn('unplaceable', student.이름, '분반 규칙 충돌')
                 return
 
         student.assigned_class = class_num
@@ -296,18 +481,20 @@ class ClassAssigner:
 
     def phase1_apply_rules(self):
         """Phase 1: 분반/합반 규칙 적용"""
-        print("\n🎯 Phase 1: 분반/합반 규칙 적용 중...")
+        log.info("\n🎯 Phase 1: 분반/합반 규칙 적용 중...")
 
         # 먼저 합반 그룹 배정 (제약이 더 강함)
+        rule_total = len(self.together_groups) + len(self.separation_rules)
         for group_idx, group in enumerate(self.together_groups):
-            # 그룹의 모든 학생 찾기
+            self._checkpoint(group_idx, rule_total)
+            # 그룹의 모든 학생 찾기 (집합 순서는 문자열 해시에 따라 달라지므로 이름순)
             group_students = []
-            for name in group:
+            for name in sorted(group):
                 student = self._find_student_by_name(name)
                 if student:
                     group_students.append(student)
                 else:
-                    print(f"   ⚠️  경고: '{name}' 학생을 명단에서 찾을 수 없습니다.")
+                    self._warn('missing_student', name)
 
             if group_students:
                 # 학생 수가 가장 적은 반에 배정
@@ -317,11 +504,14 @@ class ClassAssigner:
                 for student in group_students:
                     self._assign_student(student, target_class, lock=True)
 
-                print(f"   ✅ 합반 그룹 {group_idx + 1}: {[s.이름 for s in group_students]} → {target_class}반")
+                if log.isEnabledFor(logging.DEBUG):
+                    log.debug("   ✅ 합반 그룹 %d: %s → %d반", group_idx + 1, [s.이름 for s in group_students],
+                              target_class)
 
         # 분반 규칙 적용 (이미 배정된 학생들 고려)
         separation_applied = 0
-        for name1, names_to_avoid in self.separation_rules.items():
+        for rule_idx, (name1, names_to_avoid) in enumerate(self.separation_rules.items(), len(self.together_groups)):
+            self._checkpoint(rule_idx, rule_total)
             student1 = self._find_student_by_name(name1)
             if not student1:
                 continue
@@ -335,8 +525,8 @@ class ClassAssigner:
                 self._assign_student(student1, target_class, lock=True)
                 separation_applied += 1
 
-            # student1과 분반 규칙이 있는 학생들을 다른 반에 배정
-            for name2 in names_to_avoid:
+            # student1과 분반 규칙이 있는 학생들을 다른 반에 배정 (이름순, 프로세스마다 같은 순서)
+            for name2 in sorted(names_to_avoid):
                 student2 = self._find_student_by_name(name2)
                 if student2 and student2.assigned_class is None:
                     # student1과 다른 반 중 유효 인원이 가장 적은 반 선택
@@ -349,27 +539,28 @@ class ClassAssigner:
                     separation_applied += 1
 
         assigned_count = sum(1 for s in self.students if s.assigned_class is not None)
-        print(f"   ✅ Phase 1 완료: {assigned_count}명 배정됨")
+        log.info("   ✅ Phase 1 완료: %d명 배정됨", assigned_count)
 
     def phase2_distribute_special_needs(self):
         """Phase 2: 특수반 학생 균등 배치"""
-        print("\n🎯 Phase 2: 특수반 학생 균등 배치 중...")
+        log.info("\n🎯 Phase 2: 특수반 학생 균등 배치 중...")
 
         # 특수반 학생 현황 파악
         special_students = [s for s in self.students if s.특수반]
         assigned_special = [s for s in special_students if s.assigned_class is not None]
         unassigned_special = [s for s in special_students if s.assigned_class is None]
 
-        print(f"   - 총 특수반 학생: {len(special_students)}명")
-        print(f"   - 이미 배정됨: {len(assigned_special)}명")
-        print(f"   - 배정 필요: {len(unassigned_special)}명")
+        log.info("   - 총 특수반 학생: %d명", len(special_students))
+        log.info("   - 이미 배정됨: %d명", len(assigned_special))
+        log.info("   - 배정 필요: %d명", len(unassigned_special))
 
         # 각 반의 현재 특수반 학생 수
         special_count_per_class = {c: sum(1 for s in self.classes[c] if s.특수반)
                                   for c in range(1, self.target_class_count + 1)}
 
         # 특수반 학생을 유효 인원이 적은 반부터 배정 (분반 규칙 고려)
-        for student in unassigned_special:
+        for idx, student in enumerate(unassigned_special):
+            self._checkpoint(idx, len(unassigned_special))
             # 배정 가능한 반 중 유효 인원이 가장 적은 반 선택
             # (동점인 경우 특수반 학생이 적은 반 우선)
             valid_classes = [c for c in range(1, self.target_class_count + 1) if self._can_assign(student, c)]
@@ -379,25 +570,26 @@ class ClassAssigner:
                 self._assign_student(student, target_class, lock=True)
                 special_count_per_class[target_class] += 1
             else:
-                print(f"   ⚠️  경고: {student.이름} 학생을 배정할 수 없습니다 (규칙 충돌)")
+                self._warn('unplaceable', student.이름, '규칙 충돌')
 
-        print(f"   ✅ 반별 특수반 학생 수: {special_count_per_class}")
+        log.info("   ✅ 반별 특수반 학생 수: %s", special_count_per_class)
 
     def phase3_separate_same_names(self):
         """Phase 3: 동명이인 분리"""
-        print("\n🎯 Phase 3: 동명이인 분리 중...")
+        log.info("\n🎯 Phase 3: 동명이인 분리 중...")
 
         # 이름별 빈도 계산
         name_counts = Counter(s.이름 for s in self.students)
         duplicate_names = {name: count for name, count in name_counts.items() if count > 1}
 
         if not duplicate_names:
-            print("   ✅ 동명이인 없음")
+            log.info("   ✅ 동명이인 없음")
             return
 
-        print(f"   - 동명이인: {duplicate_names}")
+        log.info("   - 동명이인: %s", duplicate_names)
 
-        for name, count in duplicate_names.items():
+        for idx, (name, count) in enumerate(duplicate_names.items()):
+            self._checkpoint(idx, len(duplicate_names))
             students_with_name = [s for s in self.students if s.이름 == name]
             assigned = [s for s in students_with_name if s.assigned_class is not None]
             unassigned = [s for s in students_with_name if s.assigned_class is None]
@@ -417,23 +609,23 @@ class ClassAssigner:
                     self._assign_student(student, target_class, lock=True)
                     used_classes.add(target_class)
                 else:
-                    print(f"   ⚠️  경고: {student.이름} 학생을 배정할 수 없습니다 (동명이인/규칙 충돌)")
+                    self._warn('unplaceable', student.이름, '동명이인/규칙 충돌')
 
-        print("   ✅ 동명이인 분리 완료")
+        log.info("   ✅ 동명이인 분리 완료")
 
     def phase4_balance_difficulty(self):
         """Phase 4: 난이도 균등 배분"""
-        print("\n🎯 Phase 4: 난이도 균등 배분 중...")
+        log.info("\n🎯 Phase 4: 난이도 균등 배분 중...")
 
         # 난이도가 있는 미배정 학생들
         unassigned = [s for s in self.students
                      if s.assigned_class is None and s.난이도 > 0]
 
         if not unassigned:
-            print("   ✅ 배정할 난이도 학생 없음")
+            log.info("   ✅ 배정할 난이도 학생 없음")
             return
 
-        print(f"   - 난이도 배정 대상: {len(unassigned)}명")
+        log.info("   - 난이도 배정 대상: %d명", len(unassigned))
 
         # 난이도가 높은 학생부터 배정 (균등 배분을 위해)
         unassigned.sort(key=lambda s: s.난이도, reverse=True)
@@ -442,7 +634,8 @@ class ClassAssigner:
         difficulty_sum = {c: sum(s.난이도 for s in self.classes[c])
                          for c in range(1, self.target_class_count + 1)}
 
-        for student in unassigned:
+        for idx, student in enumerate(unassigned):
+            self._checkpoint(idx, len(unassigned))
             # 배정 가능한 반 중 현재 난이도 합이 가장 낮은 반에 배정
             valid_classes = [c for c in range(1, self.target_class_count + 1) if self._can_assign(student, c)]
             if valid_classes:
@@ -451,29 +644,30 @@ class ClassAssigner:
                 self._assign_student(student, target_class, lock=True)
                 difficulty_sum[target_class] += student.난이도
             else:
-                print(f"   ⚠️  경고: {student.이름} 학생을 배정할 수 없습니다 (규칙 충돌)")
+                self._warn('unplaceable', student.이름, '규칙 충돌')
 
-        print(f"   ✅ 반별 난이도 합: {difficulty_sum}")
+        log.info("   ✅ 반별 난이도 합: %s", difficulty_sum)
 
     def phase5_balance_remaining(self):
         """Phase 5: 반별 순환 배정 (남녀 교차)"""
-        print("\n🎯 Phase 5: 반별 순환 배정 중...")
+        log.info("\n🎯 Phase 5: 반별 순환 배정 중...")
 
         # 미배정 학생들
         unassigned = [s for s in self.students if s.assigned_class is None]
 
         if not unassigned:
-            print("   ✅ 모든 학생 배정 완료")
+            log.info("   ✅ 모든 학생 배정 완료")
             return
 
-        print(f"   - 배정 대상: {len(unassigned)}명")
+        log.info("   - 배정 대상: %d명", len(unassigned))
 
         # 1. 기존 반 처리 순서 랜덤 생성 (원본 반 수는 알 수 없으므로 unique 값 추출)
         original_classes = sorted(list(set(s.원반 for s in self.students)))
-        random.shuffle(original_classes)
-        print(f"   - 기존 반 처리 순서: {original_classes}")
+        self.rng.shuffle(original_classes)
+        log.info("   - 기존 반 처리 순서: %s", original_classes)
 
         # 2. 각 기존 반별로 남녀 교차 처리
+        processed = 0
         for original_class in original_classes:
             # 2-1. 해당 반의 남학생 배정
             males = [s for s in self.students
@@ -488,6 +682,8 @@ class ClassAssigner:
                                                  self._get_effective_gender_count(c, '남')))
 
             for i, student in enumerate(males):
+                self._checkpoint(processed, len(unassigned))
+                processed += 1
                 target_class = target_classes[i % self.target_class_count]
                 if self._can_assign(student, target_class):
                     self._assign_student(student, target_class, lock=False)
@@ -497,9 +693,10 @@ class ClassAssigner:
                         alt_class = target_classes[(i + offset) % self.target_class_count]
                         if self._can_assign(student, alt_class):
                             self._assign_student(student, alt_class, lock=False)
+                            self._count('alternative_class_fallbacks')
                             break
                     else:
-                        print(f"   ⚠️  경고: {student.이름} 학생을 배정할 수 없습니다 (규칙 충돌)")
+                        self._warn('unplaceable', student.이름, '규칙 충돌')
 
             # 2-2. 해당 반의 여학생 배정
             females = [s for s in self.students
@@ -514,6 +711,8 @@ class ClassAssigner:
                                                  self._get_effective_gender_count(c, '여')))
 
             for i, student in enumerate(females):
+                self._checkpoint(processed, len(unassigned))
+                processed += 1
                 target_class = target_classes[i % self.target_class_count]
                 if self._can_assign(student, target_class):
                     self._assign_student(student, target_class, lock=False)
@@ -523,24 +722,25 @@ class ClassAssigner:
                         alt_class = target_classes[(i + offset) % self.target_class_count]
                         if self._can_assign(student, alt_class):
                             self._assign_student(student, alt_class, lock=False)
+                            self._count('alternative_class_fallbacks')
                             break
                     else:
-                        print(f"   ⚠️  경고: {student.이름} 학생을 배정할 수 없습니다 (규칙 충돌)")
+                        self._warn('unplaceable', student.이름, '규칙 충돌')
 
-        print("   ✅ 반별 순환 배정 완료")
+        log.info("   ✅ 반별 순환 배정 완료")
 
     def phase6_random_distribution(self):
         """Phase 6: 랜덤 순환 배정"""
-        print("\n🎯 Phase 6: 랜덤 순환 배정 중...")
+        log.info("\n🎯 Phase 6: 랜덤 순환 배정 중...")
 
         # 미배정 학생들 (Phase 5에서 모두 배정되어야 하지만 혹시 남은 경우 처리)
         unassigned = [s for s in self.students if s.assigned_class is None]
 
         if not unassigned:
-            print("   ✅ 배정할 학생 없음 (모두 완료)")
+            log.info("   ✅ 배정할 학생 없음 (모두 완료)")
             return
 
-        print(f"   - 배정 대상: {len(unassigned)}명")
+        log.info("   - 배정 대상: %d명", len(unassigned))
 
         # 성별로 분리 및 점수순 정렬
         males = sorted([s for s in unassigned if s.성별 == '남'],
@@ -551,11 +751,11 @@ class ClassAssigner:
         # 랜덤 반 순서 생성
         male_order = list(range(1, 8))
         female_order = list(range(1, 8))
-        random.shuffle(male_order)
-        random.shuffle(female_order)
+        self.rng.shuffle(male_order)
+        self.rng.shuffle(female_order)
 
-        print(f"   - 남학생 배정 순서: {male_order}")
-        print(f"   - 여학생 배정 순서: {female_order}")
+        log.info("   - 남학생 배정 순서: %s", male_order)
+        log.info("   - 여학생 배정 순서: %s", female_order)
 
         # 남학생 순환 배정
         for idx, student in enumerate(males):
@@ -567,35 +767,20 @@ class ClassAssigner:
             class_num = female_order[idx % 7]
             self._assign_student(student, class_num, lock=False)
 
-        print("   ✅ 랜덤 순환 배정 완료")
-
-    def generate_output(self, output_file: str):
-        """결과를 엑셀 파일로 출력"""
-        print("\n📊 결과 생성 중...")
-
-        # 스타일 정의
-        THIN_BORDER = Border(left=Side(style='thin'), 
-                             right=Side(style='thin'), 
-                             top=Side(style='thin'), 
-                             bottom=Side(style='thin'))
-        
-        HEADER_FONT = Font(bold=True)
-        HEADER_FILL = PatternFill(start_color="E0E0E0", end_color="E0E0E0", fill_type="solid") # 연한 회색
-        CENTER_ALIGN = Alignment(horizontal='center', vertical='center')
-
-        # 색상 팔레트 (30개 - 분반 쌍별 구분, 부족하면 재사용)
-        COLOR_PALETTE = [
-            "FFFF99", "FFCC99", "CCFFCC", "FFCCFF", "E6CCFF",
-            "FFE6CC", "E6E6E6", "FFE6E6", "E6FFE6", "FFE6F0",
-            "F0E6FF", "E6F0FF", "FFF0E6", "F0FFE6", "FFE6FF",
-            "E6FFFF", "FFFFDD", "FFDDDD", "DDFFDD", "DDDDFF",
-            "FFDDFF", "DDFFFF", "FFFFEE", "FFEEFF", "EEFFEE",
-            "EEEEFF", "FFEEDD", "DDEEFF", "EEFFDD", "FFDDEE",
-        ]
+        log.info("   ✅ 랜덤 순환 배정 완료")
 
-        # 합반 규칙 색상
-        TOGETHER_FILL = PatternFill(start_color="CCFFFF", end_color="CCFFFF", fill_type="solid")  # 연한 파란색
+    def _get_target_grade(self) -> int:
+        """진급 학년 계산 (가장 많은 학년 + 1, 학생이 없으면 6)"""
+        # 기준 학년 설정 (학생 데이터에서 가져옴, 없으면 기본값 5)
+        base_grade = 5
+        if self.students:
+            # 가장 많은 학년을 기준으로 설정
+            grades = [s.학년 for s in self.students]
+            base_grade = max(set(grades), key=grades.count)
+        return base_grade + 1
 
+    def _get_rule_markers(self):
+        """합반 학생 집합, 분반 학생별 색상 목록, 분반 상대 목록 생성"""
         # 합반 규칙 학생 이름 집합 생성
         together_students = set()
         for group in self.together_groups:
@@ -605,225 +790,392 @@ class ClassAssigner:
         student_to_color = {}
         # 분반 상대방 정보 저장 (메모용)
         student_to_targets = defaultdict(set)
-        
+
         for idx, (student1, student2) in enumerate(self.separation_pairs):
             color = COLOR_PALETTE[idx % len(COLOR_PALETTE)]
-            fill = PatternFill(start_color=color, end_color=color, fill_type="solid")
 
             # 각 학생이 속한 모든 쌍의 색상을 리스트로 저장
-            if student1 not in student_to_color:
-                student_to_color[student1] = []
-            student_to_color[student1].append(fill)
+            student_to_color.setdefault(student1, []).append(color)
             student_to_targets[student1].add(student2)
 
-            if student2 not in student_to_color:
-                student_to_color[student2] = []
-            student_to_color[student2].append(fill)
+            student_to_color.setdefault(student2, []).append(color)
             student_to_targets[student2].add(student1)
 
-        # 디버깅: 색상 적용 대상 출력
-        print(f"   📌 합반 규칙 학생: {sorted(together_students)}")
-        print(f"   📌 분반 규칙: {len(self.separation_pairs)}쌍")
-        print(f"   📌 분반 규칙 학생: {len(student_to_color)}명")
+        return together_students, student_to_color, student_to_targets
 
-        wb = openpyxl.Workbook()
-        wb.remove(wb.active)  # 기본 시트 제거
+    def build_sheet_specs(self) -> Tuple[List[SheetSpec], List[dict]]:
+        """
+        반별 시트 명세와 요약 데이터 생성 (렌더링과 분리)
 
-        summary_data = []
+        요약 데이터는 품질 보고서를 새로 계산해 self.quality_report에 보관한다. generate_output 안에서는
+        출력 전에 한 번 계산한 보고서를 그대로 쓴다 (여러 형식으로 저장해도 한 번만 계산).
+        """
+        together_students, student_to_color, student_to_targets = self._get_rule_markers()
+        target_grade = self._get_target_grade()
 
-        summary_data = []
+        # 이름 → 학생 (동명이인은 _find_student_by_name과 같이 첫 번째 학생)
+        first_by_name = {}
+        for student in self.students:
+            first_by_name.setdefault(student.이름, student)
 
-        # 기준 학년 설정 (학생 데이터에서 가져옴, 없으면 기본값 5)
-        base_grade = 5
-        if self.students:
-            # 가장 많은 학년을 기준으로 설정
-            grades = [s.학년 for s in self.students]
-            base_grade = max(set(grades), key=grades.count)
-        
-        target_grade = base_grade + 1
+        class_specs = []
 
-        # 각 반별 시트 생성
         for class_num in range(1, self.target_class_count + 1):
             students = self.classes[class_num]
 
             # 이름 가나다순 정렬
             students.sort(key=lambda s: s.이름)
 
-            # 데이터프레임 생성
-            data = []
-            for idx, s in enumerate(students, 1):
-                data.append({
-                    '학년': target_grade,
-                    '반': class_num,
-                    '번호': idx,  # 새 반에서의 번호
-                    '이름': s.이름,
-                    '성별': s.성별,
-                    '점수': s.점수,
-                    '특수반': 1 if s.특수반 else '',
-                    '전출': 1 if s.전출 else '',
-                    '난이도': s.난이도 if s.난이도 > 0 else '',
-                    '비고': s.비고,
-                    '원학년': s.학년,
-                    '원반': s.원반,
-                    '원번호': s.원번호  # 원래 번호 유지
-                })
+            spec = SheetSpec(title=f'{target_grade}-{class_num}', header=list(OUTPUT_COLUMNS), rows=[],
+                             column_widths={'D': 12, 'J': 20})  # 이름, 비고
 
-            df = pd.DataFrame(data)
-
-            # 시트 추가
-            ws = wb.create_sheet(title=f'{target_grade}-{class_num}')
-            for r in dataframe_to_rows(df, index=False, header=True):
-                ws.append(r)
-
-            # 스타일 적용 (헤더)
-            for cell in ws[1]:
-                cell.font = HEADER_FONT
-                cell.fill = HEADER_FILL
-                cell.alignment = CENTER_ALIGN
-                cell.border = THIN_BORDER
-
-            # 데이터 행 스타일 적용
-            for row_idx, student in enumerate(students, start=2):  # 2부터 시작 (1은 헤더)
-                # 기본 스타일: 테두리 및 정렬
-                for col_idx in range(1, 14): # 13개 열
-                    cell = ws.cell(row=row_idx, column=col_idx)
-                    cell.border = THIN_BORDER
-                    
-                    # 가운데 정렬이 필요한 컬럼
-                    # 학년(1), 반(2), 번호(3), 이름(4), 성별(5), 특수반(7), 전출(8), 원학년(11), 원반(12), 원번호(13)
-                    if col_idx in [1, 2, 3, 4, 5, 7, 8, 11, 12, 13]:
-                        cell.alignment = CENTER_ALIGN
-
-                # 색상 및 메모 적용
-                # 합반 규칙 학생인지 확인
-                if student.이름 in together_students:
+            for idx, s in enumerate(students, 1):
+                spec.rows.append([
+                    target_grade,
+                    class_num,
+                    idx,  # 새 반에서의 번호
+                    s.이름,
+                    s.성별,
+                    s.점수,
+                    1 if s.특수반 else '',
+                    1 if s.전출 else '',
+                    s.난이도 if s.난이도 > 0 else '',
+                    s.비고,
+                    s.학년,
+                    s.원반,
+                    s.원번호,  # 원래 번호 유지
+                ])
+
+                row_idx = idx + 1  # 1행은 헤더
+                if s.이름 in together_students:
                     # 합반: 모든 셀에 동일한 파란색
-                    for col_idx in range(1, 14):
-                        ws.cell(row=row_idx, column=col_idx).fill = TOGETHER_FILL
+                    spec.row_fills.append((TOGETHER_COLOR,))
+                elif s.이름 in student_to_color:
+                    # 분반: 쌍별 색상 (2개 이상이면 셀마다 번갈아 적용)
+                    spec.row_fills.append(tuple(student_to_color[s.이름]))
 
-                # 분반 규칙 학생인지 확인 (쌍별 색상)
-                elif student.이름 in student_to_color:
-                    fills = student_to_color[student.이름]
-                    
                     # 메모 추가 (이름 셀인 4번 컬럼에)
-                    targets = student_to_targets[student.이름]
                     target_info_list = []
-                    for target_name in targets:
-                        target_student = self._find_student_by_name(target_name)
+                    for target_name in student_to_targets[s.이름]:
+                        target_student = first_by_name.get(target_name)
                         if target_student and target_student.assigned_class:
                             target_info_list.append(f"{target_name}({target_student.assigned_class}반)")
                         else:
                             target_info_list.append(f"{target_name}(미배정)")
-                    
-                    target_str = ", ".join(sorted(target_info_list))
-                    name_cell = ws.cell(row=row_idx, column=4)
-                    name_cell.comment = Comment(f"분반 대상: {target_str}", "AutoAssigner")
-
-                    if len(fills) == 1:
-                        # 1개 쌍: 모든 셀에 동일한 색상
-                        for col_idx in range(1, 14):
-                            ws.cell(row=row_idx, column=col_idx).fill = fills[0]
-                    else:
-                        # 2개 이상 쌍: 홀수 셀과 짝수 셀에 번갈아가며 색상 적용
-                        for col_idx in range(1, 14):
-                            # 홀수 셀: 첫 번째 색상, 짝수 셀: 두 번째 색상
-                            fill_idx = (col_idx - 1) % len(fills)
-                            ws.cell(row=row_idx, column=col_idx).fill = fills[fill_idx]
-                            
-            # 컬럼 너비 자동 조정 (간단하게 고정값 적용)
-            ws.column_dimensions['D'].width = 12 # 이름
-            ws.column_dimensions['J'].width = 20 # 비고
-
-            # 요약 데이터 수집
-            summary_data.append({
-                '반': f'{target_grade}-{class_num}',
-                '학생수': len(students),
-                '유효인원': sum(s.effective_count() for s in students),
-                '남학생수': sum(1 for s in students if s.성별 == '남'),
-                '여학생수': sum(1 for s in students if s.성별 == '여'),
-                '유효남학생': sum(s.effective_count() for s in students if s.성별 == '남'),
-                '유효여학생': sum(s.effective_count() for s in students if s.성별 == '여'),
-                '난이도합': sum(s.난이도 for s in students),
-                '특수반수': sum(1 for s in students if s.특수반),
-                '전출생수': sum(1 for s in students if s.전출)
-            })
-
-            print(f"   ✅ {class_num}반 시트 생성: {len(students)}명")
-
-        # 요약 시트 생성
-        summary_df = pd.DataFrame(summary_data)
-        ws_summary = wb.create_sheet(title='요약', index=0)
-        for r in dataframe_to_rows(summary_df, index=False, header=True):
-            ws_summary.append(r)
-            
-        # 요약 시트 스타일
-        for cell in ws_summary[1]:
-            cell.font = HEADER_FONT
-            cell.fill = HEADER_FILL
-            cell.alignment = CENTER_ALIGN
-            cell.border = THIN_BORDER
-            
-        for row in ws_summary.iter_rows(min_row=2):
-            for cell in row:
-                cell.border = THIN_BORDER
-                cell.alignment = CENTER_ALIGN
-        
-        ws_summary.column_dimensions['A'].width = 10
-        
-        # 범례(Legend) 추가
-        legend_start_row = len(summary_data) + 5
-        ws_summary.cell(row=legend_start_row, column=1, value="[범례]").font = Font(bold=True, size=12)
-        
-        # 합반 범례
-        ws_summary.cell(row=legend_start_row+1, column=1, value="합반 규칙 적용").border = THIN_BORDER
-        guide_cell = ws_summary.cell(row=legend_start_row+1, column=2, value="하늘색 배경")
-        guide_cell.fill = TOGETHER_FILL
-        guide_cell.border = THIN_BORDER
-        
-        # 분반 범례
-        ws_summary.cell(row=legend_start_row+2, column=1, value="분반 규칙 적용").border = THIN_BORDER
-        guide_cell = ws_summary.cell(row=legend_start_row+2, column=2, value="기타 색상 배경")
-        guide_cell.fill = PatternFill(start_color=COLOR_PALETTE[0], end_color=COLOR_PALETTE[0], fill_type="solid")
-        guide_cell.border = THIN_BORDER
-        guide_cell.comment = Comment("마우스를 올리면 누구와 분반인지 표시됩니다.", "AutoAssigner")
-        
-        ws_summary.cell(row=legend_start_row+2, column=3, value="← 이름에 마우스를 올리면 대상 확인 가능")
-
-        # 파일 저장
-        wb.save(output_file)
-        print(f"\n✅ 결과 파일 저장: {output_file}")
+                    spec.comments[(row_idx, 4)] = f"분반 대상: {', '.join(sorted(target_info_list))}"
+                else:
+                    spec.row_fills.append(())
 
-        # 요약 출력
-        print("\n" + "=" * 70)
-        print("📋 반별 요약")
-        print("=" * 70)
-        print(summary_df.to_string(index=False))
+            class_specs.append(spec)
+
+        # 요약 데이터: 반별 통계를 group-by 한 번으로 계산 (generate_output 중에는 한 번만)
+        if not self._reuse_quality_report:
+            self.quality_report = self.build_quality_report()
+        summary_data = self.quality_report.summary_rows(target_grade)
+
+        return class_specs, summary_data
+
+    def build_quality_report(self) -> 'QualityReport':
+        """반별/전체 품질 통계 (요약 시트와 프로그램 검증용)"""
+        from quality_report import build_quality_report
+
+        return build_quality_report({c: self.classes[c] for c in range(1, self.target_class_count + 1)})
+
+    @staticmethod
+    def build_summary_spec(summary_data: List[dict]) -> SheetSpec:
+        """요약 시트 명세 생성 (범례는 렌더러가 데이터 아래에 추가)"""
+        header = list(summary_data[0].keys()) if summary_data else ['반']
+        rows = [[row[col] for col in header] for row in summary_data]
+        return SheetSpec(title='요약', header=header, rows=rows, kind='summary',
+                         column_widths={'A': 10})
+
+    def build_result_records(self) -> List[dict]:
+        """
+        배정 결과를 학생 단위 레코드로 변환 (CSV/Parquet/JSON Lines 출력용)
+
+        새 번호는 반별 시트와 같이 반 안에서 이름 가나다순으로 부여한다.
+        """
+        together_students, student_to_color, student_to_targets = self._get_rule_markers()
+        together_group_of = {}
+        for group_idx, group in enumerate(self.together_groups, 1):
+            for name in group:
+                together_group_of[name] = group_idx
+        name_counts = Counter(s.이름 for s in self.students)
+        target_grade = self._get_target_grade()
 
-    def run(self, output_file: str = "03 6학년 배정 결과.xlsx"):
-        """전체 프로세스 실행"""
+        records = []
+        for class_num in range(1, self.target_class_count + 1):
+            for idx, s in enumerate(sorted(self.classes[class_num], key=lambda s: s.이름), 1):
+                records.append({
+                    '원학년': s.학년,
+                    '원반': s.원반,
+                    '원번호': s.원번호,
+                    '이름': s.이름,
+                    '성별': s.성별,
+                    '점수': s.점수,
+                    '학년': target_grade,
+                    '반': class_num,
+                    '번호': idx,
+                    '특수반': s.특수반,
+                    '전출': s.전출,
+                    '난이도': s.난이도,
+                    '비고': s.비고,
+                    '합반': s.이름 in together_students,
+                    '합반그룹': together_group_of.get(s.이름),
+                    '분반': s.이름 in student_to_color,
+                    '분반대상': ';'.join(sorted(student_to_targets.get(s.이름, ()))),
+                    '동명이인': name_counts[s.이름] > 1,
+                })
+        return records
+
+    def generate_output(self, output_file: str, workers: Optional[int] = None,
+                        writers: Optional[list] = None, incremental: bool = False) -> List[str]:
+        """
+        결과 파일 출력
+
+        Args:
+            output_file: 결과 파일 경로 (writers가 없으면 확장자로 출력 형식 결정, 알 수 없는 확장자는 xlsx)
+            workers: xlsx 출력 시 None이면 openpyxl 단일 통합문서로 생성.
+                     정수이면 반별 시트 XML을 프로세스 풀에서 병렬로 렌더링 (0 = CPU 수)
+            writers: 출력 형식 이름('xlsx', 'csv', 'jsonl', 'parquet') 또는 ResultWriter 목록.
+                     확장자가 output_file과 같은 형식만 output_file에, 나머지는 확장자를 바꾼 경로에 저장
+                     (result_writers.output_paths, 같은 형식이 중복되면 ValueError)
+            incremental: xlsx 출력 시 기존 결과 파일과 비교해 바뀐 시트만 다시 렌더링
+
+        Returns:
+            저장된 파일 경로 목록
+        """
+        import pandas as pd
+        from result_writers import output_paths
+
+        log.info("\n📊 결과 생성 중...")
+
+        # 색상 적용 대상 (합반 학생 명단은 debug에서만)
+        if log.isEnabledFor(logging.INFO):
+            together_students, student_to_color, _ = self._get_rule_markers()
+            if log.isEnabledFor(logging.DEBUG):
+                log.debug("   📌 합반 규칙 학생: %s", sorted(together_students))
+            log.info("   📌 분반 규칙: %d쌍", len(self.separation_pairs))
+            log.info("   📌 분반 규칙 학생: %d명", len(student_to_color))
+
+        saved_files = []
+        targets = output_paths(output_file, writers, workers=workers, incremental=incremental)
+        # 품질 보고서는 한 번만 계산해 모든 writer의 요약 시트와 아래 요약 출력에 사용
+        self.quality_report = self.build_quality_report()
+        self._reuse_quality_report = True
         try:
-            # 데이터 로드
-            self.load_students()
-            self.load_rules()
+            for idx, (writer, path) in enumerate(targets):
+                self._checkpoint(idx, len(targets))
+                writer.write(self, path)
+                saved_files.append(path)
+        finally:
+            self._reuse_quality_report = False
 
-            # 6단계 배정 프로세스
-            self.phase1_apply_rules()
-            self.phase2_distribute_special_needs()
-            self.phase3_separate_same_names()
-            self.phase4_balance_difficulty()
-            self.phase5_balance_remaining()
-            # self.phase6_random_distribution()  # Phase 5에서 모두 처리하므로 비활성화
+        for class_num in range(1, self.target_class_count + 1):
+            log.info("   ✅ %d반 시트 생성: %d명", class_num, len(self.classes[class_num]))
 
-            # 결과 생성
-            self.generate_output(output_file)
+        for path in saved_files:
+            log.info("\n✅ 결과 파일 저장: %s", path)
 
-            print("\n" + "=" * 70)
-            print("🎉 학급 편성 완료!")
-            print("=" * 70)
+        # 요약 출력
+        if log.isEnabledFor(logging.INFO):  # 요약 표는 출력할 때만 생성
+            summary_df = pd.DataFrame(self.quality_report.summary_rows(self._get_target_grade()))
+            overall = self.quality_report.overall
+            log.info("\n" + "=" * 70)
+            log.info("📋 반별 요약")
+            log.info("=" * 70)
+            log.info(summary_df.to_string(index=False))
+            log.info("\n   반별 편차(최대-최소): 유효인원 %g, 유효남학생 %g, 유효여학생 %g, 점수평균 %g, 난이도합 %g",
+                     overall['유효인원편차'], overall['유효남학생편차'], overall['유효여학생편차'],
+                     overall['점수평균편차'], overall['난이도합편차'])
+
+        return saved_files
+
+    def run(self, output_file: str = "03 6학년 배정 결과.xlsx", writers: Optional[list] = None,
+            incremental: bool = False, event_sink: Optional[EventSink] = None,
+            workers: Optional[int] = None, cancel_token: Optional[CancelToken] = None,
+            parsed_inputs: Optional['ParsedInputs'] = None, metrics_file: Optional[str] = None,
+            engine: str = 'greedy', engine_budget: Optional[float] = None,
+            engine_iterations: Optional[int] = None, profile: Optional[str] = None,
+            profile_top: int = 30) -> List[str]:
+        """
+        전체 프로세스 실행
+
+        Args:
+            output_file: 결과 파일 경로
+            writers: 추가 출력 형식 (generate_output 참고, 예: ['xlsx', 'csv', 'jsonl'])
+            incremental: 기존 결과 파일에서 바뀌지 않은 반 시트는 복사 (규칙 수정 후 반복 실행용)
+            event_sink: 진행 이벤트(AssignmentEvent)를 받을 함수. 지정하면 단계 시작마다 'phase' 이벤트,
+                        출력 한 줄마다 'log' 이벤트를 실행 중에 바로 전달 (GUI 실시간 로그용)
+            workers: xlsx 병렬 렌더링 프로세스 수 (generate_output 참고)
+            cancel_token: 취소 토큰. 단계 사이와 긴 반복문 안에서 확인하며, 취소되면
+                          결과 파일을 쓰지 않고 AssignmentCancelled 발생
+            parsed_inputs: 미리 읽어 둔 명단/규칙 (parsed_inputs.ParsedInputs). 주면 파일을 다시 읽지 않음
+            metrics_file: 단계별 시간/카운터(self.metrics)를 저장할 JSON 파일
+            engine: 배정 엔진 (assignment_engines.ENGINES). greedy가 아니면 Phase 5 다음에 개선 단계 실행
+            engine_budget: 개선 단계 실행 시간(초)
+            engine_iterations: 개선 단계 반복 횟수 (engine_budget과 함께 주면 먼저 도달한 쪽에서 멈춤)
+            profile: 진단용 프로파일 모드 ('cpu', 'memory', 'all', run_profiler 참고). 결과 파일 옆에
+                     pstats 파일과 시간 상위 함수/단계별 최대 메모리 보고서 저장 (취소/오류로 끝나도 저장)
+            profile_top: 보고서에 넣을 시간 상위 함수 수
+
+        Returns:
+            저장된 파일 경로 목록 (단계별 시간/카운터는 self.metrics)
+        """
+        from run_metrics import RunMetrics
+
+        profiler = None
+        if profile is not None:
+            from run_profiler import RunProfiler
+            profiler = RunProfiler(profile, profile_top)
+        self.profile_files = []
+
+        if event_sink is not None:
+            self.event_sink = event_sink
+        if cancel_token is not None:
+            self.cancel_token = cancel_token
+
+        saved_files = []
+        # (표시 이름, 계측 단계 이름, 실행 함수)
+        steps = [
+            # 데이터 로드
+            ("학생 데이터 로드", 'load_students', self.load_students if parsed_inputs is None
+             else lambda: self.load_students(parsed_inputs.fresh_students())),
+            ("규칙 로드", 'load_rules', self.load_rules if parsed_inputs is None
+             else lambda: self.load_rules((parsed_inputs.separation_pairs, parsed_inputs.together_groups))),
+            # 6단계 배정 프로세스
+            ("Phase 1: 분반/합반 규칙", 'phase1_apply_rules', self.phase1_apply_rules),
+            ("Phase 2: 특수반 분산", 'phase2_distribute_special_needs', self.phase2_distribute_special_needs),
+            ("Phase 3: 동명이인 분리", 'phase3_separate_same_names', self.phase3_separate_same_names),
+            ("Phase 4: 난이도 균형", 'phase4_balance_difficulty', self.phase4_balance_difficulty),
+            ("Phase 5: 나머지 학생 배정", 'phase5_balance_remaining', self.phase5_balance_remaining),
+            # self.phase6_random_distribution()  # Phase 5에서 모두 처리하므로 비활성화
+            # 필수 조건 검증 + 결과 생성
+            ("배정 검증", 'audit', self.audit),
+            ("결과 생성", 'generate_output', lambda: saved_files.extend(self.generate_output(
+                output_file, workers=workers, writers=writers, incremental=incremental))),
+        ]
+        if engine != 'greedy':
+            # 배정 개선은 Phase 5와 배정 검증 사이
+            steps.insert(-2, (f"배정 개선: {engine}", 'optimize',
+                              lambda: self.optimize(engine, engine_budget, engine_iterations)))
+        self.metrics = RunMetrics(classes=self.target_class_count)
+        self.engine_trace = None
+        self.warnings = []
+
+        with forward_output(self.event_sink):
+            if profiler is not None:
+                profiler.start()
+            try:
+                self._total_steps = len(steps)
+                for step, (name, stage, action) in enumerate(steps, 1):
+                    self._step = step
+                    self._stage_name = stage
+                    self._progress_percent = -1
+                    self._checkpoint()
+                    self._emit(AssignmentEvent('phase', name, step=step, total=len(steps),
+                                               fraction=(step - 1) / len(steps)))
+                    with self.metrics.stage(stage):
+                        action()
+                self.metrics.students = len(self.students)
+                if metrics_file:
+                    self.metrics.write_json(metrics_file)
+
+                self._emit(AssignmentEvent('progress', step=len(steps), total=len(steps), fraction=1.0))
+                log.info("\n" + "=" * 70)
+                log.info("🎉 학급 편성 완료!")
+                log.info("=" * 70)
+                return saved_files
+
+            except AssignmentCancelled:
+                log.warning("\n⏹️  배정이 취소되었습니다.")
+                raise
 
-        except Exception as e:
-            print(f"\n❌ 오류 발생: {e}")
-            raise
+            except Exception as e:
+                log.error("\n❌ 오류 발생: %s", e)
+                raise
+
+            finally:
+                self._step = self._total_steps = 0
+                self._stage_name = ''
+                if profiler is not None:
+                    profiler.stop()
+                    self.profile_files = profiler.write(output_file, self.metrics)
+                    log.info("🔬 프로파일 저장: %s", ', '.join(self.profile_files))
+
+    def optimize(self, engine: str, time_budget: Optional[float] = None, max_iterations: Optional[int] = None):
+        """배정 개선 (Phase 5 이후, 개선 기록은 self.engine_trace)"""
+        from assignment_engines import optimize
+
+        log.info("\n🎯 배정 개선 (%s) 중...", engine)
+        self.engine_trace = optimize(self, engine, time_budget, max_iterations)
+        first, last = self.engine_trace[0], self.engine_trace[-1]
+        log.info("   ✅ 목적함수 %g → %g (%d회 개선, 마지막 개선 %g초)", first['objective'], last['objective'],
+                 len(self.engine_trace) - 1, last['elapsed_sec'])
+
+    def audit(self) -> 'AuditReport':
+        """
+        배정 결과 필수 조건 검증 (assignment_audit 참고)
+
+        모든 학생이 정확히 한 반에 있는지, classes와 assigned_class가 일치하는지, 분반/합반/동명이인
+        규칙을 지켰는지 한 번에 검사한다. 위반이 있어도 멈추지 않고 경고로 출력하며 결과는
+        self.audit_report에 남긴다.
+        """
+        from assignment_audit import audit_assigner
+
+        log.info("\n🔎 배정 검증 중...")
+        report = audit_assigner(self)
+        self.audit_report = report
+        self._count('audit_violations', len(report.violations))
+        if report.ok:
+            log.info("   ✅ 필수 조건 위반 없음 (%d명, %.1fms)", report.students, report.elapsed_sec * 1000)
+        else:
+            log.warning("   ⚠️  필수 조건 위반 %d건: %s", len(report.violations),
+                        ', '.join(f'{kind} {count}건' for kind, count in report.counts().items()))
+            for violation in report.violations[:AUDIT_LOG_LIMIT]:
+                log.warning("      - %s", violation.message())
+            if len(report.violations) > AUDIT_LOG_LIMIT:
+                log.warning("      ... 외 %d건", len(report.violations) - AUDIT_LOG_LIMIT)
+        return report
+
+    def _stage(self, name: str):
+        """계측 단계 (run 밖에서는 기록하지 않음)"""
+        return self.metrics.stage(name) if self.metrics is not None else contextlib.nullcontext()
+
+    def _count(self, name: str, n: int = 1):
+        """계측 카운터 증가 (run 밖에서는 기록하지 않음)"""
+        if self.metrics is not None:
+            self.metrics.count(name, n)
+
+    def _warn(self, kind: str, name: str, reason: str = ''):
+        """배정 경고 기록 (self.warnings) 및 출력 (kind: assignment_log.WARNING_MESSAGES의 키)"""
+        if kind == 'unplaceable':
+            self._count('unplaceable_warnings')
+        if self.warnings is not None:
+            self.warnings.append(AssignmentWarning(kind, name, reason, self._stage_name))
+        log.warning(WARNING_MESSAGES[kind], {'name': name, 'reason': reason})
+
+    def _emit(self, event: AssignmentEvent):
+        """진행 이벤트 전달 (event_sink가 없으면 무시)"""
+        if self.event_sink is not None:
+            self.event_sink(event)
+
+    def _checkpoint(self, done: int = 0, total: int = 0):
+        """
+        취소 확인 및 단계 내 진행률 보고 (긴 반복문 안에서 호출)
+
+        취소 요청이 있으면 AssignmentCancelled 발생. total이 주어지면 현재 단계의
+        done/total을 전체 진행률로 환산해 1% 단위로 'progress' 이벤트를 보낸다.
+        """
+        if self.cancel_token is not None:
+            self.cancel_token.check()
+        if self.event_sink is None or not total or not self._total_steps:
+            return
+        fraction = (self._step - 1 + min(done / total, 1.0)) / self._total_steps
+        percent = int(fraction * 100)
+        if percent > self._progress_percent:
+            self._progress_percent = percent
+            self._emit(AssignmentEvent('progress', step=self._step, total=self._total_steps, fraction=fraction))
 
 
 def get_base_path():
@@ -849,6 +1201,9 @@ def select_file(title, filetypes, default_path=None, mode='open'):
     Returns:
         선택된 파일 경로 (취소시 None)
     """
+    import tkinter as tk
+    from tkinter import filedialog
+
     root = tk.Tk()
     root.withdraw()  # 메인 윈도우 숨기기
 
@@ -960,6 +1315,9 @@ def main():
         print("=" * 70)
 
         # 완료 메시지 박스 (GUI)
+        import tkinter as tk
+        from tkinter import messagebox
+
         root = tk.Tk()
         root.withdraw()
         messagebox.showinfo(
@@ -974,6 +1332,9 @@ def main():
         traceback.print_exc()
 
         # 오류 메시지 박스 (GUI)
+        import tkinter as tk
+        from tkinter import messagebox
+
         root = tk.Tk()
         root.withdraw()
         messagebox.showerror(
@@ -988,4 +1349,8 @@ def main():
 
 
 if __name__ == '__main__':
+    if len(sys.argv) > 1:
+        # 명령줄 인자가 있으면 대화상자 없이 실행 (python -m class_assigner 명단.xlsx 규칙.xlsx ...)
+        from assignment_cli import main as cli_main
+        sys.exit(cli_main())
     main()
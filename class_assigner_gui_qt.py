@@ -3,97 +3,499 @@
 PyQt6 기반 크로스플랫폼 사용자 인터페이스
 """
 
+import time
+_STARTUP_TIME = time.perf_counter()  # 시작 시간 측정 기준 (다른 import보다 먼저)
+
 import sys
 import os
-import threading
+import json
+import multiprocessing
+from collections import Counter, defaultdict
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from PyQt6.QtWidgets import (
     QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
     QPushButton, QLabel, QTextEdit, QFileDialog, QMessageBox, QFrame,
-    QSpinBox
+    QSpinBox, QProgressBar, QTabWidget, QTableView, QComboBox, QLineEdit, QHeaderView,
+    QSplitter, QMenu, QAbstractItemView
 )
-from PyQt6.QtCore import Qt, QThread, pyqtSignal
-from PyQt6.QtGui import QFont, QIcon
-from class_assigner import ClassAssigner, get_base_path
-
-
-class AssignmentThread(QThread):
-    """학급 편성을 백그라운드에서 실행하는 스레드"""
-    log_signal = pyqtSignal(str)
+from PyQt6.QtCore import Qt, QObject, QTimer, pyqtSignal, QAbstractTableModel, QModelIndex, QMimeData
+from PyQt6.QtGui import QFont, QIcon, QBrush, QColor, QKeySequence, QShortcut
+from assignment_events import AssignmentEvent
+from assignment_process import AssignmentProcess
+from class_assigner import get_base_path
+from manual_edits import ManualEditor, export_assignments, init_export_worker, update_preview
+from parsed_inputs import DiskInputCache, InputCache
+from result_preview import FLAG_COLUMNS, filter_rows, sort_rows
+from run_profiler import PROFILE_MODES, profile_paths
+
+
+class AssignmentRunner(QObject):
+    """
+    학급 편성을 별도 프로세스에서 실행하고 진행 상황을 전달하는 객체
+
+    배정 계산은 자식 프로세스(AssignmentProcess)에서 실행되므로 GIL을 나눠 쓰지 않는다.
+    GUI 스레드의 타이머가 POLL_INTERVAL_MS마다 파이프를 확인해 쌓인 이벤트를
+    events_signal 한 번으로 전달한다.
+    """
+    events_signal = pyqtSignal(list)  # AssignmentEvent 목록
     finished_signal = pyqtSignal(bool, str)  # success, message
+    cancelled_signal = pyqtSignal()
+    result_signal = pyqtSignal(object)  # ResultPreview (finished_signal 직전에 전달)
 
-    def __init__(self, student_file, rules_file, output_file, target_class_count):
+    POLL_INTERVAL_MS = 100
+    MAX_EVENTS_PER_FLUSH = 2000  # 한 번에 표시할 최대 이벤트 수 (나머지는 다음 주기)
+    CANCEL_GRACE_MS = 1000  # 취소 요청 후 이 시간 안에 멈추지 않으면 강제 종료
+
+    def __init__(self, student_file, rules_file, output_file, target_class_count, workers=None,
+                 parsed_inputs=None, profile=None):
         super().__init__()
-        self.student_file = student_file
-        self.rules_file = rules_file
         self.output_file = output_file
         self.target_class_count = target_class_count
+        self.profile = profile
+        self.process = AssignmentProcess(student_file, rules_file, output_file, target_class_count,
+                                         workers=workers, parsed_inputs=parsed_inputs, profile=profile)
+
+        self.poll_timer = QTimer(self)
+        self.poll_timer.setInterval(self.POLL_INTERVAL_MS)
+        self.poll_timer.timeout.connect(self.poll)
+
+    def start(self):
+        lines = ["=" * 70, "🎓 자동 학급 편성 시작", f"➡️ 목표 학급 수: {self.target_class_count}개 반"]
+        if self.profile:
+            lines.append(f"🔬 진단 모드: {self.profile} (결과 파일 옆에 .prof/.profile.txt 저장)")
+        self.events_signal.emit([AssignmentEvent('log', line) for line in lines + ["=" * 70, ""]])
+        self.process.start()
+        self.poll_timer.start()
+
+    def is_running(self):
+        return not self.process.finished
+
+    def stop(self):
+        """작업 프로세스 강제 종료 (창을 닫을 때)"""
+        self.poll_timer.stop()
+        self.process.terminate()
+
+    def cancel(self):
+        """취소 요청 (응답이 없으면 CANCEL_GRACE_MS 후 강제 종료)"""
+        self.process.cancel()
+        QTimer.singleShot(self.CANCEL_GRACE_MS, self._terminate_if_running)
+
+    def _terminate_if_running(self):
+        if self.is_running():
+            self.stop()
+            self.events_signal.emit([AssignmentEvent('log', "⏹️  작업 프로세스를 강제 종료했습니다.")])
+            self.cancelled_signal.emit()
+
+    def poll(self):
+        """파이프에 도착한 메시지 처리 (GUI 스레드에서 호출)"""
+        events = []
+        for message in self.process.poll(limit=self.MAX_EVENTS_PER_FLUSH):
+            if message[0] == 'event':
+                events.append(message[1])
+            elif message[0] == 'done':
+                self.poll_timer.stop()
+                events += [AssignmentEvent('log', line) for line in [
+                    "", "=" * 70, "✅ 완료! 결과 파일이 생성되었습니다:", f"📁 {self.output_file}", "=" * 70]]
+                if self.profile:
+                    events += [AssignmentEvent('log', f"🔬 진단 파일: {path}")
+                               for path in profile_paths(self.output_file)]
+                self.events_signal.emit(events)
+                self.result_signal.emit(message[2])
+                self.finished_signal.emit(
+                    True,
+                    f"학급 편성이 완료되었습니다!\n\n결과 파일:\n{self.output_file}"
+                )
+                return
+            elif message[0] == 'cancelled':
+                self.poll_timer.stop()
+                self.events_signal.emit(events)
+                self.cancelled_signal.emit()
+                return
+            elif message[0] == 'error':
+                self.poll_timer.stop()
+                _, error, detail = message
+                events += [AssignmentEvent('log', line) for line in [
+                    "", "=" * 70, f"❌ 오류 발생: {error}", "=" * 70, "", "상세 오류 정보:", detail]]
+                self.events_signal.emit(events)
+                self.finished_signal.emit(
+                    False,
+                    f"학급 편성 중 오류가 발생했습니다:\n\n{error}\n\n자세한 내용은 진행 상황 창을 확인하세요."
+                )
+                return
+        if events:
+            self.events_signal.emit(events)
 
-    def run(self):
-        """학급 편성 실행"""
+
+class InputPreparser(QObject):
+    """
+    선택한 명단/규칙 파일을 백그라운드 스레드에서 미리 파싱/검증하는 객체
+
+    결과는 InputCache(경로 + 수정 시각 + 크기 기준)에 보관되어, 파일이 바뀌지 않았다면
+    배정 실행 시 작업 프로세스가 파일을 다시 읽지 않는다. 프로그램을 다시 시작해도 내용이 같은
+    파일은 DiskInputCache(파일 내용 해시 기준)에서 바로 불러온다.
+    """
+    parsed_signal = pyqtSignal(object)  # ParsedInputs
+    failed_signal = pyqtSignal(str, str, str)  # 명단 파일, 규칙 파일, 오류 메시지
+
+    def __init__(self):
+        super().__init__()
+        self.cache = InputCache(disk=DiskInputCache())
+        self.executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='input-preparse')
+
+    def request(self, student_file, rules_file):
+        """파싱 요청 (캐시에 있으면 바로 전달)"""
+        cached = self.cache.get(student_file, rules_file)
+        if cached is not None:
+            self.parsed_signal.emit(cached)
+            return
+        future = self.executor.submit(self.cache.load, student_file, rules_file)
+        future.add_done_callback(lambda f: self._on_done(f, student_file, rules_file))
+
+    def _on_done(self, future, student_file, rules_file):
+        # 파싱 스레드에서 호출됨 (시그널은 GUI 스레드로 전달)
+        if future.cancelled():
+            return
         try:
-            self.log_signal.emit("=" * 70)
-            self.log_signal.emit("🎓 자동 학급 편성 시작")
-            self.log_signal.emit(f"➡️ 목표 학급 수: {self.target_class_count}개 반")
-            self.log_signal.emit("=" * 70)
-            self.log_signal.emit("")
-
-            # 표준 출력 캡처
-            import io
-            import contextlib
-
-            output_buffer = io.StringIO()
-
-            with contextlib.redirect_stdout(output_buffer):
-                assigner = ClassAssigner(
-                    student_file=self.student_file,
-                    rules_file=self.rules_file,
-                    target_class_count=self.target_class_count
-                )
-                assigner.run(output_file=self.output_file)
-
-            # 캡처된 출력을 GUI에 표시
-            captured_output = output_buffer.getvalue()
-            for line in captured_output.split('\n'):
-                if line.strip():
-                    self.log_signal.emit(line)
-
-            self.log_signal.emit("")
-            self.log_signal.emit("=" * 70)
-            self.log_signal.emit(f"✅ 완료! 결과 파일이 생성되었습니다:")
-            self.log_signal.emit(f"📁 {self.output_file}")
-            self.log_signal.emit("=" * 70)
-
-            self.finished_signal.emit(
-                True,
-                f"학급 편성이 완료되었습니다!\n\n결과 파일:\n{self.output_file}"
-            )
+            self.parsed_signal.emit(future.result())
+        except Exception as e:
+            self.failed_signal.emit(student_file, rules_file, str(e))
+
+    def get(self, student_file, rules_file):
+        """현재 파일 상태와 일치하는 파싱 결과 (없거나 파싱 중이면 None)"""
+        return self.cache.get(student_file, rules_file)
+
+    def shutdown(self):
+        self.executor.shutdown(wait=False, cancel_futures=True)
+
+
+# 결과 표에서 반 요약 표로 학생을 끌어 옮길 때의 데이터 형식 (students 목록 위치)
+STUDENT_MIME_TYPE = 'application/x-class-assigner-students'
+VIOLATION_BRUSH = QBrush(QColor("#C62828"))  # 규칙 위반 학생/반 글자색
+
+
+class ResultTableModel(QAbstractTableModel):
+    """
+    배정 결과 미리보기 표 모델
 
+    QTableView는 화면에 보이는 행의 셀만 data()로 요청하므로 학생 수가 많아도 그리기 비용이 일정하다.
+    정렬/필터는 QSortFilterProxyModel 대신 모델 안에서 행 번호 목록(_view)을 한 번에 계산해
+    행마다 파이썬 비교 함수를 호출하지 않는다.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self.preview = None
+        self._view = []  # 표시할 preview.rows 행 번호 (필터/정렬 적용 순서)
+        self._filter = {}
+        self._sort = None  # (컬럼, 내림차순 여부)
+        self._brushes = {}  # 색상 코드 -> QBrush
+        self._violations = {}  # 이름 -> 위반 메시지 목록 (수동 조정 후 규칙 위반 표시)
+
+    def set_preview(self, preview):
+        self.beginResetModel()
+        self.preview = preview
+        self._view = self._compute_view()
+        self.endResetModel()
+
+    def set_filter(self, class_num=None, gender=None, flag=None, text=''):
+        """필터 조건 변경 (None/빈 값이면 해당 조건 무시)"""
+        self._filter = {'class_num': class_num, 'gender': gender, 'flag': flag, 'text': text}
+        self.layoutAboutToBeChanged.emit()
+        self._view = self._compute_view()
+        self.layoutChanged.emit()
+
+    def _compute_view(self):
+        if self.preview is None:
+            return []
+        view = filter_rows(self.preview, **self._filter)
+        if self._sort is not None:
+            view = sort_rows(self.preview, view, *self._sort)
+        return view
+
+    def source_row(self, row):
+        """표의 행 번호에 해당하는 preview.rows 행 번호"""
+        return self._view[row]
+
+    def set_violations(self, violations):
+        """규칙 위반 표시 (AuditViolation 목록)"""
+        by_name = defaultdict(list)
+        for violation in violations:
+            for name in violation.names:
+                by_name[name].append(violation.message())
+        self._violations = by_name
+        self._emit_all_changed()
+
+    def rows_changed(self):
+        """수동 이동으로 반/번호 값이 바뀐 뒤 호출 (반 필터나 반/번호 정렬 중이면 행 목록 다시 계산)"""
+        if self._filter.get('class_num') is not None or (self._sort and self._sort[0] in (0, 1)):
+            self.layoutAboutToBeChanged.emit()
+            self._view = self._compute_view()
+            self.layoutChanged.emit()
+        else:
+            self._emit_all_changed()
+
+    def _emit_all_changed(self):
+        # 보이는 셀만 다시 그려지므로 전체 범위를 알려도 비용이 작음
+        if self._view:
+            self.dataChanged.emit(self.index(0, 0), self.index(len(self._view) - 1, self.columnCount() - 1))
+
+    def flags(self, index):
+        flags = super().flags(index)
+        return flags | Qt.ItemFlag.ItemIsDragEnabled if index.isValid() else flags
+
+    def mimeTypes(self):
+        return [STUDENT_MIME_TYPE]
+
+    def mimeData(self, indexes):
+        """끌어 옮길 학생들 (students 목록 위치)"""
+        rows = sorted({index.row() for index in indexes})
+        students = [self.preview.student_index[self._view[row]] for row in rows]
+        mime = QMimeData()
+        mime.setData(STUDENT_MIME_TYPE, ','.join(map(str, students)).encode())
+        return mime
+
+    def supportedDragActions(self):
+        return Qt.DropAction.CopyAction
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._view)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() or self.preview is None else len(self.preview.columns)
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        row = self._view[index.row()]
+        if role == Qt.ItemDataRole.DisplayRole:
+            value = self.preview.rows[row][index.column()]
+            if isinstance(value, bool):
+                return "✓" if value else ""
+            return "" if value is None else str(value)
+        if role == Qt.ItemDataRole.BackgroundRole:
+            color = self.preview.cell_fill(row, index.column())
+            if color is None:
+                return None
+            if color not in self._brushes:
+                self._brushes[color] = QBrush(QColor(f"#{color}"))
+            return self._brushes[color]
+        if role == Qt.ItemDataRole.TextAlignmentRole:
+            if not isinstance(self.preview.rows[row][index.column()], str):
+                return Qt.AlignmentFlag.AlignCenter
+        if self._violations and role in (Qt.ItemDataRole.ForegroundRole, Qt.ItemDataRole.ToolTipRole):
+            messages = self._violations.get(self.preview.rows[row][2])  # 이름 컬럼
+            if messages:
+                return VIOLATION_BRUSH if role == Qt.ItemDataRole.ForegroundRole else "\n".join(messages)
+        return None
+
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if role != Qt.ItemDataRole.DisplayRole or self.preview is None:
+            return None
+        if orientation == Qt.Orientation.Horizontal:
+            return self.preview.columns[section]
+        return section + 1
+
+    def sort(self, column, order=Qt.SortOrder.AscendingOrder):
+        if self.preview is None:
+            return
+        self._sort = (column, order == Qt.SortOrder.DescendingOrder)
+        self.layoutAboutToBeChanged.emit()
+        self._view = sort_rows(self.preview, self._view, *self._sort)
+        self.layoutChanged.emit()
+
+
+class ClassSummaryModel(QAbstractTableModel):
+    """
+    반별 요약 표 모델 (수동 조정 시 바뀐 반의 행만 갱신)
+
+    학생을 끌어 와 반 행에 놓으면 move_requested(학생 목록, 반 번호)를 보낸다.
+    """
+    move_requested = pyqtSignal(list, int)
+
+    COLUMNS = ['학생수', '유효인원', '남학생수', '여학생수', '점수평균', '점수표준편차', '난이도합',
+               '특수반수', '전출생수', '원반혼합도', '위반']
+
+    def __init__(self):
+        super().__init__()
+        self._rows = {}  # 반 번호 -> 요약 행 (ManualEditor.summary_rows)
+        self._class_nums = []
+
+    def set_rows(self, rows, violations):
+        self.beginResetModel()
+        self._rows = dict(rows)
+        self._class_nums = sorted(rows)
+        self._set_violation_counts(violations)
+        self.endResetModel()
+
+    def update_classes(self, rows, class_nums, violations):
+        """바뀐 반의 요약 행과 반별 위반 수 갱신"""
+        for class_num in class_nums:
+            self._rows[class_num] = rows[class_num]
+        self._set_violation_counts(violations)
+        if self._class_nums:
+            self.dataChanged.emit(self.index(0, 0), self.index(len(self._class_nums) - 1, len(self.COLUMNS) - 1))
+
+    def _set_violation_counts(self, violations):
+        counts = Counter(c for violation in violations for c in violation.classes)
+        for class_num, row in self._rows.items():
+            row['위반'] = counts.get(class_num, 0)
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._class_nums)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.COLUMNS)
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        row = self._rows[self._class_nums[index.row()]]
+        column = self.COLUMNS[index.column()]
+        if role == Qt.ItemDataRole.DisplayRole:
+            value = row[column]
+            return "" if value is None else f"{value:g}" if isinstance(value, float) else str(value)
+        if role == Qt.ItemDataRole.TextAlignmentRole:
+            return Qt.AlignmentFlag.AlignCenter
+        if role == Qt.ItemDataRole.ForegroundRole and column == '위반' and row['위반']:
+            return VIOLATION_BRUSH
+        return None
+
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if role != Qt.ItemDataRole.DisplayRole:
+            return None
+        if orientation == Qt.Orientation.Horizontal:
+            return self.COLUMNS[section]
+        return f"{self._class_nums[section]}반"
+
+    def flags(self, index):
+        return super().flags(index) | Qt.ItemFlag.ItemIsDropEnabled
+
+    def mimeTypes(self):
+        return [STUDENT_MIME_TYPE]
+
+    def supportedDropActions(self):
+        return Qt.DropAction.CopyAction
+
+    def _drop_class(self, row, parent):
+        target = parent.row() if parent.isValid() else row
+        return self._class_nums[target] if 0 <= target < len(self._class_nums) else None
+
+    def canDropMimeData(self, data, action, row, column, parent):
+        return data.hasFormat(STUDENT_MIME_TYPE) and self._drop_class(row, parent) is not None
+
+    def dropMimeData(self, data, action, row, column, parent):
+        class_num = self._drop_class(row, parent)
+        if not data.hasFormat(STUDENT_MIME_TYPE) or class_num is None:
+            return False
+        students = [int(i) for i in bytes(data.data(STUDENT_MIME_TYPE)).decode().split(',') if i]
+        self.move_requested.emit(students, class_num)
+        return True
+
+
+class ResultExporter(QObject):
+    """
+    수동 조정한 결과를 백그라운드 프로세스에서 결과 파일로 다시 저장하는 객체
+
+    이동할 때마다 schedule()을 호출하면 DEBOUNCE_MS 동안 추가 이동이 없을 때 저장한다.
+    학생/규칙은 작업 프로세스를 시작할 때 한 번만 보내고 이후에는 학생별 반 번호만 보낸다.
+    저장 중에 다시 이동하면 저장이 끝난 뒤 최신 상태로 한 번 더 저장한다.
+    """
+    exported_signal = pyqtSignal(str)  # 저장한 파일
+    failed_signal = pyqtSignal(str)  # 오류 메시지
+    _done_signal = pyqtSignal(object)  # 작업 스레드 → GUI 스레드
+
+    DEBOUNCE_MS = 500
+
+    def __init__(self, editor, output_file):
+        super().__init__()
+        self.editor = editor
+        self.output_file = output_file
+        self.executor = ProcessPoolExecutor(
+            max_workers=1, mp_context=multiprocessing.get_context('spawn'), initializer=init_export_worker,
+            initargs=(editor.students, editor.separation_pairs, editor.together_groups,
+                      editor.target_class_count))
+        self._future = None
+        self._pending = False
+
+        self.debounce_timer = QTimer(self)
+        self.debounce_timer.setSingleShot(True)
+        self.debounce_timer.setInterval(self.DEBOUNCE_MS)
+        self.debounce_timer.timeout.connect(self._export)
+        self._done_signal.connect(self._on_done)
+
+    def schedule(self):
+        self.debounce_timer.start()
+
+    def is_busy(self):
+        return self.debounce_timer.isActive() or self._future is not None
+
+    def _export(self):
+        if self._future is not None:
+            self._pending = True
+            return
+        self._pending = False
+        assignments = [s.assigned_class for s in self.editor.students]
+        self._future = self.executor.submit(export_assignments, assignments, self.output_file)
+        self._future.add_done_callback(self._done_signal.emit)
+
+    def _on_done(self, future):
+        self._future = None
+        if future.cancelled():
+            return
+        try:
+            self.exported_signal.emit(future.result())
         except Exception as e:
-            self.log_signal.emit("")
-            self.log_signal.emit("=" * 70)
-            self.log_signal.emit(f"❌ 오류 발생: {str(e)}")
-            self.log_signal.emit("=" * 70)
-
-            import traceback
-            error_detail = traceback.format_exc()
-            self.log_signal.emit("")
-            self.log_signal.emit("상세 오류 정보:")
-            self.log_signal.emit(error_detail)
-
-            self.finished_signal.emit(
-                False,
-                f"학급 편성 중 오류가 발생했습니다:\n\n{str(e)}\n\n자세한 내용은 진행 상황 창을 확인하세요."
-            )
+            self.failed_signal.emit(str(e))
+        if self._pending:
+            self._export()
+
+    def flush(self):
+        """저장하지 않은 수정 내용을 저장하고 끝날 때까지 대기 (창을 닫을 때)"""
+        if self.debounce_timer.isActive() or self._pending:
+            self.debounce_timer.stop()
+            if self._future is not None:
+                self._future.result()
+            self._future = self.executor.submit(export_assignments,
+                                                [s.assigned_class for s in self.editor.students],
+                                                self.output_file)
+        if self._future is not None:
+            self._future.result()
+        self.executor.shutdown()
+
+    def shutdown(self):
+        self.debounce_timer.stop()
+        self.executor.shutdown(wait=False, cancel_futures=True)
 
 
 class ClassAssignerGUI(QMainWindow):
-    def __init__(self):
+    AUDIT_DEBOUNCE_MS = 500  # 수동 조정 후 이 시간 동안 추가 이동이 없으면 배정 상태 전체 검증
+
+    def __init__(self, startup_benchmark=None, profile_mode=None):
         super().__init__()
 
+        # 시작 시간 측정 모드 (None이면 끔, 문자열이면 기록 파일 경로 또는 '1')
+        self.startup_benchmark = startup_benchmark
+
+        # 진단 모드 (숨은 기능: Ctrl+Shift+D 또는 CLASS_ASSIGNER_PROFILE 환경 변수로 켬)
+        # 켜면 배정 실행을 cProfile/tracemalloc으로 측정해 결과 파일 옆에 보고서 저장
+        self.profile_mode = profile_mode
+
         # 파일 경로 저장
         self.student_file_path = None
         self.rules_file_path = None
-        self.assignment_thread = None
+        self.assignment_runner = None
+        self.editor = None  # 배정 결과 수동 조정 (ManualEditor)
+        self.exporter = None  # 수동 조정 결과 재저장 (ResultExporter)
+        self.state_errors = []  # 마지막 배정 상태 전체 검증의 상태 오류 (AuditViolation 목록)
+        self.audit_timer = QTimer(self)
+        self.audit_timer.setSingleShot(True)
+        self.audit_timer.setInterval(self.AUDIT_DEBOUNCE_MS)
+        self.audit_timer.timeout.connect(self.audit_edits)
+
+        # 입력 파일 미리 파싱
+        self.preparser = InputPreparser()
+        self.preparser.parsed_signal.connect(self.on_inputs_parsed)
+        self.preparser.failed_signal.connect(self.on_inputs_failed)
 
         # UI 구성
         self.init_ui()
@@ -110,6 +512,9 @@ class ClassAssignerGUI(QMainWindow):
         central_widget = QWidget()
         self.setCentralWidget(central_widget)
 
+        # 진단 모드 전환 (메뉴/버튼 없이 단축키로만)
+        QShortcut(QKeySequence("Ctrl+Shift+D"), self, activated=self.toggle_profile_mode)
+
         # 메인 레이아웃
         main_layout = QVBoxLayout()
         main_layout.setSpacing(15)
@@ -159,7 +564,19 @@ class ClassAssignerGUI(QMainWindow):
             }
         """)
         self.execute_btn.clicked.connect(self.execute_assignment)
-        main_layout.addWidget(self.execute_btn)
+
+        # 취소 버튼 (실행 중에만 활성화)
+        self.cancel_btn = QPushButton("⏹ 취소")
+        self.cancel_btn.setMinimumHeight(60)
+        self.cancel_btn.setMinimumWidth(100)
+        self.cancel_btn.setFont(exec_font)
+        self.cancel_btn.setEnabled(False)
+        self.cancel_btn.clicked.connect(self.cancel_assignment)
+
+        execute_layout = QHBoxLayout()
+        execute_layout.addWidget(self.execute_btn, stretch=1)
+        execute_layout.addWidget(self.cancel_btn)
+        main_layout.addLayout(execute_layout)
 
         # 구분선
         line2 = QFrame()
@@ -175,11 +592,27 @@ class ClassAssignerGUI(QMainWindow):
         progress_label.setFont(progress_font)
         main_layout.addWidget(progress_label)
 
+        # 현재 단계 표시
+        self.phase_label = QLabel("")
+        self.phase_label.setFont(QFont("", 11))
+        main_layout.addWidget(self.phase_label)
+
+        # 전체 진행률
+        self.progress_bar = QProgressBar()
+        self.progress_bar.setRange(0, 1000)
+        self.progress_bar.setTextVisible(False)
+        main_layout.addWidget(self.progress_bar)
+
         self.progress_text = QTextEdit()
         self.progress_text.setReadOnly(True)
         self.progress_text.setFont(QFont("Courier", 10))
         self.progress_text.setMinimumHeight(200)
-        main_layout.addWidget(self.progress_text)
+
+        # 진행 로그 / 배정 결과 탭
+        self.tabs = QTabWidget()
+        self.tabs.addTab(self.progress_text, "📝 진행 로그")
+        self.tabs.addTab(self.create_result_section(), "📋 배정 결과")
+        main_layout.addWidget(self.tabs)
 
         # 초기 메시지
         self.log_message("대기 중... 파일을 선택하고 '학급 편성 시작' 버튼을 눌러주세요.")
@@ -308,8 +741,206 @@ class ClassAssignerGUI(QMainWindow):
         
         layout.addLayout(count_layout)
 
+        # 미리 읽은 입력 요약 (학생 수, 규칙 수, 규칙 충돌)
+        self.input_summary_label = QLabel("")
+        self.input_summary_label.setWordWrap(True)
+        layout.addWidget(self.input_summary_label)
+
+        return widget
+
+    def create_result_section(self):
+        """배정 결과 미리보기 섹션 생성 (필터 + 표)"""
+        widget = QWidget()
+        layout = QVBoxLayout()
+        widget.setLayout(layout)
+
+        filter_layout = QHBoxLayout()
+        self.class_filter = QComboBox()
+        self.class_filter.addItem("전체 반", None)
+        self.gender_filter = QComboBox()
+        for label, value in [("전체 성별", None), ("남", '남'), ("여", '여')]:
+            self.gender_filter.addItem(label, value)
+        self.flag_filter = QComboBox()
+        self.flag_filter.addItem("전체 학생", None)
+        for flag in FLAG_COLUMNS:
+            self.flag_filter.addItem(flag, flag)
+        self.search_edit = QLineEdit()
+        self.search_edit.setPlaceholderText("🔍 이름/비고 검색")
+        self.search_edit.setClearButtonEnabled(True)
+        for combo in (self.class_filter, self.gender_filter, self.flag_filter):
+            combo.currentIndexChanged.connect(self.apply_result_filter)
+            filter_layout.addWidget(combo)
+        self.search_edit.textChanged.connect(self.apply_result_filter)
+        filter_layout.addWidget(self.search_edit, stretch=1)
+        layout.addLayout(filter_layout)
+
+        # 반별 요약 (학생을 끌어 와 놓으면 그 반으로 이동)
+        self.summary_model = ClassSummaryModel()
+        self.summary_model.move_requested.connect(self.move_students)
+        self.summary_table = QTableView()
+        self.summary_table.setModel(self.summary_model)
+        self.summary_table.setDragDropMode(QAbstractItemView.DragDropMode.DropOnly)
+        self.summary_table.setDefaultDropAction(Qt.DropAction.CopyAction)
+        self.summary_table.setDropIndicatorShown(True)
+        self.summary_table.verticalHeader().setDefaultSectionSize(22)
+        self.summary_table.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeMode.ResizeToContents)
+
+        self.result_model = ResultTableModel()
+        self.result_table = QTableView()
+        self.result_table.setModel(self.result_model)
+        self.result_table.setSortingEnabled(True)
+        self.result_table.setAlternatingRowColors(False)  # 규칙 색상과 겹치지 않도록
+        self.result_table.setSelectionBehavior(QTableView.SelectionBehavior.SelectRows)
+        self.result_table.setDragDropMode(QAbstractItemView.DragDropMode.DragOnly)
+        self.result_table.setContextMenuPolicy(Qt.ContextMenuPolicy.CustomContextMenu)
+        self.result_table.customContextMenuRequested.connect(self.show_move_menu)
+        self.result_table.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Interactive)
+        self.result_table.verticalHeader().setDefaultSectionSize(22)
+
+        splitter = QSplitter(Qt.Orientation.Vertical)
+        splitter.addWidget(self.summary_table)
+        splitter.addWidget(self.result_table)
+        splitter.setStretchFactor(1, 1)
+        layout.addWidget(splitter, stretch=1)
+
+        # 편차 / 규칙 위반 / 재저장 상태
+        self.spread_label = QLabel("")
+        self.violation_label = QLabel("")
+        self.violation_label.setWordWrap(True)
+        layout.addWidget(self.spread_label)
+        layout.addWidget(self.violation_label)
+
+        status_layout = QHBoxLayout()
+        self.result_count_label = QLabel("")
+        self.export_status_label = QLabel("")
+        self.undo_btn = QPushButton("↩ 되돌리기")
+        self.undo_btn.setEnabled(False)
+        self.undo_btn.clicked.connect(self.undo_move)
+        QShortcut(QKeySequence.StandardKey.Undo, widget, activated=self.undo_move)
+        status_layout.addWidget(self.result_count_label)
+        status_layout.addStretch(1)
+        status_layout.addWidget(self.export_status_label)
+        status_layout.addWidget(self.undo_btn)
+        layout.addLayout(status_layout)
         return widget
 
+    def show_result_preview(self, preview):
+        """배정 결과 표 갱신 (이후 학생을 반 요약 표로 끌어 옮겨 수동 조정 가능)"""
+        self.editor = ManualEditor.from_preview(preview)
+        self.stop_exporter()
+        self.exporter = ResultExporter(self.editor, self.assignment_runner.output_file)
+        self.exporter.exported_signal.connect(self.on_edits_exported)
+        self.exporter.failed_signal.connect(self.on_edits_export_failed)
+        self.export_status_label.setText("")
+        self.undo_btn.setEnabled(False)
+
+        self.class_filter.blockSignals(True)
+        self.class_filter.clear()
+        self.class_filter.addItem("전체 반", None)
+        for class_num in range(1, preview.class_count + 1):
+            self.class_filter.addItem(f"{class_num}반", class_num)
+        self.class_filter.blockSignals(False)
+
+        self.result_model.set_preview(preview)
+        self.apply_result_filter()
+        self.result_table.resizeColumnsToContents()
+        self.summary_model.set_rows(self.editor.summary_rows(), self.editor.violations)
+        self.audit_timer.stop()
+        self.audit_edits()
+        self.tabs.setCurrentIndex(1)
+
+    def move_students(self, students, class_num):
+        """학생들을 다른 반으로 이동하고 바뀐 반의 통계/위반 표시만 갱신"""
+        if self.editor is None:
+            return
+        changed = set()
+        for index in students:
+            changed |= self.editor.move(index, class_num)
+        if changed:
+            self.refresh_after_edit(changed)
+
+    def undo_move(self):
+        if self.editor is not None and self.editor.history:
+            self.refresh_after_edit(self.editor.undo())
+
+    def refresh_after_edit(self, changed):
+        update_preview(self.editor, self.result_model.preview, changed)
+        violations = self.editor.violations
+        self.result_model.rows_changed()
+        self.result_model.set_violations(violations)
+        self.summary_model.update_classes(self.editor.summary_rows(), changed, violations)
+        self.update_edit_status(violations)
+        self.audit_timer.start()
+        self.exporter.schedule()
+        self.export_status_label.setText("💾 저장 대기 중...")
+
+    def audit_edits(self):
+        """배정 상태 전체 검증 (수동 조정 중에는 이동이 멈춘 뒤 한 번, AUDIT_DEBOUNCE_MS)"""
+        if self.editor is None:
+            return
+        self.state_errors = self.editor.audit().state_violations
+        self.update_edit_status()
+
+    def update_edit_status(self, violations=None):
+        """반별 편차와 규칙 위반 목록 표시 (상태 오류는 마지막 audit_edits 결과)"""
+        violations = self.editor.violations if violations is None else violations
+        state_errors = self.state_errors
+        spreads = self.editor.spreads()
+        self.spread_label.setText(
+            f"반별 편차(최대-최소): 유효인원 {spreads['유효인원편차']:g}, 유효남학생 {spreads['유효남학생편차']:g}, "
+            f"유효여학생 {spreads['유효여학생편차']:g}, 점수평균 {spreads['점수평균편차']:g}, "
+            f"난이도합 {spreads['난이도합편차']:g}")
+        if state_errors:
+            shown = [v.message() for v in state_errors[:5]]
+            more = f" 외 {len(state_errors) - 5}건" if len(state_errors) > 5 else ""
+            self.violation_label.setStyleSheet("color: #C62828;")
+            self.violation_label.setText(f"❌ 배정 상태 오류 {len(state_errors)}건: " + " / ".join(shown) + more)
+        elif violations:
+            shown = [v.message() for v in violations[:5]]
+            more = f" 외 {len(violations) - 5}건" if len(violations) > 5 else ""
+            self.violation_label.setStyleSheet("color: #C62828;")
+            self.violation_label.setText(f"⚠️ 규칙 위반 {len(violations)}건: " + " / ".join(shown) + more)
+        else:
+            self.violation_label.setStyleSheet("color: #2E7D32;")
+            self.violation_label.setText("✅ 규칙 위반 없음")
+        self.undo_btn.setEnabled(bool(self.editor.history))
+
+    def show_move_menu(self, pos):
+        """결과 표 오른쪽 클릭: 선택한 학생을 다른 반으로 이동"""
+        rows = sorted({index.row() for index in self.result_table.selectionModel().selectedRows()})
+        if self.editor is None or not rows:
+            return
+        students = [self.result_model.preview.student_index[self.result_model.source_row(r)] for r in rows]
+        menu = QMenu(self)
+        move_menu = menu.addMenu(f"➡️ {len(students)}명 다른 반으로 이동")
+        for class_num in range(1, self.editor.target_class_count + 1):
+            move_menu.addAction(f"{class_num}반", lambda c=class_num: self.move_students(students, c))
+        menu.exec(self.result_table.viewport().mapToGlobal(pos))
+
+    def on_edits_exported(self, output_file):
+        if not self.exporter.is_busy():
+            self.export_status_label.setText(f"✅ 수정 내용 저장됨 ({time.strftime('%H:%M:%S')})")
+
+    def on_edits_export_failed(self, error):
+        self.export_status_label.setText(f"⚠️ 저장 실패: {error}")
+
+    def stop_exporter(self):
+        if self.exporter is not None:
+            self.exporter.shutdown()
+            self.exporter = None
+
+    def apply_result_filter(self):
+        if self.result_model.preview is None:
+            return
+        self.result_model.set_filter(
+            class_num=self.class_filter.currentData(),
+            gender=self.gender_filter.currentData(),
+            flag=self.flag_filter.currentData(),
+            text=self.search_edit.text(),
+        )
+        self.result_count_label.setText(
+            f"{self.result_model.rowCount()}명 표시 / 전체 {len(self.result_model.preview.rows)}명")
+
     def load_default_files(self):
         """기본 파일 경로 로드"""
         base_dir = os.getcwd()
@@ -324,6 +955,43 @@ class ClassAssignerGUI(QMainWindow):
             self.rules_file_path = default_rules
             self.update_file_label(self.rules_file_label, default_rules)
 
+        self.request_preparse()
+
+    def request_preparse(self):
+        """두 파일이 모두 선택되면 백그라운드 파싱 시작"""
+        if not (self.student_file_path and self.rules_file_path
+                and os.path.exists(self.student_file_path) and os.path.exists(self.rules_file_path)):
+            return
+        self.input_summary_label.setStyleSheet("color: #666666;")
+        self.input_summary_label.setText("⏳ 입력 파일 확인 중...")
+        self.preparser.request(self.student_file_path, self.rules_file_path)
+
+    def _is_current_inputs(self, student_file, rules_file):
+        return (student_file, rules_file) == (self.student_file_path, self.rules_file_path)
+
+    def on_inputs_parsed(self, parsed):
+        """미리 읽은 명단/규칙 요약 표시 (이전에 선택했던 파일의 결과는 무시)"""
+        if not self._is_current_inputs(parsed.student_file, parsed.rules_file):
+            return
+        summary = parsed.summary()
+        text = (f"👥 학생 {summary['학생수']}명 (남 {summary['남학생수']}, 여 {summary['여학생수']} / "
+                f"특수반 {summary['특수반수']}, 전출 {summary['전출생수']}) · 원반 {summary['원반수']}개 · "
+                f"분반 {summary['분반쌍']}쌍 · 합반 {summary['합반그룹']}그룹")
+        if parsed.conflicts:
+            self.input_summary_label.setStyleSheet("color: #C62828; font-weight: bold;")
+            self.input_summary_label.setText(f"{text}\n⚠️ 규칙 충돌 {len(parsed.conflicts)}건 - 진행 상황 창을 확인하세요.")
+            self.log_message("⚠️  규칙 충돌:")
+            self.log_message("\n".join(parsed.conflicts))
+        else:
+            self.input_summary_label.setStyleSheet("color: #2E7D32;")
+            self.input_summary_label.setText(f"{text}\n✅ 규칙 충돌 없음")
+
+    def on_inputs_failed(self, student_file, rules_file, error):
+        if not self._is_current_inputs(student_file, rules_file):
+            return
+        self.input_summary_label.setStyleSheet("color: #C62828;")
+        self.input_summary_label.setText(f"⚠️ 입력 파일을 읽을 수 없습니다: {error}")
+
     def update_file_label(self, label, filepath):
         """파일 라벨 업데이트"""
         filename = os.path.basename(filepath)
@@ -348,13 +1016,14 @@ class ClassAssignerGUI(QMainWindow):
             self,
             "5학년 명단 파일을 선택하세요",
             initialdir,
-            "Excel files (*.xlsx);;All files (*.*)"
+            "입력 파일 (*.xlsx *.csv *.parquet);;Excel files (*.xlsx);;All files (*.*)"
         )
 
         if filename:
             self.student_file_path = filename
             self.update_file_label(self.student_file_label, filename)
             self.log_message(f"✅ 명단 파일 선택됨: {os.path.basename(filename)}")
+            self.request_preparse()
 
     def select_rules_file(self):
         """분반/합반 규칙 파일 선택"""
@@ -365,21 +1034,49 @@ class ClassAssignerGUI(QMainWindow):
             self,
             "분반/합반 규칙 파일을 선택하세요",
             initialdir,
-            "Excel files (*.xlsx);;All files (*.*)"
+            "입력 파일 (*.xlsx *.csv *.parquet);;Excel files (*.xlsx);;All files (*.*)"
         )
 
         if filename:
             self.rules_file_path = filename
             self.update_file_label(self.rules_file_label, filename)
             self.log_message(f"✅ 규칙 파일 선택됨: {os.path.basename(filename)}")
+            self.request_preparse()
 
     def log_message(self, message):
         """진행 상황 로그 추가"""
         self.progress_text.append(message)
 
+    def toggle_profile_mode(self):
+        """진단 모드 켜기/끄기 (다음 배정 실행부터 적용)"""
+        self.profile_mode = None if self.profile_mode else 'all'
+        if self.profile_mode:
+            self.log_message("🔬 진단 모드 켜짐: 다음 배정 실행 시간/메모리를 측정해 결과 파일 옆에 "
+                             ".prof/.profile.txt로 저장합니다 (실행이 느려집니다)")
+        else:
+            self.log_message("🔬 진단 모드 꺼짐")
+
     def clear_log(self):
         """로그 초기화"""
         self.progress_text.clear()
+        self.tabs.setCurrentIndex(0)
+        self.phase_label.setText("")
+        self.progress_bar.setValue(0)
+
+    def on_assignment_events(self, events):
+        """배정 이벤트 묶음 표시 (로그는 한 번에 추가)"""
+        lines = [event.message for event in events if event.kind == 'log']
+        if lines:
+            self.log_message("\n".join(lines))
+
+        phases = [event for event in events if event.kind == 'phase']
+        if phases:
+            phase = phases[-1]
+            self.phase_label.setText(f"⏳ [{phase.step}/{phase.total}] {phase.message}")
+
+        fractions = [event.fraction for event in events if event.kind in ('phase', 'progress')]
+        if fractions:
+            self.progress_bar.setValue(int(fractions[-1] * 1000))
 
     def execute_assignment(self):
         """학급 편성 실행"""
@@ -392,30 +1089,54 @@ class ClassAssignerGUI(QMainWindow):
             QMessageBox.critical(self, "오류", "분반/합반 규칙 파일을 선택해주세요.")
             return
 
+        # 미리 읽은 입력이 현재 파일과 같으면 재사용 (규칙 충돌이 있으면 시작하지 않음)
+        parsed_inputs = self.preparser.get(self.student_file_path, self.rules_file_path)
+        if parsed_inputs is not None and parsed_inputs.conflicts:
+            QMessageBox.critical(
+                self, "규칙 충돌",
+                "규칙 충돌이 발견되었습니다. 규칙 파일을 수정한 후 다시 실행해주세요.\n\n"
+                + "\n".join(parsed_inputs.conflicts)
+            )
+            return
+
         # 출력 파일 경로
         output_dir = os.path.dirname(self.student_file_path)
         output_file = os.path.join(output_dir, '03 배정 결과.xlsx')
 
+        # 이전 결과의 수동 조정 저장 중지 (새 결과로 덮어씀)
+        self.stop_exporter()
+        self.editor = None
+
         # UI 비활성화
         self.execute_btn.setEnabled(False)
+        self.cancel_btn.setEnabled(True)
         self.clear_log()
 
-        # 백그라운드 스레드 생성 및 실행
+        # 작업 프로세스 생성 및 실행
         target_count = self.class_count_spin.value()
-        self.assignment_thread = AssignmentThread(
+        self.assignment_runner = AssignmentRunner(
             self.student_file_path,
             self.rules_file_path,
             output_file,
-            target_count
+            target_count,
+            parsed_inputs=parsed_inputs,
+            profile=self.profile_mode
         )
-        self.assignment_thread.log_signal.connect(self.log_message)
-        self.assignment_thread.finished_signal.connect(self.on_assignment_finished)
-        self.assignment_thread.start()
+        self.assignment_runner.events_signal.connect(self.on_assignment_events)
+        self.assignment_runner.finished_signal.connect(self.on_assignment_finished)
+        self.assignment_runner.cancelled_signal.connect(self.on_assignment_cancelled)
+        self.assignment_runner.result_signal.connect(self.show_result_preview)
+        self.assignment_runner.start()
 
     def on_assignment_finished(self, success, message):
         """학급 편성 완료 처리"""
+        self.phase_label.setText("✅ 완료" if success else "❌ 실패")
+        if success:
+            self.progress_bar.setValue(self.progress_bar.maximum())
+
         # UI 다시 활성화
         self.execute_btn.setEnabled(True)
+        self.cancel_btn.setEnabled(False)
 
         # 결과 메시지 표시
         if success:
@@ -423,19 +1144,87 @@ class ClassAssignerGUI(QMainWindow):
         else:
             QMessageBox.critical(self, "오류", message)
 
+    def cancel_assignment(self):
+        """실행 중인 학급 편성 취소"""
+        if self.assignment_runner and self.assignment_runner.is_running():
+            self.cancel_btn.setEnabled(False)
+            self.phase_label.setText("⏹️ 취소 중...")
+            self.assignment_runner.cancel()
+
+    def on_assignment_cancelled(self):
+        """학급 편성 취소 완료 처리 (결과 파일은 만들어지지 않음)"""
+        self.phase_label.setText("⏹️ 취소됨")
+        self.log_message("⏹️  학급 편성이 취소되었습니다. 결과 파일은 저장되지 않았습니다.")
+        self.execute_btn.setEnabled(True)
+        self.cancel_btn.setEnabled(False)
+
+    def showEvent(self, event):
+        super().showEvent(event)
+        if self.startup_benchmark:
+            # 첫 화면이 그려진 뒤 시간 기록 후 종료
+            QTimer.singleShot(0, self.report_startup_time)
+
+    def report_startup_time(self):
+        """모듈 import 시작부터 창이 처음 표시될 때까지 걸린 시간 기록"""
+        if not self.startup_benchmark:
+            return
+        elapsed_ms = (time.perf_counter() - _STARTUP_TIME) * 1000
+        if sys.stdout is not None:  # PyInstaller --windowed 빌드에는 표준 출력이 없음
+            print(f"STARTUP_MS {elapsed_ms:.1f}", flush=True)
+        if self.startup_benchmark != '1':
+            record = {
+                'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S'),
+                'startup_ms': round(elapsed_ms, 1),
+                'frozen': bool(getattr(sys, 'frozen', False)),
+                'heavy_modules_loaded': [m for m in ('pandas', 'numpy', 'openpyxl', 'tkinter') if m in sys.modules],
+            }
+            with open(self.startup_benchmark, 'a', encoding='utf-8') as f:
+                f.write(json.dumps(record, ensure_ascii=False) + '\n')
+        self.startup_benchmark = None
+        QApplication.quit()
+
+    def closeEvent(self, event):
+        """창을 닫으면 실행 중인 작업 프로세스도 종료"""
+        if self.assignment_runner and self.assignment_runner.is_running():
+            self.assignment_runner.stop()
+        self.preparser.shutdown()
+        if self.exporter is not None:
+            try:
+                self.exporter.flush()
+            except Exception as e:
+                QMessageBox.warning(self, "저장 실패", f"수정 내용을 저장하지 못했습니다:\n\n{e}")
+        super().closeEvent(event)
+
 
 def main():
-    """PyQt6 애플리케이션 실행"""
+    """
+    PyQt6 애플리케이션 실행
+
+    --startup-benchmark 옵션 또는 CLASS_ASSIGNER_STARTUP_BENCHMARK 환경 변수(기록 파일 경로, '1'이면 출력만)가
+    있으면 창이 처음 표시될 때까지의 시간을 기록하고 바로 종료한다.
+    CLASS_ASSIGNER_PROFILE 환경 변수(cpu, memory, all)가 있으면 진단 모드로 시작한다.
+    """
+    startup_benchmark = os.environ.get('CLASS_ASSIGNER_STARTUP_BENCHMARK')
+    if '--startup-benchmark' in sys.argv:
+        sys.argv.remove('--startup-benchmark')
+        startup_benchmark = startup_benchmark or '1'
+
     app = QApplication(sys.argv)
 
     # 애플리케이션 스타일 설정
     app.setStyle('Fusion')
 
-    window = ClassAssignerGUI()
+    profile_mode = os.environ.get('CLASS_ASSIGNER_PROFILE') or None
+    if profile_mode is not None and profile_mode not in PROFILE_MODES:
+        profile_mode = 'all'
+
+    window = ClassAssignerGUI(startup_benchmark=startup_benchmark, profile_mode=profile_mode)
     window.show()
 
     sys.exit(app.exec())
 
 
 if __name__ == '__main__':
+    # PyInstaller 빌드에서 작업 프로세스(spawn)가 GUI를 다시 띄우지 않도록 가장 먼저 호출
+    multiprocessing.freeze_support()
     main()
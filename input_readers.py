@@ -0,0 +1,264 @@
+"""
+입력 파일 리더
+학생 명단 행을 Student로 바꾸는 공통 변환, pandas DataFrame 없이 xlsx 명단을 읽는 스트리밍 리더,
+학생 정보 시스템에서 내려받은 CSV / Parquet 명단과 규칙을 읽는 플러그인 방식 입력기.
+
+stream_xlsx_students는 openpyxl 읽기 전용 모드로 시트 XML을 한 행씩 읽어 바로 Student를 만든다.
+시트 전체를 DataFrame으로 만든 뒤 다시 변환하지 않으므로 최대 메모리는 결과 학생 목록 크기에
+비례한다. 필수 컬럼은 첫 행(헤더)에서 찾고, 필수 컬럼이 없는 시트는 헤더 행만 읽고 건너뛴다.
+
+CSV / Parquet 입력 (확장자로 구분, read_students/read_rules가 자동으로 사용):
+    명단  한 표에 모든 학생. 컬럼은 xlsx 명단 시트와 같음 (학년, 반, 번호, 이름, 성별, 점수, ...)
+    규칙  규칙, 이름, 상대, 그룹 컬럼의 표
+          규칙='분반': 이름과 상대를 다른 반으로 (한 행에 한 쌍)
+          규칙='합반': 그룹 값이 같은 행의 학생을 같은 반으로 (한 행에 한 명)
+모두 xlsx 리더와 같은 형태(Student 목록, (분반 쌍 목록, 합반 그룹 목록))로 돌려준다.
+"""
+
+import csv
+import importlib.util
+import math
+import os
+from typing import Callable, Dict, Iterable, List, Mapping, Optional, Set, Tuple, Type
+
+from assignment_log import get_logger
+from class_assigner import Student, is_missing
+
+log = get_logger()
+
+# 명단 시트 컬럼 (헤더 이름), 이 중 REQUIRED_COLUMNS가 모두 있어야 명단 시트로 읽음
+ROSTER_COLUMNS = ('학년', '반', '번호', '이름', '성별', '점수', '특수반', '전출', '난이도', '비고')
+REQUIRED_COLUMNS = ('학년', '반', '번호', '이름')
+# 표 형식 규칙 파일 컬럼
+RULE_COLUMNS = ('규칙', '이름', '상대', '그룹')
+# CSV 인코딩 (엑셀/학생 정보 시스템이 내보내는 UTF-8 BOM, 한글 윈도우 기본 CP949 순서로 시도)
+CSV_ENCODINGS = ('utf-8-sig', 'cp949')
+
+
+def student_from_row(row: Mapping) -> Student:
+    """
+    명단 한 행(컬럼 이름 → 값)을 Student로 변환
+
+    빈 칸(None, NaN)은 Student 기본값으로, 빈 점수는 NaN으로 둔다 (pandas로 읽은 행과 같은 결과).
+    """
+    score = row['점수']
+    return Student(
+        학년=int(row['학년']),
+        원반=int(row['반']),
+        원번호=int(row['번호']),
+        이름=str(row['이름']),
+        성별=str(row['성별']),
+        점수=float('nan') if is_missing(score) else float(score),
+        특수반=row['특수반'],
+        전출=row['전출'],
+        난이도=row['난이도'],
+        비고=row['비고']
+    )
+
+
+def header_columns(header: tuple) -> Dict[str, int]:
+    """헤더 행에서 명단 컬럼 이름 → 열 번호 (같은 이름이 여러 번 있으면 첫 번째, pandas와 같음)"""
+    columns = {}
+    for index, value in enumerate(header):
+        if value is not None and str(value) in ROSTER_COLUMNS:
+            columns.setdefault(str(value), index)
+    return columns
+
+
+def stream_xlsx_students(student_file: str,
+                         checkpoint: Optional[Callable[..., None]] = None) -> List[Student]:
+    """
+    xlsx 명단의 모든 시트를 한 행씩 읽어 Student 목록 생성 (read_students의 기본 리더)
+
+    필수 컬럼(학년/반/번호/이름)이 없는 시트는 건너뛴다. 없는 선택 컬럼은 빈 칸으로 보고,
+    모든 칸이 빈 행(서식만 남은 행)은 무시한다.
+
+    Args:
+        checkpoint: 시트/행마다 호출할 함수 (read_students 참고)
+    """
+    if checkpoint is None:
+        checkpoint = lambda done=0, total=0: None
+
+    from openpyxl import load_workbook
+
+    try:
+        wb = load_workbook(student_file, read_only=True, data_only=True)
+        sheet_names = wb.sheetnames
+        log.info("   ℹ️  감지된 시트: %s", sheet_names)
+    except Exception as e:
+        log.error("   ❌ 파일 읽기 오류: %s", e)
+        raise
+
+    all_students = []
+    try:
+        for sheet_idx, sheet_name in enumerate(sheet_names):
+            checkpoint(sheet_idx, len(sheet_names))
+            try:
+                rows = wb[sheet_name].iter_rows(values_only=True)
+                columns = header_columns(next(rows, ()))
+            except Exception as e:
+                log.warning("   ⚠️  Error reading sheet '%s': %s", sheet_name, e)
+                continue
+            if not all(col in columns for col in REQUIRED_COLUMNS):
+                log.warning("   ⚠️  Skipping sheet '%s': 필수 컬럼 누락", sheet_name)
+                continue
+
+            # 컬럼 이름 → 열 번호 (시트에 없는 컬럼은 None)
+            positions = [(name, columns.get(name)) for name in ROSTER_COLUMNS]
+            for values in rows:
+                checkpoint()
+                if all(value is None for value in values):
+                    continue
+                row = {name: values[index] if index is not None and index < len(values) else None
+                       for name, index in positions}
+                all_students.append(student_from_row(row))
+    finally:
+        wb.close()  # 읽기 전용 모드는 파일을 열어 둔 채로 읽음
+
+    return all_students
+
+
+def csv_value(text: str):
+    """CSV 칸 값 변환: 빈 칸은 None, 숫자는 int/float (엑셀 셀 값과 같은 형태), 나머지는 문자열 그대로"""
+    if not text:
+        return None
+    try:
+        return int(text)
+    except ValueError:
+        pass
+    try:
+        value = float(text)
+    except ValueError:
+        return text
+    return value if math.isfinite(value) else text  # 'nan', 'inf' 같은 이름은 문자열로
+
+
+def _is_blank(value) -> bool:
+    return is_missing(value) or (isinstance(value, str) and not value.strip())
+
+
+class InputReader:
+    """표 형식 입력 파일 리더 기본 클래스 (명단 = 학생 한 명당 한 행, 규칙 = RULE_COLUMNS 표)"""
+    name = ''
+    extensions: Tuple[str, ...] = ()
+
+    def rows(self, path: str, checkpoint: Callable[..., None]) -> Iterable[Dict[str, object]]:
+        """파일의 행을 (컬럼 이름 → 값)으로 차례로 반환 (빈 칸은 None 또는 NaN)"""
+        raise NotImplementedError
+
+    def read_students(self, path: str, checkpoint: Optional[Callable[..., None]] = None) -> List[Student]:
+        """명단 표 → Student 목록 (필수 컬럼이 없으면 ValueError, 빈 행은 무시)"""
+        if checkpoint is None:
+            checkpoint = lambda done=0, total=0: None
+        students = []
+        for line, row in enumerate(self.rows(path, checkpoint), 2):  # 1행은 헤더
+            if line == 2:
+                missing = [col for col in REQUIRED_COLUMNS if col not in row]
+                if missing:
+                    raise ValueError(f"명단 필수 컬럼 누락: {', '.join(missing)}")
+            if all(_is_blank(value) for value in row.values()):
+                continue
+            students.append(student_from_row({col: row.get(col) for col in ROSTER_COLUMNS}))
+        return students
+
+    def read_rules(self, path: str) -> Tuple[List[Tuple[str, str]], List[Set[str]]]:
+        """규칙 표 → (분반 쌍 목록, 합반 그룹 목록) (그룹은 처음 나온 순서, 잘못된 행은 ValueError)"""
+        separation_pairs = []
+        groups: Dict[object, Set[str]] = {}
+        for line, row in enumerate(self.rows(path, lambda done=0, total=0: None), 2):  # 1행은 헤더
+            if line == 2:
+                missing = [col for col in ('규칙', '이름') if col not in row]
+                if missing:
+                    raise ValueError(f"규칙 필수 컬럼 누락: {', '.join(missing)}")
+            kind, name, other, group = (row.get(col) for col in RULE_COLUMNS)
+            if all(_is_blank(value) for value in (kind, name, other, group)):
+                continue
+            if _is_blank(name):
+                raise ValueError(f"{line}행: 이름이 없습니다")
+            kind = str(kind).strip() if not _is_blank(kind) else ''
+            if kind == '분반':
+                if _is_blank(other):
+                    raise ValueError(f"{line}행: 분반 상대가 없습니다")
+                separation_pairs.append((str(name), str(other)))
+            elif kind == '합반':
+                if _is_blank(group):
+                    raise ValueError(f"{line}행: 합반 그룹이 없습니다")
+                groups.setdefault(group, set()).add(str(name))
+            else:
+                raise ValueError(f"{line}행: 규칙은 '분반' 또는 '합반'이어야 합니다: {kind or '(빈 칸)'}")
+        return separation_pairs, list(groups.values())
+
+
+class CsvInputReader(InputReader):
+    """CSV 명단/규칙 (UTF-8 BOM 또는 CP949, 숫자 칸은 숫자로 변환)"""
+    name = 'csv'
+    extensions = ('.csv',)
+
+    def rows(self, path, checkpoint):
+        # 인코딩은 파일 전체를 먼저 확인 (읽는 도중에 실패해 반쯤 만든 결과가 섞이지 않도록)
+        encoding = self.encoding(path)
+        with open(path, newline='', encoding=encoding) as f:
+            reader = csv.reader(f)
+            header = [column.strip() for column in next(reader, [])]
+            for values in reader:
+                checkpoint()
+                values += [''] * (len(header) - len(values))  # 끝의 빈 칸이 생략된 행
+                yield {column: csv_value(value) for column, value in zip(header, values) if column}
+
+    @staticmethod
+    def encoding(path: str) -> str:
+        for encoding in CSV_ENCODINGS:
+            try:
+                with open(path, encoding=encoding) as f:
+                    for _ in iter(lambda: f.read(2 ** 20), ''):
+                        pass
+                return encoding
+            except UnicodeDecodeError:
+                continue
+        raise ValueError(f"CSV 인코딩을 알 수 없습니다 (지원: {', '.join(CSV_ENCODINGS)})")
+
+
+class ParquetInputReader(InputReader):
+    """Parquet 명단/규칙 (pandas + pyarrow 또는 fastparquet 필요)"""
+    name = 'parquet'
+    extensions = ('.parquet', '.pq')
+
+    @staticmethod
+    def available() -> bool:
+        return any(importlib.util.find_spec(engine) is not None for engine in ('pyarrow', 'fastparquet'))
+
+    def rows(self, path, checkpoint):
+        if not self.available():
+            raise ImportError("Parquet 입력에는 pyarrow가 필요합니다: pip install pyarrow")
+        import pandas as pd
+        df = pd.read_parquet(path)
+        columns = [str(column) for column in df.columns]
+        for values in df.itertuples(index=False, name=None):
+            checkpoint()
+            yield dict(zip(columns, values))
+
+
+READERS: Dict[str, Type[InputReader]] = {
+    'csv': CsvInputReader,
+    'parquet': ParquetInputReader,
+}
+
+
+def register_reader(reader_class: Type[InputReader]):
+    """사용자 정의 입력기 등록 (extensions의 확장자 파일을 이 입력기로 읽음)"""
+    READERS[reader_class.name] = reader_class
+    return reader_class
+
+
+def reader_for(path: str) -> Optional[InputReader]:
+    """확장자에 맞는 표 형식 입력기 (xlsx 등 등록되지 않은 확장자는 None → 엑셀 리더)"""
+    extension = os.path.splitext(path)[1].lower()
+    for reader_class in READERS.values():
+        if extension in reader_class.extensions:
+            return reader_class()
+    return None
+
+
+def input_extensions() -> List[str]:
+    """지원하는 입력 파일 확장자 (xlsx + 등록된 입력기)"""
+    return ['.xlsx'] + [ext for reader_class in READERS.values() for ext in reader_class.extensions]
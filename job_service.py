@@ -0,0 +1,421 @@
+"""
+학급 편성 작업 서버 (로컬 HTTP)
+교내 서버에서 실행해 두면 교직원이 프로그램 설치 없이 브라우저로 명단/규칙 파일을 올려
+배정을 실행하고 결과 파일을 받을 수 있다. 표준 라이브러리만 사용하며 인터넷 연결이 필요 없다.
+
+작업은 대기열에 넣고 미리 띄워 둔 작업 프로세스 풀에서 실행한다. 작업 프로세스는 시작할 때
+pandas/openpyxl과 배정 모듈을 한 번만 불러오므로 요청마다 불러오기/시작 비용이 들지 않는다.
+
+사용법:
+    python job_service.py                                # http://127.0.0.1:8765
+    python job_service.py --host 0.0.0.0 --port 8080 -j 4 --timeout 300 --work-dir 작업/
+
+HTTP API:
+    GET  /                       업로드 화면
+    POST /jobs                   multipart/form-data (roster, rules 파일, classes, seed) → 202 + 작업 정보
+    GET  /jobs                   작업 목록
+    GET  /jobs/<id>              작업 상태 (queued / running / ok / invalid / infeasible / timeout / error)
+    GET  /jobs/<id>/result       결과 파일 (.xlsx) 다운로드
+    GET  /jobs/<id>/log          진행 로그
+"""
+
+import argparse
+import json
+import multiprocessing
+import os
+import re
+import shutil
+import sys
+import threading
+import time
+import uuid
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass, field
+from email import policy
+from email.parser import BytesParser
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, List, Optional
+from urllib.parse import quote
+
+from assignment_cli import DEFAULT_OUTPUT_NAME
+from batch_runner import BatchJob, run_job
+from input_readers import input_extensions
+
+# 업로드 요청 최대 크기 (명단 + 규칙)
+MAX_UPLOAD_BYTES = 20 * 1024 * 1024
+
+# 결과 요약 중 작업 상태로 공개하는 항목 (서버 경로 제외)
+RESULT_FIELDS = ('status', 'error', 'students', 'classes', 'seed', 'quality', 'conflicts', 'unassigned',
+                 'elapsed_sec')
+
+# 작업 프로세스가 시작할 때 불러 두는 모듈
+WARM_MODULES = ('pandas', 'openpyxl', 'class_assigner', 'parsed_inputs', 'quality_report',
+                'xlsx_writer', 'result_writers', 'assignment_cli')
+
+
+def warm_worker():
+    """작업 프로세스 초기화: 배정에 쓰는 무거운 모듈을 미리 불러옴"""
+    import importlib
+    for name in WARM_MODULES:
+        importlib.import_module(name)
+
+
+def worker_ready() -> int:
+    """풀 예열용 빈 작업 (작업 프로세스 PID 반환)"""
+    return os.getpid()
+
+
+def solve_job(job: BatchJob, timeout: Optional[float], log_dir: str) -> dict:
+    """작업 프로세스에서 배정 실행"""
+    return {**run_job(job, timeout=timeout, log_dir=log_dir), 'worker_pid': os.getpid()}
+
+
+def parse_multipart(content_type: str, body: bytes) -> Dict[str, tuple]:
+    """
+    multipart/form-data 본문 파싱
+
+    Returns:
+        {필드 이름: (파일 이름 또는 None, 내용 bytes)}
+    """
+    if not content_type.lower().startswith('multipart/form-data') or 'boundary=' not in content_type:
+        raise ValueError("multipart/form-data 형식이 아닙니다")
+    message = BytesParser(policy=policy.HTTP).parsebytes(
+        b'Content-Type: ' + content_type.encode('latin-1') + b'\r\n\r\n' + body)
+    fields = {}
+    for part in message.iter_parts():
+        name = part.get_param('name', header='content-disposition')
+        if name:
+            fields[name] = (part.get_filename(), part.get_payload(decode=True) or b'')
+    return fields
+
+
+def _input_extension(file_name: str) -> str:
+    """업로드 파일 이름의 입력 형식 확장자 (지원하지 않는 확장자는 .xlsx로 보고 읽을 때 오류)"""
+    extension = os.path.splitext(file_name or '')[1].lower()
+    return extension if extension in input_extensions() else '.xlsx'
+
+
+@dataclass
+class ServiceJob:
+    """서버에 올라온 작업 하나"""
+    id: str
+    directory: str
+    job: BatchJob
+    roster_name: str
+    created: float = field(default_factory=time.time)
+    finished: Optional[float] = None
+    future: Optional[object] = None
+    result: Optional[dict] = None
+    attempts: int = 0
+
+    @property
+    def status(self) -> str:
+        if self.result is not None:
+            return self.result['status']
+        return 'running' if self.future is not None and self.future.running() else 'queued'
+
+    def to_dict(self) -> dict:
+        info = {
+            'id': self.id,
+            'status': self.status,
+            'roster': self.roster_name,
+            'classes': self.job.target_class_count,
+            'seed': self.job.seed,
+            'created': time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(self.created)),
+            'status_url': f'/jobs/{self.id}',
+        }
+        if self.result is not None:
+            info.update({k: self.result[k] for k in RESULT_FIELDS if k in self.result})
+            if self.result['output_files']:
+                info['result_url'] = f'/jobs/{self.id}/result'
+        return info
+
+
+class JobService:
+    """
+    작업 대기열 + 미리 띄워 둔 작업 프로세스 풀
+
+    submit()은 업로드 파일을 작업 폴더에 저장하고 풀에 넣은 뒤 바로 반환한다. 작업 프로세스가
+    비정상 종료되어 풀이 깨지면 새 풀을 만들고, 끝나지 않은 작업은 한 번 더 실행한다.
+    """
+
+    def __init__(self, work_dir: str, workers: Optional[int] = None, timeout: Optional[float] = None,
+                 max_queued: int = 100, keep_jobs: int = 200):
+        """
+        Args:
+            work_dir: 작업별 업로드/결과/로그 폴더를 만들 위치
+            workers: 작업 프로세스 수 (None = CPU 수)
+            timeout: 작업당 시간 제한(초)
+            max_queued: 끝나지 않은 작업 최대 개수 (넘으면 submit이 거절)
+            keep_jobs: 보관할 작업 수 (넘으면 오래된 완료 작업과 파일 삭제)
+        """
+        self.work_dir = os.path.abspath(work_dir)
+        self.workers = max(1, workers or os.cpu_count() or 1)
+        self.timeout = timeout
+        self.max_queued = max_queued
+        self.keep_jobs = keep_jobs
+        self.jobs: Dict[str, ServiceJob] = {}
+        # 완료 콜백이 submit 안에서 바로 불릴 수 있으므로 재진입 가능한 잠금
+        self._lock = threading.RLock()
+        self._context = multiprocessing.get_context('spawn')
+        self._executor = None
+        self._warm_futures = []
+        os.makedirs(self.work_dir, exist_ok=True)
+        self._start_pool()
+
+    def _start_pool(self):
+        self._executor = ProcessPoolExecutor(max_workers=self.workers, mp_context=self._context,
+                                             initializer=warm_worker)
+        # 작업 프로세스는 필요할 때 만들어지므로 빈 작업으로 미리 모두 띄움
+        self._warm_futures = [self._executor.submit(worker_ready) for _ in range(self.workers)]
+
+    def wait_ready(self, timeout: Optional[float] = None) -> List[int]:
+        """작업 프로세스 예열이 끝날 때까지 대기 (예열된 프로세스 PID 목록)"""
+        return [future.result(timeout) for future in self._warm_futures]
+
+    def submit(self, roster: bytes, rules: bytes, roster_name: str = '명단.xlsx',
+               target_class_count: int = 7, seed: Optional[int] = None,
+               rules_name: str = '규칙.xlsx') -> ServiceJob:
+        """업로드 파일로 작업 등록 (대기열이 가득 차면 RuntimeError, 입력 형식은 업로드 파일 확장자)"""
+        if target_class_count < 1:
+            raise ValueError(f"학급 수는 1 이상이어야 합니다: {target_class_count}")
+        with self._lock:
+            pending = sum(1 for job in self.jobs.values() if job.result is None)
+            if pending >= self.max_queued:
+                raise RuntimeError(f"대기 중인 작업이 너무 많습니다 ({pending}개)")
+            job_id = uuid.uuid4().hex[:12]
+            directory = os.path.join(self.work_dir, job_id)
+            os.makedirs(directory)
+            # 업로드 파일 이름은 경로로 쓰지 않음
+            student_file = os.path.join(directory, '01 명단' + _input_extension(roster_name))
+            rules_file = os.path.join(directory, '02 규칙' + _input_extension(rules_name))
+            with open(student_file, 'wb') as f:
+                f.write(roster)
+            with open(rules_file, 'wb') as f:
+                f.write(rules)
+            job = ServiceJob(id=job_id, directory=directory, roster_name=os.path.basename(roster_name),
+                             job=BatchJob(name='job', student_file=student_file, rules_file=rules_file,
+                                          output_file=os.path.join(directory, DEFAULT_OUTPUT_NAME),
+                                          target_class_count=target_class_count, seed=seed))
+            self.jobs[job_id] = job
+            self._evict_old_jobs()
+            self._enqueue(job)
+        return job
+
+    def _enqueue(self, job: ServiceJob):
+        job.attempts += 1
+        try:
+            job.future = self._executor.submit(solve_job, job.job, self.timeout, job.directory)
+        except BrokenProcessPool:
+            self._start_pool()
+            job.future = self._executor.submit(solve_job, job.job, self.timeout, job.directory)
+        executor = self._executor
+        job.future.add_done_callback(lambda future: self._finished(job, executor, future))
+
+    def _finished(self, job: ServiceJob, executor, future):
+        try:
+            result = future.result()
+        except BrokenProcessPool:
+            with self._lock:
+                if executor is self._executor:
+                    self._start_pool()
+                if job.attempts < 2:
+                    self._enqueue(job)
+                    return
+            result = {'status': 'error', 'output_files': [], 'error': "작업 프로세스가 비정상 종료되었습니다"}
+        except Exception as e:
+            result = {'status': 'error', 'output_files': [], 'error': f"{type(e).__name__}: {e}"}
+        job.finished = time.time()
+        job.result = result
+
+    def _evict_old_jobs(self):
+        finished = sorted((job for job in self.jobs.values() if job.result is not None), key=lambda j: j.created)
+        for job in finished[:max(0, len(self.jobs) - self.keep_jobs)]:
+            del self.jobs[job.id]
+            shutil.rmtree(job.directory, ignore_errors=True)
+
+    def get(self, job_id: str) -> Optional[ServiceJob]:
+        with self._lock:
+            return self.jobs.get(job_id)
+
+    def list(self) -> List[dict]:
+        with self._lock:
+            jobs = sorted(self.jobs.values(), key=lambda j: j.created, reverse=True)
+        return [job.to_dict() for job in jobs]
+
+    def shutdown(self, wait: bool = True):
+        self._executor.shutdown(wait=wait, cancel_futures=True)
+
+
+UPLOAD_PAGE = """<!DOCTYPE html>
+<html lang="ko"><head><meta charset="utf-8"><title>자동 학급 편성</title>
+<style>body{font-family:sans-serif;max-width:720px;margin:2em auto}label{display:block;margin:.6em 0}
+table{border-collapse:collapse;width:100%}td,th{border:1px solid #ccc;padding:4px 8px;text-align:left}</style>
+</head><body>
+<h1>🎓 자동 학급 편성</h1>
+<form id="upload" method="post" action="/jobs" enctype="multipart/form-data">
+<label>학생 명단 (.xlsx, .csv, .parquet) <input type="file" name="roster" accept=".xlsx,.csv,.parquet" required></label>
+<label>분반/합반 규칙 (.xlsx, .csv, .parquet) <input type="file" name="rules" accept=".xlsx,.csv,.parquet" required></label>
+<label>진급 학급 수 <input type="number" name="classes" min="1" value="7"></label>
+<label>seed (선택) <input type="number" name="seed"></label>
+<button type="submit">배정 실행</button>
+</form>
+<h2>작업</h2>
+<table><thead><tr><th>올린 시각</th><th>명단</th><th>학급</th><th>상태</th><th>결과</th></tr></thead>
+<tbody id="jobs"></tbody></table>
+<script>
+const esc = s => String(s ?? '').replace(/[&<>"]/g, c => ({'&':'&amp;','<':'&lt;','>':'&gt;','"':'&quot;'}[c]));
+async function refresh() {
+  const jobs = await (await fetch('/jobs')).json();
+  document.getElementById('jobs').innerHTML = jobs.map(j => `<tr><td>${esc(j.created)}</td>
+    <td>${esc(j.roster)}</td><td>${j.classes}</td><td>${esc(j.status)} ${esc(j.error)}</td>
+    <td>${j.result_url ? `<a href="${j.result_url}">다운로드</a>` : ''}</td></tr>`).join('');
+}
+document.getElementById('upload').onsubmit = async e => {
+  e.preventDefault();
+  const response = await fetch('/jobs', {method: 'POST', body: new FormData(e.target)});
+  if (!response.ok) alert((await response.json()).error);
+  refresh();
+};
+refresh(); setInterval(refresh, 2000);
+</script>
+</body></html>
+"""
+
+
+class JobRequestHandler(BaseHTTPRequestHandler):
+    """HTTP 요청 처리 (self.server.service: JobService)"""
+
+    server_version = 'ClassAssigner/1.0'
+
+    def log_message(self, format, *args):
+        if getattr(self.server, 'verbose', False):
+            super().log_message(format, *args)
+
+    def send_json(self, data, status=HTTPStatus.OK):
+        body = json.dumps(data, ensure_ascii=False).encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json; charset=utf-8')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def send_error_json(self, status, message):
+        self.send_json({'error': message}, status)
+
+    def send_file(self, path, content_type, download_name=None):
+        self.send_response(HTTPStatus.OK)
+        self.send_header('Content-Type', content_type)
+        self.send_header('Content-Length', str(os.path.getsize(path)))
+        if download_name:
+            self.send_header('Content-Disposition', f"attachment; filename*=UTF-8''{quote(download_name)}")
+        self.end_headers()
+        with open(path, 'rb') as f:
+            shutil.copyfileobj(f, self.wfile)
+
+    def do_GET(self):
+        service = self.server.service
+        path = self.path.split('?', 1)[0].rstrip('/')
+        if path == '':
+            body = UPLOAD_PAGE.encode('utf-8')
+            self.send_response(HTTPStatus.OK)
+            self.send_header('Content-Type', 'text/html; charset=utf-8')
+            self.send_header('Content-Length', str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+            return
+        if path == '/jobs':
+            self.send_json(service.list())
+            return
+
+        match = re.fullmatch(r'/jobs/([0-9a-f]+)(/result|/log)?', path)
+        job = service.get(match.group(1)) if match else None
+        if job is None:
+            self.send_error_json(HTTPStatus.NOT_FOUND, "작업을 찾을 수 없습니다")
+        elif match.group(2) is None:
+            self.send_json(job.to_dict())
+        elif match.group(2) == '/log':
+            log_file = os.path.join(job.directory, 'job.log')
+            if not os.path.exists(log_file):
+                self.send_error_json(HTTPStatus.NOT_FOUND, "아직 로그가 없습니다")
+            else:
+                self.send_file(log_file, 'text/plain; charset=utf-8')
+        elif job.result is None or not job.result['output_files']:
+            self.send_error_json(HTTPStatus.CONFLICT, f"결과 파일이 없습니다 (상태: {job.status})")
+        else:
+            stem = os.path.splitext(job.roster_name)[0]
+            self.send_file(job.job.output_file,
+                           'application/vnd.openxmlformats-officedocument.spreadsheetml.sheet',
+                           f'{stem} 배정 결과.xlsx')
+
+    def do_POST(self):
+        if self.path.split('?', 1)[0].rstrip('/') != '/jobs':
+            self.send_error_json(HTTPStatus.NOT_FOUND, "지원하지 않는 경로입니다")
+            return
+        length = int(self.headers.get('Content-Length') or 0)
+        if length > MAX_UPLOAD_BYTES:
+            self.send_error_json(HTTPStatus.REQUEST_ENTITY_TOO_LARGE,
+                                 f"파일이 너무 큽니다 (최대 {MAX_UPLOAD_BYTES // (1024 * 1024)}MB)")
+            return
+        try:
+            fields = parse_multipart(self.headers.get('Content-Type', ''), self.rfile.read(length))
+            roster_name, roster = fields.get('roster', (None, b''))
+            rules_name, rules = fields.get('rules', (None, b''))
+            if not roster or not rules:
+                raise ValueError("roster, rules 파일이 모두 필요합니다")
+            classes = fields.get('classes', (None, b''))[1].decode().strip()
+            seed = fields.get('seed', (None, b''))[1].decode().strip()
+            job = self.server.service.submit(roster, rules, roster_name=roster_name or '명단.xlsx',
+                                             rules_name=rules_name or '규칙.xlsx',
+                                             target_class_count=int(classes) if classes else 7,
+                                             seed=int(seed) if seed else None)
+        except ValueError as e:
+            self.send_error_json(HTTPStatus.BAD_REQUEST, str(e))
+            return
+        except RuntimeError as e:
+            self.send_error_json(HTTPStatus.SERVICE_UNAVAILABLE, str(e))
+            return
+        self.send_json(job.to_dict(), HTTPStatus.ACCEPTED)
+
+
+def create_server(service: JobService, host: str = '127.0.0.1', port: int = 8765,
+                  verbose: bool = False) -> ThreadingHTTPServer:
+    """service를 처리하는 HTTP 서버 생성 (serve_forever()로 실행)"""
+    server = ThreadingHTTPServer((host, port), JobRequestHandler)
+    server.daemon_threads = True
+    server.service = service
+    server.verbose = verbose
+    return server
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="학급 편성 작업 서버 (로컬 HTTP)")
+    parser.add_argument('--host', default='127.0.0.1', help="접속 주소 (교내 다른 PC에서 접속하려면 0.0.0.0)")
+    parser.add_argument('--port', type=int, default=8765)
+    parser.add_argument('-j', '--workers', type=int, help="작업 프로세스 수 (기본: CPU 수)")
+    parser.add_argument('--timeout', type=float, metavar='SEC', help="작업당 시간 제한(초)")
+    parser.add_argument('--work-dir', default='job_service_data', help="업로드/결과 파일 폴더")
+    parser.add_argument('-v', '--verbose', action='store_true', help="요청 로그 출력")
+    args = parser.parse_args(argv)
+
+    start = time.perf_counter()
+    service = JobService(args.work_dir, workers=args.workers, timeout=args.timeout)
+    server = create_server(service, args.host, args.port, verbose=args.verbose)
+    service.wait_ready()
+    print(f"🎓 작업 프로세스 {service.workers}개 준비 완료 ({time.perf_counter() - start:.1f}초)")
+    print(f"🌐 http://{args.host}:{server.server_address[1]}/ (종료: Ctrl+C)")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        service.shutdown(wait=False)
+    return 0
+
+
+if __name__ == '__main__':
+    multiprocessing.freeze_support()
+    sys.exit(main())
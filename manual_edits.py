@@ -0,0 +1,324 @@
+"""
+수동 배정 조정
+배정이 끝난 뒤 학생을 다른 반으로 옮길 때 반별 통계와 규칙 위반을 즉시 다시 계산한다.
+전체를 다시 계산하지 않고 옮긴 학생이 빠진 반/들어간 반의 누적값과
+그 학생이 관련된 규칙만 갱신하므로 학생 수와 관계없이 이동 한 번이 수 ms 안에 끝난다.
+"""
+
+import contextlib
+import io
+import math
+from collections import Counter, defaultdict
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Set, Tuple, TYPE_CHECKING
+
+from assignment_audit import AuditViolation
+from assignment_log import log_level
+from class_assigner import ClassAssigner, Student
+
+if TYPE_CHECKING:
+    from assignment_audit import AuditReport, RosterCodes
+
+
+@dataclass
+class ClassStats:
+    """반 하나의 누적 통계 (학생 추가/제거 시 바로 갱신, 요약 컬럼은 quality_report와 같음)"""
+    학생수: int = 0
+    유효인원: int = 0
+    남학생수: int = 0
+    여학생수: int = 0
+    유효남학생: int = 0
+    유효여학생: int = 0
+    특수반수: int = 0
+    전출생수: int = 0
+    난이도합: float = 0.0
+    점수합: float = 0.0
+    점수제곱합: float = 0.0
+    등수합: Dict[str, float] = field(default_factory=lambda: {'남': 0.0, '여': 0.0})
+    등수개수: Dict[str, int] = field(default_factory=lambda: {'남': 0, '여': 0})
+    점수분포: Counter = field(default_factory=Counter)  # 점수 → 학생 수 (최소/최대용)
+    원반분포: Counter = field(default_factory=Counter)  # 원반 → 학생 수 (원반혼합도용)
+
+    def add(self, student: Student, sign: int = 1):
+        """학생 추가 (sign=-1이면 제거)"""
+        effective = student.effective_count()
+        self.학생수 += sign
+        self.유효인원 += sign * effective
+        if student.성별 == '남':
+            self.남학생수 += sign
+            self.유효남학생 += sign * effective
+        elif student.성별 == '여':
+            self.여학생수 += sign
+            self.유효여학생 += sign * effective
+        self.특수반수 += sign * student.특수반
+        self.전출생수 += sign * student.전출
+        self.난이도합 += sign * student.난이도
+        self.점수합 += sign * student.점수
+        self.점수제곱합 += sign * student.점수 * student.점수
+        if student.rank is not None and student.성별 in self.등수합:
+            self.등수합[student.성별] += sign * student.rank
+            self.등수개수[student.성별] += sign
+        for counter, key in ((self.점수분포, student.점수), (self.원반분포, student.원반)):
+            counter[key] += sign
+            if counter[key] <= 0:
+                del counter[key]
+
+    def remove(self, student: Student):
+        self.add(student, -1)
+
+    def row(self) -> Dict[str, Optional[float]]:
+        """요약 행 (quality_report.SUMMARY_COLUMNS 순서, 학생이 없으면 평균 등은 None)"""
+        n = self.학생수
+        mean = self.점수합 / n if n else None
+        row = {
+            '학생수': self.학생수,
+            '유효인원': self.유효인원,
+            '남학생수': self.남학생수,
+            '여학생수': self.여학생수,
+            '유효남학생': self.유효남학생,
+            '유효여학생': self.유효여학생,
+            '난이도합': round(self.난이도합, 6),  # 더하고 빼며 쌓인 부동소수 오차 제거
+            '특수반수': self.특수반수,
+            '전출생수': self.전출생수,
+            '점수평균': round(mean, 2) if n else None,
+            '점수표준편차': round(math.sqrt(max(self.점수제곱합 / n - mean * mean, 0.0)), 2) if n else None,
+            '점수최소': min(self.점수분포) if n else None,
+            '점수최대': max(self.점수분포) if n else None,
+        }
+        for gender in ('남', '여'):
+            count = self.등수개수[gender]
+            row[f'{gender}등수평균'] = round(self.등수합[gender] / count, 1) if count else None
+        row['원반혼합도'] = (round(-sum(c / n * math.log2(c / n) for c in self.원반분포.values()), 3)
+                        if n else None)
+        return row
+
+
+class ManualEditor:
+    """
+    배정 결과 수동 조정
+
+    학생은 students 목록의 위치(index)로 가리킨다. move()는 두 반의 ClassStats와
+    옮긴 학생 이름이 관련된 분반/합반/동명이인 규칙만 다시 검사한다.
+    """
+
+    def __init__(self, students: List[Student], separation_pairs: List[Tuple[str, str]],
+                 together_groups: List[Set[str]], target_class_count: int):
+        self.students = students
+        self.separation_pairs = list(separation_pairs)
+        self.together_groups = [set(group) for group in together_groups]
+        self.target_class_count = target_class_count
+        self.history: List[Tuple[int, Optional[int], Optional[int]]] = []  # (학생 index, 이전 반, 새 반)
+
+        self.members: Dict[int, Set[int]] = {c: set() for c in range(1, target_class_count + 1)}
+        self.stats: Dict[int, ClassStats] = {c: ClassStats() for c in self.members}
+        self.name_classes: Dict[str, Counter] = defaultdict(Counter)  # 이름 → 반별 학생 수
+        for idx, student in enumerate(students):
+            if student.assigned_class in self.members:
+                self.members[student.assigned_class].add(idx)
+                self.stats[student.assigned_class].add(student)
+                self.name_classes[student.이름][student.assigned_class] += 1
+
+        self.separation_rules: Dict[str, Set[str]] = defaultdict(set)
+        for name1, name2 in self.separation_pairs:
+            self.separation_rules[name1].add(name2)
+            self.separation_rules[name2].add(name1)
+        self.group_of: Dict[str, int] = {}
+        for group_idx, group in enumerate(self.together_groups):
+            for name in group:
+                self.group_of[name] = group_idx
+
+        self._violations: Dict[tuple, AuditViolation] = {}
+        for name in list(self.name_classes):
+            self._refresh_rules(name)
+        self._roster: Optional['RosterCodes'] = None  # audit용 이름/규칙 코드 (처음 검증할 때 생성)
+
+    @classmethod
+    def from_preview(cls, preview) -> 'ManualEditor':
+        """작업 프로세스가 보낸 결과 미리보기(ResultPreview)의 배정 상태로 생성"""
+        return cls(preview.students, preview.separation_pairs, preview.together_groups,
+                   preview.class_count)
+
+    # ------------------------------------------------------------------
+    # 이동
+
+    def move(self, index: int, class_num: Optional[int]) -> Set[int]:
+        """
+        학생을 다른 반으로 이동 (class_num이 None이면 미배정으로 되돌림)
+
+        Returns:
+            통계가 바뀐 반 번호 (같은 반이면 빈 집합)
+        """
+        if class_num is not None and class_num not in self.members:
+            raise ValueError(f"반 번호는 1~{self.target_class_count} 사이여야 합니다: {class_num}")
+        student = self.students[index]
+        old_class = student.assigned_class
+        if old_class == class_num:
+            return set()
+
+        if old_class in self.members:
+            self.members[old_class].discard(index)
+            self.stats[old_class].remove(student)
+            counts = self.name_classes[student.이름]
+            counts[old_class] -= 1
+            if counts[old_class] <= 0:
+                del counts[old_class]
+        student.assigned_class = class_num
+        if class_num is not None:
+            self.members[class_num].add(index)
+            self.stats[class_num].add(student)
+            self.name_classes[student.이름][class_num] += 1
+
+        self._refresh_rules(student.이름)
+        self.history.append((index, old_class, class_num))
+        return {c for c in (old_class, class_num) if c in self.members}
+
+    def undo(self) -> Set[int]:
+        """마지막 이동 취소"""
+        if not self.history:
+            return set()
+        index, old_class, _ = self.history.pop()
+        changed = self.move(index, old_class)
+        self.history.pop()  # 되돌린 이동은 기록하지 않음
+        return changed
+
+    # ------------------------------------------------------------------
+    # 규칙 위반
+
+    def _refresh_rules(self, name: str):
+        """name이 관련된 규칙의 위반 여부 다시 계산"""
+        counts = self.name_classes.get(name, Counter())
+
+        for other in self.separation_rules.get(name, ()):
+            key = ('분반',) + tuple(sorted((name, other)))
+            other_counts = self.name_classes.get(other, Counter())
+            classes = tuple(sorted(c for c in counts if other_counts.get(c)))
+            self._set_violation(key, AuditViolation('분반', key[1:], classes) if classes else None)
+
+        if name in self.group_of:
+            group_idx = self.group_of[name]
+            group = sorted(self.together_groups[group_idx])
+            classes = tuple(sorted({c for n in group for c in self.name_classes.get(n, ())}))
+            self._set_violation(('합반', group_idx),
+                                AuditViolation('합반', tuple(group), classes) if len(classes) > 1 else None)
+
+        classes = tuple(sorted(c for c, count in counts.items() if count > 1))
+        self._set_violation(('동명이인', name), AuditViolation('동명이인', (name,), classes) if classes else None)
+
+    def _set_violation(self, key: tuple, violation: Optional[AuditViolation]):
+        if violation is None:
+            self._violations.pop(key, None)
+        else:
+            self._violations[key] = violation
+
+    @property
+    def violations(self) -> List[AuditViolation]:
+        return sorted(self._violations.values(), key=lambda v: (v.kind, v.names))
+
+    @property
+    def violation_count(self) -> int:
+        return len(self._violations)
+
+    def audit(self) -> 'AuditReport':
+        """
+        현재 배정 상태 전체 검증 (assignment_audit)
+
+        move()가 갱신하는 반별 학생/규칙 위반과 별개로 학생 반, 반 목록, 규칙을 처음부터 다시
+        검사한다. 이름과 규칙 코드는 한 번만 만들어 재사용하므로 이동할 때마다 불러도 된다.
+        """
+        from assignment_audit import audit_editor, encode_roster
+
+        if self._roster is None:
+            self._roster = encode_roster([s.이름 for s in self.students], self.separation_pairs,
+                                         self.together_groups)
+        return audit_editor(self, self._roster)
+
+    def violating_names(self) -> Set[str]:
+        """규칙을 위반한 학생 이름 (표시용)"""
+        return {name for violation in self._violations.values() for name in violation.names}
+
+    # ------------------------------------------------------------------
+    # 통계 / 번호 / 내보내기
+
+    def summary_rows(self) -> Dict[int, Dict[str, Optional[float]]]:
+        """반 번호 → 요약 행"""
+        return {c: stats.row() for c, stats in self.stats.items()}
+
+    def spreads(self) -> Dict[str, float]:
+        """반별 편차(최대-최소) (quality_report overall의 편차 항목과 같은 이름)"""
+        rows = self.summary_rows().values()
+
+        def spread(column):
+            values = [row[column] for row in rows if row[column] is not None]
+            return float(max(values) - min(values)) if values else 0.0
+
+        return {
+            '유효인원편차': spread('유효인원'),
+            '유효남학생편차': spread('유효남학생'),
+            '유효여학생편차': spread('유효여학생'),
+            '점수평균편차': round(spread('점수평균'), 2),
+            '난이도합편차': round(spread('난이도합'), 6),
+            '특수반수편차': spread('특수반수'),
+        }
+
+    def numbering(self, class_num: int) -> List[int]:
+        """반 안의 학생 index (새 번호 순서 = 이름 가나다순, 결과 파일과 같음)"""
+        return sorted(self.members[class_num], key=lambda i: self.students[i].이름)
+
+    def to_assigner(self) -> ClassAssigner:
+        """현재 배정 상태의 ClassAssigner (결과 파일 출력용)"""
+        assigner = ClassAssigner.__new__(ClassAssigner)
+        assigner.students = self.students
+        assigner.classes = {c: [self.students[i] for i in self.numbering(c)] for c in self.members}
+        assigner.separation_pairs = list(self.separation_pairs)
+        assigner.separation_rules = defaultdict(set, self.separation_rules)
+        assigner.together_groups = self.together_groups
+        assigner.target_class_count = self.target_class_count
+        return assigner
+
+
+def update_preview(editor: ManualEditor, preview, class_nums: Set[int]) -> List[int]:
+    """
+    바뀐 반 학생들의 미리보기 행(반, 번호) 갱신
+
+    Returns:
+        값이 바뀐 행 번호 목록
+    """
+    changed = []
+    for class_num in class_nums:
+        for number, index in enumerate(editor.numbering(class_num), 1):
+            row = preview.row_of(index)
+            values = preview.rows[row]
+            if values[0] != class_num or values[1] != number:  # 반, 번호는 앞 두 컬럼
+                preview.rows[row] = (class_num, number) + values[2:]
+                changed.append(row)
+    return changed
+
+
+def export_edits(editor: ManualEditor, output_file: str) -> str:
+    """
+    수동 조정한 배정 결과를 파일로 저장
+
+    바뀌지 않은 반 시트는 기존 결과 파일에서 복사한다 (incremental).
+    """
+    with contextlib.redirect_stdout(io.StringIO()), log_level('error'):
+        editor.to_assigner().generate_output(output_file, incremental=True)
+    return output_file
+
+
+# 결과 파일 재저장 작업 프로세스 상태 (init_export_worker에서 한 번 받아 둠)
+_export_state: Optional[ManualEditor] = None
+
+
+def init_export_worker(students: List[Student], separation_pairs: List[Tuple[str, str]],
+                       together_groups: List[Set[str]], target_class_count: int):
+    """재저장 작업 프로세스 초기화 (학생/규칙은 한 번만 전달하고 이후에는 반 번호만 보냄)"""
+    global _export_state
+    _export_state = ManualEditor(students, separation_pairs, together_groups, target_class_count)
+
+
+def export_assignments(assignments: List[int], output_file: str) -> str:
+    """작업 프로세스에서 학생별 반 번호(students 순서, 미배정은 None)를 적용해 결과 파일 저장"""
+    for index, class_num in enumerate(assignments):
+        _export_state.move(index, class_num)
+    _export_state.history.clear()
+    return export_edits(_export_state, output_file)
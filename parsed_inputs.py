@@ -0,0 +1,297 @@
+"""
+미리 읽어 둔 입력 파일
+학생 명단과 분반/합반 규칙을 한 번 파싱해 두고 배정 실행 때 다시 읽지 않도록 한다.
+GUI는 파일을 고르는 즉시 백그라운드에서 파싱/검증하고 결과를 캐시에 보관한다.
+
+InputCache는 프로세스 안의 메모리 캐시이고, DiskInputCache는 파일 내용 해시(SHA-256)를 키로
+파싱 결과를 pickle로 저장하는 로컬 디스크 캐시다. 명단과 규칙을 따로 저장하므로 규칙 파일만
+고쳐 다시 실행하면 바뀌지 않은 명단은 xlsx를 다시 읽지 않고 수 ms 안에 불러온다.
+"""
+
+import contextlib
+import copy
+import dataclasses
+import hashlib
+import os
+import pickle
+import tempfile
+import threading
+from collections import OrderedDict, defaultdict
+from dataclasses import dataclass, field
+from typing import Callable, Dict, List, Optional, Set, Tuple
+
+from class_assigner import Student, find_rule_conflicts, read_rules, read_students
+
+
+# 디스크 캐시 형식 버전 (명단/규칙 정규화 방식이 바뀌면 올려서 이전 항목 무시)
+CACHE_FORMAT = 1
+CACHE_DIR_ENV = 'CLASS_ASSIGNER_CACHE_DIR'
+DEFAULT_CACHE_BYTES = 256 * 2 ** 20
+
+
+def file_signature(path: str) -> Tuple[str, int, int]:
+    """캐시 키용 파일 서명 (절대 경로, 수정 시각(ns), 크기)"""
+    stat = os.stat(path)
+    return os.path.abspath(path), stat.st_mtime_ns, stat.st_size
+
+
+def file_digest(path: str) -> str:
+    """파일 내용 SHA-256 (16진수)"""
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(2 ** 20), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def default_cache_dir() -> str:
+    """디스크 캐시 기본 폴더 (환경 변수 CLASS_ASSIGNER_CACHE_DIR, 없으면 사용자 캐시 폴더)"""
+    if os.environ.get(CACHE_DIR_ENV):
+        return os.environ[CACHE_DIR_ENV]
+    base = os.environ.get('LOCALAPPDATA') or os.path.join(os.path.expanduser('~'), '.cache')
+    return os.path.join(base, 'class_assigner')
+
+
+@dataclass
+class ParsedInputs:
+    """파싱/검증이 끝난 명단과 규칙"""
+    student_file: str
+    rules_file: str
+    students: List[Student]
+    separation_pairs: List[Tuple[str, str]]
+    together_groups: List[Set[str]]
+    conflicts: List[str] = field(default_factory=list)  # 규칙 충돌 (있으면 배정 불가)
+    signature: Tuple = ()  # (명단 파일 서명, 규칙 파일 서명)
+
+    def fresh_students(self) -> List[Student]:
+        """배정용 학생 복사본 (배정 결과가 캐시된 학생에 남지 않도록)"""
+        return [copy.copy(s) for s in self.students]
+
+    def summary(self) -> Dict[str, int]:
+        """명단/규칙 개수 요약"""
+        return {
+            '학생수': len(self.students),
+            '남학생수': sum(1 for s in self.students if s.성별 == '남'),
+            '여학생수': sum(1 for s in self.students if s.성별 == '여'),
+            '특수반수': sum(1 for s in self.students if s.특수반),
+            '전출생수': sum(1 for s in self.students if s.전출),
+            '원반수': len({s.원반 for s in self.students}),
+            '분반쌍': len(self.separation_pairs),
+            '합반그룹': len(self.together_groups),
+            '규칙충돌': len(self.conflicts),
+        }
+
+
+def parse_inputs(student_file: str, rules_file: str,
+                 checkpoint: Optional[Callable[..., None]] = None,
+                 disk_cache: Optional['DiskInputCache'] = None) -> ParsedInputs:
+    """
+    명단/규칙 파일 파싱 후 규칙 충돌 검사 (충돌이 있어도 예외 없이 conflicts에 기록)
+
+    Args:
+        checkpoint: 명단 시트/행마다 호출할 함수 (read_students 참고, 시간 제한 확인용)
+        disk_cache: 주면 내용이 같은 파일의 파싱 결과를 디스크 캐시에서 불러오고, 없으면 파싱 후 저장
+    """
+    signature = (file_signature(student_file), file_signature(rules_file))
+    if disk_cache is not None:
+        students = disk_cache.students(student_file, checkpoint=checkpoint)
+        separation_pairs, together_groups = disk_cache.rules(rules_file)
+    else:
+        students = read_students(student_file, checkpoint=checkpoint)
+        separation_pairs, together_groups = read_rules(rules_file)
+
+    separation_rules = defaultdict(set)
+    for name1, name2 in separation_pairs:
+        separation_rules[name1].add(name2)
+        separation_rules[name2].add(name1)
+
+    return ParsedInputs(
+        student_file=student_file,
+        rules_file=rules_file,
+        students=students,
+        separation_pairs=separation_pairs,
+        together_groups=together_groups,
+        conflicts=find_rule_conflicts(students, separation_rules, together_groups),
+        signature=signature,
+    )
+
+
+class InputCache:
+    """
+    파싱 결과 캐시 (파일 경로 + 수정 시각 + 크기 기준)
+
+    파일이 바뀌면 서명이 달라지므로 이전 결과는 자동으로 무시된다.
+    최근 max_entries개만 보관한다. GUI 스레드와 파싱 스레드에서 함께 사용할 수 있다.
+    disk를 주면 메모리에 없는 입력은 디스크 캐시(DiskInputCache)를 거쳐 파싱한다.
+    """
+
+    def __init__(self, max_entries: int = 4, disk: Optional['DiskInputCache'] = None):
+        self.max_entries = max_entries
+        self.disk = disk
+        self._entries: 'OrderedDict[Tuple, ParsedInputs]' = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def key(student_file: str, rules_file: str) -> Optional[Tuple]:
+        try:
+            return file_signature(student_file), file_signature(rules_file)
+        except OSError:
+            return None
+
+    def get(self, student_file: str, rules_file: str) -> Optional[ParsedInputs]:
+        """현재 파일 상태와 일치하는 파싱 결과 (없으면 None)"""
+        key = self.key(student_file, rules_file)
+        with self._lock:
+            if key is None or key not in self._entries:
+                return None
+            self._entries.move_to_end(key)
+            return self._entries[key]
+
+    def put(self, parsed: ParsedInputs):
+        with self._lock:
+            self._entries[parsed.signature] = parsed
+            self._entries.move_to_end(parsed.signature)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def load(self, student_file: str, rules_file: str) -> ParsedInputs:
+        """캐시에 있으면 반환, 없으면 파싱 후 저장"""
+        parsed = self.get(student_file, rules_file)
+        if parsed is None:
+            parsed = parse_inputs(student_file, rules_file, disk_cache=self.disk)
+            self.put(parsed)
+        return parsed
+
+
+class DiskInputCache:
+    """
+    파일 내용 해시 기준 파싱 결과 디스크 캐시
+
+    <폴더>/roster-<SHA-256>.pickle   정규화한 학생 목록 (read_students 결과)
+    <폴더>/rules-<SHA-256>.pickle    분반 쌍/합반 그룹 (read_rules 결과)
+
+    파일을 옮기거나 다시 저장해도 내용이 같으면 재사용한다. 같은 파일 서명(경로, 수정 시각, 크기)의
+    해시는 프로세스 안에서 기억해 다시 계산하지 않는다. 저장할 때마다 전체 크기가 max_bytes를
+    넘으면 가장 오래 쓰지 않은 항목부터 지운다 (읽을 때 수정 시각을 갱신하는 LRU).
+    읽을 수 없거나 형식 버전이 다른 항목은 지우고 다시 파싱한다.
+
+    pickle은 신뢰할 수 있는 파일만 읽어야 하므로 캐시 폴더는 사용자 전용 폴더를 사용한다.
+    """
+
+    def __init__(self, directory: Optional[str] = None, max_bytes: int = DEFAULT_CACHE_BYTES):
+        self.directory = directory or default_cache_dir()
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self._digests: Dict[Tuple[str, int, int], str] = {}
+        self._lock = threading.Lock()
+
+    def students(self, student_file: str, checkpoint: Optional[Callable[..., None]] = None) -> List[Student]:
+        """명단 파일의 학생 목록 (캐시에 없으면 read_students 후 저장)"""
+        return self._load('roster', student_file, lambda: read_students(student_file, checkpoint=checkpoint))
+
+    def rules(self, rules_file: str) -> Tuple[List[Tuple[str, str]], List[Set[str]]]:
+        """규칙 파일의 (분반 쌍, 합반 그룹) (캐시에 없으면 read_rules 후 저장)"""
+        return self._load('rules', rules_file, lambda: read_rules(rules_file))
+
+    def digest(self, path: str) -> str:
+        """파일 내용 해시 (같은 파일 서명이면 이전에 계산한 값)"""
+        signature = file_signature(path)
+        with self._lock:
+            digest = self._digests.get(signature)
+        if digest is None:
+            digest = file_digest(path)
+            with self._lock:
+                self._digests[signature] = digest
+        return digest
+
+    def entries(self) -> List[Tuple[str, int, float]]:
+        """캐시 항목 (경로, 크기, 마지막 사용 시각), 오래된 순서"""
+        try:
+            names = os.listdir(self.directory)
+        except OSError:
+            return []
+        entries = []
+        for name in names:
+            if not name.endswith('.pickle'):
+                continue
+            path = os.path.join(self.directory, name)
+            try:
+                stat = os.stat(path)
+            except OSError:  # 다른 프로세스가 지움
+                continue
+            entries.append((path, stat.st_size, stat.st_mtime))
+        return sorted(entries, key=lambda entry: entry[2])
+
+    def evict(self) -> int:
+        """전체 크기가 max_bytes 이하가 될 때까지 오래된 항목 삭제, 지운 항목 수 반환"""
+        entries = self.entries()
+        total = sum(size for _, size, _ in entries)
+        removed = 0
+        for path, size, _ in entries:
+            if total <= self.max_bytes:
+                break
+            with contextlib.suppress(OSError):
+                os.remove(path)
+                removed += 1
+            total -= size
+        return removed
+
+    def clear(self):
+        for path, _, _ in self.entries():
+            with contextlib.suppress(OSError):
+                os.remove(path)
+
+    def _path(self, kind: str, digest: str) -> str:
+        return os.path.join(self.directory, f'{kind}-{digest}.pickle')
+
+    def _load(self, kind: str, path: str, parse: Callable[[], object]):
+        cache_path = self._path(kind, self.digest(path))
+        value = self._read(cache_path, kind)
+        if value is not None:
+            self.hits += 1
+            return value
+        self.misses += 1
+        value = parse()
+        self._write(cache_path, kind, value)
+        return value
+
+    def _read(self, cache_path: str, kind: str):
+        try:
+            with open(cache_path, 'rb') as f:
+                header, value = pickle.load(f)
+        except FileNotFoundError:
+            return None
+        except Exception:  # 깨진 파일, 다른 버전의 클래스
+            with contextlib.suppress(OSError):
+                os.remove(cache_path)
+            return None
+        if header != _cache_header(kind):
+            with contextlib.suppress(OSError):
+                os.remove(cache_path)
+            return None
+        with contextlib.suppress(OSError):
+            os.utime(cache_path)  # LRU 순서 갱신
+        return value
+
+    def _write(self, cache_path: str, kind: str, value):
+        """임시 파일에 쓴 뒤 교체 (동시에 실행한 프로세스가 반쯤 쓴 파일을 읽지 않도록)"""
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            fd, temp_path = tempfile.mkstemp(dir=self.directory, suffix='.tmp')
+            try:
+                with os.fdopen(fd, 'wb') as f:
+                    pickle.dump((_cache_header(kind), value), f, protocol=pickle.HIGHEST_PROTOCOL)
+                os.replace(temp_path, cache_path)
+            except BaseException:
+                with contextlib.suppress(OSError):
+                    os.remove(temp_path)
+                raise
+        except OSError:  # 캐시 폴더에 쓸 수 없으면 캐시 없이 계속
+            return
+        self.evict()
+
+
+def _cache_header(kind: str) -> Tuple:
+    """캐시 항목 머리 (형식 버전 + 학생 필드가 같아야 재사용)"""
+    return CACHE_FORMAT, kind, tuple(f.name for f in dataclasses.fields(Student))
@@ -0,0 +1,224 @@
+"""
+배정 품질 대비 시간 벤치마크
+seed를 고정한 가상 입력(synthetic_inputs) 묶음에서 배정 엔진(assignment_engines)을 실행하고
+목적함수 항목(인원/성별/점수/난이도 편차, 규칙 위반)을 경과 시간과 함께 기록한다.
+엔진마다 시간 대비 목적함수 곡선(anytime curve)을 CSV로 저장하고, 정해 둔 시점별 평균 목적함수와
+greedy 대비 개선율을 요약표로 출력한다.
+
+시간은 Phase 1 시작부터 잰다 (greedy 배정 시간 + 개선 시간, 파일 읽기/결과 생성 제외).
+
+사용법:
+    python quality_benchmark.py                                     # 200/1000/5000명 × 7/20반 × seed 2개, 엔진당 2초
+    python quality_benchmark.py --sizes 1000 --classes 7 --budget 10 --curves curves.csv --output quality.json
+    python quality_benchmark.py --iterations 20000                  # 시간 대신 반복 횟수 (seed별 결과 고정)
+"""
+
+import argparse
+import bisect
+import contextlib
+import csv
+import json
+import os
+import platform
+import statistics
+import sys
+import tempfile
+import time
+from typing import Dict, List, Optional
+
+from assignment_engines import ENGINES, OBJECTIVE_WEIGHTS
+from assignment_log import log_level
+
+DEFAULT_SIZES = (200, 1000, 5000)
+DEFAULT_CLASS_COUNTS = (7, 20)
+DEFAULT_SEEDS = (1, 2)
+DEFAULT_BUDGET = 2.0
+DEFAULT_CHECKPOINTS = (0.1, 0.25, 0.5, 1.0, 2.0)
+
+# Phase 1 ~ 개선 단계 (곡선 시간에 포함하는 단계)
+SOLVE_STAGES = ('phase1_apply_rules', 'phase2_distribute_special_needs', 'phase3_separate_same_names',
+                'phase4_balance_difficulty', 'phase5_balance_remaining')
+
+TERM_NAMES = tuple(OBJECTIVE_WEIGHTS)
+
+
+def instance_name(students: int, classes: int, seed: int) -> str:
+    return f'{students}x{classes}-s{seed}'
+
+
+def run_engine(inputs, classes: int, engine: str, budget: Optional[float], iterations: Optional[int],
+               seed: int, output_dir: str) -> dict:
+    """
+    입력 하나에서 엔진 하나 실행
+
+    Returns:
+        {'engine', 'greedy_sec', 'total_sec', 'iterations', 'curve': [{'time_sec', 'objective', 'terms'}], 'final'}
+    """
+    from assignment_engines import evaluate
+    from class_assigner import ClassAssigner
+
+    with open(os.devnull, 'w', encoding='utf-8') as devnull, contextlib.redirect_stdout(devnull), \
+            log_level('error'):
+        assigner = ClassAssigner('', '', target_class_count=classes, seed=seed)
+        assigner.run(os.path.join(output_dir, f'{engine}.csv'), parsed_inputs=inputs, engine=engine,
+                     engine_budget=budget, engine_iterations=iterations)
+
+    stages = assigner.metrics.stages
+    greedy_sec = sum(stages[stage].wall_sec for stage in SOLVE_STAGES if stage in stages)
+    if assigner.engine_trace is None:
+        terms = evaluate(assigner)
+        objective = terms.pop('목적함수')
+        curve = [{'time_sec': round(greedy_sec, 4), 'objective': objective,
+                  'terms': {name: round(value, 6) for name, value in terms.items()}}]
+    else:
+        curve = [{'time_sec': round(greedy_sec + point['elapsed_sec'], 4), 'objective': point['objective'],
+                  'terms': point['terms']} for point in assigner.engine_trace]
+    return {
+        'engine': engine,
+        'greedy_sec': round(greedy_sec, 4),
+        'total_sec': round(greedy_sec + (stages['optimize'].wall_sec if 'optimize' in stages else 0.0), 4),
+        'iterations': assigner.metrics.counters['engine_iterations'],
+        'curve': curve,
+        'final': dict(curve[-1]['terms'], 목적함수=curve[-1]['objective']),
+    }
+
+
+def objective_at(curve: List[dict], time_sec: float) -> Optional[float]:
+    """time_sec 시점까지 찾은 가장 좋은 목적함수 (그때까지 배정이 끝나지 않았으면 None)"""
+    index = bisect.bisect_right([point['time_sec'] for point in curve], time_sec)
+    return curve[index - 1]['objective'] if index else None
+
+
+def run_benchmark(sizes=DEFAULT_SIZES, class_counts=DEFAULT_CLASS_COUNTS, seeds=DEFAULT_SEEDS,
+                  engines=ENGINES, budget: Optional[float] = DEFAULT_BUDGET, iterations: Optional[int] = None,
+                  on_run=None) -> dict:
+    """
+    모든 입력 × 엔진 실행
+
+    Returns:
+        {'timestamp', ..., 'runs': [{'instance', 'students', 'classes', 'seed', 'separation_pairs', 엔진 결과...}]}
+    """
+    from synthetic_inputs import SyntheticSpec, generate_inputs
+
+    result = {
+        'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S'),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'budget_sec': budget,
+        'iterations': iterations,
+        'weights': OBJECTIVE_WEIGHTS,
+        'runs': [],
+    }
+    with tempfile.TemporaryDirectory() as output_dir:
+        for students in sizes:
+            for classes in class_counts:
+                for seed in seeds:
+                    inputs = generate_inputs(SyntheticSpec(students=students, original_classes=classes,
+                                                           target_classes=classes, seed=seed))
+                    for engine in engines:
+                        run = {'instance': instance_name(students, classes, seed), 'students': students,
+                               'classes': classes, 'seed': seed, 'separation_pairs': len(inputs.separation_pairs)}
+                        run.update(run_engine(inputs, classes, engine, budget, iterations, seed, output_dir))
+                        result['runs'].append(run)
+                        if on_run is not None:
+                            on_run(run)
+    return result
+
+
+def summarize(result: dict, checkpoints=DEFAULT_CHECKPOINTS) -> Dict[str, dict]:
+    """
+    엔진별 요약 (입력 평균)
+
+    Returns:
+        엔진 → {'runs', 'objective_at': {시점: 평균 (모든 입력에서 배정이 끝난 시점만)},
+                'final': {항목: 평균}, 'improvement': greedy 대비 최종 목적함수 평균 감소율, 'iterations'}
+    """
+    greedy = {run['instance']: run['final']['목적함수'] for run in result['runs'] if run['engine'] == 'greedy'}
+    summary = {}
+    for engine in dict.fromkeys(run['engine'] for run in result['runs']):
+        runs = [run for run in result['runs'] if run['engine'] == engine]
+        at = {}
+        for time_sec in checkpoints:
+            values = [objective_at(run['curve'], time_sec) for run in runs]
+            at[time_sec] = round(statistics.mean(values), 3) if None not in values else None
+        improvements = [1 - run['final']['목적함수'] / greedy[run['instance']]
+                        for run in runs if greedy.get(run['instance'])]
+        summary[engine] = {
+            'runs': len(runs),
+            'objective_at': at,
+            'final': {name: round(statistics.mean(run['final'][name] for run in runs), 3)
+                      for name in TERM_NAMES + ('목적함수',)},
+            'improvement': round(statistics.mean(improvements), 4) if improvements else None,
+            'iterations': round(statistics.mean(run['iterations'] for run in runs)),
+        }
+    return summary
+
+
+def write_curves(result: dict, path: str):
+    """곡선 CSV (입력, 엔진, 시간, 목적함수, 항목별 값 / 그래프 도구에서 입력·엔진별로 그림)"""
+    with open(path, 'w', encoding='utf-8-sig', newline='') as f:
+        writer = csv.writer(f)
+        writer.writerow(['instance', 'engine', 'time_sec', 'objective'] + list(TERM_NAMES))
+        for run in result['runs']:
+            for point in run['curve']:
+                writer.writerow([run['instance'], run['engine'], point['time_sec'], point['objective']]
+                                + [point['terms'][name] for name in TERM_NAMES])
+
+
+def format_run(run: dict) -> str:
+    final = run['final']
+    return (f"   {run['instance']:<16}{run['engine']:<14}{final['목적함수']:>10,.2f}"
+            f"{final['유효인원편차']:>6g}{final['유효남학생편차']:>6g}{final['유효여학생편차']:>6g}"
+            f"{final['점수평균편차']:>8.2f}{final['난이도합편차']:>7g}{final['규칙위반']:>6g}"
+            f"{run['total_sec']:>9.2f}")
+
+
+def format_summary(summary: Dict[str, dict], checkpoints=DEFAULT_CHECKPOINTS) -> str:
+    lines = ["\n📊 엔진별 시점 평균 목적함수 (- : 아직 배정이 끝나지 않은 입력 있음)",
+             f"   {'엔진':<14}" + ''.join(f"{f'{t:g}초':>10}" for t in checkpoints)
+             + f"{'최종':>10}{'greedy 대비':>12}{'반복':>10}"]
+    for engine, row in summary.items():
+        values = ''.join(f"{v:>10,.2f}" if v is not None else f"{'-':>10}" for v in row['objective_at'].values())
+        improvement = f"{row['improvement']:.1%}" if row['improvement'] is not None else '-'
+        lines.append(f"   {engine:<14}{values}{row['final']['목적함수']:>10,.2f}{improvement:>12}"
+                     f"{row['iterations']:>10,}")
+    return '\n'.join(lines)
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="배정 엔진 품질 대비 시간 벤치마크")
+    parser.add_argument('--sizes', type=int, nargs='+', default=list(DEFAULT_SIZES), help="학생 수 목록")
+    parser.add_argument('--classes', type=int, nargs='+', default=list(DEFAULT_CLASS_COUNTS), help="학급 수 목록")
+    parser.add_argument('--seeds', type=int, nargs='+', default=list(DEFAULT_SEEDS), help="입력/배정 seed 목록")
+    parser.add_argument('--engines', nargs='+', choices=ENGINES, default=list(ENGINES), help="엔진 목록")
+    parser.add_argument('--budget', type=float, default=DEFAULT_BUDGET, help="개선 엔진 실행 시간(초, 기본 2)")
+    parser.add_argument('--iterations', type=int, help="개선 엔진 반복 횟수 (주면 --budget 대신 사용)")
+    parser.add_argument('--checkpoints', type=float, nargs='+', default=list(DEFAULT_CHECKPOINTS),
+                        help="요약표 시점(초, Phase 1 시작부터)")
+    parser.add_argument('--curves', metavar='FILE', help="시간 대비 목적함수 곡선 CSV")
+    parser.add_argument('--output', metavar='FILE', help="전체 결과 JSON (곡선 + 요약)")
+    args = parser.parse_args(argv)
+
+    budget = None if args.iterations is not None else args.budget
+    print(f"🎓 품질 벤치마크: 학생 {args.sizes} × 학급 {args.classes} × seed {args.seeds}, "
+          f"엔진 {args.engines}, " + (f"반복 {args.iterations:,}회" if budget is None else f"{budget:g}초"))
+    print(f"   {'입력':<16}{'엔진':<14}{'목적함수':>10}{'인원':>6}{'남':>6}{'여':>6}{'점수':>8}{'난이도':>7}"
+          f"{'위반':>6}{'시간(초)':>9}")
+    result = run_benchmark(args.sizes, args.classes, args.seeds, args.engines, budget, args.iterations,
+                           on_run=lambda run: print(format_run(run), flush=True))
+    summary = summarize(result, args.checkpoints)
+    result['summary'] = summary
+    print(format_summary(summary, args.checkpoints))
+
+    if args.curves:
+        write_curves(result, args.curves)
+        print(f"\n📁 곡선 저장: {args.curves}")
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(result, f, ensure_ascii=False, indent=2)
+        print(f"📁 결과 저장: {args.output}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
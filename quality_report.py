@@ -0,0 +1,171 @@
+"""
+배정 품질 보고서
+배정 결과 전체를 하나의 DataFrame으로 만들어 반별 group-by 한 번으로 통계를 계산한다.
+성별 내 등수 분포(명수, 평균, 표준편차, 최소, 사분위수, 최대)는 반/성별 group-by로 따로 계산한다.
+요약 시트와 프로그램 검증(테스트, 벤치마크)에서 같은 결과를 사용한다.
+"""
+
+from dataclasses import dataclass
+from typing import Dict, List
+
+import numpy as np
+import pandas as pd
+
+
+# 요약 시트 컬럼 (기존 요약 컬럼 + 품질 지표)
+SUMMARY_COLUMNS = ['학생수', '유효인원', '남학생수', '여학생수', '유효남학생', '유효여학생', '난이도합',
+                   '특수반수', '전출생수', '점수평균', '점수표준편차', '점수최소', '점수최대',
+                   '남등수평균', '여등수평균', '원반혼합도']
+# 반별 성별 등수 분포 컬럼 (QualityReport.rank_distribution)
+RANK_COLUMNS = ['명수', '평균', '표준편차', '최소', '1사분위수', '중앙값', '3사분위수', '최대']
+GENDERS = ['남', '여']
+
+
+@dataclass
+class QualityReport:
+    """배정 품질 보고서 (반별 통계 + 반별 성별 등수 분포 + 전체 통계)"""
+    per_class: pd.DataFrame  # index: 반 번호, columns: SUMMARY_COLUMNS
+    overall: Dict[str, float]
+    # index: (반 번호, 성별), columns: RANK_COLUMNS (성별 내 등수 분포)
+    rank_distribution: pd.DataFrame
+
+    def summary_rows(self, target_grade: int) -> List[dict]:
+        """요약 시트 행 (반 이름 + 반별 통계, 값 없음은 None)"""
+        rows = []
+        for class_num, stats in self.per_class.iterrows():
+            row = {'반': f'{target_grade}-{class_num}'}
+            for column in SUMMARY_COLUMNS:
+                value = stats[column]
+                row[column] = None if pd.isna(value) else value.item() if hasattr(value, 'item') else value
+            rows.append(row)
+        return rows
+
+    def to_dict(self) -> dict:
+        return {
+            'per_class': {int(c): {k: (None if pd.isna(v) else float(v)) for k, v in stats.items()}
+                          for c, stats in self.per_class.iterrows()},
+            'rank_distribution': {
+                int(c): {gender: {k: (None if pd.isna(v) else float(v)) for k, v in stats.items()}
+                         for gender, stats in self.rank_distribution.xs(c, level='반').iterrows()}
+                for c in self.per_class.index
+            },
+            'overall': dict(self.overall),
+        }
+
+
+def _assignment_frame(classes: Dict[int, list]) -> pd.DataFrame:
+    """반에 배정된 학생 전체를 열 단위 배열로 변환"""
+    students = [(class_num, s) for class_num, members in classes.items() for s in members]
+    return pd.DataFrame({
+        '반': np.fromiter((c for c, _ in students), dtype=np.int64, count=len(students)),
+        '성별': [s.성별 for _, s in students],
+        '점수': np.fromiter((s.점수 for _, s in students), dtype=np.float64, count=len(students)),
+        '특수반': np.fromiter((s.특수반 for _, s in students), dtype=bool, count=len(students)),
+        '전출': np.fromiter((s.전출 for _, s in students), dtype=bool, count=len(students)),
+        '난이도': np.fromiter((s.난이도 for _, s in students), dtype=np.float64, count=len(students)),
+        '등수': np.fromiter((np.nan if s.rank is None else s.rank for _, s in students),
+                          dtype=np.float64, count=len(students)),
+        '원반': np.fromiter((s.원반 for _, s in students), dtype=np.int64, count=len(students)),
+    })
+
+
+def _mixing_entropy(df: pd.DataFrame) -> pd.Series:
+    """반별 원반 구성 엔트로피 (bit, 원반이 고르게 섞일수록 큼)"""
+    counts = df.groupby(['반', '원반']).size()
+    share = counts / counts.groupby(level=0).transform('sum')
+    return (-share * np.log2(share)).groupby(level=0).sum()
+
+
+def _rank_distribution(df: pd.DataFrame, class_nums: List[int]) -> pd.DataFrame:
+    """반/성별 group-by 한 번으로 성별 내 등수 분포 (학생이 없는 조합도 명수 0으로 유지)"""
+    ranks = df.loc[df['등수'].notna() & df['성별'].isin(GENDERS), ['반', '성별', '등수']]
+    grouped = ranks.groupby(['반', '성별'])['등수']
+    quartiles = grouped.quantile([0.25, 0.5, 0.75]).unstack()
+    distribution = grouped.agg(
+        명수='size',
+        평균='mean',
+        표준편차=lambda x: x.std(ddof=0),
+        최소='min',
+        최대='max',
+    ).assign(**{'1사분위수': quartiles.get(0.25), '중앙값': quartiles.get(0.5), '3사분위수': quartiles.get(0.75)})
+    distribution = distribution.reindex(pd.MultiIndex.from_product([sorted(class_nums), GENDERS],
+                                                                   names=['반', '성별']))
+    distribution['명수'] = distribution['명수'].fillna(0).astype(np.int64)
+    return distribution[RANK_COLUMNS].round({'평균': 1, '표준편차': 2, '1사분위수': 1, '중앙값': 1, '3사분위수': 1})
+
+
+def build_quality_report(classes: Dict[int, list]) -> QualityReport:
+    """
+    반별/전체 품질 통계 계산
+
+    Args:
+        classes: 반 번호 → 학생 목록 (ClassAssigner.classes)
+    """
+    df = _assignment_frame(classes)
+
+    # 유효 인원: 특수반=3명, 전출생=0명, 일반=1명
+    effective = np.where(df['전출'], 0, np.where(df['특수반'], 3, 1))
+    male = (df['성별'] == '남').to_numpy()
+    female = (df['성별'] == '여').to_numpy()
+    df = df.assign(
+        유효=effective,
+        남=male.astype(np.int64),
+        여=female.astype(np.int64),
+        유효남=np.where(male, effective, 0),
+        유효여=np.where(female, effective, 0),
+        남등수=np.where(male, df['등수'], np.nan),
+        여등수=np.where(female, df['등수'], np.nan),
+    )
+
+    per_class = df.groupby('반').agg(
+        학생수=('반', 'size'),
+        유효인원=('유효', 'sum'),
+        남학생수=('남', 'sum'),
+        여학생수=('여', 'sum'),
+        유효남학생=('유효남', 'sum'),
+        유효여학생=('유효여', 'sum'),
+        난이도합=('난이도', 'sum'),
+        특수반수=('특수반', 'sum'),
+        전출생수=('전출', 'sum'),
+        점수평균=('점수', 'mean'),
+        점수표준편차=('점수', lambda x: x.std(ddof=0)),
+        점수최소=('점수', 'min'),
+        점수최대=('점수', 'max'),
+        남등수평균=('남등수', 'mean'),
+        여등수평균=('여등수', 'mean'),
+    )
+    per_class['원반혼합도'] = _mixing_entropy(df)
+
+    # 학생이 없는 반도 행을 유지 (개수는 0, 평균 등은 값 없음)
+    per_class = per_class.reindex(sorted(classes))
+    count_columns = ['학생수', '유효인원', '남학생수', '여학생수', '유효남학생', '유효여학생', '특수반수', '전출생수']
+    per_class[count_columns] = per_class[count_columns].fillna(0).astype(np.int64)
+    per_class['난이도합'] = per_class['난이도합'].fillna(0.0)
+    per_class.index.name = '반'
+    per_class = per_class[SUMMARY_COLUMNS].round({'점수평균': 2, '점수표준편차': 2, '남등수평균': 1,
+                                                  '여등수평균': 1, '원반혼합도': 3})
+
+    def spread(column):
+        values = per_class[column].dropna()
+        return float(values.max() - values.min()) if len(values) else 0.0
+
+    overall = {
+        '학생수': int(len(df)),
+        '유효인원': int(df['유효'].sum()),
+        '남학생수': int(df['남'].sum()),
+        '여학생수': int(df['여'].sum()),
+        '특수반수': int(df['특수반'].sum()),
+        '전출생수': int(df['전출'].sum()),
+        '난이도합': float(df['난이도'].sum()),
+        '점수평균': round(float(df['점수'].mean()), 2) if len(df) else 0.0,
+        '점수표준편차': round(float(df['점수'].std(ddof=0)), 2) if len(df) else 0.0,
+        '유효인원편차': spread('유효인원'),
+        '유효남학생편차': spread('유효남학생'),
+        '유효여학생편차': spread('유효여학생'),
+        '점수평균편차': round(spread('점수평균'), 2),
+        '난이도합편차': spread('난이도합'),
+        '특수반수편차': spread('특수반수'),
+        '원반혼합도평균': round(float(per_class['원반혼합도'].mean()), 3) if len(df) else 0.0,
+    }
+    return QualityReport(per_class=per_class, overall=overall,
+                         rank_distribution=_rank_distribution(df, list(classes)))
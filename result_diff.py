@@ -0,0 +1,434 @@
+"""
+배정 결과 비교 (Diff) 도구
+두 배정 결과(결과 파일 또는 메모리상의 ClassAssigner)를 학생 신원으로 매칭해
+이동한 학생, 반별 지표 변화, 새로 위반/충족된 규칙을 보고한다.
+
+사용 예:
+    python result_diff.py "이전 결과.xlsx" "03 배정 결과.xlsx" -o diff.json
+    python result_diff.py old.jsonl new.jsonl --rules "02 분반 합반할 학생 규칙.xlsx" -o diff.xlsx
+"""
+
+import argparse
+import csv
+import json
+import os
+import sys
+from collections import defaultdict
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Set, Tuple
+
+from class_assigner import is_missing
+
+# 학생 신원 키: (원학년, 원반, 원번호, 이름)
+StudentKey = Tuple[int, int, int, str]
+
+# 반별 비교 지표
+CLASS_METRICS = ['학생수', '유효인원', '남학생수', '여학생수', '점수평균', '난이도합', '특수반수', '전출생수']
+
+
+@dataclass
+class AssignmentSnapshot:
+    """비교용으로 정규화한 배정 결과"""
+    students: Dict[StudentKey, dict]  # 신원 → {'반', '성별', '점수', '특수반', '전출', '난이도'}
+    separation_pairs: List[Tuple[str, str]] = field(default_factory=list)
+    together_groups: List[Set[str]] = field(default_factory=list)
+
+
+@dataclass
+class AssignmentDiff:
+    """두 배정 결과의 차이"""
+    moved: List[dict]  # 반이 바뀐 학생
+    added: List[dict]  # 새 결과에만 있는 학생
+    removed: List[dict]  # 이전 결과에만 있는 학생
+    class_deltas: List[dict]  # 반별 지표 (이전, 이후, 변화량)
+    newly_violated: List[dict]  # 새로 위반된 규칙
+    newly_satisfied: List[dict]  # 새로 충족된 규칙
+
+    def to_dict(self) -> dict:
+        return {
+            'summary': {
+                'moved': len(self.moved),
+                'added': len(self.added),
+                'removed': len(self.removed),
+                'newly_violated': len(self.newly_violated),
+                'newly_satisfied': len(self.newly_satisfied),
+            },
+            'moved': self.moved,
+            'added': self.added,
+            'removed': self.removed,
+            'class_deltas': self.class_deltas,
+            'newly_violated': self.newly_violated,
+            'newly_satisfied': self.newly_satisfied,
+        }
+
+
+# ============================================================================
+# 결과 로드
+# ============================================================================
+
+def _blank(value) -> bool:
+    """빈 칸 판정 (None, NaN, pd.NA, 빈 문자열: CSV/JSON Lines/DataFrame 모두 같은 기준)"""
+    return is_missing(value) or (isinstance(value, str) and not value.strip())
+
+
+def _text(value) -> str:
+    return '' if _blank(value) else str(value)
+
+
+def _flag(value) -> bool:
+    """1/'1'/True/'true' 등을 True로 변환 (빈 값은 False)"""
+    if _blank(value):
+        return False
+    if isinstance(value, str):
+        return value.strip().lower() in ('1', 'true', 'y', 'yes', 'o')
+    return bool(value)
+
+
+def _number(value, default=0.0) -> float:
+    if _blank(value):
+        return default
+    try:
+        number = float(value)
+    except (TypeError, ValueError):
+        return default
+    return default if number != number else number
+
+
+def _student_entry(record: dict) -> Tuple[StudentKey, dict]:
+    key = (int(_number(record['원학년'])), int(_number(record['원반'])), int(_number(record['원번호'])),
+           str(record['이름']))
+    return key, {
+        '반': None if _blank(record['반']) else int(_number(record['반'])),  # 빈 반은 미배정
+        '성별': _text(record.get('성별')),
+        '점수': _number(record.get('점수')),
+        '특수반': _flag(record.get('특수반')),
+        '전출': _flag(record.get('전출')),
+        '난이도': _number(record.get('난이도')),
+    }
+
+
+def _rules_from_records(records: List[dict]) -> Tuple[List[Tuple[str, str]], List[Set[str]]]:
+    """학생 단위 레코드의 분반대상/합반그룹 컬럼에서 규칙 복원"""
+    pairs = set()
+    groups = defaultdict(set)
+    for record in records:
+        name = str(record['이름'])
+        for target in _text(record.get('분반대상')).split(';'):
+            if target:
+                pairs.add(tuple(sorted((name, target))))
+        group_id = record.get('합반그룹')
+        if not _blank(group_id):
+            if isinstance(group_id, float) and group_id.is_integer():
+                group_id = int(group_id)  # 빈 칸이 섞여 실수가 된 DataFrame 컬럼 (1.0 → '1')
+            groups[str(group_id)].add(name)
+    return sorted(pairs), [groups[k] for k in sorted(groups)]
+
+
+_NS_MAIN = '{http://schemas.openxmlformats.org/spreadsheetml/2006/main}'
+_NS_REL = '{http://schemas.openxmlformats.org/officeDocument/2006/relationships}'
+
+
+_COLUMN_CACHE: Dict[str, int] = {}
+
+
+def _column_number(ref: str) -> int:
+    """셀 참조('AB12')의 열 번호 (0부터 시작)"""
+    letters = ref.rstrip('0123456789')
+    idx = _COLUMN_CACHE.get(letters)
+    if idx is None:
+        idx = -1
+        for ch in letters:
+            idx = (idx + 1) * 26 + (ord(ch) - 65)
+        _COLUMN_CACHE[letters] = idx
+    return idx
+
+
+def _iter_sheet_rows(zf, part: str, shared_strings: List[str]):
+    """워크시트 XML을 iterparse로 행 단위 스트리밍 (값만, 스타일 무시)"""
+    import xml.etree.ElementTree as ET
+
+    cell_tag, value_tag, row_tag = f'{_NS_MAIN}c', f'{_NS_MAIN}v', f'{_NS_MAIN}row'
+    for _, elem in ET.iterparse(zf.open(part), events=('end',)):
+        if elem.tag != row_tag:
+            continue
+        row_values = {}
+        for cell in elem.iter(cell_tag):
+            cell_type = cell.get('t')
+            if cell_type == 'inlineStr':
+                value = ''.join(cell.itertext())
+            else:
+                value = cell.findtext(value_tag)
+                if value is not None:
+                    if cell_type == 's':
+                        value = shared_strings[int(value)]
+                    elif cell_type not in ('str', 'e', 'b'):
+                        number = float(value)
+                        value = int(number) if number.is_integer() else number
+            row_values[_column_number(cell.get('r', 'A'))] = value
+        elem.clear()
+        if row_values:
+            yield [row_values.get(i) for i in range(max(row_values) + 1)]
+
+
+def _read_xlsx_records(path: str) -> List[dict]:
+    """
+    결과 xlsx의 반별 시트에서 레코드 읽기
+
+    openpyxl 대신 워크시트 XML을 직접 스트리밍한다 (값만 필요하므로 스타일/메모 파싱 생략).
+    """
+    import posixpath
+    import zipfile
+    import xml.etree.ElementTree as ET
+
+    records = []
+    with zipfile.ZipFile(path) as zf:
+        names = set(zf.namelist())
+        shared_strings = []
+        if 'xl/sharedStrings.xml' in names:
+            root = ET.fromstring(zf.read('xl/sharedStrings.xml'))
+            shared_strings = [''.join(si.itertext()) for si in root.findall(f'{_NS_MAIN}si')]
+
+        # 통합문서 순서대로 시트 파트 경로 찾기
+        rels = ET.fromstring(zf.read('xl/_rels/workbook.xml.rels'))
+        targets = {rel.get('Id'): rel.get('Target') for rel in rels}
+        workbook = ET.fromstring(zf.read('xl/workbook.xml'))
+        for sheet in workbook.iter(f'{_NS_MAIN}sheet'):
+            target = targets.get(sheet.get(f'{_NS_REL}id'), '')
+            part = target.lstrip('/') if target.startswith('/') else posixpath.normpath(f'xl/{target}')
+            if part not in names:
+                continue
+
+            rows = _iter_sheet_rows(zf, part, shared_strings)
+            header = next(rows, None)
+            if not header or '반' not in header or '원반' not in header:
+                continue  # 요약 시트 등
+            columns = [str(h) if h is not None else '' for h in header]
+            name_idx = columns.index('이름')
+            for row in rows:
+                if len(row) > name_idx and row[name_idx] not in (None, ''):
+                    records.append(dict(zip(columns, row)))
+    return records
+
+
+def _read_flat_records(path: str) -> List[dict]:
+    if path.lower().endswith('.jsonl'):
+        with open(path, encoding='utf-8') as f:
+            return [json.loads(line) for line in f if line.strip()]
+    if path.lower().endswith('.parquet'):
+        import pandas as pd
+        return _frame_records(pd.read_parquet(path))
+    with open(path, encoding='utf-8-sig', newline='') as f:
+        return list(csv.DictReader(f))
+
+
+def _frame_records(df) -> List[dict]:
+    """결과 레코드 DataFrame → 레코드 목록 (빈 칸은 NaN 그대로, _blank가 빈 값으로 처리)"""
+    return df.to_dict('records')
+
+
+def load_snapshot(source, rules_file: Optional[str] = None) -> AssignmentSnapshot:
+    """
+    배정 결과를 비교용 스냅샷으로 로드
+
+    Args:
+        source: 결과 파일 경로 (.xlsx / .csv / .jsonl / .parquet), 배정이 끝난 ClassAssigner
+                또는 학생 단위 결과 레코드 DataFrame (result_writers.RECORD_FIELDS 컬럼)
+        rules_file: 분반/합반 규칙 파일. 없으면 ClassAssigner의 규칙이나
+                    CSV/JSON Lines/DataFrame의 분반대상/합반그룹 컬럼을 사용 (xlsx 결과는 규칙 비교 생략)
+    """
+    separation_pairs: List[Tuple[str, str]] = []
+    together_groups: List[Set[str]] = []
+
+    if isinstance(source, (str, os.PathLike)):
+        path = os.fspath(source)
+        if path.lower().endswith('.xlsx'):
+            records = _read_xlsx_records(path)
+        else:
+            records = _read_flat_records(path)
+            separation_pairs, together_groups = _rules_from_records(records)
+    elif hasattr(source, 'build_result_records'):
+        records = source.build_result_records()
+        separation_pairs = list(source.separation_pairs)
+        together_groups = [set(group) for group in source.together_groups]
+    else:
+        records = _frame_records(source)
+        separation_pairs, together_groups = _rules_from_records(records)
+
+    if rules_file:
+        from class_assigner import read_rules
+        separation_pairs, together_groups = read_rules(rules_file)
+
+    students = dict(_student_entry(record) for record in records)
+    return AssignmentSnapshot(students=students, separation_pairs=separation_pairs,
+                              together_groups=together_groups)
+
+
+# ============================================================================
+# 비교
+# ============================================================================
+
+def class_metrics(snapshot: AssignmentSnapshot) -> Dict[int, dict]:
+    """반별 지표 (한 번의 순회로 누적)"""
+    totals = defaultdict(lambda: defaultdict(int))
+    for info in snapshot.students.values():
+        if info['반'] is None:
+            continue  # 미배정 학생은 어느 반에도 포함하지 않음
+        m = totals[info['반']]
+        effective = 0 if info['전출'] else (3 if info['특수반'] else 1)
+        m['학생수'] += 1
+        m['유효인원'] += effective
+        m['남학생수'] += info['성별'] == '남'
+        m['여학생수'] += info['성별'] == '여'
+        m['점수합'] += info['점수']
+        m['난이도합'] += info['난이도']
+        m['특수반수'] += info['특수반']
+        m['전출생수'] += info['전출']
+
+    metrics = {}
+    for class_num, m in totals.items():
+        metrics[class_num] = {name: m[name] for name in CLASS_METRICS if name != '점수평균'}
+        metrics[class_num]['점수평균'] = round(m['점수합'] / m['학생수'], 2) if m['학생수'] else 0.0
+    return metrics
+
+
+def rule_violations(snapshot: AssignmentSnapshot) -> Dict[tuple, dict]:
+    """
+    규칙 위반 목록 (키 → 설명)
+
+    - 분반: 쌍의 두 이름이 같은 반에 있음
+    - 합반: 그룹 학생들이 둘 이상의 반에 흩어짐
+    - 동명이인: 같은 이름의 학생이 같은 반에 있음
+    """
+    classes_by_name = defaultdict(list)
+    for key, info in snapshot.students.items():
+        if info['반'] is not None:
+            classes_by_name[key[3]].append(info['반'])
+
+    violations = {}
+    for name1, name2 in snapshot.separation_pairs:
+        shared = set(classes_by_name.get(name1, ())) & set(classes_by_name.get(name2, ()))
+        if shared:
+            pair = tuple(sorted((name1, name2)))
+            violations[('분반',) + pair] = {'규칙': '분반', '학생': list(pair), '반': sorted(shared)}
+
+    for group in snapshot.together_groups:
+        classes = {c for name in group for c in classes_by_name.get(name, ())}
+        if len(classes) > 1:
+            members = sorted(group)
+            violations[('합반',) + tuple(members)] = {'규칙': '합반', '학생': members, '반': sorted(classes)}
+
+    for name, classes in classes_by_name.items():
+        counts = defaultdict(int)
+        for c in classes:
+            counts[c] += 1
+        shared = sorted(c for c, n in counts.items() if n > 1)
+        if shared:
+            violations[('동명이인', name)] = {'규칙': '동명이인', '학생': [name], '반': shared}
+    return violations
+
+
+def diff_snapshots(old: AssignmentSnapshot, new: AssignmentSnapshot) -> AssignmentDiff:
+    """두 스냅샷 비교 (학생 신원 딕셔너리 매칭으로 선형 시간)"""
+    def describe(key, **extra):
+        return dict({'원학년': key[0], '원반': key[1], '원번호': key[2], '이름': key[3]}, **extra)
+
+    moved, removed = [], []
+    for key, old_info in old.students.items():
+        new_info = new.students.get(key)
+        if new_info is None:
+            removed.append(describe(key, 반=old_info['반']))
+        elif new_info['반'] != old_info['반']:
+            moved.append(describe(key, 이전반=old_info['반'], 새반=new_info['반']))
+    added = [describe(key, 반=info['반']) for key, info in new.students.items() if key not in old.students]
+
+    old_metrics, new_metrics = class_metrics(old), class_metrics(new)
+    class_deltas = []
+    for class_num in sorted(set(old_metrics) | set(new_metrics)):
+        before = old_metrics.get(class_num, {})
+        after = new_metrics.get(class_num, {})
+        row = {'반': class_num}
+        for name in CLASS_METRICS:
+            b, a = before.get(name, 0), after.get(name, 0)
+            row[name] = {'이전': b, '이후': a, '변화': round(a - b, 2)}
+        class_deltas.append(row)
+
+    old_violations, new_violations = rule_violations(old), rule_violations(new)
+    newly_violated = [v for k, v in new_violations.items() if k not in old_violations]
+    newly_satisfied = [v for k, v in old_violations.items() if k not in new_violations]
+
+    return AssignmentDiff(moved=moved, added=added, removed=removed, class_deltas=class_deltas,
+                          newly_violated=newly_violated, newly_satisfied=newly_satisfied)
+
+
+def diff_results(old_source, new_source, rules_file: Optional[str] = None) -> AssignmentDiff:
+    """두 결과 파일(또는 ClassAssigner)을 로드해 비교"""
+    return diff_snapshots(load_snapshot(old_source, rules_file), load_snapshot(new_source, rules_file))
+
+
+# ============================================================================
+# 출력
+# ============================================================================
+
+def write_diff_json(diff: AssignmentDiff, output_file: str):
+    with open(output_file, 'w', encoding='utf-8') as f:
+        json.dump(diff.to_dict(), f, ensure_ascii=False, indent=2)
+
+
+def write_diff_xlsx(diff: AssignmentDiff, output_file: str):
+    """비교 결과를 간단한 시트 3개(이동 학생, 반별 변화, 규칙 변화)로 저장"""
+    import openpyxl
+    from openpyxl.styles import Font
+
+    wb = openpyxl.Workbook()
+    ws = wb.active
+    ws.title = '이동 학생'
+    ws.append(['구분', '원학년', '원반', '원번호', '이름', '이전반', '새반'])
+    for row in diff.moved:
+        ws.append(['이동', row['원학년'], row['원반'], row['원번호'], row['이름'], row['이전반'], row['새반']])
+    for row in diff.removed:
+        ws.append(['삭제', row['원학년'], row['원반'], row['원번호'], row['이름'], row['반'], None])
+    for row in diff.added:
+        ws.append(['추가', row['원학년'], row['원반'], row['원번호'], row['이름'], None, row['반']])
+
+    ws = wb.create_sheet('반별 변화')
+    ws.append(['반'] + [f'{name} ({part})' for name in CLASS_METRICS for part in ('이전', '이후', '변화')])
+    for row in diff.class_deltas:
+        ws.append([row['반']] + [row[name][part] for name in CLASS_METRICS for part in ('이전', '이후', '변화')])
+
+    ws = wb.create_sheet('규칙 변화')
+    ws.append(['변화', '규칙', '학생', '반'])
+    for label, items in (('새로 위반', diff.newly_violated), ('새로 충족', diff.newly_satisfied)):
+        for item in items:
+            ws.append([label, item['규칙'], ', '.join(item['학생']), ', '.join(map(str, item['반']))])
+
+    for sheet in wb.worksheets:
+        for cell in sheet[1]:
+            cell.font = Font(bold=True)
+    wb.save(output_file)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='두 배정 결과 비교')
+    parser.add_argument('old', help='이전 결과 파일 (.xlsx / .csv / .jsonl / .parquet)')
+    parser.add_argument('new', help='새 결과 파일')
+    parser.add_argument('--rules', help='분반/합반 규칙 파일 (규칙 변화 비교용)')
+    parser.add_argument('-o', '--output', help='비교 결과 파일 (.json 또는 .xlsx, 없으면 JSON을 표준 출력)')
+    args = parser.parse_args(argv)
+
+    diff = diff_results(args.old, args.new, rules_file=args.rules)
+
+    if not args.output:
+        json.dump(diff.to_dict(), sys.stdout, ensure_ascii=False, indent=2)
+        print()
+    elif args.output.lower().endswith('.xlsx'):
+        write_diff_xlsx(diff, args.output)
+    else:
+        write_diff_json(diff, args.output)
+
+    summary = diff.to_dict()['summary']
+    print(f"이동 {summary['moved']}명, 추가 {summary['added']}명, 삭제 {summary['removed']}명, "
+          f"새로 위반 {summary['newly_violated']}건, 새로 충족 {summary['newly_satisfied']}건", file=sys.stderr)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,96 @@
+"""
+배정 결과 미리보기 데이터
+GUI 결과 표(QAbstractTableModel)가 사용하는 행/색상 데이터와 정렬/필터 함수.
+작업 프로세스에서 만들어 파이프로 보내므로 Qt 없이 동작하고 pickle 가능해야 한다.
+"""
+
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Set, Tuple
+
+from class_assigner import TOGETHER_COLOR, Student
+
+# 미리보기 컬럼 (새 반/번호 → 학생 정보 → 규칙 플래그 순)
+PREVIEW_COLUMNS = ['반', '번호', '이름', '성별', '점수', '특수반', '전출', '난이도', '원반', '원번호',
+                   '합반', '분반', '분반대상', '동명이인', '비고']
+
+# 필터에서 선택할 수 있는 플래그 컬럼
+FLAG_COLUMNS = ['합반', '분반', '동명이인', '특수반', '전출']
+
+
+@dataclass
+class ResultPreview:
+    """배정 결과 미리보기 (행은 반/번호 순)"""
+    columns: List[str]
+    rows: List[tuple]
+    fills: List[Tuple[str, ...]]  # 행별 색상 (내보낸 시트와 같이 여러 색이면 셀마다 번갈아 적용)
+    class_count: int
+
+    # 수동 조정(manual_edits)용 배정 상태
+    student_index: List[int] = field(default_factory=list)  # 행 → students 목록 위치
+    students: List[Student] = field(default_factory=list)
+    separation_pairs: List[Tuple[str, str]] = field(default_factory=list)
+    together_groups: List[Set[str]] = field(default_factory=list)
+    _row_of: Optional[Dict[int, int]] = field(default=None, repr=False, compare=False)
+
+    def column_index(self, name: str) -> int:
+        return self.columns.index(name)
+
+    def row_of(self, index: int) -> int:
+        """students 목록 위치 → 행 번호"""
+        if self._row_of is None:
+            self._row_of = {student: row for row, student in enumerate(self.student_index)}
+        return self._row_of[index]
+
+    def cell_fill(self, row: int, column: int) -> Optional[str]:
+        """셀 배경색 (없으면 None)"""
+        fill = self.fills[row]
+        return fill[column % len(fill)] if fill else None
+
+
+def build_preview(assigner) -> ResultPreview:
+    """배정이 끝난 ClassAssigner에서 미리보기 생성 (색상은 결과 파일과 같은 규칙)"""
+    together_students, student_to_color, _ = assigner._get_rule_markers()
+    position = {id(s): i for i, s in enumerate(assigner.students)}
+    # build_result_records와 같은 순서 (반별 이름순)
+    student_index = [position[id(s)] for c in range(1, assigner.target_class_count + 1)
+                     for s in sorted(assigner.classes[c], key=lambda s: s.이름)]
+
+    rows, fills = [], []
+    for record in assigner.build_result_records():
+        rows.append(tuple(record[column] for column in PREVIEW_COLUMNS))
+        name = record['이름']
+        if name in together_students:
+            fills.append((TOGETHER_COLOR,))
+        else:
+            fills.append(tuple(student_to_color.get(name, ())))
+
+    return ResultPreview(columns=list(PREVIEW_COLUMNS), rows=rows, fills=fills,
+                         class_count=assigner.target_class_count, student_index=student_index,
+                         students=assigner.students, separation_pairs=list(assigner.separation_pairs),
+                         together_groups=list(assigner.together_groups))
+
+
+def filter_rows(preview: ResultPreview, class_num: Optional[int] = None, gender: Optional[str] = None,
+                flag: Optional[str] = None, text: str = '') -> List[int]:
+    """조건에 맞는 행 번호 목록 (조건이 None/빈 값이면 무시, text는 이름/비고 부분 일치)"""
+    class_idx = preview.column_index('반')
+    gender_idx = preview.column_index('성별')
+    flag_idx = preview.column_index(flag) if flag else None
+    name_idx = preview.column_index('이름')
+    note_idx = preview.column_index('비고')
+    text = text.strip()
+
+    return [
+        i for i, row in enumerate(preview.rows)
+        if (class_num is None or row[class_idx] == class_num)
+        and (gender is None or row[gender_idx] == gender)
+        and (flag_idx is None or row[flag_idx])
+        and (not text or text in row[name_idx] or text in str(row[note_idx]))
+    ]
+
+
+def sort_rows(preview: ResultPreview, indices: List[int], column: int, descending: bool = False) -> List[int]:
+    """행 번호 목록을 컬럼 값으로 정렬 (빈 값은 항상 뒤, 같은 값은 기존 순서 유지)"""
+    present = [i for i in indices if preview.rows[i][column] not in (None, '')]
+    empty = [i for i in indices if preview.rows[i][column] in (None, '')]
+    return sorted(present, key=lambda i: preview.rows[i][column], reverse=descending) + empty
@@ -0,0 +1,267 @@
+"""
+결과 출력기 (Result Writer)
+배정 결과를 여러 형식으로 저장하는 플러그인 방식 출력 인터페이스
+
+- xlsx: 서식이 적용된 반별 시트 + 요약 시트 (기존 '03 배정 결과.xlsx')
+- csv / jsonl / parquet: 하위 시스템 연동용 학생 단위 레코드
+"""
+
+import csv
+import importlib.util
+import json
+import os
+from typing import Dict, List, Optional, Tuple, Type
+
+from openpyxl.styles import PatternFill, Border, Side, Alignment, Font
+from openpyxl.comments import Comment
+
+from assignment_log import get_logger
+from class_assigner import (
+    CENTER_COLUMNS, COLOR_PALETTE, COMMENT_AUTHOR, HEADER_COLOR, TOGETHER_COLOR, SheetSpec
+)
+
+log = get_logger()
+
+
+# 학생 단위 레코드 컬럼 (ClassAssigner.build_result_records와 순서 동일)
+RECORD_FIELDS = ['원학년', '원반', '원번호', '이름', '성별', '점수', '학년', '반', '번호',
+                 '특수반', '전출', '난이도', '비고', '합반', '합반그룹', '분반', '분반대상', '동명이인']
+
+
+class ResultWriter:
+    """결과 출력기 기본 클래스"""
+    name = ''
+    extension = ''
+
+    def write(self, assigner, output_file: str):
+        """배정이 끝난 ClassAssigner의 결과를 output_file에 저장"""
+        raise NotImplementedError
+
+
+class XlsxResultWriter(ResultWriter):
+    """서식이 적용된 엑셀 결과 파일 (반별 시트 + 요약 시트)"""
+    name = 'xlsx'
+    extension = '.xlsx'
+
+    def __init__(self, workers: Optional[int] = None, incremental: bool = False):
+        # None이면 openpyxl, 정수이면 xlsx_writer 병렬 렌더링 (0 = CPU 수)
+        self.workers = workers
+        # True이면 기존 결과 파일과 비교해 바뀐 시트만 다시 렌더링 (xlsx_writer 사용)
+        self.incremental = incremental
+
+    def write(self, assigner, output_file: str):
+        class_specs, summary_data = assigner.build_sheet_specs()
+        summary_spec = assigner.build_summary_spec(summary_data)
+        rendered = [summary_spec] + class_specs
+
+        if self.incremental:
+            from xlsx_writer import write_xlsx
+            result = write_xlsx(output_file, [summary_spec] + class_specs, max_workers=self.workers or None,
+                                previous_file=output_file)
+            log.info("   ♻️  변경 없는 시트 %d개 재사용, %d개 다시 생성: %s",
+                     len(result['reused']), len(result['rendered']), result['rendered'])
+            rendered = [spec for spec in rendered if spec.title in result['rendered']]
+        elif self.workers is None:
+            import openpyxl
+            wb = openpyxl.Workbook()
+            wb.remove(wb.active)  # 기본 시트 제거
+            for spec in class_specs:
+                assigner._checkpoint()  # 취소 확인
+                render_sheet_openpyxl(wb, spec)
+            render_sheet_openpyxl(wb, summary_spec, index=0)
+            # 임시 파일에 저장 후 교체 (저장 중 중단되어도 기존 결과 파일 유지)
+            tmp_file = output_file + '.tmp'
+            wb.save(tmp_file)
+            os.replace(tmp_file, output_file)
+        else:
+            from xlsx_writer import write_xlsx
+            write_xlsx(output_file, [summary_spec] + class_specs, max_workers=self.workers or None)
+
+        # 두 렌더러 모두 헤더와 데이터 영역의 모든 셀에 서식을 적용
+        assigner._count('cells_styled', sum((len(spec.rows) + 1) * len(spec.header) for spec in rendered))
+
+
+class CsvResultWriter(ResultWriter):
+    """학생 단위 CSV (엑셀 호환을 위해 UTF-8 BOM, 플래그는 1/0)"""
+    name = 'csv'
+    extension = '.csv'
+
+    def write(self, assigner, output_file: str):
+        with open(output_file, 'w', newline='', encoding='utf-8-sig') as f:
+            writer = csv.writer(f)
+            writer.writerow(RECORD_FIELDS)
+            for record in assigner.build_result_records():
+                values = (record[field] for field in RECORD_FIELDS)
+                writer.writerow(['' if v is None else int(v) if isinstance(v, bool) else v for v in values])
+
+
+class JsonLinesResultWriter(ResultWriter):
+    """학생 단위 JSON Lines (한 줄에 학생 한 명)"""
+    name = 'jsonl'
+    extension = '.jsonl'
+
+    def write(self, assigner, output_file: str):
+        with open(output_file, 'w', encoding='utf-8') as f:
+            for record in assigner.build_result_records():
+                f.write(json.dumps(record, ensure_ascii=False))
+                f.write('\n')
+
+
+class ParquetResultWriter(ResultWriter):
+    """학생 단위 Parquet (pandas + pyarrow 또는 fastparquet 필요)"""
+    name = 'parquet'
+    extension = '.parquet'
+
+    @staticmethod
+    def available() -> bool:
+        return any(importlib.util.find_spec(engine) is not None for engine in ('pyarrow', 'fastparquet'))
+
+    def write(self, assigner, output_file: str):
+        if not self.available():
+            raise ImportError("Parquet 출력에는 pyarrow가 필요합니다: pip install pyarrow")
+        import pandas as pd
+        df = pd.DataFrame(assigner.build_result_records(), columns=RECORD_FIELDS)
+        df.to_parquet(output_file, index=False)
+
+
+WRITERS: Dict[str, Type[ResultWriter]] = {
+    'xlsx': XlsxResultWriter,
+    'csv': CsvResultWriter,
+    'jsonl': JsonLinesResultWriter,
+    'parquet': ParquetResultWriter,
+}
+
+
+def register_writer(writer_class: Type[ResultWriter]):
+    """사용자 정의 출력기 등록"""
+    WRITERS[writer_class.name] = writer_class
+    return writer_class
+
+
+def get_writer(writer, workers: Optional[int] = None, incremental: bool = False) -> ResultWriter:
+    """
+    출력기 이름, 파일 경로(확장자) 또는 ResultWriter 인스턴스로 출력기 생성
+
+    Raises:
+        ValueError: 지원하지 않는 출력 형식
+    """
+    if isinstance(writer, ResultWriter):
+        return writer
+
+    key = str(writer).lower()
+    if key not in WRITERS:
+        key = key.rsplit('.', 1)[-1] if '.' in key else key
+    if key not in WRITERS:
+        raise ValueError(f"지원하지 않는 출력 형식입니다: {writer} (지원: {', '.join(WRITERS)})")
+
+    if key == 'xlsx':
+        return XlsxResultWriter(workers=workers, incremental=incremental)
+    return WRITERS[key]()
+
+
+def output_paths(output_file: str, writers: Optional[list] = None, workers: Optional[int] = None,
+                 incremental: bool = False) -> List[Tuple[ResultWriter, str]]:
+    """
+    출력 형식별 (출력기, 저장 경로)
+
+    writers가 없으면 output_file 확장자의 형식 하나를 output_file에 저장한다 (등록되지 않은 확장자나
+    확장자가 없으면 xlsx). writers가 있으면 확장자가 output_file과 같은 형식은 output_file에,
+    나머지는 output_file의 확장자를 바꾼 경로에 저장한다.
+
+    Raises:
+        ValueError: 지원하지 않는 출력 형식, 같은 경로에 저장될 형식이 둘 이상
+    """
+    base_path, extension = os.path.splitext(output_file)
+    if writers is None:
+        name = next((name for name, writer_class in WRITERS.items()
+                     if extension.lower() == writer_class.extension), 'xlsx')
+        return [(get_writer(name, workers=workers, incremental=incremental), output_file)]
+
+    targets = []
+    for writer in writers:
+        writer = get_writer(writer, workers=workers, incremental=incremental)
+        path = output_file if extension.lower() == writer.extension else base_path + writer.extension
+        if any(path == other for _, other in targets):
+            raise ValueError(f"출력 형식이 중복되었습니다: {writer.name} ({path})")
+        targets.append((writer, path))
+    return targets
+
+
+def render_sheet_openpyxl(wb, spec: SheetSpec, index: Optional[int] = None):
+    """SheetSpec을 openpyxl 워크시트로 렌더링"""
+    # 스타일 정의
+    thin_border = Border(left=Side(style='thin'),
+                         right=Side(style='thin'),
+                         top=Side(style='thin'),
+                         bottom=Side(style='thin'))
+
+    header_font = Font(bold=True)
+    header_fill = PatternFill(start_color=HEADER_COLOR, end_color=HEADER_COLOR, fill_type="solid")
+    center_align = Alignment(horizontal='center', vertical='center')
+
+    fills = {}
+
+    def get_fill(color):
+        if color not in fills:
+            fills[color] = PatternFill(start_color=color, end_color=color, fill_type="solid")
+        return fills[color]
+
+    ws = wb.create_sheet(title=spec.title, index=index)
+    ws.append(spec.header)
+    for row in spec.rows:
+        ws.append(row)
+
+    # 스타일 적용 (헤더)
+    for cell in ws[1]:
+        cell.font = header_font
+        cell.fill = header_fill
+        cell.alignment = center_align
+        cell.border = thin_border
+
+    column_count = len(spec.header)
+    if spec.kind == 'summary':
+        for row in ws.iter_rows(min_row=2):
+            for cell in row:
+                cell.border = thin_border
+                cell.alignment = center_align
+    else:
+        # 데이터 행 스타일 적용
+        for row_idx in range(2, len(spec.rows) + 2):  # 2부터 시작 (1은 헤더)
+            row_fill = spec.row_fills[row_idx - 2] if spec.row_fills else ()
+            for col_idx in range(1, column_count + 1):
+                cell = ws.cell(row=row_idx, column=col_idx)
+                cell.border = thin_border
+                if col_idx in CENTER_COLUMNS:
+                    cell.alignment = center_align
+                if row_fill:
+                    # 2개 이상 쌍: 홀수 셀과 짝수 셀에 번갈아가며 색상 적용
+                    cell.fill = get_fill(row_fill[(col_idx - 1) % len(row_fill)])
+
+    for (row_idx, col_idx), text in spec.comments.items():
+        ws.cell(row=row_idx, column=col_idx).comment = Comment(text, COMMENT_AUTHOR)
+
+    # 컬럼 너비 (간단하게 고정값 적용)
+    for column, width in spec.column_widths.items():
+        ws.column_dimensions[column].width = width
+
+    if spec.kind == 'summary':
+        # 범례(Legend) 추가
+        legend_start_row = len(spec.rows) + 5
+        ws.cell(row=legend_start_row, column=1, value="[범례]").font = Font(bold=True, size=12)
+
+        # 합반 범례
+        ws.cell(row=legend_start_row+1, column=1, value="합반 규칙 적용").border = thin_border
+        guide_cell = ws.cell(row=legend_start_row+1, column=2, value="하늘색 배경")
+        guide_cell.fill = get_fill(TOGETHER_COLOR)
+        guide_cell.border = thin_border
+
+        # 분반 범례
+        ws.cell(row=legend_start_row+2, column=1, value="분반 규칙 적용").border = thin_border
+        guide_cell = ws.cell(row=legend_start_row+2, column=2, value="기타 색상 배경")
+        guide_cell.fill = get_fill(COLOR_PALETTE[0])
+        guide_cell.border = thin_border
+        guide_cell.comment = Comment("마우스를 올리면 누구와 분반인지 표시됩니다.", COMMENT_AUTHOR)
+
+        ws.cell(row=legend_start_row+2, column=3, value="← 이름에 마우스를 올리면 대상 확인 가능")
+
+    return ws
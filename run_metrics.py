@@ -0,0 +1,103 @@
+"""
+배정 실행 계측
+단계별 경과 시간(wall)/CPU 시간과 주요 반복 구간 카운터를 기록한다.
+ClassAssigner.run이 실행할 때마다 새 RunMetrics를 만들어 assigner.metrics에 둔다.
+"""
+
+import json
+import time
+import tracemalloc
+from collections import Counter
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional
+
+# 항상 보고하는 카운터 (실행 중 한 번도 증가하지 않아도 0으로 기록)
+COUNTER_NAMES = (
+    'can_assign_calls',             # _can_assign 호출 수
+    'alternative_class_fallbacks',  # 원래 고른 반 대신 다른 반에 배정한 횟수
+    'unplaceable_warnings',         # 어느 반에도 배정할 수 없어 경고한 학생 수
+    'cells_styled',                 # 결과 xlsx에서 서식을 적용한 셀 수 (재사용한 시트 제외)
+    'engine_iterations',            # 개선 엔진이 평가한 후보 배정 수 (greedy면 0)
+    'audit_violations',             # 배정 검증에서 찾은 필수 조건 위반 수
+)
+
+
+@dataclass
+class StageTiming:
+    """단계 하나의 누적 시간"""
+    wall_sec: float = 0.0
+    cpu_sec: float = 0.0  # 이 프로세스의 CPU 시간 (병렬 렌더링 작업 프로세스 제외)
+    calls: int = 0
+    peak_bytes: Optional[int] = None  # 단계 중 최대 추적 메모리 (tracemalloc 추적 중일 때만, run_profiler 참고)
+
+
+@dataclass
+class RunMetrics:
+    """배정 실행 한 번의 계측 결과"""
+    students: int = 0
+    classes: int = 0
+    stages: Dict[str, StageTiming] = field(default_factory=dict)
+    counters: Counter = field(default_factory=lambda: Counter({name: 0 for name in COUNTER_NAMES}))
+    # 실행 중인 바깥 단계들의 지금까지 최대 메모리 (안쪽 단계가 reset_peak 하기 전 값 보존)
+    _memory_peaks: List[int] = field(default_factory=list, repr=False)
+
+    @contextmanager
+    def stage(self, name: str):
+        """with 블록의 경과/CPU 시간을 name 단계에 누적 (예외로 끝나도 기록)"""
+        tracing = tracemalloc.is_tracing()
+        if tracing:
+            if self._memory_peaks:
+                self._memory_peaks[-1] = max(self._memory_peaks[-1], tracemalloc.get_traced_memory()[1])
+            tracemalloc.reset_peak()
+            self._memory_peaks.append(0)
+        wall, cpu = time.perf_counter(), time.process_time()
+        try:
+            yield
+        finally:
+            timing = self.stages.setdefault(name, StageTiming())
+            timing.wall_sec += time.perf_counter() - wall
+            timing.cpu_sec += time.process_time() - cpu
+            timing.calls += 1
+            if tracing:
+                peak = max(self._memory_peaks.pop(), tracemalloc.get_traced_memory()[1])
+                timing.peak_bytes = max(timing.peak_bytes or 0, peak)
+                if self._memory_peaks:
+                    self._memory_peaks[-1] = max(self._memory_peaks[-1], peak)
+
+    def count(self, name: str, n: int = 1):
+        self.counters[name] += n
+
+    @property
+    def wall_sec(self) -> float:
+        """최상위 단계 경과 시간 합 (다른 단계 안에서 잰 _validate_rules 제외)"""
+        return sum(t.wall_sec for name, t in self.stages.items() if not name.startswith('_'))
+
+    @property
+    def cpu_sec(self) -> float:
+        return sum(t.cpu_sec for name, t in self.stages.items() if not name.startswith('_'))
+
+    def to_dict(self) -> dict:
+        return {
+            'students': self.students,
+            'classes': self.classes,
+            'wall_sec': round(self.wall_sec, 6),
+            'cpu_sec': round(self.cpu_sec, 6),
+            'stages': {name: {'wall_sec': round(t.wall_sec, 6), 'cpu_sec': round(t.cpu_sec, 6), 'calls': t.calls,
+                              **({'peak_bytes': t.peak_bytes} if t.peak_bytes is not None else {})}
+                       for name, t in self.stages.items()},
+            'counters': dict(self.counters),
+        }
+
+    def write_json(self, path: str):
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(self.to_dict(), f, ensure_ascii=False, indent=2)
+
+    def format_table(self) -> str:
+        """단계별 시간/카운터 표 (콘솔 출력용)"""
+        lines = [f"   {'단계':<28}{'경과(초)':>10}{'CPU(초)':>10}"]
+        for name, t in self.stages.items():
+            lines.append(f"   {name:<28}{t.wall_sec:>10.3f}{t.cpu_sec:>10.3f}")
+        lines.append(f"   {'합계':<28}{self.wall_sec:>10.3f}{self.cpu_sec:>10.3f}")
+        lines.extend(f"   {name}: {value:,}" for name, value in self.counters.items())
+        return '\n'.join(lines)
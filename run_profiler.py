@@ -0,0 +1,108 @@
+"""
+배정 실행 프로파일링 (현장 진단용)
+특정 학교 입력에서 배정이 느리거나 메모리를 많이 쓸 때 코드를 고치지 않고 실행 전체를
+cProfile(함수별 시간)과 tracemalloc(메모리)으로 측정한다. 결과 파일 옆에 다음을 저장한다:
+
+    <결과 파일>.prof          pstats 파일 (python -m pstats, snakeviz 등으로 열기, cpu 모드)
+    <결과 파일>.profile.txt   누적/자체 시간 상위 N개 함수 표 + 단계별 최대 메모리
+
+측정 중에는 배정이 느려지므로(cProfile 약 2배, tracemalloc 수 배) 단계별 시간은 평소 실행과
+비교하지 않는다.
+"""
+
+import cProfile
+import io
+import os
+import pstats
+import time
+import tracemalloc
+from typing import List, Optional, Tuple, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from run_metrics import RunMetrics
+
+# cpu: cProfile만, memory: tracemalloc만, all: 둘 다
+PROFILE_MODES = ('cpu', 'memory', 'all')
+DEFAULT_TOP = 30
+
+
+def profile_paths(output_file: str) -> Tuple[str, str]:
+    """결과 파일 경로 → (pstats 파일, 보고서 파일) 경로"""
+    base = os.path.splitext(output_file)[0]
+    return base + '.prof', base + '.profile.txt'
+
+
+class RunProfiler:
+    """run 한 번을 감싸는 프로파일러 (start → 실행 → stop → write)"""
+
+    def __init__(self, mode: str = 'all', top: int = DEFAULT_TOP):
+        if mode not in PROFILE_MODES:
+            raise ValueError(f"지원하지 않는 프로파일 모드: {mode} (지원: {', '.join(PROFILE_MODES)})")
+        self.mode = mode
+        self.top = top
+        self.cpu = mode in ('cpu', 'all')
+        self.memory = mode in ('memory', 'all')
+        self.profile: Optional[cProfile.Profile] = None
+        self.peak_bytes: Optional[int] = None
+        self.wall_sec = 0.0
+        self._started_tracing = False
+        self._start = 0.0
+
+    def start(self):
+        if self.memory and not tracemalloc.is_tracing():
+            # 이미 다른 곳에서 추적 중이면 그대로 사용하고 stop()에서 끄지 않음
+            tracemalloc.start()
+            self._started_tracing = True
+        if self.memory:
+            tracemalloc.reset_peak()
+        if self.cpu:
+            self.profile = cProfile.Profile()
+            self.profile.enable()
+        self._start = time.perf_counter()
+
+    def stop(self):
+        self.wall_sec = time.perf_counter() - self._start
+        if self.profile is not None:
+            self.profile.disable()
+        if self.memory:
+            self.peak_bytes = tracemalloc.get_traced_memory()[1]
+            if self._started_tracing:
+                tracemalloc.stop()
+                self._started_tracing = False
+
+    def hotspots(self, sort: str = 'cumulative') -> str:
+        """시간 상위 함수 표 (sort: 'cumulative' 누적 시간, 'tottime' 자체 시간)"""
+        stream = io.StringIO()
+        stats = pstats.Stats(self.profile, stream=stream)
+        stats.strip_dirs().sort_stats(sort).print_stats(self.top)
+        return stream.getvalue().strip('\n')
+
+    def report(self, metrics: Optional['RunMetrics'] = None) -> str:
+        """보고서 본문 (시간 상위 함수 + 단계별 최대 메모리)"""
+        lines = [f"프로파일 모드: {self.mode}, 측정 시간 {self.wall_sec:.3f}초 (측정 부담 포함)"]
+        if self.profile is not None:
+            lines += ["", f"== 누적 시간 상위 {self.top}개 함수 ==", self.hotspots('cumulative'),
+                      "", f"== 자체 시간 상위 {self.top}개 함수 ==", self.hotspots('tottime')]
+        if self.memory:
+            lines += ["", "== 단계별 최대 메모리 (tracemalloc, Python 객체 할당 기준) ==",
+                      f"   {'단계':<34}{'최대(MiB)':>12}"]
+            stages = metrics.stages.items() if metrics is not None else ()
+            for name, timing in stages:
+                if timing.peak_bytes is not None:
+                    lines.append(f"   {name:<34}{timing.peak_bytes / 2 ** 20:>12.2f}")
+            lines.append(f"   {'전체':<34}{self.peak_bytes / 2 ** 20:>12.2f}")
+        return '\n'.join(lines) + '\n'
+
+    def write(self, output_file: str, metrics: Optional['RunMetrics'] = None) -> List[str]:
+        """결과 파일 옆에 pstats/보고서 저장, 저장한 파일 목록 반환"""
+        prof_file, report_file = profile_paths(output_file)
+        directory = os.path.dirname(os.path.abspath(output_file))
+        os.makedirs(directory, exist_ok=True)
+        saved = []
+        if self.profile is not None:
+            self.profile.dump_stats(prof_file)
+            saved.append(prof_file)
+        with open(report_file, 'w', encoding='utf-8') as f:
+            f.write(self.report(metrics))
+        saved.append(report_file)
+        return saved
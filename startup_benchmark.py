@@ -0,0 +1,99 @@
+"""
+시작 시간 벤치마크
+GUI를 새 프로세스로 여러 번 실행해 창이 처음 표시될 때까지의 시간을 측정한다.
+(PyInstaller 빌드 파일도 --executable로 측정 가능)
+
+사용법:
+    python startup_benchmark.py                     # 소스 실행 5회
+    python startup_benchmark.py -n 10 --history startup_history.jsonl
+    python startup_benchmark.py --executable "dist/학급편성"
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+
+
+def measure_gui_startup(command, env=None, timeout=120):
+    """
+    GUI 한 번 실행
+
+    Returns:
+        (프로세스 시작부터 창 표시까지 ms, GUI 내부 측정 ms - import 시작부터 창 표시까지)
+    """
+    env = dict(os.environ if env is None else env)
+    env['CLASS_ASSIGNER_STARTUP_BENCHMARK'] = '1'
+    start = time.perf_counter()
+    process = subprocess.Popen(command, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, env=env,
+                               text=True, cwd=BASE_DIR)
+    internal_ms = None
+    try:
+        for line in process.stdout:
+            if line.startswith('STARTUP_MS'):
+                internal_ms = float(line.split()[1])
+                break
+        wall_ms = (time.perf_counter() - start) * 1000
+        process.wait(timeout=timeout)
+    finally:
+        if process.poll() is None:
+            process.kill()
+    if internal_ms is None:
+        raise RuntimeError(f"시작 시간을 측정하지 못했습니다 (종료 코드: {process.returncode})")
+    return wall_ms, internal_ms
+
+
+def measure_import(module, timeout=60):
+    """새 인터프리터에서 모듈 import 시간(ms)과 import된 무거운 의존성"""
+    code = (
+        "import sys, time; t = time.perf_counter(); import {0}; "
+        "print((time.perf_counter() - t) * 1000); "
+        "print(','.join(m for m in ('pandas', 'numpy', 'openpyxl', 'tkinter') if m in sys.modules))"
+    ).format(module)
+    output = subprocess.run([sys.executable, '-c', code], capture_output=True, text=True, cwd=BASE_DIR,
+                            timeout=timeout, check=True).stdout.splitlines()
+    return float(output[0]), [m for m in output[1].split(',') if m] if len(output) > 1 else []
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="GUI 시작 시간 벤치마크")
+    parser.add_argument('-n', '--runs', type=int, default=5, help="실행 횟수 (기본 5)")
+    parser.add_argument('--executable', help="측정할 실행 파일 (기본: 현재 파이썬으로 class_assigner_gui_qt.py 실행)")
+    parser.add_argument('--history', help="결과를 추가할 JSON Lines 파일")
+    args = parser.parse_args(argv)
+
+    command = [args.executable] if args.executable else [sys.executable, 'class_assigner_gui_qt.py']
+
+    wall, internal = [], []
+    for run in range(1, args.runs + 1):
+        wall_ms, internal_ms = measure_gui_startup(command)
+        wall.append(wall_ms)
+        internal.append(internal_ms)
+        print(f"   {run}회: 창 표시까지 {wall_ms:.0f}ms (GUI 내부 측정 {internal_ms:.0f}ms)")
+
+    result = {
+        'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S'),
+        'command': ' '.join(command),
+        'runs': args.runs,
+        'window_shown_ms': {'min': round(min(wall), 1), 'median': round(statistics.median(wall), 1)},
+        'gui_internal_ms': {'min': round(min(internal), 1), 'median': round(statistics.median(internal), 1)},
+    }
+    if not args.executable:
+        import_ms, heavy = measure_import('class_assigner')
+        result['class_assigner_import_ms'] = round(import_ms, 1)
+        result['class_assigner_heavy_imports'] = heavy
+
+    print(json.dumps(result, ensure_ascii=False, indent=2))
+    if args.history:
+        with open(args.history, 'a', encoding='utf-8') as f:
+            f.write(json.dumps(result, ensure_ascii=False) + '\n')
+    return result
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,270 @@
+"""
+가상 명단/규칙 생성기
+규모별 성능/품질 측정용 입력을 만든다. 학생 명단은 read_students가 읽는 시트 형식(원반별 시트,
+학년/반/번호/이름/성별/점수/특수반/전출/난이도/비고), 규칙은 read_rules가 읽는 Sheet1 배치
+(왼쪽: 분반 쌍, 오른쪽: 빈 행으로 구분한 합반 그룹)로 저장한다. 같은 설정과 seed면 같은 내용.
+
+만든 규칙에는 충돌이 없다. 합반 그룹과 분반 쌍에는 동명이인이 아닌 학생만 들어가고, 합반 그룹
+학생은 분반 쌍에 넣지 않으며, 한 학생의 분반 대상은 진급 학급 수 - 1명 이하이다.
+
+사용법:
+    python synthetic_inputs.py 가상/ --students 10000 --original-classes 40 --target-classes 40 --seed 1
+"""
+
+import argparse
+import os
+import random
+import sys
+from dataclasses import dataclass
+from typing import Dict, List, Set, Tuple
+
+from class_assigner import Student
+from parsed_inputs import ParsedInputs
+
+STUDENT_FILE_NAME = '01 가상 명단.xlsx'
+RULES_FILE_NAME = '02 분반 합반할 학생 규칙.xlsx'
+
+STUDENT_COLUMNS = ['학년', '반', '번호', '이름', '성별', '점수', '특수반', '전출', '난이도', '비고']
+
+SURNAMES = ('김', '이', '박', '최', '정', '강', '조', '윤', '장', '임', '한', '오', '서', '신', '권',
+            '황', '안', '송', '류', '전', '홍', '고', '문', '양', '손', '배', '백', '허', '유', '남',
+            '심', '노', '하', '곽', '성', '차', '주', '우', '구', '민', '진', '나', '지', '엄', '채')
+GIVEN_FIRST = ('서', '민', '지', '하', '도', '예', '시', '주', '수', '준', '유', '은', '채', '윤', '현',
+               '우', '소', '다', '태', '재', '승', '건', '연', '아', '선', '정', '성', '가', '나', '라',
+               '희', '진', '동', '상', '경', '보', '세', '영', '혜', '원', '인', '규', '찬', '한', '해',
+               '새', '이', '로', '율', '온', '리', '단', '류', '겸', '솔', '별')
+GIVEN_SECOND = ('준', '윤', '아', '우', '연', '원', '서', '진', '현', '호', '민', '은', '빈', '율', '린',
+                '훈', '후', '안', '혁', '희', '영', '수', '하', '나', '경', '재', '성', '인', '주', '온',
+                '결', '유', '찬', '건', '채', '담', '솔', '별', '슬', '람', '환', '석', '규', '범', '완',
+                '정', '비', '니', '지', '미', '혜', '한', '겸', '웅', '혼', '령')
+
+# 난이도 값과 가중치 (샘플 명단의 분포)
+DIFFICULTY_LEVELS = (1.0, 2.0, 3.0)
+DIFFICULTY_WEIGHTS = (5, 9, 3)
+
+
+@dataclass
+class SyntheticSpec:
+    """가상 입력 생성 설정 (기본값은 샘플 명단과 비슷한 비율)"""
+    students: int = 152
+    original_classes: int = 7
+    target_classes: int = 7           # 분반 대상 수 상한 (진급 학급 수 - 1)
+    grade: int = 5
+    male_ratio: float = 0.5
+    special_rate: float = 0.013       # 특수반 비율
+    transfer_rate: float = 0.02       # 전출 예정 비율
+    difficulty_rate: float = 0.1      # 난이도가 있는 (특수반이 아닌) 학생 비율
+    same_name_rate: float = 0.013     # 동명이인 학생 비율 (두 명씩 같은 이름)
+    separation_density: float = 0.12  # 학생 1명당 분반 쌍 수
+    together_group_sizes: Tuple[int, ...] = (2,)  # 합반 그룹별 인원
+    seed: int = 0
+
+
+def _unique_names(rng: random.Random, count: int) -> List[str]:
+    pool = len(SURNAMES) * len(GIVEN_FIRST) * len(GIVEN_SECOND)
+    if count > pool:
+        raise ValueError(f"학생 수는 {pool:,}명 이하여야 합니다: {count:,}")
+    names = []
+    for index in rng.sample(range(pool), count):
+        index, last = divmod(index, len(GIVEN_SECOND))
+        surname, first = divmod(index, len(GIVEN_FIRST))
+        names.append(SURNAMES[surname] + GIVEN_FIRST[first] + GIVEN_SECOND[last])
+    return names
+
+
+def generate_inputs(spec: SyntheticSpec) -> ParsedInputs:
+    """
+    가상 명단과 규칙 생성 (파일로 저장하지 않음)
+
+    Returns:
+        ParsedInputs (student_file/rules_file은 빈 문자열). run(parsed_inputs=...)로 바로 배정 가능
+    """
+    if spec.students < 1 or spec.original_classes < 1 or spec.target_classes < 1:
+        raise ValueError("학생 수와 학급 수는 1 이상이어야 합니다")
+    rng = random.Random(spec.seed)
+    count = spec.students
+    names = _unique_names(rng, count)
+
+    # 동명이인: 두 명씩 같은 이름
+    order = list(range(count))
+    rng.shuffle(order)
+    same_pairs = min(int(round(count * spec.same_name_rate / 2)), count // 2)
+    for k in range(same_pairs):
+        names[order[2 * k + 1]] = names[order[2 * k]]
+
+    # 원반 배정 후 반별 이름순으로 번호 부여
+    original = [i % spec.original_classes + 1 for i in range(count)]
+    rng.shuffle(original)
+    members: Dict[int, List[int]] = {}
+    for i in range(count):
+        members.setdefault(original[i], []).append(i)
+    numbers = [0] * count
+    for class_members in members.values():
+        for number, i in enumerate(sorted(class_members, key=lambda i: (names[i], i)), 1):
+            numbers[i] = number
+
+    students = []
+    for i in range(count):
+        special = rng.random() < spec.special_rate
+        transfer = not special and rng.random() < spec.transfer_rate
+        if special:
+            difficulty = rng.choice(DIFFICULTY_LEVELS[1:])
+        elif rng.random() < spec.difficulty_rate:
+            difficulty = rng.choices(DIFFICULTY_LEVELS, DIFFICULTY_WEIGHTS)[0]
+        else:
+            difficulty = 0.0
+        students.append(Student(
+            학년=spec.grade, 원반=original[i], 원번호=numbers[i], 이름=names[i],
+            성별='남' if rng.random() < spec.male_ratio else '여',
+            점수=float(min(100, max(40, round(rng.gauss(85, 12))))),
+            특수반=special, 전출=transfer, 난이도=difficulty, 비고='특수학급' if special else '',
+        ))
+
+    # 규칙에 넣을 수 있는 학생: 동명이인 제외 (order 앞쪽이 동명이인)
+    candidates = order[2 * same_pairs:]
+
+    # 합반 그룹
+    together_groups: List[List[str]] = []
+    position = 0
+    for size in spec.together_group_sizes:
+        if size < 2 or position + size > len(candidates):
+            continue
+        together_groups.append([names[i] for i in candidates[position:position + size]])
+        position += size
+
+    # 분반 쌍 (학생별 분반 대상 수는 진급 학급 수 - 1 이하 → 항상 배정 가능)
+    eligible = candidates[position:]
+    max_degree = spec.target_classes - 1
+    target_pairs = int(round(count * spec.separation_density))
+    degree: Dict[int, int] = {}
+    seen: Set[Tuple[int, int]] = set()
+    separation_pairs: List[Tuple[str, str]] = []
+    attempts = 0
+    while len(separation_pairs) < target_pairs and len(eligible) >= 2 and max_degree > 0 \
+            and attempts < target_pairs * 20:
+        attempts += 1
+        a, b = rng.sample(eligible, 2)
+        key = (min(a, b), max(a, b))
+        if key in seen or degree.get(a, 0) >= max_degree or degree.get(b, 0) >= max_degree:
+            continue
+        seen.add(key)
+        degree[a] = degree.get(a, 0) + 1
+        degree[b] = degree.get(b, 0) + 1
+        separation_pairs.append((names[a], names[b]))
+
+    return ParsedInputs(student_file='', rules_file='', students=students, separation_pairs=separation_pairs,
+                        together_groups=[set(group) for group in together_groups])
+
+
+def write_student_file(path: str, students: List[Student]):
+    """원반별 시트로 학생 명단 저장 (샘플 명단과 같은 컬럼, 빈 값은 빈 셀)"""
+    import openpyxl
+
+    by_class: Dict[int, List[Student]] = {}
+    for student in students:
+        by_class.setdefault(student.원반, []).append(student)
+
+    wb = openpyxl.Workbook(write_only=True)
+    for class_num in sorted(by_class):
+        grade = by_class[class_num][0].학년
+        ws = wb.create_sheet(title=f'{grade}-{class_num}')
+        ws.column_dimensions['D'].width = 12
+        ws.column_dimensions['J'].width = 24
+        ws.append(STUDENT_COLUMNS)
+        for s in sorted(by_class[class_num], key=lambda s: s.원번호):
+            ws.append([s.학년, s.원반, s.원번호, s.이름, s.성별, int(s.점수),
+                       1 if s.특수반 else None, 1 if s.전출 else None,
+                       (int(s.난이도) if s.난이도 == int(s.난이도) else s.난이도) if s.난이도 > 0 else None,
+                       s.비고 or None])
+    wb.save(path)
+
+
+def write_rules_file(path: str, students: List[Student], separation_pairs: List[Tuple[str, str]],
+                     together_groups: List[Set[str]]):
+    """규칙 파일(Sheet1) 저장: A~E 분반 쌍, G~K 합반 그룹 (그룹 사이는 빈 행)"""
+    import openpyxl
+
+    class_of = {}
+    for student in students:
+        class_of.setdefault(student.이름, student.원반)
+
+    together_rows = []
+    for group in together_groups:
+        members = sorted(group)
+        for k in range(0, len(members), 2):
+            pair = members[k:k + 2]
+            right = pair[1] if len(pair) > 1 else None
+            together_rows.append((class_of.get(pair[0]), pair[0], class_of.get(right), right))
+        together_rows.append((None, None, None, None))
+
+    wb = openpyxl.Workbook()
+    ws = wb.active
+    ws.title = 'Sheet1'
+    ws.append(['분반해야하는 학생', None, None, None, None, None, '합반해야하는 학생'])
+    ws.merge_cells('A1:E1')
+    ws.merge_cells('G1:K1')
+    ws.append(['반', '이름', '↔', '반', '이름', None, '반', '이름', '＋', '반', '이름'])
+    for row in range(max(len(separation_pairs), len(together_rows))):
+        values = [None] * 11
+        if row < len(separation_pairs):
+            name1, name2 = separation_pairs[row]
+            values[0:5] = [class_of.get(name1), name1, None, class_of.get(name2), name2]
+        if row < len(together_rows):
+            class1, name1, class2, name2 = together_rows[row]
+            values[6:11] = [class1, name1, None, class2, name2]
+        ws.append(values)
+    wb.save(path)
+
+
+def write_inputs(directory: str, spec: SyntheticSpec) -> ParsedInputs:
+    """가상 명단/규칙을 directory에 저장 (파일 이름은 샘플과 같음, batch_runner 폴더 형식)"""
+    os.makedirs(directory, exist_ok=True)
+    inputs = generate_inputs(spec)
+    inputs.student_file = os.path.join(directory, STUDENT_FILE_NAME)
+    inputs.rules_file = os.path.join(directory, RULES_FILE_NAME)
+    write_student_file(inputs.student_file, inputs.students)
+    write_rules_file(inputs.rules_file, inputs.students, inputs.separation_pairs, inputs.together_groups)
+    return inputs
+
+
+def main(argv=None) -> int:
+    defaults = SyntheticSpec()
+    parser = argparse.ArgumentParser(description="가상 학생 명단/규칙 파일 생성")
+    parser.add_argument('directory', help="저장할 폴더")
+    parser.add_argument('--students', type=int, default=defaults.students)
+    parser.add_argument('--original-classes', type=int, default=defaults.original_classes)
+    parser.add_argument('--target-classes', type=int, default=defaults.target_classes)
+    parser.add_argument('--grade', type=int, default=defaults.grade)
+    parser.add_argument('--male-ratio', type=float, default=defaults.male_ratio)
+    parser.add_argument('--special-rate', type=float, default=defaults.special_rate)
+    parser.add_argument('--transfer-rate', type=float, default=defaults.transfer_rate)
+    parser.add_argument('--difficulty-rate', type=float, default=defaults.difficulty_rate)
+    parser.add_argument('--same-name-rate', type=float, default=defaults.same_name_rate)
+    parser.add_argument('--separation-density', type=float, default=defaults.separation_density,
+                        help="학생 1명당 분반 쌍 수")
+    parser.add_argument('--together-groups', type=int, nargs='*', default=list(defaults.together_group_sizes),
+                        metavar='SIZE', help="합반 그룹별 인원 (예: 2 2 3)")
+    parser.add_argument('--seed', type=int, default=defaults.seed)
+    args = parser.parse_args(argv)
+
+    spec = SyntheticSpec(
+        students=args.students, original_classes=args.original_classes, target_classes=args.target_classes,
+        grade=args.grade, male_ratio=args.male_ratio, special_rate=args.special_rate,
+        transfer_rate=args.transfer_rate, difficulty_rate=args.difficulty_rate,
+        same_name_rate=args.same_name_rate, separation_density=args.separation_density,
+        together_group_sizes=tuple(args.together_groups), seed=args.seed,
+    )
+    try:
+        inputs = write_inputs(args.directory, spec)
+    except ValueError as e:
+        print(f"❌ {e}", file=sys.stderr)
+        return 2
+    summary = inputs.summary()
+    print(f"✅ {inputs.student_file}: 학생 {summary['학생수']:,}명 (원반 {summary['원반수']}개, "
+          f"특수반 {summary['특수반수']}, 전출 {summary['전출생수']})")
+    print(f"✅ {inputs.rules_file}: 분반 {summary['분반쌍']:,}쌍, 합반 {summary['합반그룹']}그룹")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,127 @@
+"""
+assignment_audit 모듈 테스트
+배정 상태/규칙 위반 종류별 검출, 수동 조정 후 검증과 ManualEditor 위반 목록 일치, run/명령줄 연동 테스트
+"""
+
+import pytest
+import contextlib
+import io
+import random
+import sys
+import os
+
+# 상위 디렉토리의 class_assigner 모듈 import
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from assignment_audit import audit_assigner
+from assignment_cli import EXIT_OK, run_assignment
+from class_assigner import ClassAssigner, Student
+from manual_edits import ManualEditor
+from synthetic_inputs import SyntheticSpec, generate_inputs
+
+BASE_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+STUDENT_FILE = os.path.join(BASE_DIR, '01 가상 명단.xlsx')
+RULES_FILE = os.path.join(BASE_DIR, '02 분반 합반할 학생 규칙.xlsx')
+
+
+def make_student(name, class_num):
+    student = Student(학년=5, 원반=1, 원번호=1, 이름=name, 성별='남', 점수=80, 특수반=False,
+                      전출=False, 난이도=0, 비고='')
+    student.assigned_class = class_num
+    return student
+
+
+@pytest.fixture
+def assigner():
+    """규칙을 모두 지킨 3개 반 배정"""
+    assigner = ClassAssigner.__new__(ClassAssigner)
+    assigner.target_class_count = 3
+    assigner.students = [make_student(name, c) for name, c in
+                         [('가', 1), ('나', 2), ('다', 1), ('라', 1), ('마', 1), ('바', 3), ('바', 2), ('사', 3)]]
+    assigner.classes = {c: [s for s in assigner.students if s.assigned_class == c] for c in (1, 2, 3)}
+    assigner.separation_pairs = [('가', '나'), ('나', '가'), ('가', '없는학생')]
+    assigner.together_groups = [{'가', '다'}, {'다', '라'}, {'마', '없는학생'}]
+    return assigner
+
+
+def test_clean_assignment(assigner):
+    """테스트 1: 규칙을 지킨 배정은 위반 없음 (중복 분반 쌍, 명단에 없는 이름은 무시)"""
+    report = audit_assigner(assigner)
+
+    assert report.ok and report.violations == [] and report.students == 8
+    assert report.to_dict()['counts'] == {}
+
+
+def test_detects_each_violation(assigner, capsys):
+    """테스트 2: 배정 상태 오류와 분반/합반(겹치는 그룹 포함)/동명이인 위반을 종류별로 검출"""
+    students = assigner.students
+    students[0].assigned_class = None  # 가: 반 없음 (1반 목록에는 남아 있음)
+    assigner.classes[2].append(students[1])  # 나: 2반 목록에 두 번
+    assigner.classes[1].remove(students[4])  # 마: 1반이지만 목록에 없음
+    students[7].assigned_class = 2  # 사: 3반 목록에 있지만 2반
+    assigner.classes[3].append(make_student('아', 3))  # 명단에 없는 학생
+    students[3].assigned_class = 2  # 라: 다와 합반 그룹이 나뉨, 나와 같은 반
+    assigner.classes[1].remove(students[3])
+    assigner.classes[2].append(students[3])
+    assigner.separation_pairs.append(('나', '라'))
+    students[5].assigned_class = 2  # 바: 동명이인이 같은 반
+    assigner.classes[3].remove(students[5])
+    assigner.classes[2].append(students[5])
+
+    report = audit_assigner(assigner)
+
+    assert report.counts() == {'미배정': 1, '중복배정': 1, '반목록누락': 1, '반목록불일치': 2, '명단외학생': 1,
+                               '분반': 1, '합반': 1, '동명이인': 1}
+    messages = [v.message() for v in report.violations]
+    assert "미배정: 가" in messages
+    assert "중복 배정: 나 (2반, 2반)" in messages
+    assert "반 목록 누락: 마 (1반)" in messages
+    assert "반 목록 불일치: 사 (배정 2반, 반 목록 3반)" in messages
+    assert "명단에 없는 학생: 아 (3반)" in messages
+    assert "분반 위반: 나 - 라 (2반)" in messages
+    assert "합반 위반: 가, 다, 라 → 1반, 2반로 나뉨" in messages  # 겹치는 두 그룹은 하나로 (가는 반이 없음)
+    assert "동명이인 같은 반: 바 (2반)" in messages
+    assert [v.kind for v in report.state_violations] == ['미배정', '중복배정', '반목록누락', '반목록불일치',
+                                                          '반목록불일치', '명단외학생']
+
+    # run 밖에서 호출해도 위반은 경고로 출력하고 audit_report에 남김
+    assert assigner.audit().violations == report.violations
+    out = capsys.readouterr().out
+    assert "필수 조건 위반 9건" in out and "분반 위반: 나 - 라 (2반)" in out
+
+
+def test_editor_audit_matches_incremental_violations():
+    """테스트 3: 수동 조정 뒤 전체 검증의 규칙 위반은 ManualEditor가 갱신한 위반 목록과 같음 (같은 AuditViolation)"""
+    inputs = generate_inputs(SyntheticSpec(students=300, original_classes=6, target_classes=6,
+                                           separation_density=0.3, together_group_sizes=(2, 3), seed=5))
+    students = inputs.fresh_students()
+    rng = random.Random(1)
+    for student in students:
+        student.assigned_class = rng.randint(1, 6)
+    editor = ManualEditor(students, inputs.separation_pairs, inputs.together_groups, 6)
+
+    for _ in range(50):
+        editor.move(rng.randrange(len(students)), rng.randint(1, 6))
+        report = editor.audit()
+        assert report.state_violations == []
+        assert set(report.violations) == set(editor.violations)
+
+    editor.members[1].add(next(iter(editor.members[2])))  # 한 학생이 두 반 목록에
+    assert {v.kind for v in editor.audit().state_violations} == {'중복배정', '반목록불일치'}
+
+
+def test_run_and_cli(tmp_path):
+    """테스트 4: run은 결과 생성 전에 검증하고, 명령줄 결과 요약에 검증 결과 포함"""
+    with contextlib.redirect_stdout(io.StringIO()) as out:
+        assigner = ClassAssigner(STUDENT_FILE, RULES_FILE, target_class_count=7, seed=1)
+        assigner.run(str(tmp_path / 'result.csv'))
+    assert assigner.audit_report.ok and assigner.audit_report.students == 152
+    assert list(assigner.metrics.stages)[-2:] == ['audit', 'generate_output']
+    assert assigner.metrics.counters['audit_violations'] == 0
+    assert "필수 조건 위반 없음" in out.getvalue()
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        result = run_assignment(STUDENT_FILE, RULES_FILE, output_file=str(tmp_path / 'a.csv'), seed=1,
+                                engine='local_search', engine_iterations=200)
+    assert result['exit_code'] == EXIT_OK
+    assert result['audit']['ok'] and result['audit']['violations'] == []
+    assert list(result['metrics']['stages'])[-3:] == ['optimize', 'audit', 'generate_output']
@@ -0,0 +1,146 @@
+"""
+assignment_engines 모듈 테스트
+목적함수 항목 계산, restarts/local_search 개선 기록과 규칙 유지, seed 재현성, run/명령줄 연동, 시도별 경고 테스트
+"""
+
+import pytest
+import contextlib
+import io
+import subprocess
+import sys
+import os
+
+# 상위 디렉토리의 class_assigner 모듈 import
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from assignment_cli import EXIT_OK, run_assignment
+from assignment_engines import OBJECTIVE_WEIGHTS, evaluate, make_editor, objective_terms, objective_value, optimize
+from assignment_log import AssignmentWarning
+from class_assigner import ClassAssigner
+from synthetic_inputs import SyntheticSpec, generate_inputs
+
+BASE_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+STUDENT_FILE = os.path.join(BASE_DIR, '01 가상 명단.xlsx')
+RULES_FILE = os.path.join(BASE_DIR, '02 분반 합반할 학생 규칙.xlsx')
+
+
+@pytest.fixture(scope='module')
+def inputs():
+    return generate_inputs(SyntheticSpec(students=400, original_classes=8, target_classes=6,
+                                         separation_density=0.3, together_group_sizes=(2, 3), seed=3))
+
+
+def greedy_assigner(inputs, tmp_path, seed=1, **engine_options):
+    with contextlib.redirect_stdout(io.StringIO()):
+        assigner = ClassAssigner('', '', target_class_count=6, seed=seed)
+        assigner.run(str(tmp_path / 'result.csv'), parsed_inputs=inputs, **engine_options)
+    return assigner
+
+
+def test_objective_terms(inputs, tmp_path):
+    """테스트 1: 편차 항목은 ManualEditor.spreads와 같고, 규칙 위반은 큰 가중치로 더해짐"""
+    assigner = greedy_assigner(inputs, tmp_path)
+    editor = make_editor(assigner)
+    terms = objective_terms(editor)
+    spreads = editor.spreads()
+
+    for name in ('유효인원편차', '유효남학생편차', '유효여학생편차', '난이도합편차'):
+        assert terms[name] == spreads[name]
+    assert terms['점수평균편차'] == pytest.approx(spreads['점수평균편차'], abs=0.01)
+    assert terms['규칙위반'] == terms['미배정'] == 0
+    assert evaluate(assigner)['목적함수'] == pytest.approx(objective_value(terms))
+
+    name1, name2 = inputs.separation_pairs[0]
+    index = next(i for i, s in enumerate(assigner.students) if s.이름 == name1)
+    other_class = next(s.assigned_class for s in assigner.students if s.이름 == name2)
+    editor.move(index, other_class)
+    assert objective_terms(editor)['규칙위반'] >= 1
+    assert objective_value(objective_terms(editor)) >= OBJECTIVE_WEIGHTS['규칙위반']
+
+
+@pytest.mark.parametrize('engine', ['restarts', 'local_search'])
+def test_engine_improves_and_keeps_rules(inputs, tmp_path, engine):
+    """테스트 2: 개선 기록은 줄어들기만 하고, 잠긴 학생/분반/합반 규칙은 유지, classes와 학생 반이 일치"""
+    assigner = greedy_assigner(inputs, tmp_path)
+    greedy = evaluate(assigner)['목적함수']
+    locked = {s.이름: s.assigned_class for s in assigner.students if s.locked}
+
+    trace = optimize(assigner, engine, max_iterations=300)
+
+    objectives = [point['objective'] for point in trace]
+    assert objectives[0] == pytest.approx(greedy)
+    assert objectives == sorted(objectives, reverse=True) and len(set(objectives)) == len(objectives)
+    assert evaluate(assigner)['목적함수'] == pytest.approx(objectives[-1])
+    assert objectives[-1] < greedy
+    assert {s.이름: s.assigned_class for s in assigner.students if s.locked} == locked
+
+    class_of = {s.이름: s.assigned_class for s in assigner.students}
+    assert all(class_of[a] != class_of[b] for a, b in inputs.separation_pairs)
+    assert all(len({class_of[name] for name in group}) == 1 for group in inputs.together_groups)
+    assert sorted(id(s) for members in assigner.classes.values() for s in members) == \
+        sorted(id(s) for s in assigner.students)
+    assert all(s.assigned_class == c for c, members in assigner.classes.items() for s in members)
+
+
+def test_iterations_are_reproducible(inputs, tmp_path):
+    """테스트 3: 반복 횟수로 멈추면 같은 seed는 같은 배정(해시 seed가 다른 프로세스 포함), 다른 seed는 다른 배정"""
+    def assignment(seed):
+        assigner = greedy_assigner(inputs, tmp_path, seed=seed, engine='local_search', engine_iterations=500)
+        return [s.assigned_class for s in assigner.students]
+
+    assert assignment(5) == assignment(5)
+    assert assignment(5) != assignment(6)
+
+    outputs = []
+    for hash_seed in ('0', '2'):
+        output_file = tmp_path / f'hash{hash_seed}.csv'
+        result = subprocess.run([sys.executable, '-m', 'class_assigner', STUDENT_FILE, RULES_FILE,
+                                 '-o', str(output_file), '--seed', '5', '--engine', 'restarts',
+                                 '--engine-iterations', '100', '-q'], capture_output=True, text=True, cwd=BASE_DIR,
+                                env={**os.environ, 'PYTHONHASHSEED': hash_seed})
+        assert result.returncode == EXIT_OK, result.stderr
+        outputs.append(output_file.read_text(encoding='utf-8-sig'))
+    assert outputs[0] == outputs[1]
+
+    with pytest.raises(ValueError, match="지원하지 않는 엔진"):
+        optimize(greedy_assigner(inputs, tmp_path), 'annealing')
+
+
+def test_run_and_cli(tmp_path):
+    """테스트 4: run은 개선 단계를 계측하고, 명령줄 결과 요약에 목적함수 포함"""
+    assigner = greedy_assigner(generate_inputs(SyntheticSpec(students=120, seed=2)), tmp_path,
+                               engine='restarts', engine_budget=0.2)
+    assert 'optimize' in assigner.metrics.stages
+    assert assigner.engine_trace[-1]['elapsed_sec'] <= assigner.metrics.stages['optimize'].wall_sec
+    assert assigner.metrics.counters['engine_iterations'] > 0
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        greedy = run_assignment(STUDENT_FILE, RULES_FILE, output_file=str(tmp_path / 'a.csv'), seed=1)
+        improved = run_assignment(STUDENT_FILE, RULES_FILE, output_file=str(tmp_path / 'b.csv'), seed=1,
+                                  engine='local_search', engine_iterations=2000)
+    assert greedy['exit_code'] == improved['exit_code'] == EXIT_OK
+    assert 'optimize' not in greedy['metrics']['stages'] and 'optimize' in improved['metrics']['stages']
+    assert improved['objective']['목적함수'] <= greedy['objective']['목적함수']
+    assert improved['objective']['규칙위반'] == 0
+
+
+def test_restarts_keep_winning_warnings(inputs, tmp_path, monkeypatch):
+    """테스트 5: restarts는 이긴 시도의 Phase 5 경고만 남기고, 다른 단계의 경고는 유지"""
+    assigner = greedy_assigner(inputs, tmp_path)
+    earlier = AssignmentWarning('missing_student', '없는학생', '', 'phase1_apply_rules')
+    assigner.warnings = [earlier, AssignmentWarning('unplaceable', '처음', '규칙 충돌', 'phase5_balance_remaining')]
+    assigner._stage_name = 'optimize'
+
+    attempts = []
+    phase5 = assigner.phase5_balance_remaining
+
+    def phase5_with_warning():
+        phase5()
+        attempts.append(len(attempts) + 1)
+        assigner._warn('unplaceable', f'시도{attempts[-1]}', '규칙 충돌')
+
+    monkeypatch.setattr(assigner, 'phase5_balance_remaining', phase5_with_warning)
+    trace = optimize(assigner, 'restarts', max_iterations=30)
+
+    assert len(attempts) == 30 and len(trace) > 1
+    assert assigner.warnings == [earlier, AssignmentWarning('unplaceable', f"시도{trace[-1]['iteration']}",
+                                                            '규칙 충돌', 'optimize')]
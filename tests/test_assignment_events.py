@@ -0,0 +1,148 @@
+"""
+assignment_events 모듈 테스트
+출력 줄 단위 이벤트 전달, run()의 단계/진행률 이벤트, 취소 테스트
+"""
+
+import pytest
+from collections import defaultdict
+import sys
+import os
+
+# 상위 디렉토리의 class_assigner 모듈 import
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from class_assigner import ClassAssigner, Student
+from assignment_events import AssignmentCancelled, AssignmentEvent, CancelToken, EventLogStream, forward_output
+
+
+@pytest.fixture
+def assigner():
+    """파일 대신 메모리 데이터를 읽는 ClassAssigner 인스턴스"""
+    assigner = ClassAssigner.__new__(ClassAssigner)
+    assigner.students = []
+    assigner.target_class_count = 2
+    assigner.classes = {1: [], 2: []}
+    assigner.separation_rules = defaultdict(set)
+    assigner.separation_pairs = []
+    assigner.together_groups = []
+
+    def load_students():
+        print("학생 로드")
+        assigner.students = [
+            Student(학년=5, 원반=i % 3 + 1, 원번호=i // 3 + 1, 이름=f'학생{i + 1}', 성별='남' if i % 2 else '여',
+                    점수=70 + i, 특수반=False, 전출=False, 난이도=0, 비고='')
+            for i in range(300)
+        ]
+
+    assigner.load_students = load_students
+    assigner.load_rules = lambda: print("규칙 로드")
+    return assigner
+
+
+def test_stream_splits_lines():
+    """테스트 1: 줄이 완성될 때마다 'log' 이벤트 전달"""
+    events = []
+    stream = EventLogStream(events.append)
+
+    stream.write("첫 줄\n둘")
+    assert [e.message for e in events] == ['첫 줄']
+
+    stream.write("째 줄\n\n")
+    assert [e.message for e in events] == ['첫 줄', '둘째 줄', '']
+
+
+def test_forward_output_flushes_partial_line():
+    """테스트 2: 블록이 끝나면 줄바꿈 없는 마지막 출력도 전달"""
+    events = []
+
+    with forward_output(events.append):
+        print("완료", end='')
+
+    assert events == [AssignmentEvent('log', '완료')]
+
+
+def test_forward_output_without_sink(capsys):
+    """테스트 3: sink가 없으면 표준 출력 그대로"""
+    with forward_output(None):
+        print("그대로")
+
+    assert "그대로" in capsys.readouterr().out
+
+
+def test_run_streams_events_in_order(assigner, tmp_path, capsys):
+    """테스트 4: run()이 단계 시작과 출력 줄을 실행 순서대로 전달"""
+    events = []
+
+    assigner.run(output_file=str(tmp_path / 'result.csv'), event_sink=events.append)
+
+    phases = [e for e in events if e.kind == 'phase']
+    assert [e.step for e in phases] == list(range(1, 10))
+    assert all(e.total == 9 for e in phases)
+    assert phases[0].message == "학생 데이터 로드"
+    assert phases[-1].message == "결과 생성"
+
+    messages = [(e.kind, e.message) for e in events]
+    assert messages.index(('log', '규칙 로드')) > messages.index(('phase', '규칙 로드'))
+    assert any('Phase 1 완료' in m for _, m in messages)
+    assert events[-1].message == "=" * 70
+
+    # sink로 전달한 출력은 표준 출력에 쓰지 않음
+    assert capsys.readouterr().out == ''
+
+
+def test_progress_events(assigner, tmp_path):
+    """테스트 5: 진행률은 단계 안에서도 증가하고 마지막은 1.0"""
+    events = []
+
+    assigner.run(output_file=str(tmp_path / 'result.csv'), event_sink=events.append)
+
+    fractions = [e.fraction for e in events if e.kind in ('phase', 'progress')]
+    assert fractions == sorted(fractions)
+    assert fractions[-1] == 1.0
+    # Phase 5(7번째 단계) 안에서 여러 번 보고
+    phase5 = [e for e in events if e.kind == 'progress' and e.step == 7]
+    assert len(phase5) > 5
+    assert all(6 / 9 <= e.fraction < 7 / 9 for e in phase5)
+
+
+def test_cancel_token():
+    """테스트 6: 취소 후 check()는 AssignmentCancelled 발생"""
+    token = CancelToken()
+    token.check()
+
+    token.cancel()
+
+    assert token.cancelled
+    with pytest.raises(AssignmentCancelled):
+        token.check()
+
+
+def test_cancel_during_phase(assigner, tmp_path, capsys):
+    """테스트 7: 단계 진행 중 취소하면 즉시 중단되고 결과 파일을 쓰지 않음"""
+    token = CancelToken()
+    output_file = tmp_path / 'result.csv'
+    progress_after_cancel = []
+
+    def sink(event):
+        if token.cancelled:
+            progress_after_cancel.append(event)
+        elif event.kind == 'progress' and event.step == 7 and event.fraction > 6.5 / 9:
+            token.cancel()
+
+    with pytest.raises(AssignmentCancelled):
+        assigner.run(output_file=str(output_file), event_sink=sink, cancel_token=token)
+
+    assert not output_file.exists()
+    assert [e for e in progress_after_cancel if e.kind != 'log'] == []
+    assert any(s.assigned_class is None for s in assigner.students)
+
+
+def test_cancel_before_start(assigner, tmp_path, capsys):
+    """테스트 8: 이미 취소된 토큰이면 첫 단계 전에 중단"""
+    token = CancelToken()
+    token.cancel()
+
+    with pytest.raises(AssignmentCancelled):
+        assigner.run(output_file=str(tmp_path / 'result.csv'), cancel_token=token)
+
+    assert assigner.students == []
+    assert "취소" in capsys.readouterr().out
@@ -0,0 +1,112 @@
+"""
+assignment_log 모듈 테스트
+로그가 바뀐 표준 출력을 따르는지, 레벨을 올리면 메시지를 포맷하지 않는지, 배정 경고 기록 테스트
+"""
+
+import contextlib
+import io
+import json
+import logging
+import sys
+import os
+
+# 상위 디렉토리의 class_assigner 모듈 import
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from assignment_cli import EXIT_OK, main
+from assignment_events import forward_output
+from assignment_log import AssignmentWarning, StdoutHandler, get_logger, log_level, set_log_level
+from class_assigner import ClassAssigner, Student
+
+BASE_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+STUDENT_FILE = os.path.join(BASE_DIR, '01 가상 명단.xlsx')
+RULES_FILE = os.path.join(BASE_DIR, '02 분반 합반할 학생 규칙.xlsx')
+
+
+class FormatCounter:
+    """%s로 포맷될 때마다 횟수를 세는 인자"""
+
+    def __init__(self):
+        self.calls = 0
+
+    def __str__(self):
+        self.calls += 1
+        return 'x'
+
+
+def test_output_follows_stdout_and_level():
+    """테스트 1: 로그는 출력 시점의 sys.stdout(redirect_stdout, forward_output)에 쓰고, 레벨 밖 메시지는 포맷 안 함"""
+    log = get_logger()
+    assert get_logger() is log and not log.propagate
+    assert sum(isinstance(handler, StdoutHandler) for handler in log.handlers) == 1
+
+    with contextlib.redirect_stdout(io.StringIO()) as out:
+        log.info("   ✅ %d명", 3)
+    assert out.getvalue() == "   ✅ 3명\n"
+
+    events = []
+    with forward_output(events.append):
+        log.warning("경고 %s", 'a')
+    assert [e.message for e in events if e.kind == 'log'] == ["경고 a"]
+
+    counter = FormatCounter()
+    with contextlib.redirect_stdout(io.StringIO()) as out, log_level('warning'):
+        log.info("%s", counter)
+        log.debug("%s", counter)
+        assert counter.calls == 0
+        log.warning("%s", counter)
+    assert counter.calls >= 1 and out.getvalue() == "x\n"
+    assert log.level == logging.INFO
+
+    previous = set_log_level('debug')
+    try:
+        with contextlib.redirect_stdout(io.StringIO()) as out:
+            log.debug("세부 %s", counter)
+        assert out.getvalue() == "세부 x\n"
+    finally:
+        set_log_level(previous)
+
+
+def test_warnings_are_recorded(capsys):
+    """테스트 2: 배정할 수 없는 학생, 명단에 없는 학생은 경고로 기록하고 출력 (레벨을 올려도 기록)"""
+    assigner = ClassAssigner.__new__(ClassAssigner)
+    assigner.target_class_count = 2
+    assigner.students = [Student(5, 1, 1, "홍길동", "남", 80.0, False, False, 0, ""),
+                         Student(5, 1, 2, "김철수", "남", 80.0, False, False, 0, ""),
+                         Student(5, 1, 3, "이영희", "여", 80.0, False, False, 0, "")]
+    assigner.classes = {1: [], 2: []}
+    assigner.separation_rules = {"홍길동": {"김철수", "이영희"}, "김철수": {"홍길동", "이영희"},
+                                 "이영희": {"홍길동", "김철수"}}
+    assigner.together_groups = [{"홍길동", "박민수"}]
+    assigner.warnings = []
+
+    assigner.phase1_apply_rules()
+    out = capsys.readouterr().out
+    assert "'박민수' 학생을 명단에서 찾을 수 없습니다" in out
+    assert assigner.warnings[0] == AssignmentWarning('missing_student', '박민수')
+    # 세 명이 서로 분반이라 두 반에 한 명은 배정할 수 없음 (누구인지는 규칙 순서에 따라 다름)
+    name = next(s.이름 for s in assigner.students if s.assigned_class is None)
+    assert f"{name} 학생을 배정할 수 없습니다 (분반 규칙 충돌)" in out
+    assert {(w.kind, w.name, w.reason) for w in assigner.warnings[1:]} == {('unplaceable', name, '분반 규칙 충돌')}
+
+    count = len(assigner.warnings)
+    with log_level('error'):
+        assigner.phase5_balance_remaining()
+    assert capsys.readouterr().out == ""
+    assert assigner.warnings[count:] == [AssignmentWarning('unplaceable', name, '규칙 충돌')]
+    assert assigner.warnings[-1].message() == f"⚠️  경고: {name} 학생을 배정할 수 없습니다 (규칙 충돌)"
+
+
+def test_run_and_cli(tmp_path, capsys):
+    """테스트 3: run은 단계 이름과 함께 경고를 모으고, 명령줄 --log-level warning은 진행 로그를 출력 안 함"""
+    with contextlib.redirect_stdout(io.StringIO()):
+        assigner = ClassAssigner(STUDENT_FILE, RULES_FILE, target_class_count=7, seed=1)
+        assigner.run(str(tmp_path / 'result.csv'))
+    assert assigner.warnings == []
+
+    assert main([STUDENT_FILE, RULES_FILE, '-o', str(tmp_path / 'a.csv'), '--log-level', 'warning']) == EXIT_OK
+    out = capsys.readouterr().out
+    assert "Phase 1" not in out and "결과 파일: " in out
+    assert get_logger().level == logging.INFO
+
+    assert main([STUDENT_FILE, RULES_FILE, '-o', str(tmp_path / 'b.csv'), '--json']) == EXIT_OK
+    assert 'warnings' not in json.loads(capsys.readouterr().out)
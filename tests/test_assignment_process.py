@@ -0,0 +1,81 @@
+"""
+assignment_process 모듈 테스트
+별도 프로세스 배정 실행, 파이프 메시지 프로토콜, 취소 테스트
+"""
+
+import pytest
+import shutil
+import time
+import sys
+import os
+
+# 상위 디렉토리의 class_assigner 모듈 import
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from assignment_process import AssignmentProcess
+
+BASE_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+STUDENT_FILE = os.path.join(BASE_DIR, '01 가상 명단.xlsx')
+RULES_FILE = os.path.join(BASE_DIR, '02 분반 합반할 학생 규칙.xlsx')
+
+
+def _run_to_end(process, timeout=60):
+    """끝날 때까지 메시지 수집"""
+    messages = []
+    process.start()
+    deadline = time.time() + timeout
+    while not process.finished:
+        assert time.time() < deadline, "작업 프로세스 시간 초과"
+        messages += process.poll()
+        time.sleep(0.02)
+    return messages
+
+
+def test_solve_in_process(tmp_path):
+    """테스트 1: 자식 프로세스에서 배정 후 진행 이벤트와 완료 메시지 전송"""
+    student_file = tmp_path / '01 가상 명단.xlsx'
+    shutil.copy(STUDENT_FILE, student_file)
+    output_file = str(tmp_path / '03 배정 결과.xlsx')
+
+    messages = _run_to_end(AssignmentProcess(str(student_file), RULES_FILE, output_file, 7))
+
+    kind, path, preview = messages[-1]
+    assert (kind, path) == ('done', output_file)
+    assert len(preview.rows) == 152
+    events = [m[1] for m in messages if m[0] == 'event']
+    assert [e.step for e in events if e.kind == 'phase'] == list(range(1, 10))
+    assert any('Phase 5' in e.message for e in events if e.kind == 'log')
+    assert os.path.exists(output_file)
+
+
+def test_error_message(tmp_path):
+    """테스트 2: 배정 실패는 'error' 메시지 (오류 내용 + traceback)"""
+    missing = str(tmp_path / '없는 명단.xlsx')
+
+    messages = _run_to_end(AssignmentProcess(missing, RULES_FILE, str(tmp_path / 'out.xlsx'), 7))
+
+    kind, error, detail = messages[-1]
+    assert kind == 'error'
+    assert 'Traceback' in detail
+    assert sum(1 for m in messages if m[0] in ('done', 'error')) == 1
+
+
+def test_cancel(tmp_path):
+    """테스트 3: 취소 요청 시 'cancelled' 메시지로 종료"""
+    process = AssignmentProcess(STUDENT_FILE, RULES_FILE, str(tmp_path / 'out.xlsx'), 7)
+    process.cancel()
+
+    messages = _run_to_end(process)
+
+    assert messages[-1] == ('cancelled',)
+    assert not os.path.exists(tmp_path / 'out.xlsx')
+
+
+def test_terminate(tmp_path):
+    """테스트 4: 강제 종료 후에는 더 이상 메시지를 받지 않음"""
+    process = AssignmentProcess(STUDENT_FILE, RULES_FILE, str(tmp_path / 'out.xlsx'), 7)
+    process.start()
+    process.terminate()
+
+    assert process.finished
+    assert not process.process.is_alive()
+    assert process.poll() == []
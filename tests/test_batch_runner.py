@@ -0,0 +1,99 @@
+"""
+batch_runner 모듈 테스트
+작업 목록(폴더/manifest CSV) 읽기, 프로세스 풀 일괄 실행, 작업별 실패 격리와 보고서 테스트
+"""
+
+import pytest
+import csv
+import json
+import shutil
+import sys
+import os
+
+# 상위 디렉토리의 class_assigner 모듈 import
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from batch_runner import BatchJob, load_manifest, main, run_batch
+
+BASE_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+STUDENT_FILE = os.path.join(BASE_DIR, '01 가상 명단.xlsx')
+RULES_FILE = os.path.join(BASE_DIR, '02 분반 합반할 학생 규칙.xlsx')
+
+
+@pytest.fixture
+def school_dirs(tmp_path):
+    """학교 폴더 3개 (A, B: 정상, C: 명단이 비어 있음) + 명단/규칙 쌍이 없는 폴더"""
+    for name in ('A초', 'B초'):
+        (tmp_path / name).mkdir()
+        shutil.copy(STUDENT_FILE, tmp_path / name / '01 가상 명단.xlsx')
+        shutil.copy(RULES_FILE, tmp_path / name / '02 분반 합반할 학생 규칙.xlsx')
+    (tmp_path / 'C초').mkdir()
+    shutil.copy(RULES_FILE, tmp_path / 'C초' / '01 명단.xlsx')
+    shutil.copy(RULES_FILE, tmp_path / 'C초' / '02 규칙.xlsx')
+    (tmp_path / '기타').mkdir()
+    shutil.copy(RULES_FILE, tmp_path / '기타' / '02 규칙.xlsx')
+    return tmp_path
+
+
+def test_load_manifest_directory(school_dirs):
+    """테스트 1: 폴더 manifest는 명단/규칙 쌍이 있는 하위 폴더마다 작업 하나"""
+    jobs = load_manifest(str(school_dirs), target_class_count=6)
+
+    assert [job.name for job in jobs] == ['A초', 'B초', 'C초']
+    assert jobs[0].student_file.endswith('01 가상 명단.xlsx')
+    assert jobs[0].output_file == str(school_dirs / 'A초' / '03 6학년 배정 결과.xlsx')
+    assert all(job.target_class_count == 6 for job in jobs)
+
+
+def test_load_manifest_csv(school_dirs):
+    """테스트 2: CSV manifest는 manifest 기준 상대 경로, 생략한 값은 기본값, 결과 파일 중복은 오류"""
+    manifest = school_dirs / 'manifest.csv'
+    manifest.write_text(
+        "name,roster,rules,output,classes,seed\n"
+        "A,A초/01 가상 명단.xlsx,A초/02 분반 합반할 학생 규칙.xlsx,out/a.xlsx,8,3\n"
+        ",B초/01 가상 명단.xlsx,B초/02 분반 합반할 학생 규칙.xlsx,,,\n", encoding='utf-8')
+
+    first, second = load_manifest(str(manifest))
+    assert (first.name, first.target_class_count, first.seed) == ('A', 8, 3)
+    assert first.output_file == str(school_dirs / 'out' / 'a.xlsx')
+    assert (second.name, second.target_class_count, second.seed) == ('01 가상 명단', 7, None)
+    assert second.output_file == str(school_dirs / 'B초' / '01 가상 명단 배정 결과.xlsx')
+
+    manifest.write_text("roster,rules,output\na.xlsx,r.xlsx,x.xlsx\nb.xlsx,r.xlsx,x.xlsx\n", encoding='utf-8')
+    with pytest.raises(ValueError, match="결과 파일이 겹치는"):
+        load_manifest(str(manifest))
+
+
+def test_run_batch_isolates_failures(school_dirs):
+    """테스트 3: 실패한 작업은 해당 작업만 보고되고 나머지는 결과 파일 생성"""
+    jobs = load_manifest(str(school_dirs))
+    jobs.append(BatchJob(name='없음', student_file=str(school_dirs / '없음.xlsx'), rules_file=RULES_FILE,
+                         output_file=str(school_dirs / '없음 결과.xlsx')))
+    seen = []
+
+    report = run_batch(jobs, workers=2, log_dir=str(school_dirs / 'logs'), on_result=seen.append)
+
+    assert [r['name'] for r in report.results] == ['A초', 'B초', 'C초', '없음']
+    assert [r['status'] for r in report.results] == ['ok', 'ok', 'invalid', 'invalid']
+    assert report.counts() == {'ok': 2, 'invalid': 2} and not report.ok
+    assert len(seen) == 4 and report.workers == 2
+    assert os.path.exists(school_dirs / 'A초' / '03 6학년 배정 결과.xlsx')
+    assert "학급 편성 완료" in (school_dirs / 'logs' / 'A초.log').read_text(encoding='utf-8')
+
+
+def test_timeout_and_report(school_dirs, capsys):
+    """테스트 4: 작업당 시간 제한, 명령줄 실행 종료 코드와 CSV/JSON 보고서"""
+    report_file = school_dirs / 'report.csv'
+    exit_code = main([str(school_dirs), '-j', '1', '--timeout', '0.001', '--report', str(report_file)])
+
+    assert exit_code == 1
+    with open(report_file, encoding='utf-8-sig') as f:
+        rows = list(csv.DictReader(f))
+    assert [row['status'] for row in rows[:2]] == ['timeout', 'timeout']
+    assert rows[2]['status'] in ('invalid', 'timeout')  # 빈 명단은 시간 제한 전에 끝날 수 있음
+    assert "timeout" in capsys.readouterr().out
+
+    json_file = school_dirs / 'report.json'
+    assert main([str(school_dirs / 'A초' / '..'), '--report', str(json_file), '-c', '6']) == 1  # C초 실패
+    summary = json.loads(json_file.read_text(encoding='utf-8'))
+    assert summary['jobs'] == 3 and summary['counts'] == {'ok': 2, 'invalid': 1}
+    assert summary['results'][0]['classes'] == 6
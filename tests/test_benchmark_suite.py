@@ -0,0 +1,78 @@
+"""
+benchmark_suite 모듈 테스트
+조합별 단계 측정 항목, 기준값 대비 회귀 판정, 기록/기준값 파일과 종료 코드 테스트
+"""
+
+import pytest
+import contextlib
+import io
+import json
+import sys
+import os
+
+# 상위 디렉토리의 class_assigner 모듈 import
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from benchmark_suite import EXPORTERS, find_regressions, main, run_scenario
+
+STAGES = ['pipeline', 'load_students', '_validate_rules', 'load_rules', 'phase1_apply_rules',
+          'phase2_distribute_special_needs', 'phase3_separate_same_names', 'phase4_balance_difficulty',
+          'phase5_balance_remaining', 'audit', 'generate_output'] + [stage for stage, _, _ in EXPORTERS]
+
+
+def make_result(**medians):
+    return {'scenarios': {'1000x7': {'stages': {stage: {'min_ms': ms, 'median_ms': ms}
+                                                for stage, ms in medians.items()}}}}
+
+
+def test_run_scenario(tmp_path):
+    """테스트 1: 조합 하나에서 모든 단계와 결과 출력 형식의 최소/중앙값 측정"""
+    scenario = run_scenario(120, 3, str(tmp_path), repeats=2)
+
+    assert (scenario['students'], scenario['classes']) == (120, 3)
+    assert list(scenario['stages']) == STAGES
+    assert all(0 < t['min_ms'] <= t['median_ms'] for t in scenario['stages'].values())
+    assert scenario['counters']['can_assign_calls'] > 0
+    assert os.path.exists(tmp_path / '120x3' / 'export_csv.csv')
+
+
+def test_find_regressions():
+    """테스트 2: 허용 비율과 최소 차이를 모두 넘은 단계만 회귀, 기준값에 없는 단계는 건너뜀"""
+    baseline = make_result(phase1_apply_rules=100.0, phase2_distribute_special_needs=1.0, load_rules=50.0)
+    result = make_result(phase1_apply_rules=130.0, phase2_distribute_special_needs=3.0, load_rules=55.0,
+                         export_csv=10.0)
+
+    regressions = find_regressions(result, baseline)
+    assert [(r['stage'], r['change']) for r in regressions] == [('phase1_apply_rules', 0.3)]
+    assert find_regressions(result, baseline, tolerance=0.5) == []
+    assert [r['stage'] for r in find_regressions(result, baseline, min_delta_ms=1.0)] == \
+        ['phase1_apply_rules', 'phase2_distribute_special_needs']
+    assert find_regressions(result, {'scenarios': {}}) == []
+
+
+def test_history_and_baseline(tmp_path):
+    """테스트 3: 기록 파일에 한 줄씩 추가, 기준값 저장 후 느려진 기준값과 비교하면 종료 코드 1"""
+    history, baseline = str(tmp_path / 'history.jsonl'), str(tmp_path / 'baseline.json')
+    args = ['--sizes', '60', '--classes', '2', '-n', '1', '--data-dir', str(tmp_path / 'data'),
+            '--history', history, '--baseline', baseline]
+
+    with contextlib.redirect_stdout(io.StringIO()) as out:
+        assert main(args + ['--save-baseline']) == 0
+        with open(baseline, encoding='utf-8') as f:
+            saved = json.load(f)
+        for timing in saved['scenarios']['60x2']['stages'].values():
+            timing['median_ms'] = timing['median_ms'] / 100  # 기준값을 100배 빠르게
+        saved['scenarios']['60x2']['stages']['pipeline']['median_ms'] = 0.001
+        with open(baseline, 'w', encoding='utf-8') as f:
+            json.dump(saved, f)
+
+        assert main(args) == 1
+    assert "성능 회귀" in out.getvalue() and "60x2 pipeline" in out.getvalue()
+
+    with open(history, encoding='utf-8') as f:
+        lines = f.read().splitlines()
+    assert len(lines) == 2
+    assert json.loads(lines[0])['scenarios']['60x2']['students'] == 60
+
+    with pytest.raises(SystemExit):
+        with contextlib.redirect_stderr(io.StringIO()):
+            main(['--save-baseline'])
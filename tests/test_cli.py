@@ -0,0 +1,144 @@
+"""
+assignment_cli 모듈 테스트
+명령줄 실행의 JSON 출력, seed 재현성(프로세스 간 포함), 종료 코드(잘못된 입력/배정 불가/시간 제한) 테스트
+"""
+
+import pytest
+import json
+import shutil
+import subprocess
+import sys
+import os
+
+# 상위 디렉토리의 class_assigner 모듈 import
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+import parsed_inputs
+from assignment_cli import EXIT_INFEASIBLE, EXIT_INVALID, EXIT_OK, EXIT_TIMEOUT, main, run_assignment
+from class_assigner import ClassAssigner
+
+BASE_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+STUDENT_FILE = os.path.join(BASE_DIR, '01 가상 명단.xlsx')
+RULES_FILE = os.path.join(BASE_DIR, '02 분반 합반할 학생 규칙.xlsx')
+
+
+@pytest.fixture
+def input_files(tmp_path):
+    """임시 폴더에 복사한 샘플 명단/규칙 파일"""
+    student_file = str(tmp_path / '01 가상 명단.xlsx')
+    rules_file = str(tmp_path / '02 분반 합반할 학생 규칙.xlsx')
+    shutil.copy(STUDENT_FILE, student_file)
+    shutil.copy(RULES_FILE, rules_file)
+    return student_file, rules_file
+
+
+def test_json_output(input_files, tmp_path, capsys):
+    """테스트 1: --json이면 진행 로그 없이 결과 요약만 출력"""
+    output_file = str(tmp_path / 'result.xlsx')
+    exit_code = main([*input_files, '-o', output_file, '--classes', '6', '--json'])
+
+    result = json.loads(capsys.readouterr().out)
+    assert exit_code == EXIT_OK == result['exit_code']
+    assert result['status'] == 'ok'
+    assert result['output_files'] == [output_file]
+    assert result['students'] == 152 and result['classes'] == 6
+    assert result['quality']['학생수'] == 152
+    assert result['metrics']['students'] == 152 and 'phase1_apply_rules' in result['metrics']['stages']
+    assert os.path.exists(output_file)
+
+
+def test_seed_is_reproducible(input_files, tmp_path, capsys):
+    """테스트 2: 같은 seed면 같은 결과, 기본 출력 파일은 명단 폴더"""
+    outputs = []
+    for name in ('a.csv', 'b.csv'):
+        assert main([*input_files, '-o', str(tmp_path / name), '--seed', '7', '-q']) == EXIT_OK
+        with open(tmp_path / name, encoding='utf-8-sig') as f:
+            outputs.append(f.read())
+    assert outputs[0] == outputs[1]
+    assert capsys.readouterr().out == ''
+
+    result = run_assignment(*input_files, seed=7)
+    assert result['output_files'] == [str(tmp_path / '03 6학년 배정 결과.xlsx')]
+
+
+def test_invalid_inputs(input_files, tmp_path, capsys):
+    """테스트 3: 없는 파일, 잘못된 학급 수/엔진은 종료 코드 2"""
+    student_file, rules_file = input_files
+
+    assert main([str(tmp_path / '없음.xlsx'), rules_file, '-q']) == EXIT_INVALID
+    assert "파일이 없습니다" in capsys.readouterr().err
+    assert run_assignment(student_file, rules_file, target_class_count=0)['exit_code'] == EXIT_INVALID
+    assert run_assignment(student_file, student_file)['exit_code'] == EXIT_INVALID  # 규칙 형식 아님
+    with pytest.raises(SystemExit) as exc_info:
+        main([student_file, rules_file, '--engine', 'unknown'])
+    assert exc_info.value.code == EXIT_INVALID
+
+
+def test_infeasible(input_files, tmp_path, monkeypatch):
+    """테스트 4: 규칙 충돌이나 배정하지 못한 학생이 있으면 종료 코드 3"""
+    monkeypatch.setattr(parsed_inputs, 'find_rule_conflicts', lambda *args: ["❌ 충돌: 가와 나"])
+    result = run_assignment(*input_files, output_file=str(tmp_path / 'a.xlsx'))
+    assert (result['status'], result['exit_code']) == ('infeasible', EXIT_INFEASIBLE)
+    assert result['conflicts'] == ["❌ 충돌: 가와 나"]
+    assert not os.path.exists(tmp_path / 'a.xlsx')
+
+    monkeypatch.undo()
+    monkeypatch.setattr(ClassAssigner, 'phase5_balance_remaining', lambda self: None)
+    result = run_assignment(*input_files, output_file=str(tmp_path / 'b.xlsx'))
+    assert result['exit_code'] == EXIT_INFEASIBLE
+    assert len(result['unassigned']) > 0
+    assert result['output_files'] == [str(tmp_path / 'b.xlsx')]
+
+
+def test_time_budget(input_files, tmp_path):
+    """테스트 5: 시간 제한을 넘기면 결과 파일 없이 종료 코드 4"""
+    result = run_assignment(*input_files, output_file=str(tmp_path / 'a.xlsx'), time_budget=0.001)
+
+    assert (result['status'], result['exit_code']) == ('timeout', EXIT_TIMEOUT)
+    assert not os.path.exists(tmp_path / 'a.xlsx')
+
+
+def test_module_entry_point(input_files, tmp_path):
+    """테스트 6: python -m class_assigner 인자 실행은 대화상자(tkinter) 없이 종료 코드 반환"""
+    code = ("import runpy, sys; sys.argv = ['class_assigner'] + sys.argv[1:]\n"
+            "try:\n    runpy.run_module('class_assigner', run_name='__main__')\n"
+            "finally:\n    print('tkinter' in sys.modules, file=sys.stderr)")
+    result = subprocess.run([sys.executable, '-c', code, *input_files, '-o', str(tmp_path / 'a.xlsx'), '--json'],
+                            capture_output=True, text=True, cwd=BASE_DIR)
+
+    assert result.returncode == EXIT_OK
+    assert json.loads(result.stdout)['status'] == 'ok'
+    assert result.stderr.strip().endswith('False')
+
+    missing = subprocess.run([sys.executable, '-m', 'class_assigner', str(tmp_path / '없음.xlsx'),
+                              input_files[1], '-q'], capture_output=True, text=True, cwd=BASE_DIR)
+    assert missing.returncode == EXIT_INVALID
+
+
+def test_seed_is_reproducible_across_processes(input_files, tmp_path):
+    """테스트 7: 같은 seed면 문자열 해시 seed(PYTHONHASHSEED)가 다른 프로세스에서도 같은 결과 (일괄 실행/작업 서버)"""
+    outputs = []
+    for hash_seed in ('0', '2'):
+        output_file = tmp_path / f'hash{hash_seed}.csv'
+        result = subprocess.run([sys.executable, '-m', 'class_assigner', *input_files, '-o', str(output_file),
+                                 '--seed', '1', '-q'], capture_output=True, text=True, cwd=BASE_DIR,
+                                env={**os.environ, 'PYTHONHASHSEED': hash_seed})
+        assert result.returncode == EXIT_OK, result.stderr
+        outputs.append(output_file.read_text(encoding='utf-8-sig'))
+    assert outputs[0] == outputs[1]
+
+
+def test_formats_use_their_own_extension(input_files, tmp_path, capsys):
+    """테스트 8: -o out.xlsx --format csv xlsx는 out.csv와 out.xlsx, 중복 형식은 잘못된 입력"""
+    output_file = str(tmp_path / 'out.xlsx')
+    assert main([*input_files, '-o', output_file, '--format', 'csv', 'xlsx', '--json']) == EXIT_OK
+    result = json.loads(capsys.readouterr().out)
+    assert result['output_files'] == [str(tmp_path / 'out.csv'), output_file]
+    with open(output_file, 'rb') as f:
+        assert f.read(2) == b'PK'  # xlsx(zip)
+    assert (tmp_path / 'out.csv').read_text(encoding='utf-8-sig').startswith('원학년,')
+
+    assert main([*input_files, '-o', str(tmp_path / 'only.xlsx'), '--format', 'csv', '-q']) == EXIT_OK
+    assert (tmp_path / 'only.csv').exists() and not (tmp_path / 'only.xlsx').exists()
+
+    assert main([*input_files, '-o', str(tmp_path / 'dup.xlsx'), '--format', 'csv', 'csv', '-q']) == EXIT_INVALID
+    assert "출력 형식이 중복되었습니다" in capsys.readouterr().err
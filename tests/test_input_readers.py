@@ -0,0 +1,175 @@
+"""
+input_readers 모듈 테스트
+스트리밍 xlsx 명단 리더가 pandas 리더와 같은 학생 목록을 만드는지, 헤더 위치/명단 외 시트/빈 행 처리,
+CSV / Parquet 명단과 표 형식 규칙 테스트
+"""
+
+import pytest
+import contextlib
+import csv
+import io
+import math
+import sys
+import os
+
+# 상위 디렉토리의 class_assigner 모듈 import
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from assignment_cli import EXIT_OK, run_assignment
+from assignment_events import AssignmentCancelled, CancelToken
+from batch_runner import load_manifest
+from class_assigner import read_rules, read_students
+from input_readers import ROSTER_COLUMNS, ParquetInputReader, csv_value
+from synthetic_inputs import SyntheticSpec, write_inputs
+
+BASE_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+STUDENT_FILE = os.path.join(BASE_DIR, '01 가상 명단.xlsx')
+RULES_FILE = os.path.join(BASE_DIR, '02 분반 합반할 학생 규칙.xlsx')
+
+
+def read_both(path):
+    with contextlib.redirect_stdout(io.StringIO()):
+        return read_students(path), read_students(path, reader='pandas')
+
+
+def test_matches_pandas_reader(tmp_path):
+    """테스트 1: 샘플/가상 명단(특수반, 전출, 난이도, 비고 포함)에서 pandas 리더와 같은 학생 목록"""
+    inputs = write_inputs(str(tmp_path), SyntheticSpec(students=300, original_classes=6, seed=4))
+
+    for path in (STUDENT_FILE, inputs.student_file):
+        streamed, parsed = read_both(path)
+        assert len(streamed) == len(parsed) > 0
+        assert [vars(s) for s in streamed] == [vars(s) for s in parsed]
+
+    with pytest.raises(ValueError, match="지원하지 않는 명단 리더"):
+        read_students(STUDENT_FILE, reader='xlrd')
+
+
+def test_headers_and_skipped_sheets(tmp_path, capsys):
+    """테스트 2: 컬럼 순서가 달라도 헤더로 찾고, 명단이 아닌 시트는 본문을 읽지 않으며, 빈 행은 무시"""
+    import openpyxl
+
+    path = str(tmp_path / '명단.xlsx')
+    wb = openpyxl.Workbook()
+    notes = wb.active
+    notes.title = '안내'
+    notes.append(['학년', '반', '안내문'])  # 번호/이름 없음
+    for _ in range(50):
+        notes.append([5, 1, '명단 시트가 아님'])
+    roster = wb.create_sheet('5-1')
+    roster.append(['이름', '비고', '번호', '반', '학년', '성별', '점수', '기타'])  # 특수반/전출/난이도 없음
+    roster.append(['가', None, 1, 1, 5, '남', 90, 'x'])
+    roster.append([None] * 8)
+    roster.append(['나', '메모', 2, 1, 5, '여', None])
+    roster['A10'].style = 'Note'  # 서식만 있는 빈 셀
+    wb.save(path)
+
+    rows = []
+    students = read_students(path, checkpoint=lambda done=None, total=None: rows.append(done))
+    out = capsys.readouterr().out
+
+    assert "Skipping sheet '안내': 필수 컬럼 누락" in out
+    assert rows.count(None) == 9  # 5-1 시트의 행(헤더 제외)만 읽음
+    assert [(s.이름, s.원반, s.원번호, s.성별, s.비고, s.특수반, s.난이도) for s in students] == \
+        [('가', 1, 1, '남', '', False, 0.0), ('나', 1, 2, '여', '메모', False, 0.0)]
+    assert students[0].점수 == 90.0 and math.isnan(students[1].점수)
+
+
+def test_checkpoint_cancels():
+    """테스트 3: checkpoint에서 취소하면 읽기를 멈춤"""
+    token = CancelToken()
+    token.cancel()
+
+    with contextlib.redirect_stdout(io.StringIO()), pytest.raises(AssignmentCancelled):
+        read_students(STUDENT_FILE, checkpoint=lambda done=0, total=0: token.check())
+
+
+def write_csv(path, header, rows, encoding='utf-8-sig'):
+    with open(path, 'w', newline='', encoding=encoding) as f:
+        writer = csv.writer(f)
+        writer.writerow(header)
+        writer.writerows(rows)
+
+
+def write_table_inputs(directory, students, separation_pairs, together_groups, encoding='utf-8-sig'):
+    """xlsx 입력과 같은 내용의 CSV 명단/규칙 (빈 값은 빈 칸)"""
+    roster = os.path.join(directory, '명단.csv')
+    rules = os.path.join(directory, '규칙.csv')
+    write_csv(roster, ROSTER_COLUMNS,
+              [[s.학년, s.원반, s.원번호, s.이름, s.성별, s.점수, 1 if s.특수반 else '', 1 if s.전출 else '',
+                s.난이도 or '', s.비고] for s in students], encoding)
+    write_csv(rules, ['규칙', '이름', '상대', '그룹'],
+              [['분반', a, b, ''] for a, b in separation_pairs] +
+              [['합반', name, '', f'G{k}'] for k, group in enumerate(together_groups) for name in sorted(group)],
+              encoding)
+    return roster, rules
+
+
+@pytest.mark.parametrize('encoding', ['utf-8-sig', 'cp949'])
+def test_csv_inputs_match_xlsx(tmp_path, encoding):
+    """테스트 4: CSV 명단/규칙은 xlsx와 같은 학생 목록과 규칙, 명령줄/일괄 실행도 같은 결과"""
+    with contextlib.redirect_stdout(io.StringIO()):
+        students = read_students(STUDENT_FILE)
+        separation_pairs, together_groups = read_rules(RULES_FILE)
+    (tmp_path / '학교').mkdir()
+    roster, rules = write_table_inputs(str(tmp_path / '학교'), students, separation_pairs, together_groups, encoding)
+
+    assert [vars(s) for s in read_students(roster)] == [vars(s) for s in students]
+    assert read_rules(rules) == (separation_pairs, together_groups)
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        from_xlsx = run_assignment(STUDENT_FILE, RULES_FILE, output_file=str(tmp_path / 'a.csv'), seed=3)
+        from_csv = run_assignment(roster, rules, output_file=str(tmp_path / 'b.csv'), seed=3)
+    assert from_xlsx['exit_code'] == from_csv['exit_code'] == EXIT_OK
+    assert from_csv['students'] == len(students)
+    assert (tmp_path / 'a.csv').read_text(encoding='utf-8-sig') == (tmp_path / 'b.csv').read_text(encoding='utf-8-sig')
+
+    [job] = load_manifest(str(tmp_path))
+    assert (job.student_file, job.rules_file) == (roster, rules)
+
+
+def test_table_rules_and_values(tmp_path):
+    """테스트 5: 숫자 칸 변환, 끝이 생략된 행, 합반 그룹 순서, 잘못된 규칙 행은 행 번호와 함께 오류"""
+    assert [csv_value(v) for v in [' 3 ', '2.5', '', '메모', 'nan', '0']] == [3, 2.5, None, '메모', 'nan', 0]
+
+    roster = str(tmp_path / '명단.csv')
+    write_csv(roster, ['학년', '반', '번호', '이름', '성별', '점수', '특수반'],
+              [[5, 2, 1, '가', '남', 80, 0], [5, 2, 2, '나', '여', 70], ['', '', '', '', '', '', '']])
+    assert [(s.이름, s.특수반, s.비고) for s in read_students(roster)] == [('가', False, ''), ('나', False, '')]
+
+    rules = str(tmp_path / '규칙.csv')
+    write_csv(rules, ['규칙', '이름', '상대', '그룹'],
+              [['합반', '다', '', 2], ['분반', '가', '나', ''], ['합반', '라', '', 1], ['합반', '마', '', 2], []])
+    assert read_rules(rules) == ([('가', '나')], [{'다', '마'}, {'라'}])
+
+    for row, message in [(['분반', '가', '', ''], "2행: 분반 상대가 없습니다"),
+                         (['합반', '가', '', ''], "2행: 합반 그룹이 없습니다"),
+                         (['같은반', '가', '나', ''], "2행: 규칙은 '분반' 또는 '합반'")]:
+        write_csv(rules, ['규칙', '이름', '상대', '그룹'], [row])
+        with pytest.raises(ValueError, match=message):
+            read_rules(rules)
+
+    write_csv(roster, ['이름', '성별'], [['가', '남']])
+    with pytest.raises(ValueError, match="명단 필수 컬럼 누락: 학년, 반, 번호"):
+        read_students(roster)
+
+
+def test_parquet_inputs(tmp_path, monkeypatch):
+    """테스트 6: Parquet 명단/규칙은 CSV와 같은 결과, 엔진이 없으면 설치 안내"""
+    with contextlib.redirect_stdout(io.StringIO()):
+        students = read_students(STUDENT_FILE)
+        separation_pairs, together_groups = read_rules(RULES_FILE)
+
+    monkeypatch.setattr(ParquetInputReader, 'available', staticmethod(lambda: False))
+    with pytest.raises(ImportError, match="pip install pyarrow"):
+        read_students(str(tmp_path / '명단.parquet'))
+    monkeypatch.undo()
+
+    if not ParquetInputReader.available():
+        pytest.skip("pyarrow/fastparquet 없음")
+    import pandas as pd
+    roster, rules = write_table_inputs(str(tmp_path), students, separation_pairs, together_groups)
+    pd.read_csv(roster).to_parquet(tmp_path / '명단.parquet', index=False)
+    pd.read_csv(rules).to_parquet(tmp_path / '규칙.parquet', index=False)
+
+    assert [vars(s) for s in read_students(str(tmp_path / '명단.parquet'))] == [vars(s) for s in students]
+    assert read_rules(str(tmp_path / '규칙.parquet')) == (separation_pairs, together_groups)
@@ -0,0 +1,141 @@
+"""
+job_service 모듈 테스트
+multipart 업로드 파싱, 작업 등록/상태 조회/결과 다운로드, 예열된 작업 프로세스 재사용 테스트
+"""
+
+import pytest
+import json
+import threading
+import time
+import urllib.error
+import urllib.request
+import sys
+import os
+
+# 상위 디렉토리의 class_assigner 모듈 import
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from job_service import JobService, create_server, parse_multipart
+
+BASE_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+STUDENT_FILE = os.path.join(BASE_DIR, '01 가상 명단.xlsx')
+RULES_FILE = os.path.join(BASE_DIR, '02 분반 합반할 학생 규칙.xlsx')
+
+BOUNDARY = 'test-boundary-1234'
+
+
+def multipart_body(fields):
+    """{이름: 값 str 또는 (파일 이름, bytes)} → multipart/form-data 본문"""
+    chunks = []
+    for name, value in fields.items():
+        if isinstance(value, tuple):
+            header = f'Content-Disposition: form-data; name="{name}"; filename="{value[0]}"\r\n' \
+                     f'Content-Type: application/octet-stream'
+            content = value[1]
+        else:
+            header = f'Content-Disposition: form-data; name="{name}"'
+            content = value.encode('utf-8')
+        chunks.append(f'--{BOUNDARY}\r\n{header}\r\n\r\n'.encode('utf-8') + content + b'\r\n')
+    return b''.join(chunks) + f'--{BOUNDARY}--\r\n'.encode('utf-8')
+
+
+@pytest.fixture(scope='module')
+def server(tmp_path_factory):
+    """작업 프로세스 1개로 실행 중인 서버의 주소"""
+    service = JobService(str(tmp_path_factory.mktemp('jobs')), workers=1)
+    httpd = create_server(service, port=0)
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    service.wait_ready(timeout=60)
+    yield f'http://127.0.0.1:{httpd.server_address[1]}'
+    httpd.shutdown()
+    httpd.server_close()
+    service.shutdown()
+
+
+def request(url, data=None):
+    headers = {'Content-Type': f'multipart/form-data; boundary={BOUNDARY}'} if data is not None else {}
+    try:
+        with urllib.request.urlopen(urllib.request.Request(url, data=data, headers=headers), timeout=30) as r:
+            return r.status, r.headers, r.read()
+    except urllib.error.HTTPError as e:
+        return e.code, e.headers, e.read()
+
+
+def wait_for(server, job):
+    """작업이 끝날 때까지 상태 조회"""
+    deadline = time.time() + 60
+    while job['status'] in ('queued', 'running') and time.time() < deadline:
+        time.sleep(0.1)
+        job = json.loads(request(server + job['status_url'])[2])
+    return job
+
+
+def submit_and_wait(server, **fields):
+    with open(STUDENT_FILE, 'rb') as f1, open(RULES_FILE, 'rb') as f2:
+        body = multipart_body({'roster': ('6학년 명단.xlsx', f1.read()), 'rules': ('규칙.xlsx', f2.read()), **fields})
+    status, _, content = request(f'{server}/jobs', body)
+    assert status == 202
+    job = json.loads(content)
+    assert job['status'] in ('queued', 'running')
+    return wait_for(server, job)
+
+
+def test_parse_multipart():
+    """테스트 1: 파일 필드는 (파일 이름, bytes), 일반 필드는 (None, bytes)"""
+    body = multipart_body({'roster': ('명단.xlsx', b'PK\x03\x04\r\n\xff'), 'classes': '6'})
+    fields = parse_multipart(f'multipart/form-data; boundary={BOUNDARY}', body)
+
+    assert fields['roster'] == ('명단.xlsx', b'PK\x03\x04\r\n\xff')
+    assert fields['classes'] == (None, b'6')
+    with pytest.raises(ValueError):
+        parse_multipart('application/json', b'{}')
+
+
+def test_submit_poll_download(server):
+    """테스트 2: 업로드 → 상태 조회 → 결과 다운로드, 작업 목록은 최신순"""
+    first = submit_and_wait(server, classes='6', seed='3')
+    assert first['status'] == 'ok'
+    assert (first['students'], first['classes'], first['seed']) == (152, 6, 3)
+
+    status, headers, content = request(server + first['result_url'])
+    assert status == 200 and content[:2] == b'PK'
+    assert "UTF-8''6" in headers['Content-Disposition']
+
+    second = submit_and_wait(server)
+    assert second['status'] == 'ok' and second['classes'] == 7
+    jobs = json.loads(request(f'{server}/jobs')[2])
+    assert [job['id'] for job in jobs[:2]] == [second['id'], first['id']]
+    assert "학급 편성 완료" in request(f"{server}/jobs/{first['id']}/log")[2].decode('utf-8')
+
+
+def test_worker_is_reused(tmp_path):
+    """테스트 3: 작업 프로세스는 시작할 때 한 번만 만들어지고 작업마다 재사용"""
+    service = JobService(str(tmp_path), workers=1)
+    try:
+        pids = service.wait_ready(timeout=60)
+        with open(STUDENT_FILE, 'rb') as f1, open(RULES_FILE, 'rb') as f2:
+            roster, rules = f1.read(), f2.read()
+        jobs = [service.submit(roster, rules) for _ in range(2)]
+        results = [job.future.result(timeout=60) for job in jobs]
+        assert [r['worker_pid'] for r in results] == pids * 2
+    finally:
+        service.shutdown()
+
+
+def test_errors(server):
+    """테스트 4: 없는 작업 404, 파일 누락 400, 실패한 작업은 결과 다운로드 409"""
+    assert request(f'{server}/jobs/0123456789ab')[0] == 404
+    assert request(f'{server}/nothing')[0] == 404
+
+    status, _, content = request(f'{server}/jobs', multipart_body({'roster': ('a.xlsx', b'x')}))
+    assert status == 400 and 'rules' in json.loads(content)['error']
+
+    with open(RULES_FILE, 'rb') as f:
+        rules = f.read()
+    status, _, content = request(f'{server}/jobs', multipart_body({'roster': ('a.xlsx', rules), 'rules': ('b.xlsx', rules)}))
+    job = wait_for(server, json.loads(content))
+    assert job['status'] == 'invalid'
+    assert request(f"{server}/jobs/{job['id']}/result")[0] == 409
+
+    page = request(f'{server}/')[2].decode('utf-8')
+    assert 'name="roster"' in page and 'name="rules"' in page
@@ -0,0 +1,63 @@
+"""
+지연 import 테스트
+GUI/CLI 시작 시 pandas, numpy, openpyxl, tkinter를 불러오지 않는지 검증
+"""
+
+import pytest
+import subprocess
+import sys
+import os
+
+# 상위 디렉토리의 class_assigner 모듈 import
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from class_assigner import Student, is_missing
+
+BASE_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+HEAVY_MODULES = ('pandas', 'numpy', 'openpyxl', 'tkinter')
+
+
+def _modules_loaded_by(module):
+    """새 인터프리터에서 module을 import했을 때 불러온 무거운 모듈 목록"""
+    code = (f"import sys; import {module}; "
+            f"print(','.join(m for m in {HEAVY_MODULES!r} if m in sys.modules))")
+    result = subprocess.run([sys.executable, '-c', code], capture_output=True, text=True, cwd=BASE_DIR,
+                            check=True)
+    return [m for m in result.stdout.strip().split(',') if m]
+
+
+def test_class_assigner_import_is_light():
+    """테스트 1: class_assigner import 시 무거운 의존성을 불러오지 않음"""
+    assert _modules_loaded_by('class_assigner') == []
+
+
+def test_gui_import_is_light():
+    """테스트 2: GUI 모듈 import 시 무거운 의존성을 불러오지 않음"""
+    pytest.importorskip('PyQt6.QtWidgets')
+    assert _modules_loaded_by('class_assigner_gui_qt') == []
+
+
+def test_is_missing_matches_pandas():
+    """테스트 3: is_missing은 pd.isna와 같은 판정"""
+    import numpy as np
+    import pandas as pd
+
+    for value in [None, float('nan'), np.nan, np.float64('nan'), pd.NA, pd.NaT,
+                  0, 1, 0.0, True, False, '', '비고', np.int64(3), np.bool_(True)]:
+        assert is_missing(value) == bool(pd.isna(value)), repr(value)
+
+
+def test_student_defaults_from_missing_cells():
+    """테스트 4: 엑셀 빈 칸(NaN)은 기본값으로 변환"""
+    student = Student(학년=5, 원반=1, 원번호=1, 이름='학생', 성별='남', 점수=80,
+                      특수반=float('nan'), 전출=1.0, 난이도=float('nan'), 비고=float('nan'))
+
+    assert student.특수반 is False
+    assert student.전출 is True
+    assert student.난이도 == 0.0
+    assert student.비고 == ""
+
+
+def test_manual_edits_import_is_light():
+    """테스트 5: 수동 조정/검증 모듈 import 시 무거운 의존성을 불러오지 않음 (위반 표시 형식 공유)"""
+    assert _modules_loaded_by('manual_edits') == []
+    assert _modules_loaded_by('assignment_audit') == []
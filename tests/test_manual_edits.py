@@ -0,0 +1,200 @@
+"""
+manual_edits 모듈 테스트
+수동 이동 시 반별 통계/규칙 위반 즉시 갱신, 미리보기 번호 갱신, 결과 파일 재저장 테스트
+"""
+
+import pytest
+import csv
+import random
+import time
+from collections import defaultdict
+import sys
+import os
+
+# 상위 디렉토리의 class_assigner 모듈 import
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from class_assigner import ClassAssigner, Student
+from manual_edits import ManualEditor, export_assignments, export_edits, init_export_worker, update_preview
+from quality_report import SUMMARY_COLUMNS, build_quality_report
+from result_preview import build_preview
+
+
+def make_assigner(count, class_count, seed=0):
+    """반별 순환 배정된 ClassAssigner (분반 2쌍, 합반 1그룹, 동명이인 1쌍)"""
+    rng = random.Random(seed)
+    assigner = ClassAssigner.__new__(ClassAssigner)
+    assigner.students = [Student(
+        학년=5, 원반=i % 4 + 1, 원번호=i // 4 + 1, 이름=f'학생{i:05d}',
+        성별='남' if i % 2 == 0 else '여', 점수=rng.randint(40, 100), 특수반=(i % 17 == 0),
+        전출=(i % 23 == 0), 난이도=rng.choice([0.0, 0.0, 0.5, 1.5]), 비고=''
+    ) for i in range(count)]
+    assigner.students[-1].이름 = assigner.students[-2].이름  # 동명이인
+    assigner.target_class_count = class_count
+    assigner.classes = {c: [] for c in range(1, class_count + 1)}
+    assigner.separation_pairs = [('학생00000', '학생00001'), ('학생00000', '학생00002')]
+    assigner.separation_rules = defaultdict(set)
+    for name1, name2 in assigner.separation_pairs:
+        assigner.separation_rules[name1].add(name2)
+        assigner.separation_rules[name2].add(name1)
+    assigner.together_groups = [{'학생00003', '학생00004'}]
+
+    assigner._calculate_ranks()
+    for i, student in enumerate(assigner.students):
+        class_num = i % class_count + 1
+        if student.이름 == '학생00004':
+            class_num = assigner.students[3].assigned_class
+        student.assigned_class = class_num
+        assigner.classes[class_num].append(student)
+    return assigner
+
+
+@pytest.fixture
+def editor():
+    return ManualEditor.from_preview(build_preview(make_assigner(40, 3)))
+
+
+def index_of(editor, name):
+    return next(i for i, s in enumerate(editor.students) if s.이름 == name)
+
+
+def test_stats_match_quality_report(editor):
+    """테스트 1: 이동 후 누적 통계가 전체 재계산(quality_report)과 같음"""
+    rng = random.Random(1)
+    for _ in range(30):
+        editor.move(rng.randrange(len(editor.students)), rng.randint(1, 3))
+
+    report = build_quality_report(editor.to_assigner().classes)
+    for row in report.summary_rows(6):
+        class_num = int(row['반'].split('-')[1])
+        mine = editor.summary_rows()[class_num]
+        assert list(mine) == SUMMARY_COLUMNS
+        assert mine == pytest.approx({k: row[k] for k in SUMMARY_COLUMNS})
+
+    overall = report.overall
+    for key, value in editor.spreads().items():
+        assert value == pytest.approx(overall[key])
+
+
+def test_rule_violations_and_undo(editor):
+    """테스트 2: 분반/합반/동명이인 위반 표시와 되돌리기"""
+    assert editor.violations == []
+
+    partner_class = editor.students[1].assigned_class
+    assert editor.move(0, partner_class) == {1, partner_class}
+    together = index_of(editor, '학생00004')
+    editor.move(together, editor.students[together].assigned_class % 3 + 1)
+    twin = len(editor.students) - 1
+    editor.move(twin, editor.students[twin - 1].assigned_class)
+
+    kinds = {v.kind: v for v in editor.violations}
+    assert set(kinds) == {'분반', '합반', '동명이인'}
+    assert kinds['분반'].names == ('학생00000', '학생00001')
+    assert kinds['분반'].classes == (partner_class,)
+    assert len(kinds['합반'].classes) == 2
+    assert '학생00000' in editor.violating_names()
+
+    for _ in range(3):
+        editor.undo()
+    assert editor.violations == [] and editor.history == []
+
+
+def test_move_validation(editor):
+    """테스트 3: 같은 반 이동은 변화 없음, 없는 반은 오류"""
+    current = editor.students[5].assigned_class
+    assert editor.move(5, current) == set()
+    assert editor.history == []
+
+    with pytest.raises(ValueError):
+        editor.move(5, 4)
+
+
+def test_update_preview_matches_rebuild():
+    """테스트 4: 미리보기 행(반/번호) 갱신 결과가 처음부터 다시 만든 미리보기와 같음"""
+    preview = build_preview(make_assigner(40, 3))
+    editor = ManualEditor.from_preview(preview)
+
+    for index, class_num in [(7, 1), (8, 2), (20, 3), (7, 3)]:
+        update_preview(editor, preview, editor.move(index, class_num))
+
+    rebuilt = build_preview(editor.to_assigner())
+    assert sorted(preview.rows) == sorted(rebuilt.rows)
+
+
+def test_move_is_fast_on_large_roster():
+    """테스트 5: 2만 명 명단에서도 이동 한 번(통계/위반/미리보기 갱신)이 10ms 미만"""
+    preview = build_preview(make_assigner(20000, 20))
+    editor = ManualEditor.from_preview(preview)
+    rng = random.Random(2)
+
+    elapsed = []
+    for _ in range(200):
+        start = time.perf_counter()
+        changed = editor.move(rng.randrange(20000), rng.randint(1, 20))
+        editor.summary_rows()
+        editor.spreads()
+        editor.violations
+        update_preview(editor, preview, changed)
+        elapsed.append(time.perf_counter() - start)
+
+    assert sorted(elapsed)[len(elapsed) // 2] < 0.010
+
+
+def test_export(editor, tmp_path):
+    """테스트 6: 수정 내용 재저장 (작업 프로세스 방식은 반 번호 목록만 받아 같은 결과)"""
+    editor.move(0, editor.students[0].assigned_class % 3 + 1)
+    direct = export_edits(editor, str(tmp_path / 'direct.csv'))
+
+    init_export_worker(ManualEditor.from_preview(build_preview(make_assigner(40, 3))).students,
+                       editor.separation_pairs, editor.together_groups, editor.target_class_count)
+    worker = export_assignments([s.assigned_class for s in editor.students], str(tmp_path / 'worker.csv'))
+
+    with open(direct, encoding='utf-8-sig') as f1, open(worker, encoding='utf-8-sig') as f2:
+        rows = list(csv.DictReader(f1))
+        assert rows == list(csv.DictReader(f2))
+    moved = next(row for row in rows if row['이름'] == '학생00000')
+    assert int(moved['반']) == editor.students[0].assigned_class
+
+
+def test_summary_model_drop(editor):
+    """테스트 7: 결과 표에서 끌어 온 학생을 반 요약 표에 놓으면 이동 요청"""
+    pytest.importorskip('PyQt6.QtWidgets')
+    from PyQt6.QtCore import Qt
+    from class_assigner_gui_qt import ClassSummaryModel, ResultTableModel
+
+    preview = build_preview(editor.to_assigner())
+    result_model = ResultTableModel()
+    result_model.set_preview(preview)
+    summary_model = ClassSummaryModel()
+    summary_model.set_rows(editor.summary_rows(), editor.violations)
+    requests = []
+    summary_model.move_requested.connect(lambda students, class_num: requests.append((students, class_num)))
+
+    mime = result_model.mimeData([result_model.index(0, 0), result_model.index(0, 2), result_model.index(3, 0)])
+    assert summary_model.dropMimeData(mime, Qt.DropAction.CopyAction, -1, -1, summary_model.index(1, 0))
+    assert requests == [([preview.student_index[0], preview.student_index[3]], 2)]
+    assert summary_model.headerData(1, Qt.Orientation.Vertical) == '2반'
+
+
+def test_unassigned_students(tmp_path):
+    """테스트 8: 미배정 학생(반 번호 None)은 재저장에서 미배정으로 남고, 미배정에서 옮긴 이동도 되돌리기 가능"""
+    assigner = make_assigner(40, 3)
+    unassigned = assigner.students[5]
+    assigner.classes[unassigned.assigned_class].remove(unassigned)
+    unassigned.assigned_class = None
+    editor = ManualEditor.from_preview(build_preview(assigner))
+
+    # 작업 프로세스 상태는 모두 배정된 명단으로 시작 → 미배정 학생은 미배정으로 되돌림
+    init_export_worker(ManualEditor.from_preview(build_preview(make_assigner(40, 3))).students,
+                       editor.separation_pairs, editor.together_groups, editor.target_class_count)
+    assignments = [s.assigned_class for s in editor.students]
+    assert assignments[5] is None
+    worker = export_assignments(assignments, str(tmp_path / 'worker.csv'))
+    with open(worker, encoding='utf-8-sig') as f:
+        names = [row['이름'] for row in csv.DictReader(f)]
+    assert len(names) == 39 and unassigned.이름 not in names
+
+    stats = {c: editor.stats[c].학생수 for c in editor.members}
+    assert editor.move(5, 2) == {2}
+    assert editor.undo() == {2}
+    assert unassigned.assigned_class is None and 5 not in editor.members[2]
+    assert {c: editor.stats[c].학생수 for c in editor.members} == stats
@@ -0,0 +1,160 @@
+"""
+parsed_inputs 모듈 테스트
+입력 파일 미리 파싱, 경로+수정 시각+크기 캐시, 미리 읽은 입력으로 배정 실행, 내용 해시 디스크 캐시 테스트
+"""
+
+import pytest
+import os
+import shutil
+import sys
+
+# 상위 디렉토리의 class_assigner 모듈 import
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from class_assigner import ClassAssigner, Student, find_rule_conflicts
+import parsed_inputs
+from parsed_inputs import DiskInputCache, InputCache, ParsedInputs, parse_inputs
+
+BASE_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+STUDENT_FILE = os.path.join(BASE_DIR, '01 가상 명단.xlsx')
+RULES_FILE = os.path.join(BASE_DIR, '02 분반 합반할 학생 규칙.xlsx')
+
+
+@pytest.fixture
+def input_files(tmp_path):
+    """임시 폴더에 복사한 샘플 명단/규칙 파일"""
+    student_file = str(tmp_path / '01 가상 명단.xlsx')
+    rules_file = str(tmp_path / '02 분반 합반할 학생 규칙.xlsx')
+    shutil.copy(STUDENT_FILE, student_file)
+    shutil.copy(RULES_FILE, rules_file)
+    return student_file, rules_file
+
+
+def test_parse_inputs(input_files):
+    """테스트 1: 명단/규칙 파싱과 요약"""
+    parsed = parse_inputs(*input_files)
+
+    summary = parsed.summary()
+    assert summary['학생수'] == len(parsed.students) > 0
+    assert summary['남학생수'] + summary['여학생수'] == summary['학생수']
+    assert summary['분반쌍'] == len(parsed.separation_pairs)
+    assert parsed.conflicts == []
+
+
+def test_conflicts_are_collected():
+    """테스트 2: 규칙 충돌은 예외 대신 목록으로 반환"""
+    students = [Student(학년=5, 원반=1, 원번호=i, 이름=name, 성별='남', 점수=80, 특수반=False,
+                        전출=False, 난이도=0, 비고='') for i, name in enumerate(['가', '나', '다', '다'], 1)]
+
+    conflicts = find_rule_conflicts(students, {'가': {'나'}, '나': {'가'}}, [{'가', '나'}, {'다', '라'}])
+
+    assert len(conflicts) == 3  # 가-나, 나-가 분반 충돌 + '다' 동명이인
+    assert any('동명이인(2명)' in c for c in conflicts)
+
+
+def test_cache_hit_and_invalidation(input_files):
+    """테스트 3: 같은 파일은 캐시 재사용, 파일이 바뀌면 다시 파싱"""
+    student_file, rules_file = input_files
+    cache = InputCache()
+
+    first = cache.load(student_file, rules_file)
+    assert cache.load(student_file, rules_file) is first
+
+    # 수정 시각이 바뀌면 캐시 무효
+    stat = os.stat(student_file)
+    os.utime(student_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+    assert cache.get(student_file, rules_file) is None
+    assert cache.load(student_file, rules_file) is not first
+
+
+def test_cache_eviction_and_missing_file(input_files, tmp_path):
+    """테스트 4: 최근 항목만 보관, 없는 파일은 캐시 조회 실패"""
+    student_file, rules_file = input_files
+    cache = InputCache(max_entries=1)
+    parsed = cache.load(student_file, rules_file)
+
+    other = ParsedInputs(student_file='a', rules_file='b', students=[], separation_pairs=[],
+                         together_groups=[], signature=('a', 'b'))
+    cache.put(other)
+
+    assert cache.get(student_file, rules_file) is None
+    assert cache.get(str(tmp_path / '없음.xlsx'), rules_file) is None
+    assert parsed.signature not in cache._entries
+
+
+def test_run_with_parsed_inputs(input_files, tmp_path, capsys):
+    """테스트 5: 미리 읽은 입력으로 실행하면 파일을 다시 읽지 않고, 캐시된 학생은 바뀌지 않음"""
+    parsed = parse_inputs(*input_files)
+    os.remove(input_files[0])  # 다시 읽으려 하면 실패
+
+    assigner = ClassAssigner(student_file=input_files[0], rules_file=input_files[1])
+    assigner.run(output_file=str(tmp_path / 'result.csv'), parsed_inputs=parsed)
+
+    out = capsys.readouterr().out
+    assert "미리 읽어 둔 명단 사용" in out
+    assert all(s.assigned_class is not None for s in assigner.students)
+    assert all(s.assigned_class is None for s in parsed.students)
+    assert len(assigner.separation_pairs) == len(parsed.separation_pairs)
+
+
+@pytest.fixture
+def parse_calls(monkeypatch):
+    """read_students/read_rules 호출 횟수"""
+    calls = {'roster': 0, 'rules': 0}
+
+    def counted(kind, read):
+        def wrapper(*args, **kwargs):
+            calls[kind] += 1
+            return read(*args, **kwargs)
+        return wrapper
+
+    monkeypatch.setattr(parsed_inputs, 'read_students', counted('roster', parsed_inputs.read_students))
+    monkeypatch.setattr(parsed_inputs, 'read_rules', counted('rules', parsed_inputs.read_rules))
+    return calls
+
+
+def test_disk_cache_by_content(input_files, tmp_path, parse_calls):
+    """테스트 6: 내용이 같으면 다른 경로/수정 시각이어도 디스크 캐시 사용, 규칙만 바뀌면 규칙만 다시 파싱"""
+    from openpyxl import load_workbook
+
+    student_file, rules_file = input_files
+    first = parse_inputs(student_file, rules_file, disk_cache=DiskInputCache(str(tmp_path / 'cache')))
+    assert parse_calls == {'roster': 1, 'rules': 1}
+
+    # 새 프로세스처럼 새 캐시 객체로, 복사해서 수정 시각이 다른 파일
+    copied = str(tmp_path / '명단 사본.xlsx')
+    shutil.copy(student_file, copied)
+    os.utime(copied, ns=(0, 1_000_000_000))
+    cache = DiskInputCache(str(tmp_path / 'cache'))
+    second = parse_inputs(copied, rules_file, disk_cache=cache)
+    assert parse_calls == {'roster': 1, 'rules': 1} and cache.hits == 2
+    assert [vars(s) for s in second.students] == [vars(s) for s in first.students]
+    assert second.separation_pairs == first.separation_pairs and second.together_groups == first.together_groups
+    assert second.conflicts == first.conflicts
+    assert second.students[0] is not first.students[0]
+
+    workbook = load_workbook(rules_file)
+    workbook.active['B3'] = workbook.active['B3'].value  # 내용은 같게, 파일은 다시 저장
+    workbook.save(rules_file)
+    parse_inputs(student_file, rules_file, disk_cache=cache)
+    assert parse_calls == {'roster': 1, 'rules': 2}
+
+
+def test_disk_cache_eviction_and_corrupt_entry(input_files, tmp_path, parse_calls):
+    """테스트 7: 크기 제한을 넘으면 오래 쓰지 않은 항목부터 삭제, 깨진 항목은 지우고 다시 파싱"""
+    student_file, rules_file = input_files
+    cache = DiskInputCache(str(tmp_path / 'cache'))
+    cache.rules(rules_file)
+    cache.students(student_file)
+    (rules_entry, _, _), (roster_entry, roster_size, _) = cache.entries()
+    assert os.path.basename(rules_entry).startswith('rules-') and os.path.basename(roster_entry).startswith('roster-')
+
+    with open(roster_entry, 'wb') as f:
+        f.write(b'broken')
+    cache = DiskInputCache(str(tmp_path / 'cache'), max_bytes=roster_size)
+    os.utime(rules_entry, (1, 1))  # 규칙 항목이 가장 오래됨
+    assert len(cache.students(student_file)) > 0
+    assert parse_calls['roster'] == 2 and cache.misses == 1
+    assert [os.path.basename(path) for path, _, _ in cache.entries()] == [os.path.basename(roster_entry)]
+
+    cache.clear()
+    assert cache.entries() == []
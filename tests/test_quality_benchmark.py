@@ -0,0 +1,56 @@
+"""
+quality_benchmark 모듈 테스트
+입력 × 엔진 실행 결과의 곡선/요약, 시점별 목적함수, 곡선 CSV와 결과 JSON 저장 테스트
+"""
+
+import contextlib
+import csv
+import io
+import json
+import sys
+import os
+
+# 상위 디렉토리의 class_assigner 모듈 import
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from quality_benchmark import main, objective_at, run_benchmark, summarize
+
+
+def test_benchmark_and_summary():
+    """테스트 1: 입력마다 모든 엔진 실행, 곡선은 greedy 배정 시점부터 시작, 요약은 greedy 대비 개선율"""
+    result = run_benchmark(sizes=[150], class_counts=[5], seeds=[1, 2], budget=None, iterations=200)
+
+    assert [(run['instance'], run['engine']) for run in result['runs']] == [
+        ('150x5-s1', 'greedy'), ('150x5-s1', 'restarts'), ('150x5-s1', 'local_search'),
+        ('150x5-s2', 'greedy'), ('150x5-s2', 'restarts'), ('150x5-s2', 'local_search')]
+    for run in result['runs']:
+        assert run['curve'][0]['time_sec'] >= run['greedy_sec'] > 0
+        assert run['final']['목적함수'] == run['curve'][-1]['objective']
+        assert run['iterations'] == (0 if run['engine'] == 'greedy' else 200)
+        greedy = next(r for r in result['runs'] if r['instance'] == run['instance'] and r['engine'] == 'greedy')
+        assert run['curve'][0]['objective'] == greedy['final']['목적함수']
+
+    summary = summarize(result, checkpoints=(0.0, 1000.0))
+    assert summary['greedy']['improvement'] == 0
+    assert summary['local_search']['improvement'] > 0
+    assert summary['local_search']['objective_at'][0.0] is None
+    assert summary['local_search']['objective_at'][1000.0] == summary['local_search']['final']['목적함수']
+
+
+def test_objective_at_and_files(tmp_path):
+    """테스트 2: 시점별 목적함수는 그때까지의 마지막 개선 값, 곡선 CSV와 결과 JSON 저장"""
+    curve = [{'time_sec': 0.5, 'objective': 30.0}, {'time_sec': 1.0, 'objective': 20.0}]
+    assert [objective_at(curve, t) for t in (0.1, 0.5, 0.9, 5.0)] == [None, 30.0, 30.0, 20.0]
+
+    curves, output = str(tmp_path / 'curves.csv'), str(tmp_path / 'quality.json')
+    with contextlib.redirect_stdout(io.StringIO()) as out:
+        assert main(['--sizes', '80', '--classes', '4', '--seeds', '1', '--engines', 'greedy', 'local_search',
+                     '--iterations', '100', '--curves', curves, '--output', output]) == 0
+    assert 'local_search' in out.getvalue()
+
+    with open(curves, encoding='utf-8-sig') as f:
+        rows = list(csv.DictReader(f))
+    assert {row['engine'] for row in rows} == {'greedy', 'local_search'}
+    assert '유효인원편차' in rows[0]
+    with open(output, encoding='utf-8') as f:
+        saved = json.load(f)
+    assert len(saved['runs']) == 2 and set(saved['summary']) == {'greedy', 'local_search'}
@@ -0,0 +1,147 @@
+"""
+quality_report 모듈 테스트
+반별/전체 품질 통계, 반별 성별 등수 분포와 요약 시트 연동 테스트
+"""
+
+import pytest
+import math
+import random
+import numpy as np
+import openpyxl
+from collections import defaultdict
+import sys
+import os
+
+# 상위 디렉토리의 class_assigner 모듈 import
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from class_assigner import ClassAssigner, Student
+from quality_report import RANK_COLUMNS, SUMMARY_COLUMNS, build_quality_report
+
+
+@pytest.fixture
+def assigned_assigner():
+    """배정이 끝난 ClassAssigner 인스턴스 (특수반, 전출생, 난이도, 등수 포함)"""
+    assigner = ClassAssigner.__new__(ClassAssigner)
+    assigner.students = []
+    for i in range(30):
+        assigner.students.append(Student(
+            학년=5, 원반=(i % 3) + 1, 원번호=i // 3 + 1, 이름=f'학생{i + 1:02d}',
+            성별='남' if i % 2 == 0 else '여', 점수=50 + i, 특수반=(i in (4, 9)), 전출=(i == 7),
+            난이도=1.5 if i % 8 == 0 else 0.0, 비고=''
+        ))
+    assigner.target_class_count = 3
+    assigner.classes = {i: [] for i in range(1, 4)}
+    assigner.separation_rules = defaultdict(set)
+    assigner.separation_pairs = []
+    assigner.together_groups = []
+    assigner.rng = random.Random(0)  # Phase 5 섞기를 고정 (반/성별 인원이 실행마다 같도록)
+
+    assigner._calculate_ranks()
+    assigner.phase5_balance_remaining()
+    return assigner
+
+
+def test_matches_per_student_sums(assigned_assigner):
+    """테스트 1: 반별 통계가 학생별 합계와 일치"""
+    report = assigned_assigner.build_quality_report()
+
+    assert list(report.per_class.columns) == SUMMARY_COLUMNS
+    for class_num, students in assigned_assigner.classes.items():
+        stats = report.per_class.loc[class_num]
+        scores = [s.점수 for s in students]
+        mean = sum(scores) / len(scores)
+        assert stats['학생수'] == len(students)
+        assert stats['유효인원'] == sum(s.effective_count() for s in students)
+        assert stats['유효남학생'] == sum(s.effective_count() for s in students if s.성별 == '남')
+        assert stats['여학생수'] == sum(1 for s in students if s.성별 == '여')
+        assert stats['난이도합'] == sum(s.난이도 for s in students)
+        assert stats['특수반수'] == sum(1 for s in students if s.특수반)
+        assert stats['전출생수'] == sum(1 for s in students if s.전출)
+        assert stats['점수평균'] == round(mean, 2)
+        assert stats['점수표준편차'] == round(math.sqrt(sum((x - mean) ** 2 for x in scores) / len(scores)), 2)
+        assert (stats['점수최소'], stats['점수최대']) == (min(scores), max(scores))
+        male_ranks = [s.rank for s in students if s.성별 == '남']
+        assert stats['남등수평균'] == round(sum(male_ranks) / len(male_ranks), 1)
+
+
+def test_overall_stats(assigned_assigner):
+    """테스트 2: 전체 통계와 반별 편차"""
+    report = assigned_assigner.build_quality_report()
+    overall = report.overall
+
+    assert overall['학생수'] == 30
+    assert overall['유효인원'] == sum(s.effective_count() for s in assigned_assigner.students)
+    assert overall['특수반수'] == 2
+    assert overall['전출생수'] == 1
+    effective = [report.per_class.loc[c, '유효인원'] for c in range(1, 4)]
+    assert overall['유효인원편차'] == max(effective) - min(effective)
+
+
+def test_mixing_entropy():
+    """테스트 3: 원반 혼합도 (한 원반만 있으면 0, 두 원반이 반반이면 1bit)"""
+    def student(name, 원반):
+        return Student(학년=5, 원반=원반, 원번호=1, 이름=name, 성별='남', 점수=50,
+                       특수반=False, 전출=False, 난이도=0, 비고='')
+
+    report = build_quality_report({
+        1: [student('가', 1), student('나', 1)],
+        2: [student('다', 1), student('라', 2)],
+    })
+
+    assert report.per_class.loc[1, '원반혼합도'] == 0
+    assert report.per_class.loc[2, '원반혼합도'] == 1
+    assert report.overall['원반혼합도평균'] == 0.5
+
+
+def test_empty_class():
+    """테스트 4: 학생이 없는 반은 개수 0, 평균은 값 없음"""
+    report = build_quality_report({1: [], 2: []})
+
+    rows = report.summary_rows(6)
+    assert [row['반'] for row in rows] == ['6-1', '6-2']
+    assert rows[0]['학생수'] == 0
+    assert rows[0]['점수평균'] is None
+    assert report.overall['유효인원편차'] == 0
+
+
+def test_summary_sheet(assigned_assigner, tmp_path, monkeypatch):
+    """테스트 5: 요약 시트에 품질 지표 컬럼 출력 및 보고서 보관 (여러 형식으로 저장해도 한 번만 계산)"""
+    builds = []
+    build = assigned_assigner.build_quality_report
+    monkeypatch.setattr(assigned_assigner, 'build_quality_report', lambda: builds.append(1) or build())
+    output_file = tmp_path / 'result.xlsx'
+    assigned_assigner.generate_output(str(output_file), writers=['xlsx', 'csv'])
+    assert len(builds) == 1
+
+    ws = openpyxl.load_workbook(output_file)['요약']
+    header = [cell.value for cell in ws[1]]
+    assert header == ['반'] + SUMMARY_COLUMNS
+    assert ws['B2'].value == assigned_assigner.quality_report.per_class.loc[1, '학생수']
+    assert assigned_assigner.quality_report.to_dict()['overall']['학생수'] == 30
+
+
+def test_rank_distribution(assigned_assigner):
+    """테스트 6: 반별 성별 등수 분포 (명수, 평균, 표준편차, 최소, 사분위수, 최대), 학생이 없는 반은 명수 0"""
+    report = assigned_assigner.build_quality_report()
+    distribution = report.rank_distribution
+
+    assert list(distribution.columns) == RANK_COLUMNS
+    assert list(distribution.index) == [(c, g) for c in (1, 2, 3) for g in ('남', '여')]
+    for class_num, students in assigned_assigner.classes.items():
+        for gender in ('남', '여'):
+            ranks = np.array([s.rank for s in students if s.성별 == gender], dtype=float)
+            stats = distribution.loc[(class_num, gender)]
+            assert stats['명수'] == len(ranks)
+            assert stats['평균'] == round(ranks.mean(), 1)
+            assert stats['표준편차'] == round(ranks.std(), 2)
+            assert (stats['최소'], stats['최대']) == (ranks.min(), ranks.max())
+            assert stats['중앙값'] == round(np.median(ranks), 1)
+            assert (stats['1사분위수'], stats['3사분위수']) == tuple(np.round(np.quantile(ranks, [0.25, 0.75]), 1))
+        assert report.per_class.loc[class_num, '남등수평균'] == distribution.loc[(class_num, '남'), '평균']
+
+    as_dict = report.to_dict()['rank_distribution']
+    assert as_dict[1]['여']['최대'] == distribution.loc[(1, '여'), '최대']
+
+    empty = build_quality_report({1: [], 2: []})
+    assert empty.rank_distribution['명수'].tolist() == [0, 0, 0, 0]
+    assert empty.to_dict()['rank_distribution'][2]['남']['평균'] is None
@@ -0,0 +1,202 @@
+"""
+result_diff 모듈 테스트
+두 배정 결과의 이동 학생, 반별 지표 변화, 규칙 위반 변화 비교 테스트 (파일, ClassAssigner, DataFrame)
+"""
+
+import pytest
+import json
+import openpyxl
+from collections import defaultdict
+import sys
+import os
+
+# 상위 디렉토리의 class_assigner 모듈 import
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from class_assigner import ClassAssigner, Student
+from result_diff import (
+    AssignmentSnapshot, diff_results, diff_snapshots, load_snapshot, rule_violations,
+    write_diff_json, write_diff_xlsx, main
+)
+from result_writers import RECORD_FIELDS
+
+
+@pytest.fixture
+def assigned_assigner():
+    """배정이 끝난 ClassAssigner 인스턴스 (분반/합반 규칙 포함)"""
+    assigner = ClassAssigner.__new__(ClassAssigner)
+    assigner.students = []
+    for i in range(30):
+        assigner.students.append(Student(
+            학년=5, 원반=(i % 3) + 1, 원번호=i // 3 + 1, 이름=f'학생{i + 1:02d}',
+            성별='남' if i % 2 == 0 else '여', 점수=50 + i, 특수반=(i == 4), 전출=False,
+            난이도=0.0, 비고=''
+        ))
+    assigner.target_class_count = 3
+    assigner.classes = {i: [] for i in range(1, 4)}
+    assigner.separation_rules = defaultdict(set, {'학생01': {'학생02'}, '학생02': {'학생01'}})
+    assigner.separation_pairs = [('학생01', '학생02')]
+    assigner.together_groups = [{'학생10', '학생11'}]
+
+    assigner.phase1_apply_rules()
+    assigner.phase5_balance_remaining()
+    return assigner
+
+
+def _move(assigner, name, class_num):
+    student = assigner._find_student_by_name(name)
+    assigner.classes[student.assigned_class].remove(student)
+    assigner.classes[class_num].append(student)
+    student.assigned_class = class_num
+
+
+def test_identical_assignments(assigned_assigner):
+    """테스트 1: 같은 배정은 차이 없음"""
+    snapshot = load_snapshot(assigned_assigner)
+    diff = diff_snapshots(snapshot, snapshot)
+
+    assert diff.moved == [] and diff.added == [] and diff.removed == []
+    assert diff.newly_violated == [] and diff.newly_satisfied == []
+    assert all(row[name]['변화'] == 0 for row in diff.class_deltas for name in row if name != '반')
+
+
+def test_moved_student_and_class_deltas(assigned_assigner):
+    """테스트 2: 이동한 학생과 반별 학생 수 변화"""
+    old = load_snapshot(assigned_assigner)
+    student = assigned_assigner._find_student_by_name('학생20')
+    source = student.assigned_class
+    target = source % 3 + 1
+    _move(assigned_assigner, '학생20', target)
+    new = load_snapshot(assigned_assigner)
+
+    diff = diff_snapshots(old, new)
+
+    assert [(m['이름'], m['이전반'], m['새반']) for m in diff.moved] == [('학생20', source, target)]
+    deltas = {row['반']: row for row in diff.class_deltas}
+    assert deltas[source]['학생수']['변화'] == -1
+    assert deltas[target]['학생수']['변화'] == 1
+
+
+def test_newly_violated_and_satisfied_rules(assigned_assigner):
+    """테스트 3: 분반 규칙 위반 발생 → 해소"""
+    old = load_snapshot(assigned_assigner)
+    class_of_01 = assigned_assigner._find_student_by_name('학생01').assigned_class
+    _move(assigned_assigner, '학생02', class_of_01)
+    new = load_snapshot(assigned_assigner)
+
+    violated = diff_snapshots(old, new)
+    assert [v['규칙'] for v in violated.newly_violated] == ['분반']
+    assert violated.newly_violated[0]['학생'] == ['학생01', '학생02']
+
+    satisfied = diff_snapshots(new, old)
+    assert [v['규칙'] for v in satisfied.newly_satisfied] == ['분반']
+
+
+def test_rule_violations_kinds():
+    """테스트 4: 분반/합반/동명이인 위반 감지"""
+    snapshot = AssignmentSnapshot(
+        students={
+            (5, 1, 1, '가'): {'반': 1},
+            (5, 1, 2, '나'): {'반': 1},
+            (5, 1, 3, '다'): {'반': 1},
+            (5, 1, 4, '라'): {'반': 2},
+            (5, 2, 1, '가'): {'반': 1},
+        },
+        separation_pairs=[('가', '나')],
+        together_groups=[{'다', '라'}],
+    )
+
+    violations = rule_violations(snapshot)
+
+    assert set(violations) == {('분반', '가', '나'), ('합반', '다', '라'), ('동명이인', '가')}
+
+
+def test_added_and_removed_students(assigned_assigner):
+    """테스트 5: 한쪽에만 있는 학생은 추가/삭제로 보고"""
+    old = load_snapshot(assigned_assigner)
+    new = load_snapshot(assigned_assigner)
+    key = next(iter(new.students))
+    new.students[(9, 9, 9, '전입생')] = dict(new.students[key])
+    del new.students[key]
+
+    diff = diff_snapshots(old, new)
+
+    assert [a['이름'] for a in diff.added] == ['전입생']
+    assert [r['이름'] for r in diff.removed] == [key[3]]
+
+
+@pytest.mark.parametrize('extension', ['.xlsx', '.csv', '.jsonl'])
+def test_diff_result_files(assigned_assigner, tmp_path, extension):
+    """테스트 6: 결과 파일끼리 비교 (xlsx / csv / jsonl)"""
+    old_file = str(tmp_path / f'old{extension}')
+    new_file = str(tmp_path / f'new{extension}')
+    assigned_assigner.generate_output(old_file)
+    _move(assigned_assigner, '학생20', assigned_assigner._find_student_by_name('학생20').assigned_class % 3 + 1)
+    assigned_assigner.generate_output(new_file)
+
+    diff = diff_results(old_file, new_file)
+
+    assert [m['이름'] for m in diff.moved] == ['학생20']
+    assert diff.added == [] and diff.removed == []
+
+
+def test_flat_files_restore_rules(assigned_assigner, tmp_path):
+    """테스트 7: CSV/JSON Lines의 분반대상/합반그룹 컬럼으로 규칙 복원"""
+    path = str(tmp_path / 'result.jsonl')
+    assigned_assigner.generate_output(path)
+
+    snapshot = load_snapshot(path)
+
+    assert snapshot.separation_pairs == [('학생01', '학생02')]
+    assert snapshot.together_groups == [{'학생10', '학생11'}]
+
+
+def test_write_diff_outputs(assigned_assigner, tmp_path):
+    """테스트 8: JSON / xlsx 비교 보고서 저장"""
+    old = load_snapshot(assigned_assigner)
+    _move(assigned_assigner, '학생20', assigned_assigner._find_student_by_name('학생20').assigned_class % 3 + 1)
+    diff = diff_snapshots(old, load_snapshot(assigned_assigner))
+
+    json_file = tmp_path / 'diff.json'
+    xlsx_file = tmp_path / 'diff.xlsx'
+    write_diff_json(diff, str(json_file))
+    write_diff_xlsx(diff, str(xlsx_file))
+
+    data = json.loads(json_file.read_text(encoding='utf-8'))
+    assert data['summary']['moved'] == 1
+    wb = openpyxl.load_workbook(xlsx_file)
+    assert wb.sheetnames == ['이동 학생', '반별 변화', '규칙 변화']
+    assert wb['이동 학생']['E2'].value == '학생20'
+
+
+def test_cli(assigned_assigner, tmp_path, capsys):
+    """테스트 9: 명령줄 실행"""
+    old_file = str(tmp_path / 'old.jsonl')
+    assigned_assigner.generate_output(old_file)
+    output_file = tmp_path / 'diff.json'
+
+    main([old_file, old_file, '-o', str(output_file)])
+
+    assert json.loads(output_file.read_text(encoding='utf-8'))['summary']['moved'] == 0
+    assert "이동 0명" in capsys.readouterr().err
+
+
+def test_diff_dataframes(assigned_assigner):
+    """테스트 10: DataFrame(Parquet) 결과 비교: 빈 합반그룹(NaN)은 그룹 없음, 빈 반은 미배정"""
+    import pandas as pd
+
+    old = pd.DataFrame(assigned_assigner.build_result_records(), columns=RECORD_FIELDS)
+    assert old['합반그룹'].isna().sum() == 28  # 합반 그룹이 없는 학생
+    new_class = assigned_assigner._find_student_by_name('학생20').assigned_class % 3 + 1
+    _move(assigned_assigner, '학생20', new_class)
+    new = pd.DataFrame(assigned_assigner.build_result_records(), columns=RECORD_FIELDS)
+    new.loc[new['이름'] == '학생21', '반'] = float('nan')
+
+    snapshot = load_snapshot(old)
+    assert snapshot.together_groups == [{'학생10', '학생11'}]
+    assert snapshot.separation_pairs == [('학생01', '학생02')]
+
+    diff = diff_results(old, new)
+    assert sorted((m['이름'], m['새반']) for m in diff.moved) == [('학생20', new_class), ('학생21', None)]
+    assert diff.newly_violated == [] and diff.newly_satisfied == []
+    assert [row['반'] for row in diff.class_deltas] == [1, 2, 3]
+    assert sum(row['학생수']['이후'] for row in diff.class_deltas) == 29
@@ -0,0 +1,122 @@
+"""
+result_preview 모듈 테스트
+배정 결과 미리보기 데이터, 필터/정렬, 결과 파일과 같은 색상 규칙, GUI 표 모델 테스트
+"""
+
+import pytest
+import pickle
+from collections import defaultdict
+import sys
+import os
+
+# 상위 디렉토리의 class_assigner 모듈 import
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from class_assigner import ClassAssigner, Student, TOGETHER_COLOR
+from result_preview import PREVIEW_COLUMNS, build_preview, filter_rows, sort_rows
+
+
+@pytest.fixture
+def assigned_assigner():
+    """배정이 끝난 ClassAssigner 인스턴스 (분반 2쌍, 합반 1그룹)"""
+    assigner = ClassAssigner.__new__(ClassAssigner)
+    assigner.students = []
+    for i in range(24):
+        assigner.students.append(Student(
+            학년=5, 원반=(i % 3) + 1, 원번호=i // 3 + 1, 이름=f'학생{i + 1:02d}',
+            성별='남' if i % 2 == 0 else '여', 점수=60 + i, 특수반=(i == 4), 전출=(i == 7),
+            난이도=0.0, 비고='주의' if i == 10 else ''
+        ))
+    assigner.target_class_count = 3
+    assigner.classes = {i: [] for i in range(1, 4)}
+    assigner.separation_pairs = [('학생01', '학생02'), ('학생01', '학생03')]
+    assigner.separation_rules = defaultdict(set)
+    for name1, name2 in assigner.separation_pairs:
+        assigner.separation_rules[name1].add(name2)
+        assigner.separation_rules[name2].add(name1)
+    assigner.together_groups = [{'학생05', '학생06'}]
+
+    assigner._calculate_ranks()
+    assigner.phase1_apply_rules()
+    assigner.phase5_balance_remaining()
+    return assigner
+
+
+def test_build_preview(assigned_assigner):
+    """테스트 1: 모든 학생이 반/번호 순으로 한 행씩, 작업 프로세스에서 보낼 수 있도록 pickle 가능"""
+    preview = build_preview(assigned_assigner)
+
+    assert preview.columns == PREVIEW_COLUMNS
+    assert len(preview.rows) == len(preview.fills) == 24
+    keys = [(row[0], row[1]) for row in preview.rows]
+    assert keys == sorted(keys)
+    assert pickle.loads(pickle.dumps(preview)) == preview
+
+
+def test_fills_match_exported_sheets(assigned_assigner):
+    """테스트 2: 행 색상이 결과 파일 반별 시트와 같음 (합반 파란색, 분반 쌍별 색상 번갈아)"""
+    preview = build_preview(assigned_assigner)
+    class_specs, _ = assigned_assigner.build_sheet_specs()
+
+    assert preview.fills == [fill for spec in class_specs for fill in spec.row_fills]
+
+    name_idx = preview.column_index('이름')
+    rows = {row[name_idx]: i for i, row in enumerate(preview.rows)}
+    assert preview.cell_fill(rows['학생05'], 7) == TOGETHER_COLOR
+    first, second = preview.fills[rows['학생01']]
+    assert [preview.cell_fill(rows['학생01'], c) for c in range(3)] == [first, second, first]
+    assert preview.cell_fill(rows['학생10'], 0) is None
+
+
+def test_filter_rows(assigned_assigner):
+    """테스트 3: 반/성별/규칙 플래그/이름·비고 검색 필터"""
+    preview = build_preview(assigned_assigner)
+    rows = preview.rows
+
+    assert filter_rows(preview) == list(range(24))
+    assert all(rows[i][0] == 2 for i in filter_rows(preview, class_num=2))
+    assert len(filter_rows(preview, gender='여')) == 12
+    assert {rows[i][2] for i in filter_rows(preview, flag='합반')} == {'학생05', '학생06'}
+    assert {rows[i][2] for i in filter_rows(preview, flag='분반')} == {'학생01', '학생02', '학생03'}
+    assert [rows[i][2] for i in filter_rows(preview, text='주의')] == ['학생11']
+    assert [rows[i][2] for i in filter_rows(preview, gender='남', text=' 학생2')] == ['학생21', '학생23']
+
+
+def test_sort_rows(assigned_assigner):
+    """테스트 4: 컬럼 정렬 (빈 값은 항상 뒤, 같은 값은 기존 순서 유지)"""
+    preview = build_preview(assigned_assigner)
+    score_idx = preview.column_index('점수')
+    target_idx = preview.column_index('분반대상')
+    indices = filter_rows(preview)
+
+    descending = sort_rows(preview, indices, score_idx, descending=True)
+    assert [preview.rows[i][score_idx] for i in descending] == sorted(range(60, 84), reverse=True)
+
+    for desc in (False, True):
+        ordered = sort_rows(preview, indices, target_idx, descending=desc)
+        assert [preview.rows[i][target_idx] != '' for i in ordered] == [True] * 3 + [False] * 21
+        assert ordered[3:] == [i for i in indices if preview.rows[i][target_idx] == '']
+
+
+def test_result_table_model(assigned_assigner):
+    """테스트 5: GUI 표 모델의 필터/정렬/표시 값"""
+    pytest.importorskip('PyQt6.QtWidgets')
+    from PyQt6.QtCore import Qt
+    from class_assigner_gui_qt import ResultTableModel
+
+    preview = build_preview(assigned_assigner)
+    model = ResultTableModel()
+    model.set_preview(preview)
+    assert (model.rowCount(), model.columnCount()) == (24, len(PREVIEW_COLUMNS))
+
+    model.sort(preview.column_index('점수'), Qt.SortOrder.DescendingOrder)
+    assert model.data(model.index(0, preview.column_index('이름'))) == '학생24'
+
+    model.set_filter(flag='특수반')
+    assert model.rowCount() == 1
+    assert model.data(model.index(0, preview.column_index('특수반'))) == '✓'
+    assert model.data(model.index(0, preview.column_index('전출'))) == ''
+
+    # 필터를 풀어도 정렬은 유지
+    model.set_filter()
+    assert model.rowCount() == 24
+    assert preview.rows[model.source_row(0)][preview.column_index('이름')] == '학생24'
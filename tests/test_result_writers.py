@@ -0,0 +1,193 @@
+"""
+result_writers 모듈 테스트
+출력기 선택, 학생 단위 레코드, CSV / JSON Lines / Parquet 출력 테스트
+"""
+
+import pytest
+import csv
+import json
+from collections import defaultdict
+import sys
+import os
+
+# 상위 디렉토리의 class_assigner 모듈 import
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from class_assigner import ClassAssigner, Student
+from result_writers import (
+    RECORD_FIELDS, CsvResultWriter, JsonLinesResultWriter, ParquetResultWriter, ResultWriter,
+    XlsxResultWriter, get_writer, output_paths, register_writer, WRITERS
+)
+
+
+@pytest.fixture
+def assigned_assigner():
+    """배정이 끝난 ClassAssigner 인스턴스 (분반/합반 규칙, 동명이인 포함)"""
+    assigner = ClassAssigner.__new__(ClassAssigner)
+    assigner.students = [
+        Student(학년=5, 원반=1, 원번호=1, 이름='김철수', 성별='남', 점수=90, 특수반=True, 전출=False, 난이도=2.0, 비고='메모'),
+        Student(학년=5, 원반=1, 원번호=2, 이름='이영희', 성별='여', 점수=80, 특수반=False, 전출=False, 난이도=0, 비고=''),
+        Student(학년=5, 원반=2, 원번호=1, 이름='박민수', 성별='남', 점수=70, 특수반=False, 전출=True, 난이도=0, 비고=''),
+        Student(학년=5, 원반=2, 원번호=2, 이름='최지훈', 성별='남', 점수=60, 특수반=False, 전출=False, 난이도=0, 비고=''),
+        Student(학년=5, 원반=3, 원번호=1, 이름='홍길동', 성별='남', 점수=50, 특수반=False, 전출=False, 난이도=0, 비고=''),
+        Student(학년=5, 원반=3, 원번호=2, 이름='홍길동', 성별='남', 점수=40, 특수반=False, 전출=False, 난이도=0, 비고=''),
+    ]
+    assigner.target_class_count = 2
+    assigner.classes = {1: [], 2: []}
+    assigner.separation_rules = defaultdict(set, {'김철수': {'이영희'}, '이영희': {'김철수'}})
+    assigner.separation_pairs = [('김철수', '이영희')]
+    assigner.together_groups = [{'박민수', '최지훈'}]
+
+    assigner.phase1_apply_rules()
+    assigner.phase3_separate_same_names()
+    assigner.phase5_balance_remaining()
+    return assigner
+
+
+# ============================================================================
+# 출력기 선택
+# ============================================================================
+
+def test_get_writer_by_name_and_extension():
+    """테스트 1: 이름 또는 파일 확장자로 출력기 선택"""
+    assert isinstance(get_writer('csv'), CsvResultWriter)
+    assert isinstance(get_writer('결과.JSONL'), JsonLinesResultWriter)
+    assert isinstance(get_writer('03 배정 결과.xlsx'), XlsxResultWriter)
+    assert get_writer('xlsx', workers=2).workers == 2
+
+
+def test_get_writer_unknown_format():
+    """테스트 2: 지원하지 않는 형식은 ValueError"""
+    with pytest.raises(ValueError, match="지원하지 않는 출력 형식"):
+        get_writer('result.txt')
+
+
+def test_register_custom_writer(assigned_assigner, tmp_path):
+    """테스트 3: 사용자 정의 출력기 등록"""
+
+    class CountWriter(ResultWriter):
+        name = 'count'
+        extension = '.count'
+
+        def write(self, assigner, output_file):
+            with open(output_file, 'w') as f:
+                f.write(str(len(assigner.build_result_records())))
+
+    try:
+        register_writer(CountWriter)
+        output_file = tmp_path / 'result.count'
+        assigned_assigner.generate_output(str(output_file))
+        assert output_file.read_text() == '6'
+    finally:
+        WRITERS.pop('count', None)
+
+
+# ============================================================================
+# 학생 단위 레코드
+# ============================================================================
+
+def test_result_records(assigned_assigner):
+    """테스트 4: 레코드에 신원, 배정 반, 새 번호, 규칙 플래그 포함"""
+    records = assigned_assigner.build_result_records()
+
+    assert len(records) == 6
+    assert all(list(r.keys()) == RECORD_FIELDS for r in records)
+
+    by_name = {r['이름']: r for r in records if r['이름'] != '홍길동'}
+    assert by_name['김철수']['분반'] is True
+    assert by_name['김철수']['분반대상'] == '이영희'
+    assert by_name['김철수']['특수반'] is True
+    assert by_name['박민수']['합반'] is True
+    assert by_name['박민수']['합반그룹'] == 1
+    assert by_name['박민수']['반'] == by_name['최지훈']['반']
+    assert all(r['동명이인'] for r in records if r['이름'] == '홍길동')
+    assert all(r['학년'] == 6 for r in records)
+
+
+def test_new_numbers_follow_name_order(assigned_assigner):
+    """테스트 5: 새 번호는 반 안에서 이름 가나다순"""
+    records = assigned_assigner.build_result_records()
+
+    for class_num in (1, 2):
+        in_class = [r for r in records if r['반'] == class_num]
+        assert [r['번호'] for r in in_class] == list(range(1, len(in_class) + 1))
+        assert [r['이름'] for r in in_class] == sorted(r['이름'] for r in in_class)
+
+
+# ============================================================================
+# 파일 출력
+# ============================================================================
+
+def test_csv_output(assigned_assigner, tmp_path):
+    """테스트 6: CSV 출력 (플래그는 1/0)"""
+    output_file = tmp_path / 'result.csv'
+    assigned_assigner.generate_output(str(output_file))
+
+    with open(output_file, encoding='utf-8-sig', newline='') as f:
+        rows = list(csv.DictReader(f))
+
+    assert len(rows) == 6
+    assert list(rows[0].keys()) == RECORD_FIELDS
+    assert {r['분반'] for r in rows} == {'0', '1'}
+
+
+def test_jsonl_output(assigned_assigner, tmp_path):
+    """테스트 7: JSON Lines 출력"""
+    output_file = tmp_path / 'result.jsonl'
+    assigned_assigner.generate_output(str(output_file))
+
+    lines = output_file.read_text(encoding='utf-8').splitlines()
+    records = [json.loads(line) for line in lines]
+
+    assert records == assigned_assigner.build_result_records()
+
+
+def test_multiple_writers(assigned_assigner, tmp_path):
+    """테스트 8: 여러 형식 동시 출력 (output_file과 확장자가 다른 형식은 확장자만 바꾼 경로, 중복 형식은 오류)"""
+    output_file = tmp_path / '03 배정 결과.xlsx'
+    saved = assigned_assigner.generate_output(str(output_file), writers=['xlsx', 'csv', 'jsonl'])
+
+    assert saved == [str(output_file), str(tmp_path / '03 배정 결과.csv'), str(tmp_path / '03 배정 결과.jsonl')]
+    assert all(os.path.exists(path) for path in saved)
+
+    # 첫 형식이 output_file과 확장자가 달라도 각 형식은 자기 확장자 파일에
+    saved = assigned_assigner.generate_output(str(tmp_path / 'out.xlsx'), writers=['csv', 'xlsx'])
+    assert saved == [str(tmp_path / 'out.csv'), str(tmp_path / 'out.xlsx')]
+    with open(tmp_path / 'out.xlsx', 'rb') as f:
+        assert f.read(2) == b'PK'  # xlsx(zip)
+
+    with pytest.raises(ValueError, match="출력 형식이 중복되었습니다: csv"):
+        assigned_assigner.generate_output(str(tmp_path / 'dup.csv'), writers=['csv', 'CSV'])
+
+
+def test_parquet_output(assigned_assigner, tmp_path):
+    """테스트 9: Parquet 출력 (pyarrow가 있을 때만)"""
+    pytest.importorskip('pyarrow')
+    import pandas as pd
+
+    output_file = tmp_path / 'result.parquet'
+    assigned_assigner.generate_output(str(output_file))
+
+    df = pd.read_parquet(output_file)
+    assert list(df.columns) == RECORD_FIELDS
+    assert len(df) == 6
+
+
+def test_parquet_without_engine(assigned_assigner, tmp_path, monkeypatch):
+    """테스트 10: Parquet 엔진이 없으면 ImportError"""
+    monkeypatch.setattr(ParquetResultWriter, 'available', staticmethod(lambda: False))
+
+    with pytest.raises(ImportError, match="pyarrow"):
+        ParquetResultWriter().write(assigned_assigner, str(tmp_path / 'result.parquet'))
+
+
+def test_default_writer(assigned_assigner, tmp_path):
+    """테스트 11: 형식을 지정하지 않으면 확장자의 형식, 확장자가 없거나 모르는 확장자면 xlsx (경로는 그대로)"""
+    output_file = tmp_path / 'result'
+    assert assigned_assigner.generate_output(str(output_file)) == [str(output_file)]
+    with open(output_file, 'rb') as f:
+        assert f.read(2) == b'PK'  # xlsx(zip)
+
+    [(writer, path)] = output_paths('결과.txt')
+    assert isinstance(writer, XlsxResultWriter) and path == '결과.txt'
+    [(writer, path)] = output_paths('결과.JSONL')
+    assert isinstance(writer, JsonLinesResultWriter) and path == '결과.JSONL'
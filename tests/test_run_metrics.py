@@ -0,0 +1,95 @@
+"""
+run_metrics 모듈 테스트
+단계별 경과/CPU 시간 누적, 반복 구간 카운터, run 결과 계측과 JSON 저장 테스트
+"""
+
+import pytest
+import contextlib
+import io
+import json
+import time
+from collections import defaultdict
+import sys
+import os
+
+# 상위 디렉토리의 class_assigner 모듈 import
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from class_assigner import ClassAssigner, Student
+from run_metrics import COUNTER_NAMES, RunMetrics
+
+BASE_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+STUDENT_FILE = os.path.join(BASE_DIR, '01 가상 명단.xlsx')
+RULES_FILE = os.path.join(BASE_DIR, '02 분반 합반할 학생 규칙.xlsx')
+
+RUN_STAGES = ['load_students', '_validate_rules', 'load_rules', 'phase1_apply_rules',
+              'phase2_distribute_special_needs', 'phase3_separate_same_names', 'phase4_balance_difficulty',
+              'phase5_balance_remaining', 'audit', 'generate_output']
+
+
+def make_student(name):
+    return Student(학년=5, 원반=1, 원번호=1, 이름=name, 성별='남', 점수=80, 특수반=False,
+                   전출=False, 난이도=0.0, 비고='')
+
+
+def test_stage_timing():
+    """테스트 1: 같은 단계는 누적, 예외로 끝난 단계도 기록, 밑줄 단계는 합계에서 제외"""
+    metrics = RunMetrics()
+    for _ in range(2):
+        with metrics.stage('phase1_apply_rules'):
+            time.sleep(0.01)
+    with pytest.raises(ValueError):
+        with metrics.stage('phase2_distribute_special_needs'):
+            raise ValueError
+    with metrics.stage('_validate_rules'):
+        time.sleep(0.01)
+
+    timing = metrics.stages['phase1_apply_rules']
+    assert timing.calls == 2 and timing.wall_sec >= 0.02
+    assert timing.cpu_sec < timing.wall_sec  # sleep은 CPU 시간에 포함되지 않음
+    assert metrics.stages['phase2_distribute_special_needs'].calls == 1
+    assert metrics.wall_sec == pytest.approx(timing.wall_sec + metrics.stages['phase2_distribute_special_needs'].wall_sec)
+    assert dict(metrics.counters) == {name: 0 for name in COUNTER_NAMES}
+
+
+def test_fallback_and_unplaceable_counters():
+    """테스트 2: 다른 반으로 옮긴 배정과 배정할 수 없는 학생을 카운터에 기록"""
+    assigner = ClassAssigner.__new__(ClassAssigner)
+    a, b, c, d = (make_student(name) for name in 'ABCD')
+    assigner.students = [a, b, c, d]
+    assigner.target_class_count = 2
+    assigner.classes = {1: [], 2: []}
+    assigner.separation_rules = defaultdict(set, {'C': {'A', 'B'}, 'D': {'A'}})
+    assigner.metrics = RunMetrics()
+
+    assigner._assign_student(a, 1)
+    assigner._assign_student(b, 2)
+    with contextlib.redirect_stdout(io.StringIO()):
+        assigner._assign_student(c, 1)  # 두 반 모두 분반 대상 → 배정 불가
+    assigner._assign_student(d, 1)      # 1반에 A → 2반으로
+
+    assert d.assigned_class == 2 and c.assigned_class is None
+    assert assigner.metrics.counters['alternative_class_fallbacks'] == 1
+    assert assigner.metrics.counters['unplaceable_warnings'] == 1
+    assert assigner.metrics.counters['can_assign_calls'] == 6
+
+
+def test_run_records_metrics(tmp_path):
+    """테스트 3: run은 모든 단계 시간과 카운터를 assigner.metrics와 JSON 파일에 기록"""
+    metrics_file = str(tmp_path / 'metrics.json')
+    with contextlib.redirect_stdout(io.StringIO()):
+        assigner = ClassAssigner(STUDENT_FILE, RULES_FILE, target_class_count=7, seed=1)
+        assigner.run(str(tmp_path / 'result.xlsx'), metrics_file=metrics_file)
+
+    metrics = assigner.metrics
+    assert list(metrics.stages) == RUN_STAGES
+    assert all(t.calls == 1 for t in metrics.stages.values())
+    assert (metrics.students, metrics.classes) == (152, 7)
+    assert metrics.counters['can_assign_calls'] > len(assigner.students)
+    # 반 시트 7개 (학생 152명 + 헤더 7행) × 13열 + 요약 시트 (7행 + 헤더)
+    summary_columns = len(assigner.quality_report.summary_rows(6)[0])
+    assert metrics.counters['cells_styled'] == (152 + 7) * 13 + 8 * summary_columns
+
+    saved = json.loads(open(metrics_file, encoding='utf-8').read())
+    assert saved == json.loads(json.dumps(metrics.to_dict()))
+    assert list(saved['stages']) == RUN_STAGES
+    assert 'phase5_balance_remaining' in metrics.format_table()
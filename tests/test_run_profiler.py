@@ -0,0 +1,104 @@
+"""
+run_profiler 모듈 테스트
+단계별 최대 메모리(중첩 단계 포함), run/명령줄 프로파일 파일 저장, 취소된 실행의 프로파일 테스트
+"""
+
+import pytest
+import contextlib
+import io
+import json
+import pstats
+import tracemalloc
+import sys
+import os
+
+# 상위 디렉토리의 class_assigner 모듈 import
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from assignment_cli import EXIT_OK, main
+from assignment_events import AssignmentCancelled, CancelToken
+from class_assigner import ClassAssigner
+from run_metrics import RunMetrics
+from run_profiler import RunProfiler, profile_paths
+
+BASE_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+STUDENT_FILE = os.path.join(BASE_DIR, '01 가상 명단.xlsx')
+RULES_FILE = os.path.join(BASE_DIR, '02 분반 합반할 학생 규칙.xlsx')
+
+MIB = 2 ** 20
+
+
+def test_stage_peak_memory():
+    """테스트 1: 추적 중이면 단계별 최대 메모리 기록 (바깥 단계는 안쪽 최대 포함), 아니면 기록 안 함"""
+    metrics = RunMetrics()
+    with metrics.stage('load_rules'):
+        pass
+    assert metrics.stages['load_rules'].peak_bytes is None
+    assert 'peak_bytes' not in metrics.to_dict()['stages']['load_rules']
+
+    tracemalloc.start()
+    try:
+        with metrics.stage('phase1_apply_rules'):
+            with metrics.stage('_validate_rules'):
+                block = bytearray(8 * MIB)
+                del block
+            small = bytearray(MIB)
+            del small
+        with metrics.stage('phase2_distribute_special_needs'):
+            small = bytearray(MIB)
+            del small
+    finally:
+        tracemalloc.stop()
+
+    stages = metrics.stages
+    assert stages['_validate_rules'].peak_bytes >= 8 * MIB
+    assert stages['phase1_apply_rules'].peak_bytes >= stages['_validate_rules'].peak_bytes
+    assert MIB <= stages['phase2_distribute_special_needs'].peak_bytes < 8 * MIB
+    assert metrics.to_dict()['stages']['phase1_apply_rules']['peak_bytes'] == stages['phase1_apply_rules'].peak_bytes
+
+    with pytest.raises(ValueError, match="프로파일 모드"):
+        RunProfiler('time')
+
+
+def test_run_writes_profile(tmp_path):
+    """테스트 2: run(profile=...)은 결과 파일 옆에 pstats와 보고서 저장, 모드에 따라 내용이 다름"""
+    output_file = str(tmp_path / 'result.xlsx')
+    with contextlib.redirect_stdout(io.StringIO()):
+        assigner = ClassAssigner(STUDENT_FILE, RULES_FILE, target_class_count=7, seed=1)
+        saved = assigner.run(output_file, profile='all', profile_top=5)
+
+    prof_file, report_file = profile_paths(output_file)
+    assert saved == [output_file]
+    assert assigner.profile_files == [prof_file, report_file]
+    assert not tracemalloc.is_tracing()
+    stats = pstats.Stats(prof_file)
+    assert any(func[2] == 'phase1_apply_rules' for func in stats.stats)
+
+    report = open(report_file, encoding='utf-8').read()
+    assert "누적 시간 상위 5개 함수" in report and "자체 시간 상위 5개 함수" in report
+    assert "phase5_balance_remaining" in report and "전체" in report
+    assert all(t.peak_bytes > 0 for t in assigner.metrics.stages.values())
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        assigner = ClassAssigner(STUDENT_FILE, RULES_FILE, target_class_count=7, seed=1)
+        assigner.run(str(tmp_path / 'cpu.csv'), profile='cpu')
+    assert [os.path.basename(path) for path in assigner.profile_files] == ['cpu.prof', 'cpu.profile.txt']
+    assert "최대 메모리" not in open(assigner.profile_files[1], encoding='utf-8').read()
+    assert assigner.metrics.stages['load_students'].peak_bytes is None
+
+
+def test_cli_and_cancelled_run(tmp_path, capsys):
+    """테스트 3: --profile 결과 요약에 프로파일 파일 포함, 취소된 실행도 프로파일 저장"""
+    output_file = str(tmp_path / 'result.csv')
+    assert main([STUDENT_FILE, RULES_FILE, '-o', output_file, '--profile', 'memory', '--json']) == EXIT_OK
+    result = json.loads(capsys.readouterr().out)
+    assert result['profile_files'] == [profile_paths(output_file)[1]]
+    assert 'peak_bytes' in result['metrics']['stages']['phase1_apply_rules']
+
+    token = CancelToken()
+    token.cancel()
+    with contextlib.redirect_stdout(io.StringIO()):
+        assigner = ClassAssigner(STUDENT_FILE, RULES_FILE, target_class_count=7)
+        with pytest.raises(AssignmentCancelled):
+            assigner.run(str(tmp_path / 'cancelled.xlsx'), cancel_token=token, profile='cpu')
+    assert all(os.path.exists(path) for path in assigner.profile_files)
+    assert not os.path.exists(tmp_path / 'cancelled.xlsx')
@@ -0,0 +1,93 @@
+"""
+synthetic_inputs 모듈 테스트
+seed 재현성, 설정 비율 반영, 규칙 무충돌, 파일 형식(read_students/read_rules 호환) 테스트
+"""
+
+import pytest
+import contextlib
+import io
+from collections import Counter, defaultdict
+import sys
+import os
+
+# 상위 디렉토리의 class_assigner 모듈 import
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from class_assigner import ClassAssigner, find_rule_conflicts
+from parsed_inputs import parse_inputs
+from synthetic_inputs import SyntheticSpec, generate_inputs, main, write_inputs
+
+
+def student_rows(students):
+    return sorted((s.원반, s.원번호, s.이름, s.성별, s.점수, s.특수반, s.전출, s.난이도, s.비고) for s in students)
+
+
+def test_deterministic_by_seed():
+    """테스트 1: 같은 설정과 seed면 같은 명단/규칙, seed가 다르면 다른 명단"""
+    spec = SyntheticSpec(students=500, original_classes=12, seed=7)
+    first, second = generate_inputs(spec), generate_inputs(spec)
+
+    assert student_rows(first.students) == student_rows(second.students)
+    assert first.separation_pairs == second.separation_pairs
+    assert first.together_groups == second.together_groups
+    assert student_rows(generate_inputs(SyntheticSpec(students=500, original_classes=12, seed=8)).students) \
+        != student_rows(first.students)
+
+
+def test_spec_rates_and_rules():
+    """테스트 2: 인원/비율/동명이인/합반 그룹 크기 반영, 규칙 충돌 없음, 분반 대상 수 상한"""
+    spec = SyntheticSpec(students=5000, original_classes=20, target_classes=4, male_ratio=0.6,
+                         special_rate=0.05, transfer_rate=0.03, same_name_rate=0.02,
+                         separation_density=0.5, together_group_sizes=(2, 3, 5), seed=1)
+    inputs = generate_inputs(spec)
+    students = inputs.students
+
+    assert len(students) == 5000
+    assert Counter(s.원반 for s in students) == {c: 250 for c in range(1, 21)}
+    assert sorted(s.원번호 for s in students if s.원반 == 1) == list(range(1, 251))
+    assert sum(s.성별 == '남' for s in students) / 5000 == pytest.approx(0.6, abs=0.03)
+    assert sum(s.특수반 for s in students) / 5000 == pytest.approx(0.05, abs=0.015)
+    assert not any(s.특수반 and s.전출 for s in students)
+    assert sum(c for c in Counter(s.이름 for s in students).values() if c > 1) == 100
+    assert sorted(len(g) for g in inputs.together_groups) == [2, 3, 5]
+    assert len(inputs.separation_pairs) == 2500
+
+    separation_rules = defaultdict(set)
+    for name1, name2 in inputs.separation_pairs:
+        separation_rules[name1].add(name2)
+        separation_rules[name2].add(name1)
+    assert max(len(targets) for targets in separation_rules.values()) <= 3
+    assert find_rule_conflicts(students, separation_rules, inputs.together_groups) == []
+    assert inputs.conflicts == []
+
+
+def test_files_round_trip(tmp_path):
+    """테스트 3: 저장한 파일을 read_students/read_rules로 읽으면 생성한 내용과 같음"""
+    spec = SyntheticSpec(students=300, original_classes=9, together_group_sizes=(2, 3), seed=4)
+    written = write_inputs(str(tmp_path), spec)
+    with contextlib.redirect_stdout(io.StringIO()):
+        parsed = parse_inputs(written.student_file, written.rules_file)
+
+    assert student_rows(parsed.students) == student_rows(written.students)
+    assert parsed.separation_pairs == written.separation_pairs
+    assert sorted(map(sorted, parsed.together_groups)) == sorted(map(sorted, written.together_groups))
+    assert parsed.conflicts == []
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        assert main([str(tmp_path / 'cli'), '--students', '40', '--original-classes', '2', '--seed', '1']) == 0
+    assert os.path.exists(tmp_path / 'cli' / '01 가상 명단.xlsx')
+    with contextlib.redirect_stderr(io.StringIO()):
+        assert main([str(tmp_path / 'big'), '--students', '10000000']) == 2
+
+
+def test_generated_inputs_are_assignable(tmp_path):
+    """테스트 4: 생성한 입력은 모든 학생이 배정됨 (분반 규칙 위반 없음)"""
+    inputs = generate_inputs(SyntheticSpec(students=800, original_classes=8, target_classes=6,
+                                           separation_density=0.8, together_group_sizes=(2, 4), seed=2))
+    with contextlib.redirect_stdout(io.StringIO()):
+        assigner = ClassAssigner('', '', target_class_count=6, seed=0)
+        assigner.run(str(tmp_path / 'result.csv'), parsed_inputs=inputs)
+
+    assert all(s.assigned_class is not None for s in assigner.students)
+    class_of = {s.이름: s.assigned_class for s in assigner.students}
+    assert all(class_of[a] != class_of[b] for a, b in inputs.separation_pairs)
+    assert all(len({class_of[name] for name in group}) == 1 for group in inputs.together_groups)
@@ -0,0 +1,220 @@
+"""
+xlsx_writer 모듈 테스트
+병렬 렌더링 결과가 openpyxl 렌더링 결과와 같은지 검증
+"""
+
+import pytest
+import zipfile
+import openpyxl
+from collections import defaultdict
+import sys
+import os
+
+# 상위 디렉토리의 class_assigner 모듈 import
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from class_assigner import ClassAssigner, Student
+from xlsx_writer import column_letter, column_index, render_sheet, write_xlsx
+
+
+@pytest.fixture
+def assigned_assigner():
+    """배정이 끝난 ClassAssigner 인스턴스 (분반/합반 규칙 포함)"""
+    assigner = ClassAssigner.__new__(ClassAssigner)
+    assigner.students = []
+    for i in range(40):
+        assigner.students.append(Student(
+            학년=5, 원반=(i % 4) + 1, 원번호=i // 4 + 1, 이름=f'학생{i + 1:02d}',
+            성별='남' if i % 2 == 0 else '여', 점수=60 + i, 특수반=(i == 3), 전출=(i == 7),
+            난이도=1.0 if i % 10 == 0 else 0.0, 비고='비고 ' if i == 5 else ''
+        ))
+    assigner.target_class_count = 5
+    assigner.classes = {i: [] for i in range(1, 6)}
+    assigner.separation_rules = defaultdict(set)
+    assigner.separation_pairs = [('학생01', '학생02'), ('학생01', '학생03'), ('학생10', '학생11')]
+    for name1, name2 in assigner.separation_pairs:
+        assigner.separation_rules[name1].add(name2)
+        assigner.separation_rules[name2].add(name1)
+    assigner.together_groups = [{'학생20', '학생21'}]
+
+    assigner.phase1_apply_rules()
+    assigner.phase5_balance_remaining()
+    return assigner
+
+
+def _cell_signature(cell):
+    value = cell.value if cell.value != '' else None
+    return (value, cell.fill.fgColor.rgb[-6:] if cell.fill.fill_type else None,
+            cell.comment.text if cell.comment else None,
+            bool(cell.font.b), cell.alignment.horizontal, cell.border.left.style)
+
+
+def test_column_letters():
+    """테스트 1: 열 번호 ↔ 열 문자 변환"""
+    for idx in [1, 13, 26, 27, 52, 703]:
+        assert column_index(column_letter(idx)) == idx
+    assert column_letter(1) == 'A'
+    assert column_letter(27) == 'AA'
+
+
+@pytest.mark.parametrize('workers', [1, 2])
+def test_matches_openpyxl_output(assigned_assigner, tmp_path, workers):
+    """테스트 2: 병렬 렌더링 결과가 openpyxl 결과와 셀 단위로 동일"""
+    openpyxl_file = tmp_path / 'openpyxl.xlsx'
+    parallel_file = tmp_path / 'parallel.xlsx'
+    assigned_assigner.generate_output(str(openpyxl_file))
+    assigned_assigner.generate_output(str(parallel_file), workers=workers)
+
+    expected = openpyxl.load_workbook(openpyxl_file)
+    actual = openpyxl.load_workbook(parallel_file)
+    assert expected.sheetnames == actual.sheetnames
+
+    for name in expected.sheetnames:
+        ws_expected, ws_actual = expected[name], actual[name]
+        assert ws_expected.max_row == ws_actual.max_row
+        for row_expected, row_actual in zip(ws_expected.iter_rows(), ws_actual.iter_rows()):
+            for cell_expected, cell_actual in zip(row_expected, row_actual):
+                assert _cell_signature(cell_expected) == _cell_signature(cell_actual), cell_expected.coordinate
+
+
+def test_package_parts(assigned_assigner, tmp_path):
+    """테스트 3: 메모가 있는 시트만 메모/VML 파트를 가짐"""
+    output_file = tmp_path / 'parallel.xlsx'
+    assigned_assigner.generate_output(str(output_file), workers=1)
+
+    with zipfile.ZipFile(output_file) as zf:
+        names = set(zf.namelist())
+        assert zf.testzip() is None
+
+    assert '[Content_Types].xml' in names
+    assert 'xl/styles.xml' in names
+    # 요약 시트(1번)는 범례 메모를 항상 가짐
+    assert 'xl/comments/comment1.xml' in names
+    for index in range(1, 7):
+        assert f'xl/worksheets/sheet{index}.xml' in names
+
+
+def test_render_sheet_without_comments(assigned_assigner):
+    """테스트 4: 메모가 없는 시트는 워크시트 XML만 생성"""
+    class_specs, _ = assigned_assigner.build_sheet_specs()
+    spec = class_specs[0]
+    spec.comments = {}
+
+    parts = render_sheet(2, spec)
+
+    assert list(parts) == ['xl/worksheets/sheet2.xml']
+    assert b'legacyDrawing' not in parts['xl/worksheets/sheet2.xml']
+
+
+def test_escapes_special_characters(tmp_path):
+    """테스트 5: XML 특수 문자와 제어 문자가 포함된 값"""
+    from class_assigner import SheetSpec
+
+    spec = SheetSpec(title='6-1', header=['이름', '비고'], rows=[['<A&B>', '탭\x01문자']],
+                     row_fills=[()])
+    output_file = tmp_path / 'escape.xlsx'
+    write_xlsx(str(output_file), [spec], max_workers=1)
+
+    ws = openpyxl.load_workbook(output_file)['6-1']
+    assert ws['A2'].value == '<A&B>'
+    assert ws['B2'].value == '탭문자'
+
+
+def test_empty_class_has_header(tmp_path):
+    """테스트 6: 학생이 없는 반도 헤더가 있는 시트로 출력"""
+    assigner = ClassAssigner.__new__(ClassAssigner)
+    assigner.students = []
+    assigner.target_class_count = 2
+    assigner.classes = {1: [], 2: []}
+    assigner.separation_rules = defaultdict(set)
+    assigner.separation_pairs = []
+    assigner.together_groups = []
+
+    output_file = tmp_path / 'empty.xlsx'
+    assigner.generate_output(str(output_file), workers=1)
+
+    wb = openpyxl.load_workbook(output_file)
+    assert wb.sheetnames == ['요약', '6-1', '6-2']
+    assert wb['6-1']['A1'].value == '학년'
+
+
+# ============================================================================
+# 증분 출력 (바뀐 시트만 다시 렌더링)
+# ============================================================================
+
+def _sheet_values(path):
+    wb = openpyxl.load_workbook(path)
+    return {name: [[_cell_signature(c) for c in row] for row in wb[name].iter_rows()] for name in wb.sheetnames}
+
+
+def test_incremental_reuses_unchanged_sheets(assigned_assigner, tmp_path):
+    """테스트 7: 변경이 없으면 모든 시트를 이전 파일에서 재사용"""
+    from xlsx_writer import read_sheet_signatures
+
+    output_file = str(tmp_path / 'result.xlsx')
+    class_specs, summary_data = assigned_assigner.build_sheet_specs()
+    specs = [assigned_assigner.build_summary_spec(summary_data)] + class_specs
+
+    first = write_xlsx(output_file, specs, max_workers=1, previous_file=output_file)
+    assert first['reused'] == []
+    assert len(read_sheet_signatures(output_file)) == len(specs)
+
+    second = write_xlsx(output_file, specs, max_workers=1, previous_file=output_file)
+    assert second['rendered'] == []
+    assert second['reused'] == [spec.title for spec in specs]
+
+
+def test_incremental_rerenders_changed_classes(assigned_assigner, tmp_path):
+    """테스트 8: 학생을 옮기면 관련 반 시트와 요약 시트만 다시 렌더링"""
+    output_file = str(tmp_path / 'result.xlsx')
+    full_file = str(tmp_path / 'full.xlsx')
+    assigned_assigner.generate_output(output_file, incremental=True)
+
+    # 분반/합반 규칙과 관계없는 학생을 1반 → 2반으로 이동
+    rule_names = {'학생01', '학생02', '학생03', '학생10', '학생11', '학생20', '학생21'}
+    student = next(s for s in assigned_assigner.classes[1] if s.이름 not in rule_names)
+    assigned_assigner.classes[1].remove(student)
+    assigned_assigner.classes[2].append(student)
+    student.assigned_class = 2
+
+    class_specs, summary_data = assigned_assigner.build_sheet_specs()
+    specs = [assigned_assigner.build_summary_spec(summary_data)] + class_specs
+    result = write_xlsx(output_file, specs, max_workers=1, previous_file=output_file)
+
+    assert set(result['rendered']) == {'요약', '6-1', '6-2'}
+    assert set(result['reused']) == {'6-3', '6-4', '6-5'}
+
+    # 증분 출력 결과는 전체 렌더링 결과와 동일
+    write_xlsx(full_file, specs, max_workers=1)
+    assert _sheet_values(output_file) == _sheet_values(full_file)
+
+
+def test_incremental_ignores_modified_parts(assigned_assigner, tmp_path):
+    """테스트 9: 이전 파일의 시트 파트가 바뀌었으면 재사용하지 않음"""
+    output_file = str(tmp_path / 'result.xlsx')
+    tampered_file = str(tmp_path / 'tampered.xlsx')
+    class_specs, summary_data = assigned_assigner.build_sheet_specs()
+    specs = [assigned_assigner.build_summary_spec(summary_data)] + class_specs
+    write_xlsx(output_file, specs, max_workers=1)
+
+    # 2번 시트(6-1) XML만 변경한 복사본 생성
+    with zipfile.ZipFile(output_file) as src, zipfile.ZipFile(tampered_file, 'w') as dst:
+        for name in src.namelist():
+            data = src.read(name)
+            if name == 'xl/worksheets/sheet2.xml':
+                data = data.replace(b'<pageMargins', b'<!-- edited --><pageMargins')
+            dst.writestr(name, data)
+
+    result = write_xlsx(output_file, specs, max_workers=1, previous_file=tampered_file)
+    assert result['rendered'] == ['6-1']
+
+
+def test_incremental_without_previous_signatures(assigned_assigner, tmp_path):
+    """테스트 10: openpyxl로 만든 이전 파일은 서명이 없으므로 전체 렌더링"""
+    output_file = str(tmp_path / 'result.xlsx')
+    assigned_assigner.generate_output(output_file)
+
+    class_specs, summary_data = assigned_assigner.build_sheet_specs()
+    specs = [assigned_assigner.build_summary_spec(summary_data)] + class_specs
+    result = write_xlsx(output_file, specs, max_workers=1, previous_file=output_file)
+
+    assert result['reused'] == []
@@ -0,0 +1,491 @@
+"""
+병렬 xlsx 렌더러
+반별 시트의 워크시트 XML을 프로세스 풀에서 독립적으로 렌더링한 뒤
+하나의 .xlsx 패키지(zip)로 한 번에 조립한다.
+
+- 모든 문자열은 inline string으로 기록 (공유 문자열 테이블 없음 → 시트 간 의존성 없음)
+- 스타일 테이블은 고정 (헤더/합반/분반 팔레트 색상 × 정렬 여부) → 시트별로 독립 렌더링 가능
+- 시트별 서명을 문서 속성에 기록 → 다시 출력할 때 바뀌지 않은 시트는 이전 파일에서 그대로 복사
+"""
+
+import hashlib
+import os
+import re
+import zipfile
+import xml.etree.ElementTree as ET
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Optional, Tuple
+from xml.sax.saxutils import escape, quoteattr
+
+from class_assigner import (
+    CENTER_COLUMNS, COLOR_PALETTE, COMMENT_AUTHOR, HEADER_COLOR, TOGETHER_COLOR, SheetSpec
+)
+
+
+NS_MAIN = "http://schemas.openxmlformats.org/spreadsheetml/2006/main"
+NS_REL = "http://schemas.openxmlformats.org/officeDocument/2006/relationships"
+NS_PKG_REL = "http://schemas.openxmlformats.org/package/2006/relationships"
+NS_CUSTOM_PROPS = "http://schemas.openxmlformats.org/officeDocument/2006/custom-properties"
+REL_TYPE = NS_REL
+XML_DECL = '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+
+CT_WORKSHEET = "application/vnd.openxmlformats-officedocument.spreadsheetml.worksheet+xml"
+CT_COMMENTS = "application/vnd.openxmlformats-officedocument.spreadsheetml.comments+xml"
+
+# 렌더링 결과가 바뀌는 수정 시 올려서 이전 파일의 시트 재사용을 막음
+WRITER_VERSION = '1'
+SIGNATURE_PREFIX = 'sheet_signature:'
+
+# 이 개수 미만의 시트는 프로세스 생성 비용이 더 크므로 순차 렌더링
+PARALLEL_MIN_SHEETS = 4
+
+# 채우기 색상 목록 (순서가 곧 스타일 번호이므로 변경 시 주의)
+FILL_COLORS = [HEADER_COLOR, TOGETHER_COLOR] + [c for i, c in enumerate(COLOR_PALETTE)
+                                                if c not in COLOR_PALETTE[:i]
+                                                and c not in (HEADER_COLOR, TOGETHER_COLOR)]
+_FILL_POS = {color: pos for pos, color in enumerate(FILL_COLORS, 1)}  # 0 = 색상 없음
+
+# cellXfs 고정 번호
+XF_DEFAULT = 0
+XF_HEADER = 1
+XF_LEGEND_TITLE = 2
+_XF_BODY_BASE = 3
+
+# XML 1.0에서 허용되지 않는 제어 문자
+_ILLEGAL_XML_CHARS = re.compile('[\x00-\x08\x0b\x0c\x0e-\x1f]')
+
+
+def body_xf(center: bool, color: Optional[str] = None) -> int:
+    """테두리가 있는 본문 셀의 스타일 번호 (정렬 여부 × 채우기 색상)"""
+    fill_pos = _FILL_POS[color] if color else 0
+    return _XF_BODY_BASE + 2 * fill_pos + (1 if center else 0)
+
+
+def column_letter(col_idx: int) -> str:
+    """1부터 시작하는 열 번호를 엑셀 열 문자로 변환 (1 → A)"""
+    letters = ''
+    while col_idx > 0:
+        col_idx, rem = divmod(col_idx - 1, 26)
+        letters = chr(65 + rem) + letters
+    return letters
+
+
+def column_index(letters: str) -> int:
+    """엑셀 열 문자를 열 번호로 변환 (A → 1)"""
+    idx = 0
+    for ch in letters:
+        idx = idx * 26 + (ord(ch) - 64)
+    return idx
+
+
+def _text(value) -> str:
+    return escape(_ILLEGAL_XML_CHARS.sub('', str(value)))
+
+
+def _cell_xml(ref: str, value, style: int) -> str:
+    """셀 하나의 XML (빈 값이면 스타일만 기록)"""
+    if value is None or value == '':
+        return f'<c r="{ref}" s="{style}"/>'
+    if isinstance(value, bool):
+        return f'<c r="{ref}" s="{style}" t="b"><v>{int(value)}</v></c>'
+    if isinstance(value, (int, float)):
+        if value != value:  # NaN
+            return f'<c r="{ref}" s="{style}"/>'
+        return f'<c r="{ref}" s="{style}"><v>{format(value, ".15g")}</v></c>'
+    text = str(value)
+    space = ' xml:space="preserve"' if text != text.strip() else ''
+    return f'<c r="{ref}" s="{style}" t="inlineStr"><is><t{space}>{_text(text)}</t></is></c>'
+
+
+def _summary_legend_rows(spec: SheetSpec) -> List[Tuple[int, List[Tuple[int, object, int]]]]:
+    """요약 시트 범례 행 (openpyxl 렌더러와 동일한 배치)"""
+    start = len(spec.rows) + 5
+    return [
+        (start, [(1, "[범례]", XF_LEGEND_TITLE)]),
+        (start + 1, [(1, "합반 규칙 적용", body_xf(False)),
+                     (2, "하늘색 배경", body_xf(False, TOGETHER_COLOR))]),
+        (start + 2, [(1, "분반 규칙 적용", body_xf(False)),
+                     (2, "기타 색상 배경", body_xf(False, COLOR_PALETTE[0])),
+                     (3, "← 이름에 마우스를 올리면 대상 확인 가능", XF_DEFAULT)]),
+    ]
+
+
+def _summary_comments(spec: SheetSpec) -> Dict[Tuple[int, int], str]:
+    comments = dict(spec.comments)
+    comments[(len(spec.rows) + 7, 2)] = "마우스를 올리면 누구와 분반인지 표시됩니다."
+    return comments
+
+
+def render_sheet(index: int, spec: SheetSpec, selected: bool = False) -> Dict[str, bytes]:
+    """
+    시트 하나를 워크시트 XML (+ 메모/VML 파트)로 렌더링
+
+    Args:
+        index: 1부터 시작하는 시트 번호 (파트 이름에 사용)
+        spec: 시트 명세
+        selected: 통합문서를 열었을 때 선택된 시트인지 여부
+
+    Returns:
+        {zip 내부 경로: 바이트} 딕셔너리
+    """
+    columns = [column_letter(i) for i in range(1, len(spec.header) + 1)]
+    is_summary = spec.kind == 'summary'
+    comments = _summary_comments(spec) if is_summary else spec.comments
+
+    out = []
+    # 헤더
+    out.append('<row r="1">')
+    for col_idx, value in enumerate(spec.header):
+        out.append(_cell_xml(f'{columns[col_idx]}1', value, XF_HEADER))
+    out.append('</row>')
+
+    # 데이터 행
+    center_xf = body_xf(True)
+    for row_no, row in enumerate(spec.rows, 2):
+        fill = spec.row_fills[row_no - 2] if spec.row_fills else ()
+        out.append(f'<row r="{row_no}">')
+        for col_idx, value in enumerate(row):
+            col_no = col_idx + 1
+            if is_summary:
+                style = center_xf
+            else:
+                color = fill[col_idx % len(fill)] if fill else None
+                style = body_xf(col_no in CENTER_COLUMNS, color)
+            out.append(_cell_xml(f'{columns[col_idx]}{row_no}', value, style))
+        out.append('</row>')
+
+    max_row = len(spec.rows) + 1
+    max_col = len(spec.header)
+    if is_summary:
+        for row_no, cells in _summary_legend_rows(spec):
+            out.append(f'<row r="{row_no}">')
+            for col_no, value, style in cells:
+                out.append(_cell_xml(f'{column_letter(col_no)}{row_no}', value, style))
+            out.append('</row>')
+            max_row = row_no
+            max_col = max(max_col, max(c[0] for c in cells))
+
+    cols = ''
+    if spec.column_widths:
+        cols = '<cols>' + ''.join(
+            f'<col min="{column_index(c)}" max="{column_index(c)}" width="{w}" customWidth="1"/>'
+            for c, w in sorted(spec.column_widths.items(), key=lambda item: column_index(item[0]))
+        ) + '</cols>'
+
+    tab = ' tabSelected="1"' if selected else ''
+    legacy = '<legacyDrawing r:id="rIdVml"/>' if comments else ''
+    sheet_xml = (
+        f'{XML_DECL}<worksheet xmlns="{NS_MAIN}" xmlns:r="{NS_REL}">'
+        f'<dimension ref="A1:{column_letter(max_col)}{max_row}"/>'
+        f'<sheetViews><sheetView workbookViewId="0"{tab}/></sheetViews>'
+        f'<sheetFormatPr defaultRowHeight="15"/>{cols}'
+        f'<sheetData>{"".join(out)}</sheetData>'
+        f'<pageMargins left="0.75" right="0.75" top="1" bottom="1" header="0.5" footer="0.5"/>'
+        f'{legacy}</worksheet>'
+    )
+
+    parts = {f'xl/worksheets/sheet{index}.xml': sheet_xml.encode('utf-8')}
+    if comments:
+        parts.update(_render_comments(index, comments))
+    return parts
+
+
+def _render_comments(index: int, comments: Dict[Tuple[int, int], str]) -> Dict[str, bytes]:
+    """메모 파트, VML 도형 파트, 시트 관계 파트 렌더링"""
+    items = sorted(comments.items())
+    comment_xml = [f'{XML_DECL}<comments xmlns="{NS_MAIN}"><authors><author>{_text(COMMENT_AUTHOR)}</author>'
+                   f'</authors><commentList>']
+    for (row, col), text in items:
+        comment_xml.append(f'<comment ref="{column_letter(col)}{row}" authorId="0">'
+                           f'<text><t xml:space="preserve">{_text(text)}</t></text></comment>')
+    comment_xml.append('</commentList></comments>')
+
+    vml = [
+        '<xml xmlns:v="urn:schemas-microsoft-com:vml" xmlns:o="urn:schemas-microsoft-com:office:office" '
+        'xmlns:x="urn:schemas-microsoft-com:office:excel">'
+        f'<o:shapelayout v:ext="edit"><o:idmap v:ext="edit" data="{index}"/></o:shapelayout>'
+        '<v:shapetype id="_x0000_t202" coordsize="21600,21600" o:spt="202" path="m,l,21600r21600,l21600,xe">'
+        '<v:stroke joinstyle="miter"/><v:path gradientshapeok="t" o:connecttype="rect"/></v:shapetype>'
+    ]
+    for shape_no, ((row, col), _) in enumerate(items, 1):
+        vml.append(
+            f'<v:shape id="_x0000_s{index * 1024 + shape_no}" type="#_x0000_t202" '
+            'style="position:absolute;margin-left:59.25pt;margin-top:1.5pt;width:144px;height:79px;'
+            'z-index:1;visibility:hidden" fillcolor="#ffffe1" o:insetmode="auto">'
+            '<v:fill color2="#ffffe1"/><v:shadow color="black" obscured="t"/>'
+            '<v:path o:connecttype="none"/><v:textbox style="mso-direction-alt:auto">'
+            '<div style="text-align:left"></div></v:textbox>'
+            '<x:ClientData ObjectType="Note"><x:MoveWithCells/><x:SizeWithCells/>'
+            f'<x:AutoFill>False</x:AutoFill><x:Row>{row - 1}</x:Row><x:Column>{col - 1}</x:Column>'
+            '</x:ClientData></v:shape>'
+        )
+    vml.append('</xml>')
+
+    rels = (
+        f'{XML_DECL}<Relationships xmlns="{NS_PKG_REL}">'
+        f'<Relationship Id="rIdComments" Type="{REL_TYPE}/comments" Target="../comments/comment{index}.xml"/>'
+        f'<Relationship Id="rIdVml" Type="{REL_TYPE}/vmlDrawing" '
+        f'Target="../drawings/commentsDrawing{index}.vml"/>'
+        '</Relationships>'
+    )
+    return {
+        f'xl/comments/comment{index}.xml': ''.join(comment_xml).encode('utf-8'),
+        f'xl/drawings/commentsDrawing{index}.vml': ''.join(vml).encode('utf-8'),
+        f'xl/worksheets/_rels/sheet{index}.xml.rels': rels.encode('utf-8'),
+    }
+
+
+def _render_task(args):
+    return render_sheet(*args)
+
+
+def styles_xml() -> bytes:
+    """고정 스타일 테이블 (body_xf 번호 규칙과 일치해야 함)"""
+    font = '<sz val="11"/><name val="Calibri"/><family val="2"/>'
+    fonts = (f'<fonts count="3"><font>{font}</font><font><b/>{font}</font>'
+             '<font><b/><sz val="12"/><name val="Calibri"/><family val="2"/></font></fonts>')
+
+    fill_xml = ['<fill><patternFill patternType="none"/></fill>',
+                '<fill><patternFill patternType="gray125"/></fill>']
+    for color in FILL_COLORS:
+        fill_xml.append(f'<fill><patternFill patternType="solid"><fgColor rgb="FF{color}"/>'
+                        f'<bgColor rgb="FF{color}"/></patternFill></fill>')
+    fills = f'<fills count="{len(fill_xml)}">{"".join(fill_xml)}</fills>'
+
+    thin = ''.join(f'<{side} style="thin"><color auto="1"/></{side}>'
+                   for side in ('left', 'right', 'top', 'bottom'))
+    borders = ('<borders count="2"><border><left/><right/><top/><bottom/><diagonal/></border>'
+               f'<border>{thin}<diagonal/></border></borders>')
+
+    center = '<alignment horizontal="center" vertical="center"/>'
+    xfs = [
+        '<xf numFmtId="0" fontId="0" fillId="0" borderId="0" xfId="0"/>',
+        f'<xf numFmtId="0" fontId="1" fillId="{_FILL_POS[HEADER_COLOR] + 1}" borderId="1" xfId="0" '
+        f'applyFont="1" applyFill="1" applyBorder="1" applyAlignment="1">{center}</xf>',
+        '<xf numFmtId="0" fontId="2" fillId="0" borderId="0" xfId="0" applyFont="1"/>',
+    ]
+    for fill_pos in range(len(FILL_COLORS) + 1):
+        fill_id = fill_pos + 1 if fill_pos else 0  # 0, 1번 채우기는 예약됨
+        apply_fill = ' applyFill="1"' if fill_pos else ''
+        xfs.append(f'<xf numFmtId="0" fontId="0" fillId="{fill_id}" borderId="1" xfId="0" '
+                   f'applyBorder="1"{apply_fill}/>')
+        xfs.append(f'<xf numFmtId="0" fontId="0" fillId="{fill_id}" borderId="1" xfId="0" '
+                   f'applyBorder="1"{apply_fill} applyAlignment="1">{center}</xf>')
+    cell_xfs = f'<cellXfs count="{len(xfs)}">{"".join(xfs)}</cellXfs>'
+
+    return (
+        f'{XML_DECL}<styleSheet xmlns="{NS_MAIN}">{fonts}{fills}{borders}'
+        '<cellStyleXfs count="1"><xf numFmtId="0" fontId="0" fillId="0" borderId="0"/></cellStyleXfs>'
+        f'{cell_xfs}<cellStyles count="1"><cellStyle name="Normal" xfId="0" builtinId="0"/></cellStyles>'
+        '</styleSheet>'
+    ).encode('utf-8')
+
+
+def _workbook_parts(titles: List[str], sheet_parts: Dict[str, bytes],
+                    custom_properties: Optional[Dict[str, str]] = None) -> Dict[str, bytes]:
+    """통합문서/관계/콘텐츠 형식 등 패키지 공통 파트"""
+    sheets = ''.join(f'<sheet name={quoteattr(_ILLEGAL_XML_CHARS.sub("", t))} sheetId="{i}" r:id="rId{i}"/>'
+                     for i, t in enumerate(titles, 1))
+    workbook = (f'{XML_DECL}<workbook xmlns="{NS_MAIN}" xmlns:r="{NS_REL}"><workbookPr/>'
+                f'<bookViews><workbookView activeTab="0"/></bookViews><sheets>{sheets}</sheets></workbook>')
+
+    wb_rels = [f'<Relationship Id="rId{i}" Type="{REL_TYPE}/worksheet" Target="worksheets/sheet{i}.xml"/>'
+               for i in range(1, len(titles) + 1)]
+    wb_rels.append(f'<Relationship Id="rId{len(titles) + 1}" Type="{REL_TYPE}/styles" Target="styles.xml"/>')
+
+    root_rels = [
+        f'<Relationship Id="rId1" Type="{REL_TYPE}/officeDocument" Target="xl/workbook.xml"/>',
+        '<Relationship Id="rId2" Type="http://schemas.openxmlformats.org/package/2006/relationships/'
+        'metadata/core-properties" Target="docProps/core.xml"/>',
+        f'<Relationship Id="rId3" Type="{REL_TYPE}/extended-properties" Target="docProps/app.xml"/>',
+    ]
+
+    overrides = [
+        ('/xl/workbook.xml', 'application/vnd.openxmlformats-officedocument.spreadsheetml.sheet.main+xml'),
+        ('/xl/styles.xml', 'application/vnd.openxmlformats-officedocument.spreadsheetml.styles+xml'),
+        ('/docProps/core.xml', 'application/vnd.openxmlformats-package.core-properties+xml'),
+        ('/docProps/app.xml', 'application/vnd.openxmlformats-officedocument.extended-properties+xml'),
+    ]
+    for name in sheet_parts:
+        if name.startswith('xl/worksheets/sheet'):
+            overrides.append((f'/{name}', CT_WORKSHEET))
+        elif name.startswith('xl/comments/'):
+            overrides.append((f'/{name}', CT_COMMENTS))
+
+    parts = {
+        'xl/workbook.xml': workbook,
+        'xl/_rels/workbook.xml.rels': f'{XML_DECL}<Relationships xmlns="{NS_PKG_REL}">{"".join(wb_rels)}'
+                                      '</Relationships>',
+        'docProps/core.xml': (
+            f'{XML_DECL}<cp:coreProperties '
+            'xmlns:cp="http://schemas.openxmlformats.org/package/2006/metadata/core-properties" '
+            'xmlns:dc="http://purl.org/dc/elements/1.1/"><dc:creator>'
+            f'{_text(COMMENT_AUTHOR)}</dc:creator></cp:coreProperties>'),
+        'docProps/app.xml': (
+            f'{XML_DECL}<Properties xmlns="http://schemas.openxmlformats.org/officeDocument/2006/'
+            'extended-properties"><Application>Microsoft Excel</Application></Properties>'),
+    }
+
+    if custom_properties:
+        props = ''.join(
+            f'<property fmtid="{{D5CDD505-2E9C-101B-9397-08002B2CF9AE}}" pid="{pid}" name={quoteattr(name)}>'
+            f'<vt:lpwstr>{_text(value)}</vt:lpwstr></property>'
+            for pid, (name, value) in enumerate(sorted(custom_properties.items()), 2)
+        )
+        parts['docProps/custom.xml'] = (
+            f'{XML_DECL}<Properties xmlns="{NS_CUSTOM_PROPS}" xmlns:vt="http://schemas.openxmlformats.org/'
+            f'officeDocument/2006/docPropsVTypes">{props}</Properties>')
+        root_rels.append(f'<Relationship Id="rId4" Type="{REL_TYPE}/custom-properties" '
+                         'Target="docProps/custom.xml"/>')
+        overrides.append(('/docProps/custom.xml',
+                          'application/vnd.openxmlformats-officedocument.custom-properties+xml'))
+
+    parts['_rels/.rels'] = f'{XML_DECL}<Relationships xmlns="{NS_PKG_REL}">{"".join(root_rels)}</Relationships>'
+    parts['[Content_Types].xml'] = (
+        f'{XML_DECL}<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">'
+        '<Default Extension="rels" ContentType="application/vnd.openxmlformats-package.relationships+xml"/>'
+        '<Default Extension="xml" ContentType="application/xml"/>'
+        '<Default Extension="vml" ContentType="application/vnd.openxmlformats-officedocument.vmlDrawing"/>'
+        + ''.join(f'<Override PartName="{name}" ContentType="{ct}"/>' for name, ct in overrides)
+        + '</Types>'
+    )
+    return {name: data.encode('utf-8') if isinstance(data, str) else data for name, data in parts.items()}
+
+
+def sheet_signature(spec: SheetSpec) -> str:
+    """시트 명세의 서명 (구성원, 순서, 값, 색상, 메모가 같으면 같은 값)"""
+    payload = repr((WRITER_VERSION, spec.kind, spec.title, spec.header, spec.rows, spec.row_fills,
+                    sorted(spec.comments.items()), sorted(spec.column_widths.items())))
+    return hashlib.sha1(payload.encode('utf-8')).hexdigest()
+
+
+def sheet_part_names(index: int) -> List[str]:
+    """시트 하나에 속한 패키지 파트 이름 목록"""
+    return [f'xl/worksheets/sheet{index}.xml',
+            f'xl/worksheets/_rels/sheet{index}.xml.rels',
+            f'xl/comments/comment{index}.xml',
+            f'xl/drawings/commentsDrawing{index}.vml']
+
+
+def _parts_digest(parts: Dict[str, bytes]) -> str:
+    digest = hashlib.sha1()
+    for name in sorted(parts):
+        digest.update(name.encode('utf-8'))
+        digest.update(parts[name])
+    return digest.hexdigest()
+
+
+def read_sheet_signatures(xlsx_file: str) -> Dict[str, Tuple[int, str, str]]:
+    """
+    이전 결과 파일에 기록된 시트 서명 읽기
+
+    Returns:
+        {시트 이름: (시트 번호, 명세 서명, 파트 해시)} - 서명이 없는 파일이면 빈 딕셔너리
+    """
+    try:
+        with zipfile.ZipFile(xlsx_file) as zf:
+            root = ET.fromstring(zf.read('docProps/custom.xml'))
+    except (OSError, KeyError, zipfile.BadZipFile, ET.ParseError):
+        return {}
+
+    signatures = {}
+    for prop in root.findall(f'{{{NS_CUSTOM_PROPS}}}property'):
+        name = prop.get('name', '')
+        value = ''.join(prop.itertext())
+        if not name.startswith(SIGNATURE_PREFIX):
+            continue
+        try:
+            index, spec_sig, parts_sig = value.split(':')
+            signatures[name[len(SIGNATURE_PREFIX):]] = (int(index), spec_sig, parts_sig)
+        except ValueError:
+            continue
+    return signatures
+
+
+def _reuse_previous_parts(previous_file: str, specs: List[SheetSpec],
+                          signatures: List[str]) -> Dict[int, Dict[str, bytes]]:
+    """서명이 같고 파트가 손상되지 않은 시트의 파트를 이전 파일에서 읽기 (시트 번호 → 파트)"""
+    previous = read_sheet_signatures(previous_file)
+    if not previous:
+        return {}
+
+    reused = {}
+    with zipfile.ZipFile(previous_file) as zf:
+        names = set(zf.namelist())
+        for index, (spec, signature) in enumerate(zip(specs, signatures), 1):
+            if previous.get(spec.title, (None, None, None))[:2] != (index, signature):
+                continue
+            parts = {name: zf.read(name) for name in sheet_part_names(index) if name in names}
+            # 엑셀에서 다시 저장한 파일 등 파트 내용이 바뀐 경우 재사용하지 않음
+            if parts and _parts_digest(parts) == previous[spec.title][2]:
+                reused[index] = parts
+    return reused
+
+
+def _render_tasks(tasks: list, max_workers: Optional[int] = None) -> Dict[int, Dict[str, bytes]]:
+    """렌더링 작업 목록 실행 (작업 수가 충분하면 프로세스 풀 사용), 시트 번호 → 파트"""
+    workers = max_workers or os.cpu_count() or 1
+
+    if workers <= 1 or len(tasks) < PARALLEL_MIN_SHEETS:
+        return {task[0]: _render_task(task) for task in tasks}
+
+    workers = min(workers, len(tasks))
+    chunksize = max(1, len(tasks) // (workers * 4))
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        results = executor.map(_render_task, tasks, chunksize=chunksize)
+        return {task[0]: parts for task, parts in zip(tasks, results)}
+
+
+def assemble_package(output_file: str, titles: List[str], sheet_parts: Dict[str, bytes],
+                     custom_properties: Optional[Dict[str, str]] = None):
+    """렌더링된 시트 파트와 공통 파트를 하나의 xlsx 파일로 기록 (한 번에 순차 기록)"""
+    parts = _workbook_parts(titles, sheet_parts, custom_properties)
+    parts['xl/styles.xml'] = styles_xml()
+
+    tmp_file = f'{output_file}.tmp'
+    with zipfile.ZipFile(tmp_file, 'w', compression=zipfile.ZIP_DEFLATED) as zf:
+        zf.writestr('[Content_Types].xml', parts.pop('[Content_Types].xml'))
+        for name, data in parts.items():
+            zf.writestr(name, data)
+        for name, data in sheet_parts.items():
+            zf.writestr(name, data)
+    os.replace(tmp_file, output_file)
+
+
+def write_xlsx(output_file: str, specs: List[SheetSpec], max_workers: Optional[int] = None,
+               previous_file: Optional[str] = None) -> Dict[str, List[str]]:
+    """
+    시트 명세 목록을 xlsx 파일로 저장 (시트 XML 병렬 렌더링 + 단일 패스 조립)
+
+    Args:
+        output_file: 저장할 xlsx 경로
+        specs: 시트 명세 목록 (첫 번째 시트가 활성 시트)
+        max_workers: 프로세스 수 (None = CPU 수, 1 = 순차 렌더링)
+        previous_file: 이전 결과 파일 (output_file과 같아도 됨).
+                       주어지면 구성원/순서/색상이 바뀌지 않은 시트는 다시 렌더링하지 않고 복사
+
+    Returns:
+        {'rendered': 다시 렌더링한 시트 이름, 'reused': 이전 파일에서 복사한 시트 이름}
+    """
+    signatures = [sheet_signature(spec) for spec in specs]
+
+    reused = {}
+    if previous_file and os.path.exists(previous_file):
+        reused = _reuse_previous_parts(previous_file, specs, signatures)
+
+    tasks = [(index, spec, index == 1) for index, spec in enumerate(specs, 1) if index not in reused]
+    by_index = dict(reused)
+    by_index.update(_render_tasks(tasks, max_workers))
+
+    sheet_parts: Dict[str, bytes] = {}
+    custom_properties = {}
+    for index, (spec, signature) in enumerate(zip(specs, signatures), 1):
+        parts = by_index[index]
+        sheet_parts.update(parts)
+        custom_properties[SIGNATURE_PREFIX + spec.title] = f'{index}:{signature}:{_parts_digest(parts)}'
+
+    assemble_package(output_file, [spec.title for spec in specs], sheet_parts, custom_properties)
+    return {
+        'rendered': [spec.title for index, spec in enumerate(specs, 1) if index not in reused],
+        'reused': [spec.title for index, spec in enumerate(specs, 1) if index in reused],
+    }